@@ -24,18 +24,33 @@ from nautilus_trader.common.component cimport Logger
 from nautilus_trader.core.rust.model cimport OrderSide
 from nautilus_trader.model.events.account cimport AccountState
 from nautilus_trader.model.events.order cimport OrderFilled
+from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.objects cimport Money
+from nautilus_trader.model.orders.base cimport Order
 
 
 cdef class AccountsManager:
     cdef Clock _clock
     cdef Logger _log
     cdef CacheFacade _cache
+    cdef dict _order_amounts
+    cdef dict _order_totals
+    cdef dict _order_update_counts
 
+    cdef readonly int reconciliation_interval
+    """The number of incremental order updates per instrument between full recalculations.\n\n:returns: `int`"""
+
+    cpdef void reset(self)
     cdef AccountState update_balances(self, Account account, Instrument instrument, OrderFilled fill)
     cdef AccountState update_orders(self, Account account, Instrument instrument, list orders_open, uint64_t ts_event)
+    cdef AccountState update_order(self, Account account, Instrument instrument, Order order, uint64_t ts_event)
+    cdef void discard_order(self, Order order)
     cdef AccountState update_positions(self, MarginAccount account, Instrument instrument, list positions_open, uint64_t ts_event)
+    cdef AccountState _reconcile_orders(self, Account account, Instrument instrument, uint64_t ts_event)
+    cdef object _calculate_order_amount(self, Account account, Instrument instrument, Order order)
+    cdef void _track_orders(self, Account account, Instrument instrument, dict amounts, object total)
+    cdef void _untrack_orders(self, InstrumentId instrument_id)
     cdef AccountState _update_balance_locked(self, CashAccount account, Instrument instrument, list orders_open, uint64_t ts_event)
     cdef AccountState _update_margin_init(self, MarginAccount account, Instrument instrument, list orders_open, uint64_t ts_event)
     cdef void _update_balance_single_currency(self, Account account, OrderFilled fill, Money pnl)
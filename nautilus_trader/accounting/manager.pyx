@@ -31,6 +31,8 @@ from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.rust.model cimport OrderSide
 from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.core.uuid cimport UUID4
+from nautilus_trader.model.identifiers cimport ClientOrderId
+from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.identifiers cimport PositionId
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.objects cimport AccountBalance
@@ -51,6 +53,14 @@ cdef class AccountsManager:
         The logger for the manager.
     clock : Clock
         The clock for the manager.
+    reconciliation_interval : int, default 1000
+        The number of incremental order updates for an instrument after which
+        the locked balance or initial margin is fully recalculated from all open orders.
+
+    Raises
+    ------
+    ValueError
+        If `reconciliation_interval` is not positive (> 0).
     """
 
     def __init__(
@@ -58,10 +68,27 @@ cdef class AccountsManager:
         CacheFacade cache not None,
         Logger logger not None,
         Clock clock not None,
+        int reconciliation_interval = 1000,
     ):
+        Condition.positive_int(reconciliation_interval, "reconciliation_interval")
+
         self._clock = clock
         self._log = logger
         self._cache = cache
+        self._order_amounts: dict[InstrumentId, dict[ClientOrderId, Decimal]] = {}
+        self._order_totals: dict[InstrumentId, Decimal] = {}
+        self._order_update_counts: dict[InstrumentId, int] = {}
+
+        self.reconciliation_interval = reconciliation_interval
+
+    cpdef void reset(self):
+        """
+        Reset the incremental order accounting state.
+
+        """
+        self._order_amounts.clear()
+        self._order_totals.clear()
+        self._order_update_counts.clear()
 
     cdef AccountState update_balances(
         self,
@@ -183,6 +210,176 @@ cdef class AccountsManager:
         else:
             raise RuntimeError("invalid `AccountType`")  # pragma: no cover (design-time error)
 
+    cdef AccountState update_order(
+        self,
+        Account account,
+        Instrument instrument,
+        Order order,
+        uint64_t ts_event,
+    ):
+        """
+        Update the account states based on the given changed order.
+
+        The locked balance (cash accounts) or initial margin (margin accounts) for
+        the instrument is adjusted by the change in the orders contribution only.
+        Falls back to a full recalculation from all open passive orders when the
+        instrument is not yet tracked, when a conversion to the account base currency
+        is required, or once every `reconciliation_interval` updates.
+
+        Parameters
+        ----------
+        account : Account
+            The account to update.
+        instrument : Instrument
+            The instrument for the update.
+        order : Order
+            The order which changed.
+        ts_event : uint64_t
+            UNIX timestamp (nanoseconds) when the account event occurred.
+
+        Returns
+        -------
+        AccountState or ``None``
+
+        """
+        Condition.not_none(account, "account")
+        Condition.not_none(instrument, "instrument")
+        Condition.not_none(order, "order")
+
+        cdef InstrumentId instrument_id = instrument.id
+        cdef dict amounts = self._order_amounts.get(instrument_id)
+        cdef int count = self._order_update_counts.get(instrument_id, 0) + 1
+        if amounts is None or count >= self.reconciliation_interval:
+            return self._reconcile_orders(account, instrument, ts_event)
+
+        self._order_update_counts[instrument_id] = count
+
+        amount = self._calculate_order_amount(account, instrument, order)
+        previous = amounts.pop(order.client_order_id, None)
+        if amount is not None:
+            amounts[order.client_order_id] = amount
+
+        total = self._order_totals[instrument_id]
+        if previous is not None:
+            total -= previous
+        if amount is not None:
+            total += amount
+        self._order_totals[instrument_id] = total
+
+        cdef Currency currency = account.base_currency or instrument.get_settlement_currency()
+        cdef Money total_money = Money(total, currency)
+        if account.is_cash_account:
+            if not amounts:
+                account.clear_balance_locked(instrument_id)
+            else:
+                account.update_balance_locked(instrument_id, total_money)
+            self._log.info(f"{instrument_id} balance_locked={total_money.to_formatted_str()}")
+        elif account.is_margin_account:
+            if total == 0:
+                account.clear_margin_init(instrument_id)
+            else:
+                account.update_margin_init(instrument_id, total_money)
+            self._log.info(f"{instrument_id} margin_init={total_money.to_formatted_str()}")
+        else:
+            raise RuntimeError("invalid `AccountType`")  # pragma: no cover (design-time error)
+
+        return self._generate_account_state(
+            account=account,
+            ts_event=ts_event,
+        )
+
+    cdef void discard_order(self, Order order):
+        """
+        Discard any tracked contribution of the given closed order.
+
+        The account state is not changed until the next update for the instrument.
+
+        Parameters
+        ----------
+        order : Order
+            The order to discard.
+
+        """
+        Condition.not_none(order, "order")
+
+        cdef dict amounts = self._order_amounts.get(order.instrument_id)
+        if amounts is None:
+            return
+
+        previous = amounts.pop(order.client_order_id, None)
+        if previous is not None:
+            self._order_totals[order.instrument_id] -= previous
+
+    cdef AccountState _reconcile_orders(
+        self,
+        Account account,
+        Instrument instrument,
+        uint64_t ts_event,
+    ):
+        cdef list orders_open = self._cache.orders_open(
+            venue=None,  # Faster query filtering
+            instrument_id=instrument.id,
+        )
+
+        cdef Order o
+        return self.update_orders(
+            account=account,
+            instrument=instrument,
+            orders_open=[o for o in orders_open if o.is_passive_c()],
+            ts_event=ts_event,
+        )
+
+    cdef object _calculate_order_amount(
+        self,
+        Account account,
+        Instrument instrument,
+        Order order,
+    ):
+        # Return the locked balance or initial margin amount for the order,
+        # or ``None`` if the order does not contribute.
+        if not order.is_open_c() or not order.is_passive_c():
+            return None
+
+        if not order.has_price_c() and not order.has_trigger_price_c():
+            return None
+
+        price = order.price if order.has_price_c() else order.trigger_price
+        if account.is_cash_account:
+            amount = (<CashAccount>account).calculate_balance_locked(
+                instrument,
+                order.side,
+                order.quantity,
+                price,
+            ).as_decimal()
+        else:
+            amount = (<MarginAccount>account).calculate_margin_init(
+                instrument,
+                order.quantity,
+                price,
+            ).as_decimal()
+
+        if account.base_currency is not None:
+            # Only tracked incrementally when no conversion is required (xrate is 1)
+            amount = round(amount, account.base_currency.get_precision())
+
+        return amount
+
+    cdef void _track_orders(self, Account account, Instrument instrument, dict amounts, object total):
+        # Incremental tracking requires no conversion to the account base currency,
+        # as exchange rates change independently of order events.
+        if account.base_currency is not None and account.base_currency != instrument.get_settlement_currency():
+            self._untrack_orders(instrument.id)
+            return
+
+        self._order_amounts[instrument.id] = amounts
+        self._order_totals[instrument.id] = total
+        self._order_update_counts[instrument.id] = 0
+
+    cdef void _untrack_orders(self, InstrumentId instrument_id):
+        self._order_amounts.pop(instrument_id, None)
+        self._order_totals.pop(instrument_id, None)
+        self._order_update_counts.pop(instrument_id, None)
+
     cdef AccountState _update_balance_locked(
         self,
         CashAccount account,
@@ -192,6 +389,7 @@ cdef class AccountsManager:
     ):
         if not orders_open:
             account.clear_balance_locked(instrument.id)
+            self._track_orders(account, instrument, {}, Decimal(0))
             return self._generate_account_state(
                 account=account,
                 ts_event=ts_event,
@@ -199,6 +397,7 @@ cdef class AccountsManager:
 
         total_locked = Decimal(0)
         base_xrate  = Decimal(0)
+        cdef dict amounts = {}  # type: dict[ClientOrderId, Decimal]
 
         cdef Currency currency = instrument.get_settlement_currency()
         cdef:
@@ -234,6 +433,7 @@ cdef class AccountsManager:
                             f"insufficient data for "
                             f"{instrument.get_settlement_currency()}/{account.base_currency}"
                         )
+                        self._untrack_orders(instrument.id)
                         return None  # Cannot calculate
 
                 # Apply base xrate
@@ -241,9 +441,11 @@ cdef class AccountsManager:
 
             # Increment total locked
             total_locked += locked
+            amounts[order.client_order_id] = locked
 
         cdef Money locked_money = Money(total_locked, currency)
         account.update_balance_locked(instrument.id, locked_money)
+        self._track_orders(account, instrument, amounts, total_locked)
 
         self._log.info(f"{instrument.id} balance_locked={locked_money.to_formatted_str()}")
 
@@ -287,6 +489,7 @@ cdef class AccountsManager:
 
         total_margin_init = Decimal(0)
         base_xrate = Decimal(0)
+        cdef dict amounts = {}  # type: dict[ClientOrderId, Decimal]
 
         cdef Currency currency = instrument.get_settlement_currency()
 
@@ -321,6 +524,7 @@ cdef class AccountsManager:
                             f"insufficient data for "
                             f"{instrument.get_settlement_currency()}/{account.base_currency}"
                         )
+                        self._untrack_orders(instrument.id)
                         return None  # Cannot calculate
 
                 # Apply base xrate
@@ -328,12 +532,14 @@ cdef class AccountsManager:
 
             # Increment total initial margin
             total_margin_init += margin_init
+            amounts[order.client_order_id] = margin_init
 
         cdef Money margin_init_money = Money(total_margin_init, currency)
         if total_margin_init == 0:
             account.clear_margin_init(instrument.id)
         else:
             account.update_margin_init(instrument.id, margin_init_money)
+        self._track_orders(account, instrument, amounts, total_margin_init)
 
         self._log.info(f"{instrument.id} margin_init={margin_init_money.to_formatted_str()}")
 
@@ -313,6 +313,7 @@ register_arrow(
     schema=BetfairTicker.schema(),
     encoder=make_dict_serializer(schema=BetfairTicker.schema()),
     decoder=make_dict_deserializer(BetfairTicker),
+    batch_encoder=True,
 )
 
 # Register serialization/parquet BetfairStartingPrice
@@ -327,6 +328,7 @@ register_arrow(
     schema=BetfairStartingPrice.schema(),
     encoder=make_dict_serializer(schema=BetfairStartingPrice.schema()),
     decoder=make_dict_deserializer(BetfairStartingPrice),
+    batch_encoder=True,
 )
 
 
@@ -15,9 +15,16 @@
 
 import asyncio
 import datetime
+import hashlib
+import os
 import re
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import Literal
 
+import msgspec
 import pandas as pd
 from ibapi.common import MarketDataTypeEnum
 
@@ -47,11 +54,150 @@ from nautilus_trader.model.enums import AggregationSource
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.identifiers import TraderId
 from nautilus_trader.model.instruments.base import Instrument
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.serialization.serializer import MsgSpecSerializer
+
+
+class _RequestPacer:
+    """
+    Limits the number of concurrent requests, and the number of requests started
+    within rolling windows (to stay within the IB historical data pacing limits).
+
+    Besides the overall window, at most `max_contract_requests` may start within
+    `contract_window_secs` for the same contract and tick type, and an identical
+    request may not repeat within `identical_window_secs`.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_requests: int,
+        window_secs: float,
+        max_contract_requests: int = 6,
+        contract_window_secs: float = 2.0,
+        identical_window_secs: float = 15.0,
+    ) -> None:
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._lock = asyncio.Lock()
+        self._max_requests = max_requests
+        self._window_secs = window_secs
+        self._max_contract_requests = max_contract_requests
+        self._contract_window_secs = contract_window_secs
+        self._identical_window_secs = identical_window_secs
+        self._starts: deque[float] = deque()
+        self._contract_starts: dict[str, deque[float]] = {}
+        self._request_starts: dict[str, float] = {}
+
+    @asynccontextmanager
+    async def request(self, contract_key: str, request_key: str) -> AsyncIterator[None]:
+        await self._semaphore.acquire()
+        try:
+            loop = asyncio.get_running_loop()
+            while True:
+                # Sleep outside the lock, so requests for other contracts are not held up
+                async with self._lock:
+                    now = loop.time()
+                    delay = self._delay(now, contract_key, request_key)
+                    if delay <= 0.0:
+                        self._starts.append(now)
+                        self._contract_starts.setdefault(contract_key, deque()).append(now)
+                        self._request_starts[request_key] = now
+                        break
+                await asyncio.sleep(delay)
+            yield
+        finally:
+            self._semaphore.release()
+
+    def _delay(self, now: float, contract_key: str, request_key: str) -> float:
+        delay = 0.0
+
+        while self._starts and now - self._starts[0] >= self._window_secs:
+            self._starts.popleft()
+        if len(self._starts) >= self._max_requests:
+            delay = self._window_secs - (now - self._starts[0])
+
+        contract_starts = self._contract_starts.get(contract_key)
+        if contract_starts:
+            while contract_starts and now - contract_starts[0] >= self._contract_window_secs:
+                contract_starts.popleft()
+            if len(contract_starts) >= self._max_contract_requests:
+                delay = max(delay, self._contract_window_secs - (now - contract_starts[0]))
+
+        last_start = self._request_starts.get(request_key)
+        if last_start is not None:
+            delay = max(delay, self._identical_window_secs - (now - last_start))
+
+        return delay
+
+
+class _SegmentCache:
+    """
+    Persists the data of completed request segments, so that interrupted downloads
+    resume from where they left off.
+    """
+
+    def __init__(self, path: str | None) -> None:
+        self._path = Path(path) if path else None
+        self._serializer = MsgSpecSerializer(encoding=msgspec.msgpack)
+        if self._path is not None:
+            self._path.mkdir(parents=True, exist_ok=True)
+
+    def _file(self, key: str) -> Path:
+        return self._path / f"{hashlib.sha1(key.encode()).hexdigest()}.msgpack"  # noqa: S324
+
+    def get(self, key: str) -> list | None:
+        if self._path is None:
+            return None
+
+        file = self._file(key)
+        if not file.exists():
+            return None
+
+        return [self._serializer.deserialize(b) for b in msgspec.msgpack.decode(file.read_bytes())]
+
+    def put(self, key: str, data: list) -> None:
+        if self._path is None:
+            return
+
+        # Write then rename, so a partial segment is never read
+        file = self._file(key)
+        tmp_file = file.with_suffix(".tmp")
+        tmp_file.write_bytes(msgspec.msgpack.encode([self._serializer.serialize(x) for x in data]))
+        os.replace(tmp_file, file)
 
 
 class HistoricInteractiveBrokersClient:
     """
     Provides a means of requesting historical market data for backtesting.
+
+    Requests for separate contracts, bar specifications and duration segments are
+    run concurrently, within the given pacing limits. The IB limits of at most six
+    requests per contract and tick type within two seconds, and no identical request
+    within 15 seconds, are also observed.
+
+    Parameters
+    ----------
+    host : str, default '127.0.0.1'
+        The hostname or ip address for the IB Gateway or TWS.
+    port : int, default 7497
+        The port for the gateway server.
+    client_id : int, default 1
+        The client_id to be passed into connect call.
+    market_data_type : MarketDataTypeEnum, default ``REALTIME``
+        The market data type to request.
+    log_level : str, default 'INFO'
+        The log level for the client.
+    max_concurrent_requests : int, default 10
+        The maximum number of historical data requests in flight at once.
+    max_requests_per_10_mins : int, default 60
+        The maximum number of historical data requests started within any 10 minute window.
+    cache_path : str, optional
+        The directory to persist completed request segments to. If set, then repeating an
+        interrupted download only requests the segments not yet completed.
+    client : InteractiveBrokersClient, optional
+        An existing client to request data with. If ``None`` then a client is created
+        for the given `host`, `port` and `client_id`.
+
     """
 
     def __init__(
@@ -61,20 +207,34 @@ class HistoricInteractiveBrokersClient:
         client_id: int = 1,
         market_data_type: MarketDataTypeEnum = MarketDataTypeEnum.REALTIME,
         log_level: str = "INFO",
+        max_concurrent_requests: int = 10,
+        max_requests_per_10_mins: int = 60,
+        cache_path: str | None = None,
+        client: InteractiveBrokersClient | None = None,
     ) -> None:
-        loop = asyncio.get_event_loop()
-        loop.set_debug(True)
-        clock = LiveClock()
-
         self._log_guard = init_logging(level_stdout=log_level_from_str(log_level))
 
         self.log = Logger(name="HistoricInteractiveBrokersClient")
+        self.market_data_type = market_data_type
+        self._pacer = _RequestPacer(
+            max_concurrent=max_concurrent_requests,
+            max_requests=max_requests_per_10_mins,
+            window_secs=600.0,
+        )
+        self._segment_cache = _SegmentCache(cache_path)
+
+        if client is not None:
+            self._client = client
+            return
+
+        loop = asyncio.get_event_loop()
+        loop.set_debug(True)
+        clock = LiveClock()
         msgbus = MessageBus(
             TraderId("historic_interactive_brokers_client-001"),
             clock,
         )
         cache = Cache()
-        self.market_data_type = market_data_type
         self._client = InteractiveBrokersClient(
             loop=loop,
             msgbus=msgbus,
@@ -196,6 +356,7 @@ class HistoricInteractiveBrokersClient:
         instrument_ids: list[str] | None = None,
         use_rth: bool = True,
         timeout: int = 120,
+        catalog: ParquetDataCatalog | None = None,
     ) -> list[Bar]:
         """
         Return Bars for one or more bar specifications for a list of IBContracts and/or
@@ -224,6 +385,9 @@ class HistoricInteractiveBrokersClient:
             Whether to use regular trading hours.
         timeout : int, default '120'
             The timeout in seconds for each request.
+        catalog : ParquetDataCatalog, optional
+            The catalog to write the instruments and each completed bar series to. If
+            provided then the bars are not also retained in memory and returned.
 
         Returns
         -------
@@ -242,48 +406,111 @@ class HistoricInteractiveBrokersClient:
         )
 
         # Ensure instruments are fetched and cached
-        await self._fetch_instruments_if_not_cached(contracts)
-
-        data: list[Bar] = []
+        await self._fetch_instruments_if_not_cached(contracts, catalog)
 
+        segments = self._calculate_duration_segments(start_date_time, end_date_time, duration)
+        coros = []
         for contract in contracts:
+            instrument_id = ib_contract_to_instrument_id(contract)
             for bar_spec in bar_specifications:
-                instrument_id = ib_contract_to_instrument_id(contract)
                 bar_type = BarType(
                     instrument_id,
                     BarSpecification.from_str(bar_spec),
                     AggregationSource.EXTERNAL,
                 )
-
-                for segment_end_date_time, segment_duration in self._calculate_duration_segments(
-                    start_date_time,
-                    end_date_time,
-                    duration,
-                ):
-                    self.log.info(
-                        f"{instrument_id}: Requesting historical bars: {bar_type} ending on '{segment_end_date_time}' "
-                        f"with duration '{segment_duration}'",
-                    )
-
-                    bars = await self._client.get_historical_bars(
+                coros.append(
+                    self._request_bars_series(
                         bar_type,
                         contract,
+                        segments,
                         use_rth,
-                        segment_end_date_time,
-                        segment_duration,
-                        timeout=timeout,
-                    )
-                    if bars:
-                        self.log.info(
-                            f"{instrument_id}: Number of bars retrieved in batch: {len(bars)}",
-                        )
-                        data.extend(bars)
-                        self.log.info(f"Total number of bars in data: {len(data)}")
-                    else:
-                        self.log.info(f"{instrument_id}: No bars retrieved for: {bar_type}")
+                        timeout,
+                        catalog,
+                    ),
+                )
+
+        data: list[Bar] = []
+        for bars in await self._gather_all(coros):
+            data.extend(bars)
 
         return sorted(data, key=lambda x: x.ts_init)
 
+    async def _request_bars_series(
+        self,
+        bar_type: BarType,
+        contract: IBContract,
+        segments: list[tuple[pd.Timestamp, str]],
+        use_rth: bool,
+        timeout: int,
+        catalog: ParquetDataCatalog | None,
+    ) -> list[Bar]:
+        results = await self._gather_all(
+            [
+                self._request_bars_segment(
+                    bar_type,
+                    contract,
+                    use_rth,
+                    segment_end_date_time,
+                    segment_duration,
+                    timeout,
+                )
+                for segment_end_date_time, segment_duration in segments
+            ],
+        )
+        bars: list[Bar] = sorted((b for r in results for b in r), key=lambda x: x.ts_init)
+        self.log.info(f"{bar_type.instrument_id}: Total number of bars for {bar_type}: {len(bars)}")
+
+        if catalog is not None:
+            if bars:
+                catalog.write_data(bars)
+            return []
+
+        return bars
+
+    async def _request_bars_segment(
+        self,
+        bar_type: BarType,
+        contract: IBContract,
+        use_rth: bool,
+        segment_end_date_time: pd.Timestamp,
+        segment_duration: str,
+        timeout: int,
+    ) -> list[Bar]:
+        instrument_id = bar_type.instrument_id
+        key = f"bars|{bar_type}|{use_rth}|{segment_end_date_time.isoformat()}|{segment_duration}"
+        bars = self._segment_cache.get(key)
+        if bars is not None:
+            self.log.info(
+                f"{instrument_id}: Using cached bars: {bar_type} ending on '{segment_end_date_time}' "
+                f"with duration '{segment_duration}'",
+            )
+            return bars
+
+        contract_key = f"{instrument_id}|{bar_type.spec.price_type}"
+        async with self._pacer.request(contract_key, key):
+            self.log.info(
+                f"{instrument_id}: Requesting historical bars: {bar_type} ending on '{segment_end_date_time}' "
+                f"with duration '{segment_duration}'",
+            )
+            bars = await self._client.get_historical_bars(
+                bar_type,
+                contract,
+                use_rth,
+                segment_end_date_time,
+                segment_duration,
+                timeout=timeout,
+            )
+
+        if not bars:
+            # The client also returns no bars on a timeout or connection error,
+            # so an empty segment is not cached and will be requested again
+            self.log.warning(f"{instrument_id}: No bars retrieved for: {bar_type}")
+            return []
+
+        self.log.info(f"{instrument_id}: Number of bars retrieved in batch: {len(bars)}")
+        self._segment_cache.put(key, bars)
+        return bars
+
     async def request_ticks(
         self,
         tick_type: Literal["TRADES", "BID_ASK"],
@@ -294,6 +521,7 @@ class HistoricInteractiveBrokersClient:
         instrument_ids: list[str] | None = None,
         use_rth: bool = True,
         timeout: int = 60,
+        catalog: ParquetDataCatalog | None = None,
     ) -> list[TradeTick | QuoteTick]:
         """
         Return TradeTicks or QuoteTicks for one or more bar specifications for a list of
@@ -317,6 +545,9 @@ class HistoricInteractiveBrokersClient:
             Whether to use regular trading hours.
         timeout : int, default '60'
             The timeout in seconds for each request.
+        catalog : ParquetDataCatalog, optional
+            The catalog to write the instruments and each completed tick series to. If
+            provided then the ticks are not also retained in memory and returned.
 
         Returns
         -------
@@ -353,50 +584,137 @@ class HistoricInteractiveBrokersClient:
         )
 
         # Ensure instruments are fetched and cached
-        await self._fetch_instruments_if_not_cached(contracts)
+        await self._fetch_instruments_if_not_cached(contracts, catalog)
 
         data: list[TradeTick | QuoteTick] = []
-        for contract in contracts:
-            instrument_id = ib_contract_to_instrument_id(contract)
-            current_start_date_time = start_date_time
-            while True:
-                self.log.info(
-                    f"{instrument_id}: Requesting {tick_type} ticks from {current_start_date_time}",
+        results = await self._gather_all(
+            [
+                self._request_ticks_series(
+                    contract,
+                    tick_type,
+                    start_date_time,
+                    end_date_time,
+                    use_rth,
+                    timeout,
+                    catalog,
                 )
+                for contract in contracts
+            ],
+        )
+        for ticks in results:
+            data.extend(ticks)
 
-                ticks: list[TradeTick | QuoteTick] = await self._client.get_historical_ticks(
-                    contract=contract,
-                    tick_type=tick_type,
-                    start_date_time=current_start_date_time,
-                    use_rth=use_rth,
-                    timeout=timeout,
-                )
+        return sorted(data, key=lambda x: x.ts_init)
+
+    async def _request_ticks_series(
+        self,
+        contract: IBContract,
+        tick_type: Literal["TRADES", "BID_ASK"],
+        start_date_time: pd.Timestamp,
+        end_date_time: pd.Timestamp,
+        use_rth: bool,
+        timeout: int,
+        catalog: ParquetDataCatalog | None,
+    ) -> list[TradeTick | QuoteTick]:
+        # Each batch starts from the last timestamp of the previous, so batches for
+        # a single contract are requested sequentially
+        instrument_id = ib_contract_to_instrument_id(contract)
+        data: list[TradeTick | QuoteTick] = []
+        current_start_date_time = start_date_time
+        while True:
+            ticks = await self._request_ticks_batch(
+                contract,
+                instrument_id,
+                tick_type,
+                current_start_date_time,
+                use_rth,
+                timeout,
+            )
+
+            if not ticks:
+                break
 
-                if not ticks:
-                    break
+            current_start_date_time, should_continue = self._handle_timestamp_iteration(
+                ticks,
+                end_date_time,
+            )
 
+            if not should_continue:
+                # Filter out ticks that are after the end_date_time
+                ticks = [tick for tick in ticks if tick.ts_event <= dt_to_unix_nanos(end_date_time)]
+                data.extend(ticks)
                 self.log.info(
-                    f"{instrument_id}: Number of {tick_type} ticks retrieved in batch: {len(ticks)}",
+                    f"{instrument_id}: Total number of {tick_type} ticks in data: {len(data)}",
                 )
+                break
 
-                current_start_date_time, should_continue = self._handle_timestamp_iteration(
-                    ticks,
-                    end_date_time,
-                )
+            data.extend(ticks)
+            self.log.info(
+                f"{instrument_id}: Total number of {tick_type} ticks in data: {len(data)}",
+            )
 
-                if not should_continue:
-                    # Filter out ticks that are after the end_date_time
-                    ticks = [
-                        tick for tick in ticks if tick.ts_event <= dt_to_unix_nanos(end_date_time)
-                    ]
-                    data.extend(ticks)
-                    self.log.info(f"Total number of {tick_type} ticks in data: {len(data)}")
-                    break
+        if catalog is not None:
+            if data:
+                catalog.write_data(data)
+            return []
 
-                data.extend(ticks)
-                self.log.info(f"Total number of {tick_type} ticks in data: {len(data)}")
+        return data
 
-        return sorted(data, key=lambda x: x.ts_init)
+    async def _request_ticks_batch(
+        self,
+        contract: IBContract,
+        instrument_id: InstrumentId,
+        tick_type: Literal["TRADES", "BID_ASK"],
+        start_date_time: pd.Timestamp,
+        use_rth: bool,
+        timeout: int,
+    ) -> list[TradeTick | QuoteTick]:
+        key = f"ticks|{instrument_id}|{tick_type}|{use_rth}|{start_date_time.isoformat()}"
+        ticks = self._segment_cache.get(key)
+        if ticks is not None:
+            self.log.info(
+                f"{instrument_id}: Using cached {tick_type} ticks from {start_date_time}",
+            )
+            return ticks
+
+        async with self._pacer.request(f"{instrument_id}|{tick_type}", key):
+            self.log.info(
+                f"{instrument_id}: Requesting {tick_type} ticks from {start_date_time}",
+            )
+            ticks = await self._client.get_historical_ticks(
+                contract=contract,
+                tick_type=tick_type,
+                start_date_time=start_date_time,
+                use_rth=use_rth,
+                timeout=timeout,
+            )
+
+        if ticks is None:
+            # Timed out or failed, completed batches remain cached for a retry
+            raise RuntimeError(
+                f"{instrument_id}: Failed to retrieve {tick_type} ticks from {start_date_time}",
+            )
+
+        if not ticks:
+            # An empty batch may be the live edge or a transient reply,
+            # so it is not cached and will be requested again
+            return ticks
+
+        self.log.info(
+            f"{instrument_id}: Number of {tick_type} ticks retrieved in batch: {len(ticks)}",
+        )
+        self._segment_cache.put(key, ticks)
+        return ticks
+
+    async def _gather_all(self, coros: list) -> list:
+        # Let every request run to completion (so completed segments are cached)
+        # before raising the first error
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        return results
 
     def _handle_timestamp_iteration(
         self,
@@ -436,7 +754,11 @@ class HistoricInteractiveBrokersClient:
 
         return max_timestamp, True
 
-    async def _fetch_instruments_if_not_cached(self, contracts: list[IBContract]) -> None:
+    async def _fetch_instruments_if_not_cached(
+        self,
+        contracts: list[IBContract],
+        catalog: ParquetDataCatalog | None = None,
+    ) -> None:
         """
         Fetch and cache Instruments for the given IBContracts if they are not already
         cached.
@@ -445,6 +767,8 @@ class HistoricInteractiveBrokersClient:
         ----------
         contracts : list[IBContract]
             A list of IBContracts to fetch Instruments for.
+        catalog : ParquetDataCatalog, optional
+            The catalog to also write the instruments to.
 
         Returns
         -------
@@ -457,6 +781,13 @@ class HistoricInteractiveBrokersClient:
                 self.log.info(f"Fetching Instrument for: {instrument_id}")
                 await self.request_instruments(contracts=[contract])
 
+        if catalog is not None:
+            instruments = [
+                self._client._cache.instrument(ib_contract_to_instrument_id(contract))
+                for contract in contracts
+            ]
+            catalog.write_data([i for i in instruments if i is not None])
+
     def _calculate_duration_segments(
         self,
         start_date: pd.Timestamp | None,
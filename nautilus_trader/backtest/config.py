@@ -24,6 +24,7 @@ from nautilus_trader.common import Environment
 from nautilus_trader.common.config import ActorConfig
 from nautilus_trader.common.config import ImportableActorConfig
 from nautilus_trader.common.config import NautilusConfig
+from nautilus_trader.common.config import PositiveInt
 from nautilus_trader.common.config import resolve_path
 from nautilus_trader.core.datetime import dt_to_unix_nanos
 from nautilus_trader.data.config import DataEngineConfig
@@ -288,6 +289,20 @@ class BacktestEngineConfig(NautilusKernelConfig, frozen=True):
         If logging should be bypassed.
     run_analysis : bool, default True
         If post backtest performance analysis should be run.
+    profile : bool, default False
+        If per-stage timings (venue processing, data engine processing, message bus
+        handler dispatch and time event callbacks) should be recorded and reported
+        at the end of the run.
+    profile_sample_interval : PositiveInt, default 1
+        The interval (in main loop iterations) between profiled iterations,
+        larger values reduce the instrumentation overhead.
+    deterministic_uuids : bool, default False
+        If `UUID4` values (such as event and command IDs) should be generated
+        deterministically from a counter rather than randomly. This is faster and
+        makes runs reproducible, values are only unique within the process. Each
+        engine generates its own sequence (seeded by engine creation order in the
+        process) only while it is building, running, ending or resetting, and a
+        `reset()` restarts the sequence so a rerun generates the same values.
 
     """
 
@@ -297,6 +312,9 @@ class BacktestEngineConfig(NautilusKernelConfig, frozen=True):
     risk_engine: RiskEngineConfig = RiskEngineConfig()
     exec_engine: ExecEngineConfig = ExecEngineConfig()
     run_analysis: bool = True
+    profile: bool = False
+    profile_sample_interval: PositiveInt = 1
+    deterministic_uuids: bool = False
 
 
 class BacktestRunConfig(NautilusConfig, frozen=True):
@@ -0,0 +1,51 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.data cimport Data
+
+
+cdef class CompactDataSegment:
+    cdef object _ts_inits
+    cdef object _tags
+    cdef list _buffers
+    cdef list _objects
+    cdef list _paths
+    cdef uint64_t* _ts_inits_ptr
+    cdef uint8_t* _tags_ptr
+    cdef uint8_t* _buffer_ptrs[6]
+
+    cdef readonly uint64_t size
+    """The number of data elements in the segment.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t nbytes
+    """The number of bytes held by the segments compact buffers.\n\n:returns: `uint64_t`"""
+
+    cdef Data next_c(self, uint64_t* cursor)
+    cdef uint64_t ts_init_at_c(self, uint64_t index)
+    cdef void unlink_files_c(self)
+
+
+cdef class CompactDataStream:
+    cdef list _segments
+    cdef object _directory
+
+    cdef readonly uint64_t chunk_size
+    """The number of data elements materialized per chunk.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t size
+    """The total number of data elements in the stream.\n\n:returns: `uint64_t`"""
+
+    cdef void _unlink_segment_files(self)
@@ -0,0 +1,420 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import heapq
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.data cimport Data
+from nautilus_trader.core.rust.model cimport Bar_t
+from nautilus_trader.core.rust.model cimport OrderBookDelta_t
+from nautilus_trader.core.rust.model cimport OrderBookDepth10_t
+from nautilus_trader.core.rust.model cimport QuoteTick_t
+from nautilus_trader.core.rust.model cimport TradeTick_t
+from nautilus_trader.model.data cimport Bar
+from nautilus_trader.model.data cimport OrderBookDelta
+from nautilus_trader.model.data cimport OrderBookDepth10
+from nautilus_trader.model.data cimport QuoteTick
+from nautilus_trader.model.data cimport TradeTick
+
+
+cdef enum CompactTag:
+    TAG_OBJECT = 0
+    TAG_QUOTE = 1
+    TAG_TRADE = 2
+    TAG_BAR = 3
+    TAG_DELTA = 4
+    TAG_DEPTH10 = 5
+
+
+cdef int TAG_COUNT = 6
+
+
+cdef inline uint8_t _tag(Data data):
+    # Exact type checks, as subclasses may carry state beyond the underlying struct
+    if type(data) is QuoteTick:
+        return TAG_QUOTE
+    elif type(data) is TradeTick:
+        return TAG_TRADE
+    elif type(data) is Bar:
+        return TAG_BAR
+    elif type(data) is OrderBookDelta:
+        return TAG_DELTA
+    elif type(data) is OrderBookDepth10:
+        return TAG_DEPTH10
+    else:
+        return TAG_OBJECT
+
+
+cdef inline size_t _item_size(uint8_t tag):
+    if tag == TAG_QUOTE:
+        return sizeof(QuoteTick_t)
+    elif tag == TAG_TRADE:
+        return sizeof(TradeTick_t)
+    elif tag == TAG_BAR:
+        return sizeof(Bar_t)
+    elif tag == TAG_DELTA:
+        return sizeof(OrderBookDelta_t)
+    elif tag == TAG_DEPTH10:
+        return sizeof(OrderBookDepth10_t)
+    else:
+        return 0
+
+
+cdef inline uint8_t* _buffer_ptr(object buffer):
+    cdef uint8_t[:, ::1] view
+    if buffer is None:
+        return NULL
+    view = buffer
+    return &view[0, 0]
+
+
+cdef object _allocate(object directory, str name, tuple shape, object dtype, list paths):
+    if directory is None:
+        return np.empty(shape, dtype=dtype)
+
+    # Unique file per buffer, so a file still mapped by another segment is never truncated
+    fd, path = tempfile.mkstemp(prefix=f"{name}-", suffix=".bin", dir=directory)
+    os.close(fd)
+    paths.append(path)
+    return np.memmap(path, dtype=dtype, mode="w+", shape=shape)
+
+
+cdef class CompactDataSegment:
+    """
+    Provides a time ordered segment of data held in compact form.
+
+    `QuoteTick`, `TradeTick`, `Bar`, `OrderBookDelta` and `OrderBookDepth10` data
+    are held as contiguous arrays of their underlying structs (one array per type),
+    alongside arrays of the `ts_init` and type of each element in stream order.
+    All other data are held as objects.
+
+    Parameters
+    ----------
+    data : list[Data]
+        The data for the segment, already sorted by `ts_init`.
+    directory : str or Path, optional
+        The directory for memory-mapped buffers. If None then buffers are held in memory.
+        The buffer files are deleted when the segment is deallocated.
+    name : str, default 'segment'
+        The name prefix for the segments memory-mapped buffer files (each file is
+        given a unique suffix).
+
+    Raises
+    ------
+    ValueError
+        If `data` is empty.
+
+    """
+
+    def __init__(
+        self,
+        list data not None,
+        directory=None,
+        str name = "segment",
+    ) -> None:
+        Condition.not_empty(data, "data")
+
+        self.size = len(data)
+        self._paths = []
+        self._ts_inits = _allocate(
+            directory,
+            f"{name}-ts-init",
+            (self.size,),
+            np.uint64,
+            self._paths,
+        )
+        self._tags = _allocate(directory, f"{name}-tags", (self.size,), np.uint8, self._paths)
+        self._buffers = [None] * TAG_COUNT
+        self._objects = []
+
+        cdef uint64_t[::1] ts_inits = self._ts_inits
+        cdef uint8_t[::1] tags = self._tags
+        cdef uint64_t counts[6]
+        cdef uint64_t i
+        cdef uint8_t tag
+        for tag in range(TAG_COUNT):
+            counts[tag] = 0
+
+        # Tag each element and count the elements of each type
+        cdef Data element
+        for i in range(self.size):
+            element = data[i]
+            tag = _tag(element)
+            tags[i] = tag
+            ts_inits[i] = element.ts_init
+            counts[tag] += 1
+
+        self.nbytes = self.size * (sizeof(uint64_t) + sizeof(uint8_t))
+        for tag in range(1, TAG_COUNT):
+            if counts[tag] == 0:
+                continue
+            self._buffers[tag] = _allocate(
+                directory,
+                f"{name}-{tag}",
+                (counts[tag], _item_size(tag)),
+                np.uint8,
+                self._paths,
+            )
+            self._buffer_ptrs[tag] = _buffer_ptr(self._buffers[tag])
+            self.nbytes += counts[tag] * _item_size(tag)
+
+        self._ts_inits_ptr = &ts_inits[0]
+        self._tags_ptr = &tags[0]
+
+        # Copy the underlying structs into the type buffers in stream order
+        cdef uint64_t pos[6]
+        for tag in range(TAG_COUNT):
+            pos[tag] = 0
+
+        for i in range(self.size):
+            element = data[i]
+            tag = tags[i]
+            if tag == TAG_QUOTE:
+                (<QuoteTick_t*>self._buffer_ptrs[tag])[pos[tag]] = (<QuoteTick>element)._mem
+            elif tag == TAG_TRADE:
+                (<TradeTick_t*>self._buffer_ptrs[tag])[pos[tag]] = (<TradeTick>element)._mem
+            elif tag == TAG_BAR:
+                (<Bar_t*>self._buffer_ptrs[tag])[pos[tag]] = (<Bar>element)._mem
+            elif tag == TAG_DELTA:
+                (<OrderBookDelta_t*>self._buffer_ptrs[tag])[pos[tag]] = (<OrderBookDelta>element)._mem
+            elif tag == TAG_DEPTH10:
+                (<OrderBookDepth10_t*>self._buffer_ptrs[tag])[pos[tag]] = (<OrderBookDepth10>element)._mem
+            else:
+                self._objects.append(element)
+            pos[tag] += 1
+
+    def __dealloc__(self) -> None:
+        if self._paths:
+            self.unlink_files_c()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(size={self.size}, nbytes={self.nbytes})"
+
+    cdef void unlink_files_c(self):
+        # Existing mappings remain valid until released, so the files can be
+        # removed while the segment is still being iterated
+        for path in self._paths:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass  # Already removed (or still open on platforms without unlink semantics)
+        self._paths = []
+
+    cdef uint64_t ts_init_at_c(self, uint64_t index):
+        return self._ts_inits_ptr[index]
+
+    cdef Data next_c(self, uint64_t* cursor):
+        # The cursor holds the next element index, followed by the next position for each tag
+        cdef uint64_t index = cursor[0]
+        if index >= self.size:
+            return None
+
+        cdef uint8_t tag = self._tags_ptr[index]
+        cdef uint64_t pos = cursor[tag + 1]
+        cursor[0] = index + 1
+        cursor[tag + 1] = pos + 1
+
+        if tag == TAG_QUOTE:
+            return QuoteTick.from_mem_c((<QuoteTick_t*>self._buffer_ptrs[tag])[pos])
+        elif tag == TAG_TRADE:
+            return TradeTick.from_mem_c((<TradeTick_t*>self._buffer_ptrs[tag])[pos])
+        elif tag == TAG_BAR:
+            return Bar.from_mem_c((<Bar_t*>self._buffer_ptrs[tag])[pos])
+        elif tag == TAG_DELTA:
+            return OrderBookDelta.from_mem_c((<OrderBookDelta_t*>self._buffer_ptrs[tag])[pos])
+        elif tag == TAG_DEPTH10:
+            return OrderBookDepth10.from_mem_c((<OrderBookDepth10_t*>self._buffer_ptrs[tag])[pos])
+        else:
+            return self._objects[pos]
+
+
+cdef class CompactDataStream:
+    """
+    Provides a compact data stream for a `BacktestEngine`.
+
+    Data are held in compact form as per type arrays of their underlying structs
+    (see `CompactDataSegment`), optionally memory-mapped to files, and data objects
+    are only materialized chunk by chunk as the stream is iterated. Pass the stream
+    to `BacktestEngine.add_data_iterator` so objects are created as the main backtest
+    loop reaches them, rather than holding every data object in memory for the run.
+
+    Each call to `add` creates a new segment, and segments are merged by `ts_init`
+    during iteration (data with equal `ts_init` are yielded in the order they were
+    added, matching a stable sort of all added data).
+
+    Parameters
+    ----------
+    chunk_size : int, default 10_000
+        The number of data elements to materialize per chunk (> 0).
+    directory : str or Path, optional
+        The directory for memory-mapped buffers. If None then buffers are held in memory.
+        The buffer files are deleted when the stream is cleared or deallocated.
+
+    Raises
+    ------
+    ValueError
+        If `chunk_size` is not positive (> 0).
+
+    Warnings
+    --------
+    Memory-mapped buffers hold process local pointers (for interned identifiers),
+    so the files are only valid as scratch space for the process which created them.
+
+    """
+
+    def __init__(
+        self,
+        int chunk_size = 10_000,
+        directory=None,
+    ) -> None:
+        Condition.positive_int(chunk_size, "chunk_size")
+
+        if directory is not None:
+            directory = Path(directory)
+            directory.mkdir(parents=True, exist_ok=True)
+
+        self.chunk_size = chunk_size
+        self.size = 0
+        self._segments = []
+        self._directory = directory
+
+    def __dealloc__(self) -> None:
+        self._unlink_segment_files()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"size={self.size}, "
+            f"segments={len(self._segments)}, "
+            f"nbytes={self.nbytes})"
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Return the number of bytes held by the streams compact buffers.
+
+        Returns
+        -------
+        int
+
+        """
+        cdef uint64_t nbytes = 0
+        cdef CompactDataSegment segment
+        for segment in self._segments:
+            nbytes += segment.nbytes
+        return nbytes
+
+    def add(self, list data not None, bint sort = True) -> None:
+        """
+        Add the given data to the stream as a new compact segment.
+
+        Parameters
+        ----------
+        data : list[Data]
+            The data to add.
+        sort : bool, default True
+            If the data should be sorted by `ts_init`. If False then the data must
+            already be sorted.
+
+        Raises
+        ------
+        ValueError
+            If `data` is empty.
+
+        """
+        Condition.not_empty(data, "data")
+
+        if sort:
+            data = sorted(data, key=lambda x: x.ts_init)
+
+        cdef CompactDataSegment segment = CompactDataSegment(
+            data=data,
+            directory=self._directory,
+            name=f"segment-{len(self._segments)}",
+        )
+        self._segments.append(segment)
+        self.size += segment.size
+
+    def clear(self) -> None:
+        """
+        Clear all data from the stream.
+
+        Any memory-mapped buffer files are deleted.
+        """
+        self._unlink_segment_files()
+        self._segments = []
+        self.size = 0
+
+    cdef void _unlink_segment_files(self):
+        if self._segments is None:
+            return
+
+        cdef CompactDataSegment segment
+        for segment in self._segments:
+            segment.unlink_files_c()
+
+    def __iter__(self):
+        cdef list segments = list(self._segments)
+        cdef int count = len(segments)
+        cdef uint64_t chunk_size = self.chunk_size
+        if count == 0:
+            return
+
+        cursors = np.zeros((count, TAG_COUNT + 1), dtype=np.uint64)
+        cdef uint64_t[:, ::1] cursors_view = cursors
+        cdef CompactDataSegment segment
+
+        # Heap of the next `ts_init` for each segment, ties go to the earliest segment
+        cdef list heap = []
+        cdef int selected
+        for selected in range(count):
+            segment = segments[selected]
+            heap.append((segment.ts_init_at_c(0), selected))
+        heapq.heapify(heap)
+
+        cdef list chunk = []
+        cdef uint64_t index
+        while heap:
+            selected = heap[0][1]
+            segment = segments[selected]
+            chunk.append(segment.next_c(&cursors_view[selected, 0]))
+
+            index = cursors_view[selected, 0]
+            if index < segment.size:
+                heapq.heapreplace(heap, (segment.ts_init_at_c(index), selected))
+            else:
+                heapq.heappop(heap)  # Segment exhausted
+
+            if <uint64_t>len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+
+        if chunk:
+            yield chunk
@@ -22,6 +22,7 @@ from nautilus_trader.common.component cimport Logger
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.rust.backtest cimport TimeEventAccumulatorAPI
 from nautilus_trader.core.rust.core cimport CVec
+from nautilus_trader.core.uuid cimport DeterministicUUIDScope
 from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.data.engine cimport DataEngine
 
@@ -35,6 +36,9 @@ cdef class BacktestEngine:
     cdef object _kernel
     cdef UUID4 _instance_id
     cdef DataEngine _data_engine
+    cdef object _profiler
+    cdef DeterministicUUIDScope _uuid_scope
+    cdef uint64_t _uuid_reset_count
     cdef str _run_config_id
     cdef UUID4 _run_id
     cdef datetime _run_started
@@ -44,7 +48,9 @@ cdef class BacktestEngine:
 
     cdef dict[Venue, SimulatedExchange] _venues
     cdef list[Data] _data
+    cdef object _data_iterator
     cdef uint64_t _data_len
+    cdef uint64_t _data_offset
     cdef uint64_t _index
     cdef uint64_t _iteration
 
@@ -14,11 +14,14 @@
 # -------------------------------------------------------------------------------------------------
 
 import pickle
+from contextlib import nullcontext
 from decimal import Decimal
+from time import perf_counter_ns
 
 import pandas as pd
 
 from nautilus_trader.accounting.error import AccountError
+from nautilus_trader.backtest.profiling import BacktestProfiler
 from nautilus_trader.backtest.results import BacktestResult
 from nautilus_trader.common import Environment
 from nautilus_trader.common.component import is_logging_pyo3
@@ -35,6 +38,8 @@ from nautilus_trader.trading.trader import Trader
 
 from cpython.datetime cimport datetime
 from cpython.object cimport PyObject
+from libc.stdint cimport UINT64_MAX
+from libc.stdint cimport uint32_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.backtest.data_client cimport BacktestDataClient
@@ -76,6 +81,7 @@ from nautilus_trader.core.rust.model cimport AccountType
 from nautilus_trader.core.rust.model cimport AggregationSource
 from nautilus_trader.core.rust.model cimport BookType
 from nautilus_trader.core.rust.model cimport OmsType
+from nautilus_trader.core.uuid cimport DeterministicUUIDScope
 from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.execution.algorithm cimport ExecAlgorithm
 from nautilus_trader.model.data cimport Bar
@@ -98,6 +104,16 @@ from nautilus_trader.portfolio.base cimport PortfolioFacade
 from nautilus_trader.trading.strategy cimport Strategy
 
 
+# Seeds each engines deterministic UUID scope, so engines in the same process never collide
+cdef uint32_t _UUID_SCOPE_SEED = 0
+
+
+cdef uint32_t _next_uuid_scope_seed():
+    global _UUID_SCOPE_SEED
+    _UUID_SCOPE_SEED += 1
+    return _UUID_SCOPE_SEED
+
+
 cdef class BacktestEngine:
     """
     Provides a backtest engine to run a portfolio of strategies over historical
@@ -121,6 +137,10 @@ cdef class BacktestEngine:
 
         self._config: BacktestEngineConfig  = config
 
+        self._uuid_scope = None
+        if config.deterministic_uuids:
+            self._uuid_scope = DeterministicUUIDScope(seed=_next_uuid_scope_seed())
+
         # Set up components
         self._accumulator = <TimeEventAccumulatorAPI>time_event_accumulator_new()
 
@@ -131,7 +151,9 @@ cdef class BacktestEngine:
         # Venues and data
         self._venues: dict[Venue, SimulatedExchange] = {}
         self._data: list[Data] = []
+        self._data_iterator = None
         self._data_len: uint64_t = 0
+        self._data_offset: uint64_t = 0
         self._index: uint64_t = 0
         self._iteration: uint64_t = 0
 
@@ -142,12 +164,21 @@ cdef class BacktestEngine:
         self._backtest_end: datetime | None = None
 
         # Build core system kernel
-        self._kernel = NautilusKernel(name=type(self).__name__, config=config)
+        with self._deterministic_uuids():
+            self._kernel = NautilusKernel(name=type(self).__name__, config=config)
+        if self._uuid_scope is not None:
+            self._uuid_reset_count = self._uuid_scope.count
         self._instance_id = self._kernel.instance_id
         self._log = Logger(type(self).__name__)
 
         self._data_engine: DataEngine = self._kernel.data_engine
 
+        # Profiling (opt-in)
+        self._profiler: BacktestProfiler | None = None
+        if config.profile:
+            self._profiler = BacktestProfiler(config.profile_sample_interval)
+            self._kernel.msgbus.set_profiler(self._profiler)
+
     def __del__(self) -> None:
         if self._accumulator._0 != NULL:
             time_event_accumulator_drop(self._accumulator)
@@ -214,6 +245,18 @@ cdef class BacktestEngine:
         """
         return self._log
 
+    @property
+    def profiler(self) -> BacktestProfiler | None:
+        """
+        Return the profiler for the engine (if profiling is enabled).
+
+        Returns
+        -------
+        BacktestProfiler or ``None``
+
+        """
+        return self._profiler
+
     @property
     def run_config_id(self) -> str:
         """
@@ -617,6 +660,10 @@ cdef class BacktestEngine:
         """
         Condition.not_empty(data, "data")
         Condition.list_type(data, Data, "data")
+        Condition.is_true(
+            self._data_iterator is None,
+            "Cannot add data to an engine with a data iterator, call `clear_data()` first",
+        )
 
         if isinstance(data[0], NAUTILUS_PYO3_DATA_TYPES):
             raise TypeError(
@@ -668,6 +715,51 @@ cdef class BacktestEngine:
             f"Added {len(data):_} {data_added_str} element{'' if len(data) == 1 else 's'}",
         )
 
+    def add_data_iterator(self, data, ClientId client_id = None) -> None:
+        """
+        Add the given iterator of time ordered data chunks as the engines data stream.
+
+        Chunks are pulled lazily as the main backtest loop reaches them, so the full
+        stream is never held in memory at once. Chunks are used directly as the
+        stream, without validation, copying or sorting.
+
+        Parameters
+        ----------
+        data : Iterable[list[Data]]
+            The data chunks. Each chunk must be a list sorted by `ts_init`, and the
+            chunks must be in `ts_init` order with respect to each other. A
+            `CompactDataStream` can be used to hold large datasets in compact form.
+        client_id : ClientId, optional
+            The data client ID to register for custom data in the stream.
+
+        Raises
+        ------
+        ValueError
+            If data has already been added to the engine.
+
+        Warnings
+        --------
+        The iterator is consumed in a single pass, and is cleared on `reset()`.
+        Instruments for all data in the stream must be added to the engine prior to running.
+
+        Data earlier than the last data of the previous chunk raises a `ValueError`
+        when its chunk is reached, other ordering within a chunk is not checked.
+
+        """
+        Condition.not_none(data, "data")
+        Condition.is_true(
+            not self._data and self._data_iterator is None,
+            "Data already added to the engine, call `clear_data()` first",
+        )
+
+        if client_id is not None:
+            # Check client has been registered
+            self._add_data_client_if_not_exists(client_id)
+
+        self._data_iterator = iter(data)
+
+        self._log.info("Added data iterator")
+
     def dump_pickled_data(self) -> bytes:
         """
         Return the internal data stream pickled.
@@ -789,11 +881,22 @@ cdef class BacktestEngine:
         All stateful fields are reset to their initial value.
 
         Note: instruments and data are not dropped/reset, this can be done through a
-        separate call to `.clear_data()` if desired.
+        separate call to `.clear_data()` if desired. A data iterator added with
+        `.add_data_iterator()` is cleared, as it cannot be replayed.
 
         """
         self._log.debug(f"Resetting")
 
+        with self._deterministic_uuids():
+            self._reset()
+
+        if self._uuid_scope is not None:
+            # Restart the sequence so a rerun generates the same values
+            self._uuid_scope.count = self._uuid_reset_count
+
+        self._log.info("Reset")
+
+    def _reset(self) -> None:
         if self.kernel.trader.is_running:
             # End current backtest run
             self.end()
@@ -827,15 +930,24 @@ cdef class BacktestEngine:
         self._run_config_id = None
         self._run_id = None
 
+        if self._data_iterator is not None:
+            # An iterator is consumed in a single pass, so cannot be replayed from the start
+            self._data = []
+            self._data_iterator = None
+            self._data_len = 0
+            self._log.warning("Data iterator cleared on reset, add a new iterator before running")
+
         # Reset timing
         self._iteration = 0
         self._index = 0
+        self._data_offset = 0
         self._run_started = None
         self._run_finished = None
         self._backtest_start = None
         self._backtest_end = None
 
-        self._log.info("Reset")
+        if self._profiler is not None:
+            self._profiler.reset()
 
     def clear_data(self) -> None:
         """
@@ -844,8 +956,14 @@ cdef class BacktestEngine:
         Does not clear added instruments.
 
         """
-        self._data.clear()
+        if self._data_iterator is None:
+            self._data.clear()
+        else:
+            # Do not mutate the chunk owned by the caller
+            self._data = []
+            self._data_iterator = None
         self._data_len = 0
+        self._data_offset = 0
         self._index = 0
 
     def clear_actors(self) -> None:
@@ -902,6 +1020,11 @@ cdef class BacktestEngine:
          - Add next batch of data stream.
          - Call either `run(streaming=False)` or `end()`. When there is no more data to run on.
 
+        Alternatively, an iterator of time ordered data chunks can be added through
+        `add_data_iterator()`, which is then consumed lazily by a single call to `run()`.
+        If the data iterator yields no data then there is nothing to run, and a warning
+        is logged before the backtest is ended as normal.
+
         Parameters
         ----------
         start : datetime or str or int, optional
@@ -924,9 +1047,10 @@ cdef class BacktestEngine:
             If the `start` is >= the `end` datetime.
 
         """
-        self._run(start, end, run_config_id)
-        if not streaming:
-            self.end()
+        with self._deterministic_uuids():
+            self._run(start, end, run_config_id)
+            if not streaming:
+                self.end()
 
     def end(self):
         """
@@ -937,6 +1061,10 @@ cdef class BacktestEngine:
         Only required if you have previously been running with streaming.
 
         """
+        with self._deterministic_uuids():
+            self._end()
+
+    def _end(self) -> None:
         if self.kernel.trader.is_running:
             self.kernel.trader.stop()
         if self.kernel.data_engine.is_running:
@@ -988,7 +1116,7 @@ cdef class BacktestEngine:
             backtest_start=maybe_dt_to_unix_nanos(self._backtest_start),
             backtest_end=maybe_dt_to_unix_nanos(self._backtest_end),
             elapsed_time=(self._backtest_end - self._backtest_start).total_seconds(),
-            iterations=self._index,
+            iterations=self._data_offset + self._index,
             total_events=self._kernel.exec_engine.event_count,
             total_orders=self._kernel.cache.orders_total_count(),
             total_positions=self._kernel.cache.positions_total_count(),
@@ -996,23 +1124,42 @@ cdef class BacktestEngine:
             stats_returns=self._kernel.portfolio.analyzer.get_performance_stats_returns(),
         )
 
+    def _deterministic_uuids(self):
+        # Scopes UUID generation to the engines own deterministic sequence (if enabled)
+        return self._uuid_scope if self._uuid_scope is not None else nullcontext()
+
     def _run(
         self,
         start: datetime | str | int | None = None,
         end: datetime | str | int | None = None,
         run_config_id: str | None = None,
     ):
+        cdef bint iterating = self._data_iterator is not None
+        cdef Data data = None
+        if iterating:
+            # Pull the next chunk if required, without consuming its first data
+            data = self._next()
+            if data is None:
+                # Nothing to run (the caller still ends the backtest as normal)
+                self._log.warning("No data remaining in the data iterator, nothing to run")
+                self._data_iterator = None
+                return
+            self._index -= 1
+
         cdef uint64_t start_ns
         cdef uint64_t end_ns
         # Time range check and set
         if start is None:
             # Set `start` to start of data
-            start_ns = self._data[0].ts_init
+            start_ns = data.ts_init if iterating else self._data[0].ts_init
             start = unix_nanos_to_dt(start_ns)
         else:
             start = pd.to_datetime(start, utc=True)
             start_ns = start.value
-        if end is None:
+        if end is None and iterating:
+            # Run until the data iterator is exhausted
+            end_ns = UINT64_MAX
+        elif end is None:
             # Set `end` to end of data
             end_ns = self._data[-1].ts_init
             end = unix_nanos_to_dt(end_ns)
@@ -1060,35 +1207,53 @@ cdef class BacktestEngine:
             set_logging_clock_static_time(start_ns)
             self._log_pre_run()
 
-        self._log_run(start, end)
-
-        # Set data stream length
-        self._data_len = len(self._data)
+        self._log_run(start, "until data iterator exhausted" if end is None else end)
 
-        # Set starting index
         cdef uint64_t i
-        for i in range(self._data_len):
-            if start_ns <= self._data[i].ts_init:
-                self._index = i
-                break
+        if iterating:
+            # Skip data prior to `start` (chunks are pulled as required)
+            data = self._next()
+            while data is not None and data.ts_init < start_ns:
+                data = self._next()
+        else:
+            # Set data stream length
+            self._data_len = len(self._data)
+
+            # Set starting index
+            for i in range(self._data_len):
+                if start_ns <= self._data[i].ts_init:
+                    self._index = i
+                    break
+
+            data = self._next()
 
         # -- MAIN BACKTEST LOOP -----------------------------------------------#
         cdef bint force_stop = False
+        cdef bint profiling = self._profiler is not None
+        cdef bint sampled = False
+        cdef uint64_t ts_stage = 0
         cdef uint64_t last_ns = 0
         cdef uint64_t raw_handlers_count = 0
-        cdef Data data = self._next()
         cdef CVec raw_handlers
         cdef SimulatedExchange venue
         try:
             while data is not None:
                 if data.ts_init > end_ns:
                     # End of backtest
+                    if iterating:
+                        # Leave the data for the next run
+                        self._index -= 1
                     break
+                if profiling:
+                    sampled = self._profiler.begin_iteration(self._iteration)
                 if data.ts_init > last_ns:
                     # Advance clocks to the next data time
                     raw_handlers = self._advance_time(data.ts_init)
                     raw_handlers_count = raw_handlers.len
 
+                if sampled:
+                    ts_stage = perf_counter_ns()
+
                 # Process data through venue
                 if isinstance(data, OrderBookDelta):
                     venue = self._venues[data.instrument_id.venue]
@@ -1112,12 +1277,23 @@ cdef class BacktestEngine:
                     venue = self._venues[data.instrument_id.venue]
                     venue.process_instrument_status(data)
 
+                if sampled:
+                    self._profiler.record(BacktestProfiler.STAGE_EXCHANGE_DATA, perf_counter_ns() - ts_stage)
+                    ts_stage = perf_counter_ns()
+
                 self._data_engine.process(data)
 
+                if sampled:
+                    self._profiler.record(BacktestProfiler.STAGE_DATA_ENGINE, perf_counter_ns() - ts_stage)
+                    ts_stage = perf_counter_ns()
+
                 # Process all exchange messages
                 for exchange in self._venues.values():
                     exchange.process(data.ts_init)
 
+                if sampled:
+                    self._profiler.record(BacktestProfiler.STAGE_EXCHANGE_MESSAGES, perf_counter_ns() - ts_stage)
+
                 last_ns = data.ts_init
                 data = self._next()
                 if data is None or data.ts_init > last_ns:
@@ -1160,6 +1336,31 @@ cdef class BacktestEngine:
         if cursor < self._data_len:
             return self._data[cursor]
 
+        if self._data_iterator is None:
+            return None
+
+        # Pull the next chunk from the data iterator (skipping empty chunks)
+        cdef list chunk = next(self._data_iterator, None)
+        while chunk is not None and not chunk:
+            chunk = next(self._data_iterator, None)
+        if chunk is None:
+            return None  # Data iterator exhausted
+
+        cdef Data first = chunk[0]
+        if self._data_len > 0:
+            last_ts_init = self._data[self._data_len - 1].ts_init
+            if first.ts_init < last_ts_init:
+                raise ValueError(
+                    f"Data chunks not in `ts_init` order, "
+                    f"chunk started at {first.ts_init} before previous chunk end {last_ts_init}",
+                )
+
+        self._data_offset += self._data_len
+        self._data = chunk
+        self._data_len = len(chunk)
+        self._index = 1
+        return first
+
     cdef CVec _advance_time(self, uint64_t ts_now):
         cdef list[TestClock] clocks = get_component_clocks(self._instance_id)
 
@@ -1206,6 +1407,9 @@ cdef class BacktestEngine:
             PyObject *raw_callback
             object callback
             SimulatedExchange exchange
+            bint sampled = self._profiler is not None and self._profiler.sampling
+            uint64_t ts_start
+            uint64_t elapsed_ns
         for i in range(raw_handler_vec.len):
             raw_handler = <TimeEventHandler_t>raw_handlers[i]
             ts_event_init = raw_handler.event.ts_init
@@ -1222,7 +1426,14 @@ cdef class BacktestEngine:
             # Cast raw `PyObject *` to a `PyObject`
             raw_callback = <PyObject *>raw_handler.callback_ptr
             callback = <object>raw_callback
-            callback(event)
+            if sampled:
+                ts_start = perf_counter_ns()
+                callback(event)
+                elapsed_ns = perf_counter_ns() - ts_start
+                self._profiler.record(BacktestProfiler.STAGE_TIME_EVENTS, elapsed_ns)
+                self._profiler.record_handler(callback, elapsed_ns)
+            else:
+                callback(event)
 
             if ts_event_init != ts_last_init:
                 # Process exchange messages
@@ -1255,7 +1466,7 @@ cdef class BacktestEngine:
                 for b in account.starting_balances().values():
                     self._log.info(b.to_formatted_str())
 
-    def _log_run(self, start: pd.Timestamp, end: pd.Timestamp):
+    def _log_run(self, start: pd.Timestamp, end: pd.Timestamp | str):
         cdef str color = self._get_log_color_code()
 
         self._log.info(f"{color}=================================================================")
@@ -1269,6 +1480,32 @@ cdef class BacktestEngine:
         self._log.info(f"Batch end:      {end}")
         self._log.info(f"{color}-----------------------------------------------------------------")
 
+    def _log_profile(self):
+        cdef str color = self._get_log_color_code()
+        cdef dict report = self._profiler.report()
+
+        self._log.info(f"{color}=================================================================")
+        self._log.info(f"{color} BACKTEST PROFILE")
+        self._log.info(f"{color}=================================================================")
+        self._log.info(f"Sample interval:    {report['sample_interval']:_}")
+        self._log.info(f"Sampled iterations: {report['sampled_iterations']:_}")
+        self._log.info(f"{color}-----------------------------------------------------------------")
+        self._log.info("Stages:")
+        for name, stats in report["stages"].items():
+            self._log.info(self._format_profile_stats(name, stats))
+        self._log.info(f"{color}-----------------------------------------------------------------")
+        self._log.info("Handlers (inclusive):")
+        for name, stats in report["handlers"].items():
+            self._log.info(self._format_profile_stats(name, stats))
+
+    def _format_profile_stats(self, str name, dict stats) -> str:
+        return (
+            f"{name}: count={stats['count']:_}, "
+            f"total={stats['total_ns'] / 1_000_000:.3f}ms, "
+            f"mean={stats['mean_ns'] / 1_000:.3f}us, "
+            f"max={stats['max_ns'] / 1_000:.3f}us"
+        )
+
     def _log_post_run(self):
         if self._run_finished and self._run_started:
             elapsed_time = self._run_finished - self._run_started
@@ -1304,6 +1541,9 @@ cdef class BacktestEngine:
 
         self._log.info(f"Total positions: {len(positions):_}")
 
+        if self._profiler is not None:
+            self._log_profile()
+
         if not self._config.run_analysis:
             return
 
@@ -25,10 +25,10 @@ from nautilus_trader.backtest.models cimport FeeModel
 from nautilus_trader.backtest.models cimport FillModel
 from nautilus_trader.cache.base cimport CacheFacade
 from nautilus_trader.common.component cimport LogColor
+from nautilus_trader.common.component cimport LogLevel
 from nautilus_trader.common.component cimport Logger
 from nautilus_trader.common.component cimport MessageBus
 from nautilus_trader.common.component cimport TestClock
-from nautilus_trader.common.component cimport is_logging_initialized
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.datetime cimport format_iso8601
@@ -372,7 +372,7 @@ cdef class OrderMatchingEngine:
         """
         Condition.not_none(delta, "delta")
 
-        if is_logging_initialized():
+        if self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"Processing {repr(delta)}")
 
         if self.book_type in (BookType.L2_MBP, BookType.L3_MBO):
@@ -402,7 +402,7 @@ cdef class OrderMatchingEngine:
         """
         Condition.not_none(deltas, "deltas")
 
-        if is_logging_initialized():
+        if self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"Processing {repr(deltas)}")
 
         if self.book_type in (BookType.L2_MBP, BookType.L3_MBO):
@@ -434,7 +434,7 @@ cdef class OrderMatchingEngine:
         """
         Condition.not_none(tick, "tick")
 
-        if is_logging_initialized():
+        if self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"Processing {repr(tick)}")
 
         if self.book_type == BookType.L1_MBP:
@@ -456,7 +456,7 @@ cdef class OrderMatchingEngine:
         """
         Condition.not_none(tick, "tick")
 
-        if is_logging_initialized():
+        if self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"Processing {repr(tick)}")
 
         if self.book_type == BookType.L1_MBP:
@@ -508,7 +508,7 @@ cdef class OrderMatchingEngine:
             else:
                 return
 
-        if is_logging_initialized():
+        if self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"Processing {repr(bar)}")
 
         cdef PriceType price_type = bar_type.spec.price_type
@@ -1563,10 +1563,11 @@ cdef class OrderMatchingEngine:
         """
         cdef Quantity cached_filled_qty = self._cached_filled_qty.get(order.client_order_id)
         if cached_filled_qty is not None and cached_filled_qty._mem.raw >= order.quantity._mem.raw:
-            self._log.debug(
-                f"Ignoring fill as already filled pending application of events: "
-                f"{cached_filled_qty=}, {order.quantity=}, {order.filled_qty=}, {order.leaves_qty=}",
-            )
+            if self._log.is_enabled(LogLevel.DEBUG):
+                self._log.debug(
+                    f"Ignoring fill as already filled pending application of events: "
+                    f"{cached_filled_qty=}, {order.quantity=}, {order.filled_qty=}, {order.leaves_qty=}",
+                )
             return
 
         cdef PositionId venue_position_id = self._get_position_id(order)
@@ -1611,10 +1612,11 @@ cdef class OrderMatchingEngine:
 
         cdef Quantity cached_filled_qty = self._cached_filled_qty.get(order.client_order_id)
         if cached_filled_qty is not None and cached_filled_qty._mem.raw >= order.quantity._mem.raw:
-            self._log.debug(
-                f"Ignoring fill as already filled pending application of events: "
-                f"{cached_filled_qty=}, {order.quantity=}, {order.filled_qty=}, {order.leaves_qty=}",
-            )
+            if self._log.is_enabled(LogLevel.DEBUG):
+                self._log.debug(
+                    f"Ignoring fill as already filled pending application of events: "
+                    f"{cached_filled_qty=}, {order.quantity=}, {order.filled_qty=}, {order.leaves_qty=}",
+                )
             return
 
         cdef Price price = order.price
@@ -1712,7 +1714,7 @@ cdef class OrderMatchingEngine:
         if self.oms_type == OmsType.NETTING:
             venue_position_id = None  # No position IDs generated by the venue
 
-        if is_logging_initialized():
+        if self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(
                 f"Applying fills to {order}, "
                 f"venue_position_id={venue_position_id}, "
@@ -1925,10 +1927,11 @@ cdef class OrderMatchingEngine:
                         client_order_id=client_order_id,
                         strategy_id=child_order.strategy_id,
                     )
-                    self._log.debug(
-                        f"Indexed {repr(order.position_id)} "
-                        f"for {repr(child_order.client_order_id)}",
-                    )
+                    if self._log.is_enabled(LogLevel.DEBUG):
+                        self._log.debug(
+                            f"Indexed {repr(order.position_id)} "
+                            f"for {repr(child_order.client_order_id)}",
+                        )
                 if not child_order.is_open_c() or (child_order.status_c() == OrderStatus.PENDING_UPDATE and child_order._previous_status == OrderStatus.SUBMITTED):
                     self.process_order(
                         order=child_order,
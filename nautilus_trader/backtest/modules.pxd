@@ -13,7 +13,6 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from cpython.datetime cimport datetime
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.accounting.calculators cimport RolloverInterestCalculator
@@ -21,6 +20,7 @@ from nautilus_trader.backtest.exchange cimport SimulatedExchange
 from nautilus_trader.common.actor cimport Actor
 from nautilus_trader.common.component cimport Logger
 from nautilus_trader.core.data cimport Data
+from nautilus_trader.model.instruments.base cimport Instrument
 
 
 cdef class SimulationModule(Actor):
@@ -36,9 +36,11 @@ cdef class SimulationModule(Actor):
 cdef class FXRolloverInterestModule(SimulationModule):
     cdef RolloverInterestCalculator _calculator
     cdef object _rollover_spread
-    cdef datetime _rollover_time
-    cdef bint _rollover_applied
-    cdef dict _rollover_totals
-    cdef int _day_number
-
-    cdef void _apply_rollover_interest(self, datetime timestamp, int iso_week_day)
+    cdef uint64_t _rollover_time_ns
+    cdef int _rollover_iso_week_day
+    cdef readonly dict _rollover_totals
+    """The rollover interest totals applied per currency.\n\n:returns: `dict[Currency, Money]`"""
+
+    cdef void _update_rollover_time(self, uint64_t ts_now, bint after_now)
+    cdef double _mid_price(self, Instrument instrument)
+    cdef void _apply_rollover_interest(self, uint64_t ts_now, int iso_week_day)
@@ -22,6 +22,7 @@ from nautilus_trader.backtest.config import SimulationModuleConfig
 from nautilus_trader.common.config import ActorConfig
 
 from cpython.datetime cimport datetime
+from cpython.datetime cimport timedelta
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.accounting.calculators cimport RolloverInterestCalculator
@@ -106,10 +107,9 @@ cdef class FXRolloverInterestModule(SimulationModule):
             rate_data = pd.read_json(msgspec.json.decode(rate_data))
 
         self._calculator = RolloverInterestCalculator(data=config.rate_data)
-        self._rollover_time = None  # Initialized at first rollover
-        self._rollover_applied = False
+        self._rollover_time_ns = 0  # Initialized at first process
+        self._rollover_iso_week_day = 0
         self._rollover_totals = {}
-        self._day_number = 0
 
     cpdef void process(self, uint64_t ts_now):
         """
@@ -121,61 +121,73 @@ cdef class FXRolloverInterestModule(SimulationModule):
             The current UNIX timestamp (nanoseconds) in the simulated exchange.
 
         """
-        cdef datetime now = pd.Timestamp(ts_now, tz="UTC")
-        cdef datetime rollover_local
-        if self._day_number != now.day:
-            # Set account statistics for new day
-            self._day_number = now.day
-            self._rollover_applied = False
-
-            rollover_local = now.astimezone(_TZ_US_EAST)
-            self._rollover_time = _TZ_US_EAST.localize(datetime(
-                rollover_local.year,
-                rollover_local.month,
-                rollover_local.day,
-                17),
-            ).astimezone(pytz.utc)
+        if self._rollover_time_ns == 0:
+            self._update_rollover_time(ts_now, after_now=False)
 
         # Check for and apply any rollover interest
-        if not self._rollover_applied and now >= self._rollover_time:
-            self._apply_rollover_interest(now, self._rollover_time.isoweekday())
-            self._rollover_applied = True
-
-    cdef void _apply_rollover_interest(self, datetime timestamp, int iso_week_day):
-        cdef list open_positions = self.exchange.cache.positions_open()
-
+        if ts_now >= self._rollover_time_ns:
+            self._apply_rollover_interest(ts_now, self._rollover_iso_week_day)
+            self._update_rollover_time(ts_now, after_now=True)
+
+    cdef void _update_rollover_time(self, uint64_t ts_now, bint after_now):
+        # Rollover occurs at 17:00 US/Eastern, computed once per rollover
+        # so that per tick checks are only integer comparisons.
+        cdef datetime now_local = pd.Timestamp(ts_now, tz=pytz.utc).astimezone(_TZ_US_EAST)
+        cdef datetime rollover = _TZ_US_EAST.localize(
+            datetime(now_local.year, now_local.month, now_local.day, 17),
+        )
+        cdef uint64_t rollover_ns = pd.Timestamp(rollover).value
+        if after_now and rollover_ns <= ts_now:
+            next_date = now_local.date() + timedelta(days=1)
+            rollover = _TZ_US_EAST.localize(
+                datetime(next_date.year, next_date.month, next_date.day, 17),
+            )
+            rollover_ns = pd.Timestamp(rollover).value
+
+        self._rollover_time_ns = rollover_ns
+        self._rollover_iso_week_day = rollover.isoweekday()
+
+    cdef double _mid_price(self, Instrument instrument):
+        cdef OrderBook book = self.exchange.get_book(instrument.id)
+        mid = book.midpoint()
+        if mid is None:
+            mid = book.best_bid_price()
+        if mid is None:
+            mid = book.best_ask_price()
+        if mid is None:  # pragma: no cover
+            raise RuntimeError("cannot apply rollover interest, no market prices")
+        return Price(float(mid), precision=instrument.price_precision).as_f64_c()
+
+    cdef void _apply_rollover_interest(self, uint64_t ts_now, int iso_week_day):
+        # Aggregate open position quantities per instrument, so market prices,
+        # interest rates and exchange rates are only computed once per instrument.
+        cdef dict quantities = {}  # type: dict[InstrumentId, float]
         cdef Position position
-        cdef Instrument instrument
-        cdef OrderBook book
-        cdef dict mid_prices = {}  # type: dict[InstrumentId, float]
-        cdef Currency currency
-        cdef double mid
-        cdef double rollover
-        cdef double xrate
-        cdef Money rollover_total
-        for position in open_positions:
-            instrument = self.exchange.instruments[position.instrument_id]
+        for position in self.exchange.cache.positions_open(venue=self.exchange.id):
+            quantities[position.instrument_id] = (
+                quantities.get(position.instrument_id, 0.0) + position.quantity.as_f64_c()
+            )
+
+        if not quantities:
+            return
+
+        cdef datetime timestamp = pd.Timestamp(ts_now, tz=pytz.utc)
+        cdef dict rollovers = {}  # type: dict[Currency, float]
+
+        cdef:
+            InstrumentId instrument_id
+            Instrument instrument
+            Currency currency
+            double quantity
+            double rollover
+            double xrate
+        for instrument_id, quantity in quantities.items():
+            instrument = self.exchange.instruments[instrument_id]
             if instrument.asset_class != AssetClass.FX:
                 continue  # Only applicable to FX
 
-            mid = mid_prices.get(instrument.id, 0.0)
-            if mid == 0.0:
-                book = self.exchange.get_book(instrument.id)
-                mid = book.midpoint()
-                if mid is None:
-                    mid = book.best_bid_price()
-                if mid is None:
-                    mid = book.best_ask_price()
-                if mid is None:  # pragma: no cover
-                    raise RuntimeError("cannot apply rollover interest, no market prices")
-                mid_prices[instrument.id] = Price(float(mid), precision=instrument.price_precision)
-
-            interest_rate = self._calculator.calc_overnight_rate(
-                position.instrument_id,
-                timestamp,
-            )
-
-            rollover = position.quantity.as_f64_c() * mid_prices[instrument.id] * float(interest_rate)
+            interest_rate = self._calculator.calc_overnight_rate(instrument_id, timestamp)
+            rollover = quantity * self._mid_price(instrument) * float(interest_rate)
 
             if iso_week_day == 3:  # Book triple for Wednesdays
                 rollover *= 3
@@ -185,7 +197,7 @@ cdef class FXRolloverInterestModule(SimulationModule):
             if self.exchange.base_currency is not None:
                 currency = self.exchange.base_currency
                 xrate = self.exchange.cache.get_xrate(
-                    venue=instrument.id.venue,
+                    venue=instrument_id.venue,
                     from_currency=instrument.quote_currency,
                     to_currency=currency,
                     price_type=PriceType.MID,
@@ -194,9 +206,15 @@ cdef class FXRolloverInterestModule(SimulationModule):
             else:
                 currency = instrument.quote_currency
 
-            rollover_total = Money(self._rollover_totals.get(currency, 0.0) + rollover, currency)
-            self._rollover_totals[currency] = rollover_total
+            rollovers[currency] = rollovers.get(currency, 0.0) + rollover
 
+        cdef Money rollover_total
+        for currency, rollover in rollovers.items():
+            rollover_total = self._rollover_totals.get(currency)
+            self._rollover_totals[currency] = Money(
+                (rollover_total.as_f64_c() if rollover_total is not None else 0.0) + rollover,
+                currency,
+            )
             self.exchange.adjust_account(Money(-rollover, currency))
 
     cpdef void log_diagnostics(self, Logger logger):
@@ -215,7 +233,6 @@ cdef class FXRolloverInterestModule(SimulationModule):
         logger.info(f"Rollover interest (totals): {rollover_totals}")
 
     cpdef void reset(self):
-        self._rollover_time = None  # Initialized at first rollover
-        self._rollover_applied = False
+        self._rollover_time_ns = 0  # Initialized at first process
+        self._rollover_iso_week_day = 0
         self._rollover_totals = {}
-        self._day_number = 0
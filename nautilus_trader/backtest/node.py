@@ -367,20 +367,10 @@ class BacktestNode:
                 session=session,
             )
 
-        # Stream data
-        for chunk in session.to_query_result():
-            engine.add_data(
-                data=capsule_to_list(chunk),
-                validate=False,  # Cannot validate mixed type stream
-                sort=True,  # Already sorted from backend
-            )
-            engine.run(
-                run_config_id=run_config_id,
-                streaming=True,
-            )
-            engine.clear_data()
-
-        engine.end()
+        # Stream data (chunks are already sorted from the backend, and are
+        # converted lazily as the engine reaches them)
+        engine.add_data_iterator(capsule_to_list(chunk) for chunk in session.to_query_result())
+        engine.run(run_config_id=run_config_id)
 
     def _run_oneshot(
         self,
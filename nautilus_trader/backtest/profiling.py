@@ -0,0 +1,200 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from nautilus_trader.core.correctness import PyCondition
+
+
+class StageStats:
+    """
+    Represents accumulated wall-clock timings for a single profiled stage.
+    """
+
+    __slots__ = ("count", "total_ns", "max_ns")
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.total_ns: int = 0
+        self.max_ns: int = 0
+
+    def add(self, elapsed_ns: int) -> None:
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "mean_ns": self.total_ns // self.count if self.count else 0,
+            "max_ns": self.max_ns,
+        }
+
+
+class BacktestProfiler:
+    """
+    Provides opt-in per-stage timing instrumentation for backtest runs.
+
+    Timings are only recorded for sampled iterations, so the overhead of
+    instrumentation can be bounded by increasing the `sample_interval`.
+
+    Parameters
+    ----------
+    sample_interval : int, default 1
+        The interval (in main loop iterations) between sampled iterations.
+
+    Raises
+    ------
+    ValueError
+        If `sample_interval` is not positive (> 0).
+
+    Notes
+    -----
+    Message bus handler timings are inclusive, and are nested within the
+    engine stage which published the message (e.g. `data_engine.process`).
+
+    """
+
+    STAGE_EXCHANGE_DATA = "exchange.process_data"
+    STAGE_DATA_ENGINE = "data_engine.process"
+    STAGE_EXCHANGE_MESSAGES = "exchange.process"
+    STAGE_TIME_EVENTS = "time_events"
+
+    def __init__(self, sample_interval: int = 1) -> None:
+        PyCondition.positive_int(sample_interval, "sample_interval")
+
+        self.sample_interval = sample_interval
+        self.sampling: bool = False
+        self.sampled_iterations: int = 0
+        self._stages: dict[str, StageStats] = {}
+        self._handlers: dict[Callable, StageStats] = {}
+
+    def begin_iteration(self, iteration: int) -> bool:
+        """
+        Mark the start of a main loop iteration.
+
+        Parameters
+        ----------
+        iteration : int
+            The current iteration count.
+
+        Returns
+        -------
+        bool
+            True if the iteration is sampled.
+
+        """
+        self.sampling = iteration % self.sample_interval == 0
+        if self.sampling:
+            self.sampled_iterations += 1
+        return self.sampling
+
+    def record(self, stage: str, elapsed_ns: int) -> None:
+        """
+        Record the elapsed time for the given engine `stage`.
+
+        Parameters
+        ----------
+        stage : str
+            The stage name.
+        elapsed_ns : int
+            The elapsed wall-clock time (nanoseconds).
+
+        """
+        stats = self._stages.get(stage)
+        if stats is None:
+            stats = StageStats()
+            self._stages[stage] = stats
+        stats.add(elapsed_ns)
+
+    def record_handler(self, handler: Callable, elapsed_ns: int) -> None:
+        """
+        Record the elapsed time for a single handler invocation.
+
+        Parameters
+        ----------
+        handler : Callable
+            The handler which was invoked.
+        elapsed_ns : int
+            The elapsed wall-clock time (nanoseconds).
+
+        """
+        stats = self._handlers.get(handler)
+        if stats is None:
+            stats = StageStats()
+            self._handlers[handler] = stats
+        stats.add(elapsed_ns)
+
+    def report(self) -> dict[str, Any]:
+        """
+        Return a structured report of all recorded timings.
+
+        Handlers are keyed by component and method name, and sorted by
+        descending total time.
+
+        Returns
+        -------
+        dict[str, Any]
+
+        """
+        handlers: dict[str, StageStats] = {}
+        for handler, stats in self._handlers.items():
+            # Aggregate handlers which resolve to the same name
+            name = _handler_name(handler)
+            existing = handlers.get(name)
+            if existing is None:
+                existing = StageStats()
+                handlers[name] = existing
+            existing.count += stats.count
+            existing.total_ns += stats.total_ns
+            existing.max_ns = max(existing.max_ns, stats.max_ns)
+
+        return {
+            "sample_interval": self.sample_interval,
+            "sampled_iterations": self.sampled_iterations,
+            "stages": _sorted_stats(self._stages),
+            "handlers": _sorted_stats(handlers),
+        }
+
+    def reset(self) -> None:
+        """
+        Reset the profiler by clearing all recorded timings.
+        """
+        self.sampling = False
+        self.sampled_iterations = 0
+        self._stages.clear()
+        self._handlers.clear()
+
+
+def _sorted_stats(stats: dict[str, StageStats]) -> dict[str, dict[str, Any]]:
+    items = sorted(stats.items(), key=lambda x: x[1].total_ns, reverse=True)
+    return {name: s.to_dict() for name, s in items}
+
+
+def _handler_name(handler: Callable) -> str:
+    owner = getattr(handler, "__self__", None)
+    method = getattr(handler, "__name__", None) or type(handler).__name__
+    if owner is None:
+        return getattr(handler, "__qualname__", None) or repr(handler)
+
+    owner_id = getattr(owner, "id", None)
+    if owner_id is not None:
+        return f"{owner_id}.{method}"
+    return f"{type(owner).__name__}.{method}"
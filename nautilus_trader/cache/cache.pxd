@@ -128,10 +128,16 @@ cdef class Cache(CacheFacade):
     cpdef void reset(self)
     cpdef void dispose(self)
     cpdef void flush_db(self)
+    cpdef void purge_closed_orders(self, uint64_t ts_now, uint64_t buffer_secs=*)
+    cpdef void purge_closed_positions(self, uint64_t ts_now, uint64_t buffer_secs=*)
+    cpdef void purge_order(self, ClientOrderId client_order_id)
+    cpdef void purge_position(self, PositionId position_id)
+    cpdef dict memory_stats(self)
 
     cdef tuple _build_quote_table(self, Venue venue)
     cdef void _build_index_venue_account(self)
     cdef void _cache_venue_account_id(self, AccountId account_id)
+    cdef void _discard_from_index_set(self, dict index, object key, object value)
     cdef void _build_indexes_from_orders(self)
     cdef void _build_indexes_from_positions(self)
     cdef set _build_order_query_filter_set(self, Venue venue, InstrumentId instrument_id, StrategyId strategy_id)
@@ -171,6 +177,8 @@ cdef class Cache(CacheFacade):
 
     cpdef void update_account(self, Account account)
     cpdef void update_order(self, Order order)
+    cpdef void update_orders(self, list orders)
+    cdef void _update_order_indexes(self, Order order)
     cpdef void update_order_pending_cancel_local(self, Order order)
     cpdef void update_position(self, Position position)
     cpdef void update_actor(self, Actor actor)
@@ -34,6 +34,7 @@ from nautilus_trader.cache.facade cimport CacheDatabaseFacade
 from nautilus_trader.common.component cimport LogColor
 from nautilus_trader.common.component cimport Logger
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.rust.core cimport secs_to_nanos
 from nautilus_trader.core.rust.model cimport AggregationSource
 from nautilus_trader.core.rust.model cimport ContingencyType
 from nautilus_trader.core.rust.model cimport OmsType
@@ -768,6 +769,237 @@ cdef class Cache(CacheFacade):
 
         self._log.info("Cache database flushed")
 
+    cpdef void purge_closed_orders(self, uint64_t ts_now, uint64_t buffer_secs = 0):
+        """
+        Purge all closed orders from the cache which were closed at least
+        `buffer_secs` before `ts_now`.
+
+        Orders are only purged from memory (any backing database is not modified),
+        so this is intended to bound the memory of long-running nodes once orders
+        have been persisted. If the cache has no database backing then no orders
+        are purged, as their history would otherwise be permanently lost.
+
+        Parameters
+        ----------
+        ts_now : uint64_t
+            UNIX timestamp (nanoseconds) for the current time.
+        buffer_secs : uint64_t, default 0
+            The minimum time (seconds) which must have elapsed since an order
+            was closed before it can be purged.
+
+        Warnings
+        --------
+        Purged orders will no longer be available from the cache, an order is
+        only purged once all of its linked orders are also closed, and its
+        position (if any) has been purged.
+
+        """
+        if self._database is None:
+            self._log.warning("Cannot purge closed orders: no cache database to persist them")
+            return
+
+        cdef uint64_t buffer_ns = secs_to_nanos(buffer_secs)
+        cdef int count = 0
+
+        cdef:
+            ClientOrderId client_order_id
+            ClientOrderId linked_order_id
+            PositionId position_id
+            Order order
+            Order linked_order
+            bint linked_open
+        for client_order_id in list(self._index_orders_closed):
+            order = self._orders.get(client_order_id)
+            if order is None or order.ts_last + buffer_ns > ts_now:
+                continue
+
+            # Retain orders for cached positions (required for `orders_for_position`)
+            position_id = self._index_order_position.get(client_order_id)
+            if position_id is not None and position_id in self._positions:
+                continue
+
+            linked_open = False
+            for linked_order_id in order.linked_order_ids or []:
+                linked_order = self._orders.get(linked_order_id)
+                if linked_order is not None and linked_order.is_open_c():
+                    linked_open = True
+                    break
+            if linked_open:
+                continue
+
+            self.purge_order(client_order_id)
+            count += 1
+
+        if count:
+            self._log.info(f"Purged {count} closed order{'' if count == 1 else 's'}", LogColor.BLUE)
+
+    cpdef void purge_closed_positions(self, uint64_t ts_now, uint64_t buffer_secs = 0):
+        """
+        Purge all closed positions from the cache which were closed at least
+        `buffer_secs` before `ts_now`.
+
+        Positions are only purged from memory (any backing database is not modified),
+        so this is intended to bound the memory of long-running nodes once positions
+        have been persisted. If the cache has no database backing then no positions
+        are purged, as their history would otherwise be permanently lost.
+
+        Parameters
+        ----------
+        ts_now : uint64_t
+            UNIX timestamp (nanoseconds) for the current time.
+        buffer_secs : uint64_t, default 0
+            The minimum time (seconds) which must have elapsed since a position
+            was closed before it can be purged.
+
+        """
+        if self._database is None:
+            self._log.warning("Cannot purge closed positions: no cache database to persist them")
+            return
+
+        cdef uint64_t buffer_ns = secs_to_nanos(buffer_secs)
+        cdef int count = 0
+
+        cdef:
+            PositionId position_id
+            Position position
+        for position_id in list(self._index_positions_closed):
+            position = self._positions.get(position_id)
+            if position is None or position.ts_closed + buffer_ns > ts_now:
+                continue
+
+            self.purge_position(position_id)
+            count += 1
+
+        if count:
+            self._log.info(f"Purged {count} closed position{'' if count == 1 else 's'}", LogColor.BLUE)
+
+    cpdef void purge_order(self, ClientOrderId client_order_id):
+        """
+        Purge the order for the given client order ID from the cache, and remove
+        it from all indexes.
+
+        Parameters
+        ----------
+        client_order_id : ClientOrderId
+            The client order ID to purge.
+
+        """
+        Condition.not_none(client_order_id, "client_order_id")
+
+        cdef Order order = self._orders.pop(client_order_id, None)
+        if order is None:
+            self._log.warning(f"Cannot purge order: {client_order_id!r} not found")
+            return
+
+        cdef InstrumentId instrument_id = order.instrument_id
+
+        self._discard_from_index_set(self._index_venue_orders, instrument_id.venue, client_order_id)
+        self._discard_from_index_set(self._index_instrument_orders, instrument_id, client_order_id)
+        self._discard_from_index_set(self._index_strategy_orders, order.strategy_id, client_order_id)
+
+        cdef VenueOrderId venue_order_id = self._index_client_order_ids.pop(client_order_id, None)
+        if venue_order_id is not None:
+            self._index_venue_order_ids.pop(venue_order_id, None)
+
+        cdef PositionId position_id = self._index_order_position.pop(client_order_id, None)
+        if position_id is not None:
+            self._discard_from_index_set(self._index_position_orders, position_id, client_order_id)
+
+        self._index_order_strategy.pop(client_order_id, None)
+        self._index_order_client.pop(client_order_id, None)
+
+        if order.exec_algorithm_id is not None:
+            self._discard_from_index_set(self._index_exec_algorithm_orders, order.exec_algorithm_id, client_order_id)
+            self._discard_from_index_set(self._index_exec_spawn_orders, order.exec_spawn_id, client_order_id)
+
+        self._index_orders.discard(client_order_id)
+        self._index_orders_open.discard(client_order_id)
+        self._index_orders_closed.discard(client_order_id)
+        self._index_orders_emulated.discard(client_order_id)
+        self._index_orders_inflight.discard(client_order_id)
+        self._index_orders_pending_cancel.discard(client_order_id)
+
+        # Drop the order list once none of its orders remain cached
+        cdef OrderList order_list
+        if order.order_list_id is not None:
+            order_list = self._order_lists.get(order.order_list_id)
+            if order_list is not None and not any(o.client_order_id in self._orders for o in order_list.orders):
+                self._order_lists.pop(order.order_list_id, None)
+
+        self._log.debug(f"Purged {order}")
+
+    cpdef void purge_position(self, PositionId position_id):
+        """
+        Purge the position for the given position ID from the cache, and remove
+        it from all indexes.
+
+        Parameters
+        ----------
+        position_id : PositionId
+            The position ID to purge.
+
+        """
+        Condition.not_none(position_id, "position_id")
+
+        cdef Position position = self._positions.pop(position_id, None)
+        if position is None:
+            self._log.warning(f"Cannot purge position: {position_id!r} not found")
+            return
+
+        self._discard_from_index_set(self._index_venue_positions, position.instrument_id.venue, position_id)
+        self._discard_from_index_set(self._index_instrument_positions, position.instrument_id, position_id)
+        self._discard_from_index_set(self._index_strategy_positions, position.strategy_id, position_id)
+
+        self._index_position_strategy.pop(position_id, None)
+        self._index_position_orders.pop(position_id, None)
+        self._index_positions.discard(position_id)
+        self._index_positions_open.discard(position_id)
+        self._index_positions_closed.discard(position_id)
+        self._position_snapshots.pop(position_id, None)
+
+        self._log.debug(f"Purged {position}")
+
+    cpdef dict memory_stats(self):
+        """
+        Return the count of objects held in memory for each cache collection.
+
+        The counts for ``order_events`` and ``position_events`` are the total
+        events retained by all cached orders and positions respectively.
+
+        Returns
+        -------
+        dict[str, int]
+
+        """
+        cdef int order_events = 0
+        cdef int position_events = 0
+
+        cdef Order order
+        for order in self._orders.values():
+            order_events += len(order._events)
+
+        cdef Position position
+        for position in self._positions.values():
+            position_events += len(position._events)
+
+        return {
+            "general": len(self._general),
+            "currencies": len(self._currencies),
+            "instruments": len(self._instruments),
+            "synthetics": len(self._synthetics),
+            "accounts": len(self._accounts),
+            "order_books": len(self._order_books),
+            "quote_ticks": sum(len(d) for d in self._quote_ticks.values()),
+            "trade_ticks": sum(len(d) for d in self._trade_ticks.values()),
+            "bars": sum(len(d) for d in self._bars.values()),
+            "orders": len(self._orders),
+            "order_events": order_events,
+            "order_lists": len(self._order_lists),
+            "positions": len(self._positions),
+            "position_events": position_events,
+            "position_snapshots": sum(len(s) for s in self._position_snapshots.values()),
+        }
+
     cdef void _build_index_venue_account(self):
         cdef AccountId account_id
         for account_id in self._accounts.keys():
@@ -776,6 +1008,16 @@ cdef class Cache(CacheFacade):
     cdef void _cache_venue_account_id(self, AccountId account_id):
         self._index_venue_account[Venue(account_id.get_issuer())] = account_id
 
+    cdef void _discard_from_index_set(self, dict index, object key, object value):
+        cdef set values = index.get(key)
+        if values is None:
+            return
+
+        values.discard(value)
+        if not values:
+            # Drop empty sets so indexes do not grow without bound
+            del index[key]
+
     cdef void _build_indexes_from_orders(self):
         cdef ClientOrderId client_order_id
         cdef Order order
@@ -1812,6 +2054,41 @@ cdef class Cache(CacheFacade):
         """
         Condition.not_none(order, "order")
 
+        self._update_order_indexes(order)
+
+        if self._database is None:
+            return
+
+        # Update database
+        self._database.update_order(order)
+
+    cpdef void update_orders(self, list orders):
+        """
+        Update the given orders in the cache.
+
+        Intended for bulk state transitions (such as a burst of cancels), where
+        the cache indexes are updated for every order before any are persisted.
+
+        Parameters
+        ----------
+        orders : list[Order]
+            The orders to update (from their last events).
+
+        """
+        Condition.not_none(orders, "orders")
+
+        cdef Order order
+        for order in orders:
+            self._update_order_indexes(order)
+
+        if self._database is None:
+            return
+
+        # Update database
+        for order in orders:
+            self._database.update_order(order)
+
+    cdef void _update_order_indexes(self, Order order):
         # Update venue order ID
         if order.venue_order_id is not None and order.venue_order_id not in self._index_venue_order_ids:
             # If the order is being modified then we allow a changing `VenueOrderId` to accommodate
@@ -1843,12 +2120,6 @@ cdef class Cache(CacheFacade):
         else:
             self._index_orders_emulated.add(order.client_order_id)
 
-        if self._database is None:
-            return
-
-        # Update database
-        self._database.update_order(order)
-
     cpdef void update_order_pending_cancel_local(self, Order order):
         """
         Update the given `order` as pending cancel locally.
@@ -20,3 +20,4 @@ from nautilus_trader.serialization.base cimport Serializer
 cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
     cdef Serializer _serializer
     cdef object _backing
+    cdef int _position_max_events
@@ -110,11 +110,16 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         The serializer for database operations.
     config : CacheConfig, optional
         The configuration for the instance.
+    position_max_events : int, optional
+        The maximum number of fill events retained in memory per loaded position
+        (compact mode). If ``None`` then loaded positions retain all events.
 
     Raises
     ------
     TypeError
         If `config` is not of type `CacheConfig`.
+    ValueError
+        If `position_max_events` is not ``None`` and not positive (> 0).
 
     Warnings
     --------
@@ -133,10 +138,13 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         UUID4 instance_id not None,
         Serializer serializer not None,
         config: CacheConfig | None = None,
+        position_max_events: int | None = None,
     ) -> None:
         if config is None:
             config = CacheConfig()
         Condition.type(config, CacheConfig, "config")
+        if position_max_events is not None:
+            Condition.positive_int(position_max_events, "position_max_events")
         super().__init__(config)
 
         # Validate configuration
@@ -154,8 +162,10 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         self._log.info(f"{config.flush_on_start=}", LogColor.BLUE)
         self._log.info(f"{config.use_trader_prefix=}", LogColor.BLUE)
         self._log.info(f"{config.use_instance_id=}", LogColor.BLUE)
+        self._log.info(f"{position_max_events=}", LogColor.BLUE)
 
         self._serializer = serializer
+        self._position_max_events = position_max_events or 0
 
         self._backing = nautilus_pyo3.RedisCacheDatabase(
             trader_id=nautilus_pyo3.TraderId(trader_id.value),
@@ -647,7 +657,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
             )
             return
 
-        cdef Position position = Position(instrument, initial_fill)
+        cdef Position position = Position(instrument, initial_fill, self._position_max_events or None)
 
         cdef:
             bytes event_bytes
@@ -261,6 +261,7 @@ cdef class Actor(Component):
     cpdef void _handle_trade_ticks_response(self, DataResponse response)
     cpdef void _handle_bars_response(self, DataResponse response)
     cpdef void _finish_response(self, UUID4 request_id)
+    cdef bint _has_historical_data_handler(self)
     cpdef void _handle_indicators_for_quote(self, list indicators, QuoteTick tick)
     cpdef void _handle_indicators_for_trade(self, list indicators, TradeTick tick)
     cpdef void _handle_indicators_for_bar(self, list indicators, Bar bar)
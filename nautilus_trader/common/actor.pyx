@@ -2506,6 +2506,10 @@ cdef class Actor(Component):
         """
         Handle the given historical quote tick data by handling each tick individually.
 
+        Registered indicators are updated with all the data in a single batch,
+        unless `on_historical_data` is overridden, in which case they are updated
+        with each tick before it is passed to `on_historical_data`.
+
         Parameters
         ----------
         ticks : list[QuoteTick]
@@ -2531,6 +2535,13 @@ cdef class Actor(Component):
         # Update indicators
         cdef list indicators = self._indicators_for_quotes.get(first.instrument_id)
 
+        cdef Indicator indicator
+        if indicators and not self._has_historical_data_handler():
+            # Intermediate indicator values are not observable, so update each indicator in one batch
+            for indicator in indicators:
+                indicator.handle_quote_ticks(ticks)
+            indicators = None
+
         cdef:
             int i
             QuoteTick tick
@@ -2576,6 +2587,10 @@ cdef class Actor(Component):
         """
         Handle the given historical trade tick data by handling each tick individually.
 
+        Registered indicators are updated with all the data in a single batch,
+        unless `on_historical_data` is overridden, in which case they are updated
+        with each tick before it is passed to `on_historical_data`.
+
         Parameters
         ----------
         ticks : list[TradeTick]
@@ -2601,6 +2616,13 @@ cdef class Actor(Component):
         # Update indicators
         cdef list indicators = self._indicators_for_trades.get(first.instrument_id)
 
+        cdef Indicator indicator
+        if indicators and not self._has_historical_data_handler():
+            # Intermediate indicator values are not observable, so update each indicator in one batch
+            for indicator in indicators:
+                indicator.handle_trade_ticks(ticks)
+            indicators = None
+
         cdef:
             int i
             TradeTick tick
@@ -2646,6 +2668,10 @@ cdef class Actor(Component):
         """
         Handle the given historical bar data by handling each bar individually.
 
+        Registered indicators are updated with all the data in a single batch,
+        unless `on_historical_data` is overridden, in which case they are updated
+        with each bar before it is passed to `on_historical_data`.
+
         Parameters
         ----------
         bars : list[Bar]
@@ -2674,6 +2700,13 @@ cdef class Actor(Component):
         # Update indicators
         cdef list indicators = self._indicators_for_bars.get(first.bar_type)
 
+        cdef Indicator indicator
+        if indicators and not self._has_historical_data_handler():
+            # Intermediate indicator values are not observable, so update each indicator in one batch
+            for indicator in indicators:
+                indicator.handle_bars(bars)
+            indicators = None
+
         cdef:
             int i
             Bar bar
@@ -2834,10 +2867,21 @@ cdef class Actor(Component):
         self._finish_response(response.correlation_id)
 
     cpdef void _finish_response(self, UUID4 request_id):
+        if self._msgbus.is_pending_request(request_id):
+            return  # Further response chunks to come
+
         callback: Callable | None = self._pending_requests.pop(request_id, None)
         if callback is not None:
             callback(request_id)
 
+    cdef bint _has_historical_data_handler(self):
+        if type(self).on_historical_data is not Actor.on_historical_data:
+            return True
+
+        # Handler may also be assigned on the instance
+        cdef dict attrs = getattr(self, "__dict__", None)
+        return attrs is not None and "on_historical_data" in attrs
+
     cpdef void _handle_indicators_for_quote(self, list indicators, QuoteTick tick):
         cdef Indicator indicator
         for indicator in indicators:
@@ -166,7 +166,11 @@ cpdef void set_logging_pyo3(bint value)
 cdef class Logger:
     cdef str _name
     cdef const char* _name_ptr
+    cdef int _level_min
+    cdef uint64_t _levels_version
 
+    cdef int _resolve_level_min(self)
+    cpdef bint is_enabled(self, LogLevel level)
     cpdef void debug(self, str message, LogColor color=*)
     cpdef void info(self, str message, LogColor color=*)
     cpdef void warning(self, str message, LogColor color=*)
@@ -257,6 +261,7 @@ cdef class MessageBus:
     cdef tuple[type] _publishable_types
     cdef set[type] _streaming_types
     cdef bint _resolved
+    cdef object _profiler
 
     cdef readonly TraderId trader_id
     """The trader ID associated with the bus.\n\n:returns: `TraderId`"""
@@ -285,9 +290,10 @@ cdef class MessageBus:
     cpdef void register(self, str endpoint, handler)
     cpdef void deregister(self, str endpoint, handler)
     cpdef void add_streaming_type(self, type cls)
+    cpdef void set_profiler(self, profiler)
     cpdef void send(self, str endpoint, msg)
     cpdef void request(self, str endpoint, Request request)
-    cpdef void response(self, Response response)
+    cpdef void response(self, Response response, bint final=*)
     cpdef void subscribe(self, str topic, handler, int priority=*)
     cpdef void unsubscribe(self, str topic, handler)
     cpdef void publish(self, str topic, msg, bint external_pub=*)
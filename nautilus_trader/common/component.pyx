@@ -19,6 +19,7 @@ import socket
 import sys
 import traceback
 from collections import deque
+from time import perf_counter_ns
 from typing import Any
 from typing import Callable
 
@@ -1015,6 +1016,39 @@ cpdef str log_level_to_str(LogLevel value):
     return cstr_to_pystr(log_level_to_cstr(value))
 
 
+# The lowest level written by any output (beyond `ERROR` when nothing is written),
+# with a version which is incremented so that loggers refresh their cached level.
+cdef int _LOG_LEVEL_DISABLED = LogLevel.ERROR + 1
+cdef int _LOG_LEVEL_MIN = _LOG_LEVEL_DISABLED
+cdef dict _LOG_COMPONENT_LEVELS = {}
+cdef uint64_t _LOG_LEVELS_VERSION = 1
+
+
+cdef void _set_log_levels(
+    LogLevel level_stdout,
+    LogLevel level_file,
+    dict component_levels,
+):
+    global _LOG_LEVEL_MIN, _LOG_COMPONENT_LEVELS, _LOG_LEVELS_VERSION
+
+    cdef int level_min = _LOG_LEVEL_DISABLED
+    cdef LogLevel level
+    for level in (level_stdout, level_file):
+        if level != LogLevel.OFF and level < level_min:
+            level_min = level
+
+    cdef dict levels = {}
+    if component_levels:
+        for component, value in component_levels.items():
+            if isinstance(value, str):
+                value = log_level_from_str(value)
+            levels[str(component)] = value
+
+    _LOG_LEVEL_MIN = level_min
+    _LOG_COMPONENT_LEVELS = levels
+    _LOG_LEVELS_VERSION += 1
+
+
 cdef class LogGuard:
     """
     Provides a `LogGuard` which serves as a token to signal the initialization
@@ -1115,6 +1149,8 @@ cpdef LogGuard init_logging(
         print_config,
     )
 
+    _set_log_levels(level_stdout, level_file, component_levels)
+
     cdef LogGuard log_guard = LogGuard.__new__(LogGuard)
     log_guard._mem = log_guard_api
     return log_guard
@@ -1154,6 +1190,8 @@ cdef class Logger:
 
         self._name = name  # Reference to `name` needs to be kept alive
         self._name_ptr = pystr_to_cstr(self._name)
+        self._level_min = _LOG_LEVEL_DISABLED
+        self._levels_version = 0  # Resolved lazily on first level check
 
     @property
     def name(self) -> str:
@@ -1167,6 +1205,45 @@ cdef class Logger:
         """
         return self._name
 
+    cdef int _resolve_level_min(self):
+        if _LOG_LEVELS_VERSION == 1 and logging_is_initialized():
+            # Initialized outside of `init_logging`, so levels are unknown (do not cache)
+            self._level_min = LogLevel.OFF
+            return self._level_min
+
+        cdef int level_min = _LOG_LEVEL_MIN
+        component_level = _LOG_COMPONENT_LEVELS.get(self._name)
+        if component_level is not None and component_level > level_min:
+            level_min = component_level  # Component filters can only restrict further
+        self._level_min = level_min
+        self._levels_version = _LOG_LEVELS_VERSION
+        return level_min
+
+    cpdef bint is_enabled(self, LogLevel level):
+        """
+        Return whether a message at the given `level` would be logged.
+
+        The check is cheap and should be used to guard the formatting of
+        expensive messages (typically at ``DEBUG`` level) on hot paths.
+
+        Parameters
+        ----------
+        level : LogLevel
+            The log level to check.
+
+        Returns
+        -------
+        bool
+
+        """
+        if LOGGING_PYO3:
+            return True  # Level filtering is handled by the pyo3 logger
+
+        if self._levels_version != _LOG_LEVELS_VERSION:
+            self._resolve_level_min()
+
+        return level >= self._level_min
+
     cpdef void debug(
         self,
         str message,
@@ -1192,7 +1269,7 @@ cdef class Logger:
             )
             return
 
-        if not logging_is_initialized():
+        if not logging_is_initialized() or not self.is_enabled(LogLevel.DEBUG):
             return
 
         logger_log(
@@ -2054,6 +2131,7 @@ cdef class MessageBus:
             self._publishable_types = tuple(o for o in _EXTERNAL_PUBLISHABLE_TYPES if o not in types_filter)
         self._streaming_types = set()
         self._resolved = False
+        self._profiler = None
 
         # Counters
         self.sent_count = 0
@@ -2253,6 +2331,22 @@ cdef class MessageBus:
 
         self._log.debug(f"Removed endpoint '{endpoint}' {handler}")
 
+    cpdef void set_profiler(self, profiler):
+        """
+        Set the profiler to record subscription handler timings with.
+
+        When set, each handler invocation during a sampled iteration is timed
+        and recorded via `profiler.record_handler(handler, elapsed_ns)`.
+
+        Parameters
+        ----------
+        profiler : object, optional
+            The profiler to record with (must expose a `sampling` flag and a
+            `record_handler` method). If ``None`` then profiling is disabled.
+
+        """
+        self._profiler = profiler
+
     cpdef void add_streaming_type(self, type cls):
         """
         Register the given type for external->internal message bus streaming.
@@ -2330,7 +2424,7 @@ cdef class MessageBus:
         handler(request)
         self.req_count += 1
 
-    cpdef void response(self, Response response):
+    cpdef void response(self, Response response, bint final = True):
         """
         Handle the given `response`.
 
@@ -2340,11 +2434,18 @@ cdef class MessageBus:
         ----------
         response : Response
             The response to handle
+        final : bool, default True
+            If the response is the final one for the request. If False then the
+            request remains pending, so that further response chunks can be
+            delivered to the same callback.
 
         """
         Condition.not_none(response, "response")
 
-        callback = self._correlation_index.pop(response.correlation_id, None)
+        if final:
+            callback = self._correlation_index.pop(response.correlation_id, None)
+        else:
+            callback = self._correlation_index.get(response.correlation_id)
         if callback is None:
             self._log.error(
                 f"Cannot handle response: "
@@ -2509,9 +2610,17 @@ cdef class MessageBus:
         cdef:
             int i
             Subscription sub
-        for i in range(len(subs)):
-            sub = subs[i]
-            sub.handler(msg)
+            uint64_t ts_start
+        if self._profiler is not None and self._profiler.sampling:
+            for i in range(len(subs)):
+                sub = subs[i]
+                ts_start = perf_counter_ns()
+                sub.handler(msg)
+                self._profiler.record_handler(sub.handler, perf_counter_ns() - ts_start)
+        else:
+            for i in range(len(subs)):
+                sub = subs[i]
+                sub.handler(msg)
 
         # Publish externally (if configured)
         cdef bytes payload_bytes
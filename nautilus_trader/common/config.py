@@ -369,6 +369,12 @@ class InstrumentProviderConfig(NautilusConfig, frozen=True):
         whether the instrument should be loaded
     log_warnings : bool, default True
         If parser warnings should be logged.
+    snapshot_path : str, optional
+        The file path for a local instrument snapshot. If set, then loaded instruments are
+        written to the snapshot, and on the next start are loaded from it immediately
+        (when within `snapshot_ttl_secs`) while being refreshed from the venue in the background.
+    snapshot_ttl_secs : PositiveInt, default 86_400
+        The maximum age (seconds) of an instrument snapshot to warm start from.
 
     """
 
@@ -388,6 +394,8 @@ class InstrumentProviderConfig(NautilusConfig, frozen=True):
     filters: dict[str, Any] | None = None
     filter_callable: str | None = None
     log_warnings: bool = True
+    snapshot_path: str | None = None
+    snapshot_ttl_secs: PositiveInt = 86_400
 
 
 class OrderEmulatorConfig(NautilusConfig, frozen=True):
@@ -398,10 +406,16 @@ class OrderEmulatorConfig(NautilusConfig, frozen=True):
     ----------
     debug : bool, default False
         If debug mode is active (will provide extra debug logging).
+    auto_unsubscribe : bool, default False
+        If market data for a trigger instrument should be unsubscribed from once
+        no emulated orders remain for that instrument. The matching core market
+        state is then reset, so contingent orders emulated after their parent is
+        released will have no market until the next update is received.
 
     """
 
     debug: bool = False
+    auto_unsubscribe: bool = False
 
 
 class ActorConfig(NautilusConfig, kw_only=True, frozen=True):
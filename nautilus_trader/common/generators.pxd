@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from libc.stdint cimport uint64_t
+
 from nautilus_trader.common.component cimport Clock
 from nautilus_trader.model.identifiers cimport ClientOrderId
 from nautilus_trader.model.identifiers cimport OrderListId
@@ -23,6 +25,8 @@ from nautilus_trader.model.identifiers cimport StrategyId
 cdef class IdentifierGenerator:
     cdef Clock _clock
     cdef str _id_tag_trader
+    cdef uint64_t _tag_second
+    cdef str _datetime_tag
 
     cdef str _get_datetime_tag(self)
 
@@ -14,9 +14,11 @@
 # -------------------------------------------------------------------------------------------------
 
 from cpython.datetime cimport datetime
+from libc.stdint cimport uint64_t
 
 from nautilus_trader.common.component cimport Clock
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.datetime cimport unix_nanos_to_dt
 from nautilus_trader.model.identifiers cimport ClientOrderId
 from nautilus_trader.model.identifiers cimport PositionId
 from nautilus_trader.model.identifiers cimport StrategyId
@@ -38,18 +40,28 @@ cdef class IdentifierGenerator:
     def __init__(self, TraderId trader_id not None, Clock clock not None):
         self._clock = clock
         self._id_tag_trader = trader_id.get_tag()
+        self._tag_second = 0
+        self._datetime_tag = None
 
     cdef str _get_datetime_tag(self):
         """
         Return the tag string for the current timestamp (UTC).
 
+        The tag is cached and only reformatted when the clock has moved to a
+        different second.
+
         Returns
         -------
         str
 
         """
-        cdef datetime now = self._clock.utc_now()
-        return (
+        cdef uint64_t ts_second = self._clock.timestamp_ns() // 1_000_000_000
+        if self._datetime_tag is not None and ts_second == self._tag_second:
+            return self._datetime_tag
+
+        cdef datetime now = unix_nanos_to_dt(ts_second * 1_000_000_000)
+        self._tag_second = ts_second
+        self._datetime_tag = (
             f"{now.year}"
             f"{now.month:02d}"
             f"{now.day:02d}-"
@@ -57,6 +69,7 @@ cdef class IdentifierGenerator:
             f"{now.minute:02d}"
             f"{now.second:02d}"
         )
+        return self._datetime_tag
 
 
 cdef class ClientOrderIdGenerator(IdentifierGenerator):
@@ -14,13 +14,22 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import msgspec
 
 from nautilus_trader.common.component import Logger
 from nautilus_trader.config import InstrumentProviderConfig
 from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.model.enums import CurrencyType
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.instruments import Instrument
 from nautilus_trader.model.objects import Currency
+from nautilus_trader.serialization.serializer import MsgSpecSerializer
 
 
 class InstrumentProvider:
@@ -50,12 +59,15 @@ class InstrumentProvider:
         self._load_all_on_start = config.load_all
         self._load_ids_on_start = set(config.load_ids) if config.load_ids is not None else None
         self._filters = config.filters
+        self._snapshot_path = Path(config.snapshot_path) if config.snapshot_path else None
+        self._snapshot_ttl_ns = config.snapshot_ttl_secs * 1_000_000_000
 
         # Async loading flags
         self._loaded = False
         self._loading = False
 
         self._tasks: set[asyncio.Task] = set()
+        self._update_handlers: list[Callable[[list[Instrument]], None]] = []
 
         self._log.info("READY")
 
@@ -141,6 +153,12 @@ class InstrumentProvider:
 
         If `initialize()` then will immediately return.
 
+        If a `snapshot_path` is configured and a snapshot within the TTL exists,
+        then the instruments are loaded from the snapshot immediately, and refreshed
+        from the venue in the background (with any changed instruments passed to
+        the registered update handlers, and any instruments the venue no longer
+        returns removed).
+
         """
         if self._loaded:
             return  # Already loaded
@@ -148,16 +166,19 @@ class InstrumentProvider:
         if not self._loading:
             # Set async loading flag
             self._loading = True
-            if self._load_all_on_start:
-                await self.load_all_async(self._filters)
-            elif self._load_ids_on_start:
-                instrument_ids = [
-                    InstrumentId.from_str(i)
-                    for i in self._load_ids_on_start
-                    if not isinstance(i, InstrumentId)
-                ]
-                await self.load_ids_async(instrument_ids, self._filters)
-            self._log.info(f"Loaded {self.count} instruments")
+            if self._snapshot_path is not None and self._load_snapshot():
+                self._log.info(f"Loaded {self.count} instruments from snapshot")
+                task = asyncio.get_running_loop().create_task(
+                    self._refresh_from_venue(),
+                    name="refresh_instruments",
+                )
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            else:
+                await self._load_from_venue()
+                self._log.info(f"Loaded {self.count} instruments")
+                if self._snapshot_path is not None:
+                    self._write_snapshot()
         else:
             self._log.debug("Awaiting loading...")
             while self._loading:
@@ -167,6 +188,21 @@ class InstrumentProvider:
         self._loading = False
         self._loaded = True
 
+    def register_update_handler(self, handler: Callable[[list[Instrument]], None]) -> None:
+        """
+        Register the given handler to receive instruments which changed when
+        refreshing from the venue after a warm start from the snapshot.
+
+        Parameters
+        ----------
+        handler : Callable[[list[Instrument]], None]
+            The handler to register.
+
+        """
+        PyCondition.callable(handler, "handler")
+
+        self._update_handlers.append(handler)
+
     def load_all(self, filters: dict | None = None) -> None:
         """
         Load the latest instruments into the provider, optionally applying the given
@@ -359,3 +395,145 @@ class InstrumentProvider:
         PyCondition.not_none(instrument_id, "instrument_id")
 
         return self._instruments.get(instrument_id)
+
+    async def _load_from_venue(self) -> None:
+        if self._load_all_on_start:
+            await self.load_all_async(self._filters)
+        elif self._load_ids_on_start:
+            await self.load_ids_async(self._instrument_ids_to_load(), self._filters)
+
+    def _instrument_ids_to_load(self) -> list[InstrumentId]:
+        return [
+            InstrumentId.from_str(i)
+            for i in self._load_ids_on_start or ()
+            if not isinstance(i, InstrumentId)
+        ]
+
+    async def _refresh_from_venue(self) -> None:
+        snapshot_instruments = self._instruments.copy()
+        previous = {i.id: _instrument_state(i) for i in snapshot_instruments.values()}
+        try:
+            await self._load_from_venue()
+        except asyncio.CancelledError:
+            self._log.debug("Canceled task 'refresh_instruments'")
+            return
+        except Exception as e:
+            self._log.exception("Error refreshing instruments, continuing from snapshot", e)
+            return
+
+        # Snapshot instruments not reloaded by the venue are no longer listed
+        removed = self._remove_stale_instruments(snapshot_instruments)
+
+        # Ignore timestamps, which are reset on every load
+        updated = [
+            i for i in self._instruments.values() if previous.get(i.id) != _instrument_state(i)
+        ]
+        self._log.info(
+            f"Refreshed instruments with {len(updated)} updates "
+            f"and {len(removed)} removals since snapshot",
+        )
+
+        if updated:
+            for handler in self._update_handlers:
+                handler(updated)
+
+        self._write_snapshot()
+
+    def _remove_stale_instruments(
+        self,
+        snapshot_instruments: dict[InstrumentId, Instrument],
+    ) -> list[InstrumentId]:
+        # Instruments loaded from the venue replace the snapshot objects, so any
+        # snapshot object still held was not returned by the venue on refresh
+        load_ids: set[InstrumentId] | None = None
+        if not self._load_all_on_start:
+            load_ids = set(self._instrument_ids_to_load())
+
+        removed: list[InstrumentId] = []
+        for instrument_id, instrument in snapshot_instruments.items():
+            if load_ids is not None and instrument_id not in load_ids:
+                continue  # Not managed by the configured loading
+            if self._instruments.get(instrument_id) is instrument:
+                self._instruments.pop(instrument_id)
+                removed.append(instrument_id)
+
+        for instrument_id in removed:
+            self._log.info(f"Removed {instrument_id} no longer listed by the venue")
+
+        return removed
+
+    def _snapshot_key(self) -> str:
+        # Identifies the loading config the snapshot was written for
+        load_ids = sorted(str(i) for i in self._load_ids_on_start or ())
+        return repr((self._load_all_on_start, load_ids, self._filters))
+
+    def _load_snapshot(self) -> bool:
+        if not self._snapshot_path.exists():
+            return False
+
+        try:
+            snapshot: dict[str, Any] = msgspec.msgpack.decode(self._snapshot_path.read_bytes())
+            if snapshot["key"] != self._snapshot_key():
+                self._log.info("Instrument snapshot was written for another config, ignoring")
+                return False
+
+            age_ns = time.time_ns() - snapshot["ts_created"]
+            if age_ns > self._snapshot_ttl_ns:
+                self._log.info("Instrument snapshot expired, ignoring")
+                return False
+
+            # Currencies must be registered before the instruments can be decoded
+            for code, precision, iso4217, name, currency_type in snapshot["currencies"]:
+                self.add_currency(
+                    Currency(code, precision, iso4217, name, CurrencyType(currency_type)),
+                )
+
+            serializer = MsgSpecSerializer(encoding=msgspec.msgpack)
+            instruments = [serializer.deserialize(b) for b in snapshot["instruments"]]
+        except Exception as e:
+            self._log.warning(f"Cannot load instrument snapshot {self._snapshot_path}: {e!r}")
+            return False
+
+        self.add_bulk(instruments)
+        return True
+
+    def _write_snapshot(self) -> None:
+        currencies: dict[str, Currency] = self._currencies.copy()
+        for instrument in self._instruments.values():
+            for currency in (
+                instrument.quote_currency,
+                instrument.get_base_currency(),
+                instrument.get_settlement_currency(),
+            ):
+                if currency is not None:
+                    currencies.setdefault(currency.code, currency)
+
+        serializer = MsgSpecSerializer(encoding=msgspec.msgpack)
+        snapshot = {
+            "key": self._snapshot_key(),
+            "ts_created": time.time_ns(),
+            "currencies": [
+                (c.code, c.precision, c.iso4217, c.name, int(c.currency_type))
+                for c in currencies.values()
+            ],
+            "instruments": [serializer.serialize(i) for i in self._instruments.values()],
+        }
+
+        # Write then rename, so a partial snapshot is never read
+        try:
+            self._snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._snapshot_path.with_suffix(self._snapshot_path.suffix + ".tmp")
+            tmp_path.write_bytes(msgspec.msgpack.encode(snapshot))
+            os.replace(tmp_path, self._snapshot_path)
+        except OSError as e:
+            self._log.warning(f"Cannot write instrument snapshot {self._snapshot_path}: {e!r}")
+            return
+
+        self._log.debug(f"Wrote {len(self._instruments)} instruments to snapshot")
+
+
+def _instrument_state(instrument: Instrument) -> dict[str, Any]:
+    state = type(instrument).to_dict(instrument)
+    state.pop("ts_event", None)
+    state.pop("ts_init", None)
+    return state
@@ -38,6 +38,8 @@ from cpython.unicode cimport PyUnicode_Contains
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.rust.core cimport unix_nanos_to_iso8601_cstr
+from nautilus_trader.core.string cimport cstr_to_pystr
 
 
 # UNIX epoch is the UTC time at 00:00:00 on 1/1/1970
@@ -105,6 +107,25 @@ cpdef str unix_nanos_to_str(uint64_t unix_nanos):
     return format_iso8601(unix_nanos_to_dt(unix_nanos))
 
 
+cpdef str unix_nanos_to_iso8601(uint64_t unix_nanos):
+    """
+    Convert the given `unix_nanos` to a nanosecond accurate ISO 8601 (RFC 3339) formatted string.
+
+    Formatting is performed natively without constructing an intermediate datetime object.
+
+    Parameters
+    ----------
+    unix_nanos : int
+        The UNIX timestamp (nanoseconds) to be converted.
+
+    Returns
+    -------
+    str
+
+    """
+    return cstr_to_pystr(unix_nanos_to_iso8601_cstr(unix_nanos))
+
+
 cpdef maybe_unix_nanos_to_dt(nanos):
     """
     Return the datetime (UTC) from the given UNIX timestamp (nanoseconds), or ``None``.
@@ -13,9 +13,24 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from libc.stdint cimport uint32_t
+from libc.stdint cimport uint64_t
+
 from nautilus_trader.core.rust.core cimport UUID4_t
 
 
+cdef class DeterministicUUIDScope:
+    cdef int _depth
+    cdef bint _prev_enabled
+    cdef uint32_t _prev_seed
+    cdef uint64_t _prev_count
+
+    cdef readonly uint32_t seed
+    """The seed which prefixes every value generated in the scope.\n\n:returns: `uint32_t`"""
+    cdef public uint64_t count
+    """The number of values generated in the scope (the next value continues from this count).\n\n:returns: `uint64_t`"""
+
+
 cdef class UUID4:
     cdef UUID4_t _mem
 
@@ -23,3 +38,6 @@ cdef class UUID4:
 
     @staticmethod
     cdef UUID4 from_mem_c(UUID4_t raw)
+
+
+cpdef void set_deterministic_uuids(bint value, uint32_t seed=*)
@@ -13,6 +13,11 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint32_t
+from libc.stdint cimport uint64_t
+from libc.string cimport memcpy
+
 from nautilus_trader.core.rust.core cimport UUID4_t
 from nautilus_trader.core.rust.core cimport uuid4_eq
 from nautilus_trader.core.rust.core cimport uuid4_from_cstr
@@ -23,6 +28,111 @@ from nautilus_trader.core.string cimport cstr_to_pystr
 from nautilus_trader.core.string cimport pystr_to_cstr
 
 
+cdef const char* _HEX_DIGITS = b"0123456789abcdef"
+cdef const char* _DETERMINISTIC_TEMPLATE = b"00000000-0000-4000-8000-000000000000"
+
+cdef bint _DETERMINISTIC = False
+cdef uint32_t _DETERMINISTIC_SEED = 0
+cdef uint64_t _DETERMINISTIC_COUNT = 0
+
+
+cpdef void set_deterministic_uuids(bint value, uint32_t seed=0):
+    """
+    Set whether generated `UUID4` values are deterministic.
+
+    When enabled, values are formatted from the `seed` and an incrementing
+    counter (reset on each call) rather than generated randomly. This is faster
+    and makes backtest runs reproducible, however values are only unique within
+    the process and sequence, so this must not be enabled for live trading.
+
+    Parameters
+    ----------
+    value : bool
+        If deterministic values should be generated.
+    seed : uint32_t, default 0
+        The seed which prefixes every generated value.
+
+    """
+    global _DETERMINISTIC, _DETERMINISTIC_SEED, _DETERMINISTIC_COUNT
+    _DETERMINISTIC = value
+    _DETERMINISTIC_SEED = seed
+    _DETERMINISTIC_COUNT = 0
+
+
+cdef class DeterministicUUIDScope:
+    """
+    Provides a scope within which generated `UUID4` values are deterministic.
+
+    Each scope holds its own seed and counter, and the sequence resumes from
+    where it left off each time the scope is entered. The previous generation
+    mode is restored when the outermost use of the scope exits, so the scope
+    can be safely nested and never leaks into code running outside of it.
+
+    Parameters
+    ----------
+    seed : uint32_t, default 0
+        The seed which prefixes every generated value (should be unique per scope).
+
+    Warnings
+    --------
+    Values are only unique within the process and between scopes with distinct
+    seeds, so a scope must not be used for live trading.
+
+    """
+
+    def __init__(self, uint32_t seed=0) -> None:
+        self.seed = seed
+        self.count = 0
+        self._depth = 0
+        self._prev_enabled = False
+        self._prev_seed = 0
+        self._prev_count = 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(seed={self.seed}, count={self.count})"
+
+    def __enter__(self) -> DeterministicUUIDScope:
+        global _DETERMINISTIC, _DETERMINISTIC_SEED, _DETERMINISTIC_COUNT
+        if self._depth == 0:
+            self._prev_enabled = _DETERMINISTIC
+            self._prev_seed = _DETERMINISTIC_SEED
+            self._prev_count = _DETERMINISTIC_COUNT
+            _DETERMINISTIC = True
+            _DETERMINISTIC_SEED = self.seed
+            _DETERMINISTIC_COUNT = self.count
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        global _DETERMINISTIC, _DETERMINISTIC_SEED, _DETERMINISTIC_COUNT
+        self._depth -= 1
+        if self._depth == 0:
+            self.count = _DETERMINISTIC_COUNT
+            _DETERMINISTIC = self._prev_enabled
+            _DETERMINISTIC_SEED = self._prev_seed
+            _DETERMINISTIC_COUNT = self._prev_count
+
+
+cdef inline void _write_hex(uint8_t* buffer, int start, int length, uint64_t value):
+    cdef int i
+    for i in range(start + length - 1, start - 1, -1):
+        buffer[i] = _HEX_DIGITS[value & 0xF]
+        value >>= 4
+
+
+cdef inline UUID4_t _deterministic_uuid4():
+    global _DETERMINISTIC_COUNT
+    _DETERMINISTIC_COUNT += 1
+
+    # Layout "ssssssss-0000-4000-8ccc-cccccccccccc" (valid version 4 and variant digits)
+    cdef UUID4_t mem
+    memcpy(mem.value, _DETERMINISTIC_TEMPLATE, 37)  # Includes null terminator
+    _write_hex(mem.value, 0, 8, _DETERMINISTIC_SEED)
+    _write_hex(mem.value, 20, 3, _DETERMINISTIC_COUNT >> 48)
+    _write_hex(mem.value, 24, 12, _DETERMINISTIC_COUNT)
+    return mem
+
+
 cdef class UUID4:
     """
     Represents a pseudo-random UUID (universally unique identifier)
@@ -44,7 +154,10 @@ cdef class UUID4:
 
     def __init__(self, str value = None):
         if value is None:
-            self._mem = uuid4_new()
+            if _DETERMINISTIC:
+                self._mem = _deterministic_uuid4()
+            else:
+                self._mem = uuid4_new()
         else:
             self._mem = uuid4_from_cstr(pystr_to_cstr(value))
 
@@ -16,6 +16,7 @@
 from __future__ import annotations
 
 from nautilus_trader.common.config import NautilusConfig
+from nautilus_trader.common.config import PositiveInt
 from nautilus_trader.model.identifiers import ClientId
 
 
@@ -41,6 +42,12 @@ class DataEngineConfig(NautilusConfig, frozen=True):
     external_clients : list[ClientId], optional
         The client IDs declared for external stream processing.
         The data engine will not attempt to send data commands to these client IDs.
+    catalog_cache_size : PositiveInt, optional
+        The maximum number of data series (per data type and instrument or bar type) queried
+        from a registered catalog to hold in memory. Repeated historical requests covered by a
+        cached time range are then served from memory, and requests extending beyond it only
+        query the missing tail. The catalog is assumed not to be written to for those ranges
+        while the engine is running. If ``None`` then catalog results are not cached.
     debug : bool, default False
         If debug mode is active (will provide extra debug logging).
 
@@ -52,4 +59,5 @@ class DataEngineConfig(NautilusConfig, frozen=True):
     validate_data_sequence: bool = False
     buffer_deltas: bool = False
     external_clients: list[ClientId] | None = None
+    catalog_cache_size: PositiveInt | None = None
     debug: bool = False
@@ -51,6 +51,8 @@ cdef class DataEngine(Component):
     cdef readonly DataClient _default_client
     cdef readonly set[ClientId] _external_clients
     cdef readonly object _catalog
+    cdef readonly dict _catalog_cache
+    cdef readonly int _catalog_cache_size
 
     cdef readonly dict[ClientId, DataClient] _clients
     cdef readonly dict[Venue, DataClient] _routing_map
@@ -143,6 +145,13 @@ cdef class DataEngine(Component):
     cpdef void _handle_unsubscribe_data(self, DataClient client, DataType data_type)
     cpdef void _handle_request(self, DataRequest request)
     cpdef void _query_catalog(self, DataRequest request)
+    cpdef tuple _catalog_time_range(self, DataRequest request)
+    cpdef list _query_catalog_data(self, DataType data_type, uint64_t ts_start, uint64_t ts_end)
+    cpdef DataResponse _catalog_response(self, DataRequest request, list data)
+    cdef object _catalog_cache_key(self, DataType data_type)
+    cpdef list _catalog_cache_get(self, DataType data_type, uint64_t ts_start, uint64_t ts_end)
+    cpdef tuple _catalog_query_range(self, DataType data_type, uint64_t ts_start, uint64_t ts_end)
+    cpdef bint _catalog_cache_put(self, DataType data_type, uint64_t ts_start, uint64_t ts_end, list data)
 
 # -- DATA HANDLERS --------------------------------------------------------------------------------
 
@@ -161,6 +170,8 @@ cdef class DataEngine(Component):
 # -- RESPONSE HANDLERS ----------------------------------------------------------------------------
 
     cpdef void _handle_response(self, DataResponse response)
+    cpdef void _handle_response_data(self, DataResponse response)
+    cpdef void _send_response_chunk(self, DataResponse response, list data, bint final)
     cpdef void _handle_instruments(self, list instruments)
     cpdef void _handle_quote_ticks(self, list ticks)
     cpdef void _handle_trade_ticks(self, list ticks)
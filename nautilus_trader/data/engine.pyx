@@ -29,6 +29,9 @@ Alternative implementations can be written on top of the generic engine - which
 just need to override the `execute`, `process`, `send` and `receive` methods.
 """
 
+from bisect import bisect_left
+from bisect import bisect_right
+from operator import attrgetter
 from typing import Callable
 
 from nautilus_trader.common.enums import LogColor
@@ -45,6 +48,7 @@ from nautilus_trader.common.component cimport REQ
 from nautilus_trader.common.component cimport RES
 from nautilus_trader.common.component cimport Clock
 from nautilus_trader.common.component cimport Component
+from nautilus_trader.common.component cimport LogLevel
 from nautilus_trader.common.component cimport Logger
 from nautilus_trader.common.component cimport MessageBus
 from nautilus_trader.core.correctness cimport Condition
@@ -92,6 +96,11 @@ from nautilus_trader.model.objects cimport Quantity
 from nautilus_trader.model.enums import RecordFlag
 
 
+# Request metadata which does not identify the cached catalog series
+cdef frozenset _CATALOG_RANGE_KEYS = frozenset(("start", "end", "limit"))
+_ts_init = attrgetter("ts_init")
+
+
 cdef class DataEngine(Component):
     """
     Provides a high-performance data engine for managing many `DataClient`
@@ -133,6 +142,7 @@ cdef class DataEngine(Component):
         self._default_client: DataClient | None = None
         self._external_clients: set[ClientId] = set()
         self._catalog: ParquetDataCatalog | None = None
+        self._catalog_cache: dict[tuple, tuple[int, int, list[Data]]] = {}
         self._order_book_intervals: dict[tuple[InstrumentId, int], list[Callable[[OrderBook], None]]] = {}
         self._bar_aggregators: dict[BarType, BarAggregator] = {}
         self._synthetic_quote_feeds: dict[InstrumentId, list[SyntheticInstrument]] = {}
@@ -149,6 +159,7 @@ cdef class DataEngine(Component):
         self._time_bars_interval_type = config.time_bars_interval_type
         self._validate_data_sequence = config.validate_data_sequence
         self._buffer_deltas = config.buffer_deltas
+        self._catalog_cache_size = config.catalog_cache_size or 0
 
         if config.external_clients:
             self._external_clients = set(config.external_clients)
@@ -250,6 +261,7 @@ cdef class DataEngine(Component):
         Condition.not_none(catalog, "catalog")
 
         self._catalog = catalog
+        self._catalog_cache.clear()
 
     cpdef void register_client(self, DataClient client):
         """
@@ -540,6 +552,7 @@ cdef class DataEngine(Component):
         self._subscribed_synthetic_trades.clear()
         self._buffered_deltas_map.clear()
         self._snapshot_info.clear()
+        self._catalog_cache.clear()
 
         self._clock.cancel_timers()
         self.command_count = 0
@@ -622,7 +635,7 @@ cdef class DataEngine(Component):
 # -- COMMAND HANDLERS -----------------------------------------------------------------------------
 
     cpdef void _execute_command(self, DataCommand command):
-        if self.debug:
+        if self.debug and self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"{RECV}{CMD} {command}", LogColor.MAGENTA)
         self.command_count += 1
 
@@ -1261,7 +1274,7 @@ cdef class DataEngine(Component):
 # -- REQUEST HANDLERS -----------------------------------------------------------------------------
 
     cpdef void _handle_request(self, DataRequest request):
-        if self.debug:
+        if self.debug and self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"{RECV}{REQ} {request}", LogColor.MAGENTA)
         self.request_count += 1
 
@@ -1342,6 +1355,24 @@ cdef class DataEngine(Component):
                 self._log.error(f"Cannot handle request: unrecognized data type {request.data_type}")
 
     cpdef void _query_catalog(self, DataRequest request):
+        cdef tuple time_range = self._catalog_time_range(request)
+        cdef uint64_t ts_start = time_range[0]
+        cdef uint64_t ts_end = time_range[1]
+
+        cdef list data = self._catalog_cache_get(request.data_type, ts_start, ts_end)
+        cdef tuple query_range
+        if data is None:
+            query_range = self._catalog_query_range(request.data_type, ts_start, ts_end)
+            data = self._query_catalog_data(request.data_type, query_range[0], query_range[1])
+            if data is None:
+                self._log.error("No bar type provided for bars request")
+                return
+            if self._catalog_cache_put(request.data_type, query_range[0], query_range[1], data):
+                data = self._catalog_cache_get(request.data_type, ts_start, ts_end)
+
+        self._handle_response(self._catalog_response(request, data))
+
+    cpdef tuple _catalog_time_range(self, DataRequest request):
         cdef datetime start = request.data_type.metadata.get("start")
         cdef datetime end = request.data_type.metadata.get("end")
 
@@ -1359,49 +1390,55 @@ cdef class DataEngine(Component):
             )
             ts_end = ts_now
 
-        if request.data_type.type == Instrument:
-            instrument_id = request.data_type.metadata.get("instrument_id")
+        return ts_start, ts_end
+
+    cpdef list _query_catalog_data(self, DataType data_type, uint64_t ts_start, uint64_t ts_end):
+        # Only touches the catalog, so that live engines can run this on an executor thread
+        if data_type.type == Instrument:
+            instrument_id = data_type.metadata.get("instrument_id")
             if instrument_id is None:
-                data = self._catalog.instruments()
+                return self._catalog.instruments()
             else:
-                data = self._catalog.instruments(instrument_ids=[str(instrument_id)])
-        elif request.data_type.type == QuoteTick:
-            data = self._catalog.quote_ticks(
-                instrument_ids=[str(request.data_type.metadata.get("instrument_id"))],
+                return self._catalog.instruments(instrument_ids=[str(instrument_id)])
+        elif data_type.type == QuoteTick:
+            return self._catalog.quote_ticks(
+                instrument_ids=[str(data_type.metadata.get("instrument_id"))],
                 start=ts_start,
                 end=ts_end,
             )
-        elif request.data_type.type == TradeTick:
-            data = self._catalog.trade_ticks(
-                instrument_ids=[str(request.data_type.metadata.get("instrument_id"))],
+        elif data_type.type == TradeTick:
+            return self._catalog.trade_ticks(
+                instrument_ids=[str(data_type.metadata.get("instrument_id"))],
                 start=ts_start,
                 end=ts_end,
             )
-        elif request.data_type.type == Bar:
-            bar_type = request.data_type.metadata.get("bar_type")
+        elif data_type.type == Bar:
+            bar_type = data_type.metadata.get("bar_type")
             if bar_type is None:
-                self._log.error("No bar type provided for bars request")
-                return
-            data = self._catalog.bars(
+                return None
+            return self._catalog.bars(
                 instrument_ids=[str(bar_type.instrument_id)],
                 bar_type=str(bar_type),
                 start=ts_start,
                 end=ts_end,
             )
-        elif request.data_type.type == InstrumentClose:
-            data = self._catalog.instrument_closes(
-                instrument_ids=[str(request.data_type.metadata.get("instrument_id"))],
+        elif data_type.type == InstrumentClose:
+            return self._catalog.instrument_closes(
+                instrument_ids=[str(data_type.metadata.get("instrument_id"))],
                 start=ts_start,
                 end=ts_end,
             )
         else:
-            data = self._catalog.custom_data(
-                cls=request.data_type.type,
-                metadata=request.data_type.metadata,
+            return self._catalog.custom_data(
+                cls=data_type.type,
+                metadata=data_type.metadata,
                 start=ts_start,
                 end=ts_end,
             )
 
+    cpdef DataResponse _catalog_response(self, DataRequest request, list data):
+        cdef uint64_t ts_now = self._clock.timestamp_ns()
+
         # Validation data is not from the future
         if data and data[-1].ts_init > ts_now:
             raise RuntimeError(
@@ -1409,16 +1446,86 @@ cdef class DataEngine(Component):
                 f"data[-1].ts_init={data[-1].ts_init}, {ts_now=}",
             )
 
-        response = DataResponse(
+        return DataResponse(
             client_id=request.client_id,
             venue=request.venue,
             data_type=request.data_type,
             data=data,
             correlation_id=request.id,
             response_id=UUID4(),
-            ts_init=self._clock.timestamp_ns(),
+            ts_init=ts_now,
         )
-        self._handle_response(response)
+
+    cdef object _catalog_cache_key(self, DataType data_type):
+        if self._catalog_cache_size == 0 or data_type.type == Instrument:
+            return None  # Caching disabled, or data without a time range
+
+        # The same series regardless of the requested time range
+        key = (
+            data_type.type,
+            frozenset([(k, v) for k, v in data_type.metadata.items() if k not in _CATALOG_RANGE_KEYS]),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None  # Unhashable metadata
+
+        return key
+
+    cpdef list _catalog_cache_get(self, DataType data_type, uint64_t ts_start, uint64_t ts_end):
+        key = self._catalog_cache_key(data_type)
+        if key is None:
+            return None
+
+        cdef tuple entry = self._catalog_cache.pop(key, None)
+        if entry is None:
+            return None
+
+        self._catalog_cache[key] = entry  # Move to most recently used
+        if ts_start < entry[0] or ts_end > entry[1]:
+            return None  # Not covered by the cached range
+
+        cdef list data = entry[2]
+        return data[
+            bisect_left(data, ts_start, key=_ts_init):bisect_right(data, ts_end, key=_ts_init)
+        ]
+
+    cpdef tuple _catalog_query_range(self, DataType data_type, uint64_t ts_start, uint64_t ts_end):
+        key = self._catalog_cache_key(data_type)
+        if key is None:
+            return ts_start, ts_end
+
+        cdef tuple entry = self._catalog_cache.get(key)
+        if entry is not None and entry[0] <= ts_start <= entry[1] < ts_end:
+            # Only the tail beyond the cached range is missing
+            return entry[1] + 1, ts_end
+
+        return ts_start, ts_end
+
+    cpdef bint _catalog_cache_put(
+        self,
+        DataType data_type,
+        uint64_t ts_start,
+        uint64_t ts_end,
+        list data,
+    ):
+        key = self._catalog_cache_key(data_type)
+        if key is None:
+            return False
+
+        cdef tuple entry = self._catalog_cache.pop(key, None)
+        if entry is not None and ts_start == entry[1] + 1:
+            # Extend the cached range with the contiguous queried tail
+            entry = (entry[0], ts_end, entry[2] + data)
+        else:
+            entry = (ts_start, ts_end, data)
+
+        self._catalog_cache[key] = entry
+        if len(self._catalog_cache) > self._catalog_cache_size:
+            # Evict least recently used
+            self._catalog_cache.pop(next(iter(self._catalog_cache)))
+
+        return True
 
 # -- DATA HANDLERS --------------------------------------------------------------------------------
 
@@ -1621,10 +1728,14 @@ cdef class DataEngine(Component):
 # -- RESPONSE HANDLERS ----------------------------------------------------------------------------
 
     cpdef void _handle_response(self, DataResponse response):
-        if self.debug:
+        if self.debug and self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"{RECV}{RES} {response}", LogColor.MAGENTA)
         self.response_count += 1
 
+        self._handle_response_data(response)
+        self._msgbus.response(response)
+
+    cpdef void _handle_response_data(self, DataResponse response):
         if response.data_type.type == Instrument:
             if isinstance(response.data, list):
                 self._handle_instruments(response.data)
@@ -1637,7 +1748,21 @@ cdef class DataEngine(Component):
         elif response.data_type.type == Bar:
             self._handle_bars(response.data, response.data_type.metadata.get("Partial"))
 
-        self._msgbus.response(response)
+    cpdef void _send_response_chunk(self, DataResponse response, list data, bint final):
+        cdef DataResponse chunk = DataResponse(
+            client_id=response.client_id,
+            venue=response.venue,
+            data_type=response.data_type,
+            data=data,
+            correlation_id=response.correlation_id,
+            response_id=UUID4(),
+            ts_init=self._clock.timestamp_ns(),
+        )
+
+        if final:
+            self.response_count += 1
+
+        self._msgbus.response(chunk, final)
 
     cpdef void _handle_instruments(self, list instruments):
         cdef Instrument instrument
@@ -1686,7 +1811,7 @@ cdef class DataEngine(Component):
         order_book.apply(data)
 
     cpdef void _snapshot_order_book(self, TimeEvent snap_event):
-        if self.debug:
+        if self.debug and self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"Received snapshot event for {snap_event}", LogColor.MAGENTA)
 
         cdef SnapshotInfo snap_info = self._snapshot_info.get(snap_event.name)
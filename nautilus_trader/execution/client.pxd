@@ -63,6 +63,7 @@ cdef class ExecutionClient(Component):
     """If the client is connected.\n\n:returns: `bool`"""
 
     cpdef Account get_account(self)
+    cpdef bint supports_batch_cancel(self)
 
     cpdef void _set_connected(self, bint value=*)
     cpdef void _set_account_id(self, AccountId account_id)
@@ -156,6 +156,20 @@ cdef class ExecutionClient(Component):
         """
         return self._cache.account(self.account_id)
 
+    cpdef bint supports_batch_cancel(self):
+        """
+        Return whether the client implements native batch order cancellation.
+
+        If ``False`` then the `ExecutionEngine` will route each `CancelOrder`
+        within a `BatchCancelOrders` command to `cancel_order` individually.
+
+        Returns
+        -------
+        bool
+
+        """
+        return type(self).batch_cancel_orders is not ExecutionClient.batch_cancel_orders
+
 # -- COMMAND HANDLERS -----------------------------------------------------------------------------
 
     cpdef void submit_order(self, SubmitOrder command):
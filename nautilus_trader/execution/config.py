@@ -21,6 +21,7 @@ import msgspec
 
 from nautilus_trader.common.config import NautilusConfig
 from nautilus_trader.common.config import PositiveFloat
+from nautilus_trader.common.config import PositiveInt
 from nautilus_trader.common.config import msgspec_encoding_hook
 from nautilus_trader.common.config import resolve_config_path
 from nautilus_trader.common.config import resolve_path
@@ -50,6 +51,12 @@ class ExecEngineConfig(NautilusConfig, frozen=True):
         If ``None`` then no additional snapshots will be taken.
         To include unrealized PnL in these snapshots, quotes for the position's instrument must be
         available in the cache.
+    position_max_events : PositiveInt, optional
+        The maximum number of fill events retained per position (compact mode).
+        Long-lived positions will then only hold their aggregate state plus the last
+        `position_max_events` fills in memory (also applied to positions loaded from
+        the cache database).
+        If ``None`` then all fill events are retained for the life of each position.
     debug : bool, default False
         If debug mode is active (will provide extra debug logging).
 
@@ -59,6 +66,7 @@ class ExecEngineConfig(NautilusConfig, frozen=True):
     snapshot_orders: bool = False
     snapshot_positions: bool = False
     snapshot_positions_interval_secs: PositiveFloat | None = None
+    position_max_events: PositiveInt | None = None
     debug: bool = False
 
 
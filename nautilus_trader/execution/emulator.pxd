@@ -49,6 +49,8 @@ cdef class OrderEmulator(Actor):
 
     cdef readonly bint debug
     """If debug mode is active (will provide extra debug logging).\n\n:returns: `bool`"""
+    cdef readonly bint auto_unsubscribe
+    """If market data is unsubscribed from once no emulated orders remain for an instrument.\n\n:returns: `bool`"""
     cdef readonly int command_count
     """The total count of commands received by the emulator.\n\n:returns: `int`"""
     cdef readonly int event_count
@@ -73,4 +75,5 @@ cdef class OrderEmulator(Actor):
     cpdef void _fill_limit_order(self, Order order)
 
     cdef void _iterate_orders(self, MatchingCore matching_core)
+    cdef void _check_idle(self, MatchingCore matching_core)
     cdef void _update_trailing_stop_order(self, MatchingCore matching_core, Order order)
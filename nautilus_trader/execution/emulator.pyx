@@ -15,6 +15,7 @@
 
 from nautilus_trader.common.config import OrderEmulatorConfig
 
+from libc.stdint cimport int64_t
 from libc.stdint cimport uint8_t
 from libc.stdint cimport uint64_t
 
@@ -26,8 +27,8 @@ from nautilus_trader.common.component cimport RECV
 from nautilus_trader.common.component cimport SENT
 from nautilus_trader.common.component cimport Clock
 from nautilus_trader.common.component cimport LogColor
+from nautilus_trader.common.component cimport LogLevel
 from nautilus_trader.common.component cimport MessageBus
-from nautilus_trader.common.component cimport is_logging_initialized
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.message cimport Event
 from nautilus_trader.core.rust.model cimport ContingencyType
@@ -36,6 +37,10 @@ from nautilus_trader.core.rust.model cimport OrderStatus
 from nautilus_trader.core.rust.model cimport OrderType
 from nautilus_trader.core.rust.model cimport TimeInForce
 from nautilus_trader.core.rust.model cimport TriggerType
+from nautilus_trader.core.rust.model cimport orderbook_best_ask_price
+from nautilus_trader.core.rust.model cimport orderbook_best_bid_price
+from nautilus_trader.core.rust.model cimport orderbook_has_ask
+from nautilus_trader.core.rust.model cimport orderbook_has_bid
 from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.execution.manager cimport OrderManager
 from nautilus_trader.execution.matching_core cimport MatchingCore
@@ -138,6 +143,7 @@ cdef class OrderEmulator(Actor):
 
         # Settings
         self.debug: bool = config.debug
+        self.auto_unsubscribe: bool = config.auto_unsubscribe
 
         # Counters
         self.command_count: int = 0
@@ -266,6 +272,7 @@ cdef class OrderEmulator(Actor):
             matching_core = self._matching_cores.get(order.instrument_id)
             if matching_core is not None:
                 matching_core.delete_order(order)
+                self._check_idle(matching_core)
 
     cpdef void on_stop(self):
         pass
@@ -405,6 +412,9 @@ cdef class OrderEmulator(Actor):
         # Check if immediately marketable (initial match)
         matching_core.match_order(order, initial=True)
 
+        if self.auto_unsubscribe and order.client_order_id not in self._manager.get_submit_order_commands():
+            return  # Already released (no market data required)
+
         # Check data subscription
         if emulation_trigger == TriggerType.DEFAULT or emulation_trigger == TriggerType.BID_ASK:
             if trigger_instrument_id not in self._subscribed_quotes:
@@ -517,6 +527,8 @@ cdef class OrderEmulator(Actor):
         else:
             raise RuntimeError("invalid `OrderSide`")  # pragma: no cover (design-time error)
 
+        self._check_idle(matching_core)
+
     cdef void _handle_cancel_order(self, CancelOrder command):
         cdef Order order = self.cache.order(command.client_order_id)
         if order is None:
@@ -587,6 +599,7 @@ cdef class OrderEmulator(Actor):
         cdef MatchingCore matching_core = self._matching_cores.get(trigger_instrument_id)
         if matching_core is not None:
             matching_core.delete_order(order)
+            self._check_idle(matching_core)
 
         self.cache.update_order_pending_cancel_local(order)
 
@@ -800,7 +813,7 @@ cdef class OrderEmulator(Actor):
     cpdef void on_order_book_deltas(self, deltas):
         cdef OrderBookDeltas _deltas = deltas  # C typing to optimize performance
 
-        if is_logging_initialized():
+        if self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"Processing {repr(_deltas)}", LogColor.CYAN)
 
 
@@ -814,19 +827,28 @@ cdef class OrderEmulator(Actor):
             self.log.error(f"Cannot handle `OrderBookDeltas`: no book being maintained for {_deltas.instrument_id}")
             return
 
-        cdef Price best_bid = book.best_bid_price()
-        cdef Price best_ask = book.best_ask_price()
+        # Read top-of-book as raw values (avoids creating `Price` objects per update)
+        cdef bint has_bid = orderbook_has_bid(&book._mem)
+        cdef bint has_ask = orderbook_has_ask(&book._mem)
+        cdef int64_t bid_raw = orderbook_best_bid_price(&book._mem).raw if has_bid else 0
+        cdef int64_t ask_raw = orderbook_best_ask_price(&book._mem).raw if has_ask else 0
+
+        if (
+            (not has_bid or (matching_core.is_bid_initialized and matching_core.bid_raw == bid_raw))
+            and (not has_ask or (matching_core.is_ask_initialized and matching_core.ask_raw == ask_raw))
+        ):
+            return  # Top-of-book unchanged
 
-        if best_bid is not None:
-            matching_core.set_bid_raw(best_bid._mem.raw)
+        if has_bid:
+            matching_core.set_bid_raw(bid_raw)
 
-        if best_ask is not None:
-            matching_core.set_ask_raw(best_ask._mem.raw)
+        if has_ask:
+            matching_core.set_ask_raw(ask_raw)
 
         self._iterate_orders(matching_core)
 
     cpdef void on_quote_tick(self, QuoteTick tick):
-        if is_logging_initialized():
+        if self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"Processing {repr(tick)}", LogColor.CYAN)
 
         cdef MatchingCore matching_core = self._matching_cores.get(tick.instrument_id)
@@ -834,13 +856,21 @@ cdef class OrderEmulator(Actor):
             self._log.error(f"Cannot handle `QuoteTick`: no matching core for instrument {tick.instrument_id}")
             return
 
+        if (
+            matching_core.is_bid_initialized
+            and matching_core.is_ask_initialized
+            and matching_core.bid_raw == tick._mem.bid_price.raw
+            and matching_core.ask_raw == tick._mem.ask_price.raw
+        ):
+            return  # Top-of-book unchanged
+
         matching_core.set_bid_raw(tick._mem.bid_price.raw)
         matching_core.set_ask_raw(tick._mem.ask_price.raw)
 
         self._iterate_orders(matching_core)
 
     cpdef void on_trade_tick(self, TradeTick tick):
-        if is_logging_initialized():
+        if self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"Processing {repr(tick)}...", LogColor.CYAN)
 
         cdef MatchingCore matching_core = self._matching_cores.get(tick.instrument_id)
@@ -848,6 +878,9 @@ cdef class OrderEmulator(Actor):
             self._log.error(f"Cannot handle `TradeTick`: no matching core for instrument {tick.instrument_id}")
             return
 
+        if matching_core.is_last_initialized and matching_core.last_raw == tick._mem.price.raw:
+            return  # Last price unchanged
+
         matching_core.set_last_raw(tick._mem.price.raw)
         if tick.instrument_id not in self._subscribed_quotes:
             matching_core.set_bid_raw(tick._mem.price.raw)
@@ -856,17 +889,46 @@ cdef class OrderEmulator(Actor):
         self._iterate_orders(matching_core)
 
     cdef void _iterate_orders(self, MatchingCore matching_core):
-        matching_core.iterate(self._clock.timestamp_ns())
+        # Only iterate when the market has reached the nearest trigger price of a held order
+        if matching_core.is_trigger_crossed():
+            matching_core.iterate(self._clock.timestamp_ns())
 
-        cdef list orders = matching_core.get_orders()
+        cdef list orders
         cdef Order order
-        for order in orders:
-            if order.is_closed_c():
-                continue
+        if matching_core.has_trailing_stop_orders():
+            orders = matching_core.get_orders()
+            for order in orders:
+                if order.is_closed_c():
+                    continue
+
+                # Manage trailing stop
+                if order.order_type == OrderType.TRAILING_STOP_MARKET or order.order_type == OrderType.TRAILING_STOP_LIMIT:
+                    self._update_trailing_stop_order(matching_core, order)
+
+        self._check_idle(matching_core)
+
+    cdef void _check_idle(self, MatchingCore matching_core):
+        if not self.auto_unsubscribe or matching_core.has_orders():
+            return
+
+        cdef InstrumentId instrument_id = matching_core.instrument_id
+        if instrument_id not in self._subscribed_quotes and instrument_id not in self._subscribed_trades:
+            return  # Nothing subscribed
+
+        if instrument_id in self._subscribed_quotes:
+            if not instrument_id.is_synthetic():
+                self.unsubscribe_order_book_deltas(instrument_id)
+            self.unsubscribe_quote_ticks(instrument_id)
+            self._subscribed_quotes.discard(instrument_id)
+
+        if instrument_id in self._subscribed_trades:
+            self.unsubscribe_trade_ticks(instrument_id)
+            self._subscribed_trades.discard(instrument_id)
+
+        # Market state is no longer maintained, avoid matching against stale prices
+        matching_core.reset()
 
-            # Manage trailing stop
-            if order.order_type == OrderType.TRAILING_STOP_MARKET or order.order_type == OrderType.TRAILING_STOP_LIMIT:
-                self._update_trailing_stop_order(matching_core, order)
+        self._log.info(f"No emulated orders for {instrument_id}, unsubscribed from market data", LogColor.MAGENTA)
 
     cdef void _update_trailing_stop_order(self, MatchingCore matching_core, Order order):
         # TODO: Improve efficiency of this ---------------------------------
@@ -926,5 +988,6 @@ cdef class OrderEmulator(Actor):
         )
         order.apply(event)
         self.cache.update_order(order)
+        matching_core.invalidate_triggers()
 
         self._manager.send_risk_event(event)
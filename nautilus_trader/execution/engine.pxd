@@ -61,6 +61,8 @@ cdef class ExecutionEngine(Component):
     """If position state snapshots should be persisted.\n\n:returns: `bool`"""
     cdef readonly double snapshot_positions_interval_secs
     """The interval (seconds) at which additional position state snapshots are persisted.\n\n:returns: `double`"""
+    cdef readonly int position_max_events
+    """The maximum number of fill events retained per position (zero for unbounded).\n\n:returns: `int`"""
     cdef readonly int command_count
     """The total count of commands received by the engine.\n\n:returns: `int`"""
     cdef readonly int event_count
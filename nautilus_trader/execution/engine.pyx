@@ -47,6 +47,7 @@ from nautilus_trader.common.component cimport RECV
 from nautilus_trader.common.component cimport Clock
 from nautilus_trader.common.component cimport Component
 from nautilus_trader.common.component cimport LogColor
+from nautilus_trader.common.component cimport LogLevel
 from nautilus_trader.common.component cimport Logger
 from nautilus_trader.common.component cimport MessageBus
 from nautilus_trader.common.component cimport TimeEvent
@@ -151,10 +152,12 @@ cdef class ExecutionEngine(Component):
         self.snapshot_positions = config.snapshot_positions
         self.snapshot_positions_interval_secs = config.snapshot_positions_interval_secs or 0
         self.snapshot_positions_timer_name = "ExecEngine_SNAPSHOT_POSITIONS"
+        self.position_max_events = config.position_max_events or 0
 
         self._log.info(f"{config.snapshot_orders=}", LogColor.BLUE)
         self._log.info(f"{config.snapshot_positions=}", LogColor.BLUE)
         self._log.info(f"{config.snapshot_positions_interval_secs=}", LogColor.BLUE)
+        self._log.info(f"{config.position_max_events=}", LogColor.BLUE)
 
         # Counters
         self.command_count: int = 0
@@ -750,7 +753,7 @@ cdef class ExecutionEngine(Component):
 # -- COMMAND HANDLERS -----------------------------------------------------------------------------
 
     cpdef void _execute_command(self, TradingCommand command):
-        if self.debug:
+        if self.debug and self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"{RECV}{CMD} {command}", LogColor.MAGENTA)
         self.command_count += 1
 
@@ -865,7 +868,14 @@ cdef class ExecutionEngine(Component):
         client.cancel_all_orders(command)
 
     cpdef void _handle_batch_cancel_orders(self, ExecutionClient client, BatchCancelOrders command):
-        client.batch_cancel_orders(command)
+        if client.supports_batch_cancel():
+            client.batch_cancel_orders(command)
+            return
+
+        # Client has no native batch cancel, so route each cancel individually
+        cdef CancelOrder cancel
+        for cancel in command.cancels:
+            client.cancel_order(cancel)
 
     cpdef void _handle_query_order(self, ExecutionClient client, QueryOrder command):
         client.query_order(command)
@@ -873,7 +883,7 @@ cdef class ExecutionEngine(Component):
 # -- EVENT HANDLERS -------------------------------------------------------------------------------
 
     cpdef void _handle_event(self, OrderEvent event):
-        if self.debug:
+        if self.debug and self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"{RECV}{EVT} {event}", LogColor.MAGENTA)
         self.event_count += 1
 
@@ -947,7 +957,7 @@ cdef class ExecutionEngine(Component):
     cpdef void _determine_position_id(self, OrderFilled fill, OmsType oms_type):
         # Fetch ID from cache
         cdef PositionId position_id = self._cache.position_id(fill.client_order_id)
-        if self.debug:
+        if self.debug and self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(
                 f"Determining position ID for {fill.client_order_id!r}, "
                 f"position_id={position_id!r}",
@@ -962,7 +972,7 @@ cdef class ExecutionEngine(Component):
                 )
             # Assign position ID to fill
             fill.position_id = position_id
-            if self.debug:
+            if self.debug and self._log.is_enabled(LogLevel.DEBUG):
                 self._log.debug(f"Assigned {position_id!r} to {fill}", LogColor.MAGENTA)
             return
 
@@ -999,11 +1009,12 @@ cdef class ExecutionEngine(Component):
                 primary.client_order_id,
                 primary.strategy_id,
             )
-            self._log.debug(f"Assigned primary order {position_id!r}", LogColor.MAGENTA)
+            if self._log.is_enabled(LogLevel.DEBUG):
+                self._log.debug(f"Assigned primary order {position_id!r}", LogColor.MAGENTA)
 
     cpdef PositionId _determine_hedging_position_id(self, OrderFilled fill):
         if fill.position_id is not None:
-            if self.debug:
+            if self.debug and self._log.is_enabled(LogLevel.DEBUG):
                 self._log.debug(f"Already had a position ID of: {fill.position_id!r}", LogColor.MAGENTA)
             # Already assigned
             return fill.position_id
@@ -1021,14 +1032,14 @@ cdef class ExecutionEngine(Component):
             exec_spawn_orders = self._cache.orders_for_exec_spawn(order.exec_spawn_id)
             for spawned_order in exec_spawn_orders:
                 if spawned_order.position_id is not None:
-                    if self.debug:
+                    if self.debug and self._log.is_enabled(LogLevel.DEBUG):
                         self._log.debug(f"Found spawned {spawned_order.position_id!r} for {fill}", LogColor.MAGENTA)
                     # Use position ID for execution spawn
                     return spawned_order.position_id
 
         # Assign new position ID
         position_id = self._pos_id_generator.generate(fill.strategy_id)
-        if self.debug:
+        if self.debug and self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"Generated {position_id!r} for {fill}", LogColor.MAGENTA)
         return position_id
 
@@ -1097,7 +1108,7 @@ cdef class ExecutionEngine(Component):
 
     cpdef Position _open_position(self, Instrument instrument, Position position, OrderFilled fill, OmsType oms_type):
         if position is None:
-            position = Position(instrument, fill)
+            position = Position(instrument, fill, self.position_max_events or None)
             self._cache.add_position(position, oms_type)
             if self.snapshot_positions:
                 self._create_position_state_snapshot(position)
@@ -1253,7 +1264,7 @@ cdef class ExecutionEngine(Component):
         self._open_position(instrument, None, fill_split2, oms_type)
 
     cpdef void _create_order_state_snapshot(self, Order order):
-        if self.debug:
+        if self.debug and self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"Creating order state snapshot for {order}", LogColor.MAGENTA)
 
         if self._cache.has_backing:
@@ -1266,7 +1277,7 @@ cdef class ExecutionEngine(Component):
             )
 
     cpdef void _create_position_state_snapshot(self, Position position):
-        if self.debug:
+        if self.debug and self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"Creating position state snapshot for {position}", LogColor.MAGENTA)
 
         cdef Money unrealized_pnl = self._cache.calculate_unrealized_pnl(position)
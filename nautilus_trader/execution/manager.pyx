@@ -32,6 +32,7 @@ from nautilus_trader.core.rust.model cimport ContingencyType
 from nautilus_trader.core.rust.model cimport OrderStatus
 from nautilus_trader.core.rust.model cimport TriggerType
 from nautilus_trader.core.uuid cimport UUID4
+from nautilus_trader.execution.messages cimport BatchCancelOrders
 from nautilus_trader.execution.messages cimport CancelAllOrders
 from nautilus_trader.execution.messages cimport CancelOrder
 from nautilus_trader.execution.messages cimport ModifyOrder
@@ -577,7 +578,15 @@ cdef class OrderManager:
         Condition.not_none(command, "command")
 
         if is_logging_initialized():
-            self._log.info(f"{CMD}{SENT} {command}")  # pragma: no cover  (no logging in tests)
+            if isinstance(command, BatchCancelOrders):
+                # Avoid formatting every contained cancel for large batches
+                self._log.info(  # pragma: no cover  (no logging in tests)
+                    f"{CMD}{SENT} BatchCancelOrders("
+                    f"instrument_id={command.instrument_id.to_str()}, "
+                    f"cancels={len(command.cancels)})",
+                )
+            else:
+                self._log.info(f"{CMD}{SENT} {command}")  # pragma: no cover  (no logging in tests)
         self._msgbus.send(endpoint="ExecEngine.execute", msg=command)
 
     cpdef void send_risk_event(self, OrderEvent event):
@@ -36,6 +36,13 @@ cdef class MatchingCore:
     cdef readonly bint is_ask_initialized
     cdef readonly bint is_last_initialized
 
+    cdef int64_t _bid_trigger_low
+    cdef int64_t _bid_trigger_high
+    cdef int64_t _ask_trigger_low
+    cdef int64_t _ask_trigger_high
+    cdef bint _has_trailing_stops
+    cdef bint _triggers_stale
+
     cdef object _trigger_stop_order
     cdef object _fill_market_order
     cdef object _fill_limit_order
@@ -51,6 +58,9 @@ cdef class MatchingCore:
     cpdef list get_orders(self)
     cpdef list get_orders_bid(self)
     cpdef list get_orders_ask(self)
+    cpdef bint is_trigger_crossed(self)
+    cpdef bint has_orders(self)
+    cpdef bint has_trailing_stop_orders(self)
 
 # -- COMMANDS -------------------------------------------------------------------------------------
 
@@ -65,6 +75,8 @@ cdef class MatchingCore:
     cdef void sort_ask_orders(self)
     cpdef void delete_order(self, Order order)
     cpdef void iterate(self, uint64_t timestamp_ns)
+    cdef void invalidate_triggers(self)
+    cdef void _update_triggers(self)
 
 # -- MATCHING -------------------------------------------------------------------------------------
 
@@ -81,3 +93,4 @@ cdef class MatchingCore:
 
 
 cdef int64_t order_sort_key(Order order)
+cdef bint is_stop_trigger(Order order)
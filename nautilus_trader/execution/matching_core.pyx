@@ -15,6 +15,8 @@
 
 from typing import Callable
 
+from libc.stdint cimport INT64_MAX
+from libc.stdint cimport INT64_MIN
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.core.correctness cimport Condition
@@ -65,6 +67,14 @@ cdef class MatchingCore:
         self.is_ask_initialized = False
         self.is_last_initialized = False
 
+        # Nearest trigger prices (lazily updated when orders change)
+        self._bid_trigger_low = INT64_MIN
+        self._bid_trigger_high = INT64_MAX
+        self._ask_trigger_low = INT64_MIN
+        self._ask_trigger_high = INT64_MAX
+        self._has_trailing_stops = False
+        self._triggers_stale = False
+
         # Event handlers
         self._trigger_stop_order = trigger_stop_order
         self._fill_market_order = fill_market_order
@@ -175,6 +185,54 @@ cdef class MatchingCore:
     cpdef list get_orders_ask(self):
         return self._orders_ask
 
+    cpdef bint is_trigger_crossed(self):
+        """
+        Return a value indicating whether the current market crosses the
+        nearest trigger (or limit) price of any order held in the core.
+
+        When this returns ``False`` a call to `iterate` would not match any order,
+        and so can be skipped.
+
+        Returns
+        -------
+        bool
+
+        """
+        if self._triggers_stale:
+            self._update_triggers()
+
+        # BUY orders match against the ask, SELL orders match against the bid
+        if self.is_ask_initialized and (self.ask_raw <= self._ask_trigger_low or self.ask_raw >= self._ask_trigger_high):
+            return True
+        if self.is_bid_initialized and (self.bid_raw >= self._bid_trigger_high or self.bid_raw <= self._bid_trigger_low):
+            return True
+        return False
+
+    cpdef bint has_orders(self):
+        """
+        Return a value indicating whether any orders are held in the core.
+
+        Returns
+        -------
+        bool
+
+        """
+        return len(self._orders_bid) > 0 or len(self._orders_ask) > 0
+
+    cpdef bint has_trailing_stop_orders(self):
+        """
+        Return a value indicating whether any trailing stop orders are held in the core.
+
+        Returns
+        -------
+        bool
+
+        """
+        if self._triggers_stale:
+            self._update_triggers()
+
+        return self._has_trailing_stops
+
 # -- COMMANDS -------------------------------------------------------------------------------------
 
     cdef void set_bid_raw(self, int64_t bid_raw):
@@ -199,6 +257,7 @@ cdef class MatchingCore:
         self.is_bid_initialized = False
         self.is_ask_initialized = False
         self.is_last_initialized = False
+        self._triggers_stale = True
 
     cpdef void add_order(self, Order order):
         Condition.not_none(order, "order")
@@ -221,9 +280,11 @@ cdef class MatchingCore:
 
     cdef void sort_bid_orders(self):
         self._orders_bid.sort(key=order_sort_key, reverse=True)
+        self._triggers_stale = True
 
     cdef void sort_ask_orders(self):
         self._orders_ask.sort(key=order_sort_key)
+        self._triggers_stale = True
 
     cpdef void delete_order(self, Order order):
         Condition.not_none(order, "order")
@@ -239,6 +300,8 @@ cdef class MatchingCore:
         else:
             raise RuntimeError(f"invalid `OrderSide`, was {order.side}")  # pragma: no cover (design-time error)
 
+        self._triggers_stale = True
+
     cpdef void iterate(self, uint64_t timestamp_ns):
         cdef Order order
         for order in self._orders_bid + self._orders_ask:  # Lists implicitly copied
@@ -246,6 +309,56 @@ cdef class MatchingCore:
                 continue  # Orders state has changed since iteration started  # pragma: no cover
             self.match_order(order)
 
+        # Matching may have triggered orders in place
+        self._triggers_stale = True
+
+    cdef void invalidate_triggers(self):
+        # Must be called when an orders price or trigger price is changed in place
+        self._triggers_stale = True
+
+    cdef void _update_triggers(self):
+        cdef int64_t ask_low = INT64_MIN   # BUY limits and touches match when ask <= level
+        cdef int64_t ask_high = INT64_MAX  # BUY stops trigger when ask >= level
+        cdef int64_t bid_low = INT64_MIN   # SELL stops trigger when bid <= level
+        cdef int64_t bid_high = INT64_MAX  # SELL limits and touches match when bid >= level
+        cdef bint has_trailing_stops = False
+
+        cdef:
+            Order order
+            int64_t level
+        for order in self._orders_bid:
+            if order.has_trigger_price_c() and order.trigger_price is None:
+                ask_low = INT64_MAX  # Cannot determine level (always iterate)
+                continue
+            level = order_sort_key(order)
+            if is_stop_trigger(order):
+                if level < ask_high:
+                    ask_high = level
+            elif level > ask_low:
+                ask_low = level
+            if order.order_type == OrderType.TRAILING_STOP_MARKET or order.order_type == OrderType.TRAILING_STOP_LIMIT:
+                has_trailing_stops = True
+
+        for order in self._orders_ask:
+            if order.has_trigger_price_c() and order.trigger_price is None:
+                bid_high = INT64_MIN  # Cannot determine level (always iterate)
+                continue
+            level = order_sort_key(order)
+            if is_stop_trigger(order):
+                if level > bid_low:
+                    bid_low = level
+            elif level < bid_high:
+                bid_high = level
+            if order.order_type == OrderType.TRAILING_STOP_MARKET or order.order_type == OrderType.TRAILING_STOP_LIMIT:
+                has_trailing_stops = True
+
+        self._ask_trigger_low = ask_low
+        self._ask_trigger_high = ask_high
+        self._bid_trigger_low = bid_low
+        self._bid_trigger_high = bid_high
+        self._has_trailing_stops = has_trailing_stops
+        self._triggers_stale = False
+
 # -- MATCHING -------------------------------------------------------------------------------------
 
     cpdef void match_order(self, Order order, bint initial = False):
@@ -456,3 +569,14 @@ cdef inline int64_t order_sort_key(Order order):
             f"invalid order type to sort in book, "
             f"was {order_type_to_str(order.order_type)}",
         )
+
+
+cdef inline bint is_stop_trigger(Order order):
+    # Stop orders trigger when the market moves through the trigger price
+    # (away from the side of the order), until triggered as a limit order
+    if order.order_type == OrderType.STOP_MARKET or order.order_type == OrderType.TRAILING_STOP_MARKET:
+        return True
+    elif order.order_type == OrderType.STOP_LIMIT or order.order_type == OrderType.TRAILING_STOP_LIMIT:
+        return not order.is_triggered
+    else:
+        return False
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
 from nautilus_trader.indicators.base.indicator cimport Indicator
 
@@ -29,5 +31,6 @@ cdef class AverageTrueRange(Indicator):
     """The current value.\n\n:returns: `double`"""
 
     cpdef void update_raw(self, double high, double low, double close)
+    cpdef void update_raw_batch(self, np.ndarray high, np.ndarray low, np.ndarray close)
     cdef void _floor_value(self)
     cdef void _check_initialized(self)
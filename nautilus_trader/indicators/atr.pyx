@@ -13,11 +13,19 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.ma_factory import MovingAverageType
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport bar_closes
+from nautilus_trader.indicators.base.indicator cimport bar_highs
+from nautilus_trader.indicators.base.indicator cimport bar_lows
+from nautilus_trader.indicators.base.indicator cimport has_python_override
 from nautilus_trader.model.data cimport Bar
 
 
@@ -78,6 +86,24 @@ cdef class AverageTrueRange(Indicator):
 
         self.update_raw(bar.high.as_double(), bar.low.as_double(), bar.close.as_double())
 
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given historical bars.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The bars to handle (in time order).
+
+        """
+        Condition.not_none(bars, "bars")
+
+        if has_python_override(self, "handle_bar"):
+            Indicator.handle_bars(self, bars)  # Through the overridden handler
+            return
+
+        self.update_raw_batch(bar_highs(bars), bar_lows(bars), bar_closes(bars))
+
     cpdef void update_raw(
         self,
         double high,
@@ -109,6 +135,66 @@ cdef class AverageTrueRange(Indicator):
         self._floor_value()
         self._check_initialized()
 
+    cpdef void update_raw_batch(self, np.ndarray high, np.ndarray low, np.ndarray close):
+        """
+        Update the indicator with the given raw value arrays.
+
+        The indicator is left in the same state as if `update_raw` had been
+        called for each set of values in order. The true ranges are computed
+        from the arrays and passed to the inner moving average as a batch.
+
+        Parameters
+        ----------
+        high : np.ndarray[float64]
+            The high prices (in time order).
+        low : np.ndarray[float64]
+            The low prices (in time order).
+        close : np.ndarray[float64]
+            The close prices (in time order).
+
+        Raises
+        ------
+        ValueError
+            If the arrays are not of equal length.
+
+        """
+        Condition.not_none(high, "high")
+        Condition.not_none(low, "low")
+        Condition.not_none(close, "close")
+        Condition.equal(len(low), len(high), "len(low)", "len(high)")
+        Condition.equal(len(close), len(high), "len(close)", "len(high)")
+
+        cdef double[:] high_mv = np.asarray(high, dtype=np.float64)
+        cdef double[:] low_mv = np.asarray(low, dtype=np.float64)
+        cdef double[:] close_mv = np.asarray(close, dtype=np.float64)
+        cdef Py_ssize_t length = high_mv.shape[0]
+        cdef Py_ssize_t i
+        if has_python_override(self, "update_raw"):
+            for i in range(length):
+                self.update_raw(high_mv[i], low_mv[i], close_mv[i])  # Through the overridden update
+            return
+
+        if length == 0:
+            return
+
+        cdef np.ndarray true_ranges = np.empty(length, dtype=np.float64)
+        cdef double[::1] true_ranges_mv = true_ranges
+        cdef double previous_close
+        if self._use_previous:
+            previous_close = self._previous_close if self.has_inputs else close_mv[0]
+            for i in range(length):
+                true_ranges_mv[i] = max(previous_close, high_mv[i]) - min(low_mv[i], previous_close)
+                previous_close = close_mv[i]
+            self._previous_close = previous_close
+        else:
+            for i in range(length):
+                true_ranges_mv[i] = high_mv[i] - low_mv[i]
+
+        self._ma.update_raw_batch(true_ranges)
+
+        self._floor_value()
+        self._check_initialized()
+
     cdef void _floor_value(self):
         if self._value_floor == 0:
             self.value = self._ma.value
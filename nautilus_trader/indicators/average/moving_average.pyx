@@ -16,9 +16,18 @@
 from enum import Enum
 from enum import unique
 
+import cython
+import numpy as np
+
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport bar_closes
+from nautilus_trader.indicators.base.indicator cimport has_python_override
+from nautilus_trader.indicators.base.indicator cimport quote_prices
+from nautilus_trader.indicators.base.indicator cimport trade_prices
 
 
 @unique
@@ -80,8 +89,87 @@ cdef class MovingAverage(Indicator):
         """
         raise NotImplementedError("method `update_raw` must be implemented in the subclass")  # pragma: no cover
 
+    cpdef void update_raw_batch(self, np.ndarray values):
+        """
+        Update the indicator with the given raw values.
+
+        The indicator is left in the same state as if `update_raw` had been
+        called for each value in order. The base implementation calls
+        `update_raw` for each value, subclasses with a closed form or simple
+        recurrence override this to update from the array directly.
+
+        Parameters
+        ----------
+        values : np.ndarray[float64]
+            The update values (in time order).
+
+        """
+        Condition.not_none(values, "values")
+
+        cdef double[:] mv = np.asarray(values, dtype=np.float64)
+        cdef Py_ssize_t i
+        for i in range(mv.shape[0]):
+            self.update_raw(mv[i])
+
+    cpdef void handle_quote_ticks(self, list ticks):
+        """
+        Update the indicator with the given historical quote ticks.
+
+        Parameters
+        ----------
+        ticks : list[QuoteTick]
+            The ticks to handle (in time order).
+
+        """
+        Condition.not_none(ticks, "ticks")
+
+        if has_python_override(self, "handle_quote_tick"):
+            Indicator.handle_quote_ticks(self, ticks)  # Through the overridden handler
+            return
+
+        self.update_raw_batch(quote_prices(ticks, self.price_type))
+
+    cpdef void handle_trade_ticks(self, list ticks):
+        """
+        Update the indicator with the given historical trade ticks.
+
+        Parameters
+        ----------
+        ticks : list[TradeTick]
+            The ticks to handle (in time order).
+
+        """
+        Condition.not_none(ticks, "ticks")
+
+        if has_python_override(self, "handle_trade_tick"):
+            Indicator.handle_trade_ticks(self, ticks)  # Through the overridden handler
+            return
+
+        self.update_raw_batch(trade_prices(ticks))
+
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given historical bars.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The bars to handle (in time order).
+
+        """
+        Condition.not_none(bars, "bars")
+
+        if has_python_override(self, "handle_bar"):
+            Indicator.handle_bars(self, bars)  # Through the overridden handler
+            return
+
+        self.update_raw_batch(bar_closes(bars))
+
     cpdef void _increment_count(self):
-        self.count += 1
+        self._increment_count_by(1)
+
+    cdef void _increment_count_by(self, int count):
+        self.count += count
 
         # Initialization logic
         if not self.initialized:
@@ -96,3 +184,20 @@ cdef class MovingAverage(Indicator):
 
     cpdef void _reset_ma(self):
         pass  # Optionally override if additional values to reset
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void update_exponential_batch(MovingAverage ma, double alpha, double[:] values):
+    # Applies the exponential recurrence of `update_raw` across the values
+    cdef Py_ssize_t length = values.shape[0]
+    if length == 0:
+        return
+
+    cdef double value = ma.value if ma.has_inputs else values[0]
+    cdef Py_ssize_t i
+    for i in range(length):
+        value = alpha * values[i] + ((1.0 - alpha) * value)
+
+    ma.value = value
+    ma._increment_count_by(length)
@@ -13,9 +13,15 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
+from nautilus_trader.indicators.average.moving_average cimport update_exponential_batch
+from nautilus_trader.indicators.base.indicator cimport has_python_override
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.data cimport TradeTick
@@ -106,3 +112,24 @@ cdef class WilderMovingAverage(MovingAverage):
 
         self.value = self.alpha * value + ((1.0 - self.alpha) * self.value)
         self._increment_count()
+
+    cpdef void update_raw_batch(self, np.ndarray values):
+        """
+        Update the indicator with the given raw values.
+
+        The indicator is left in the same state as if `update_raw` had been
+        called for each value in order.
+
+        Parameters
+        ----------
+        values : np.ndarray[float64]
+            The update values (in time order).
+
+        """
+        Condition.not_none(values, "values")
+
+        if has_python_override(self, "update_raw"):
+            MovingAverage.update_raw_batch(self, values)  # Through the overridden update
+            return
+
+        update_exponential_batch(self, self.alpha, np.asarray(values, dtype=np.float64))
@@ -13,8 +13,13 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
+from nautilus_trader.indicators.base.ring_buffer cimport RingBuffer
 
 
 cdef class SimpleMovingAverage(MovingAverage):
-    cdef object _inputs
+    cdef RingBuffer _inputs
+
+    cpdef void update_raw_batch(self, np.ndarray values)
@@ -13,14 +13,15 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
-
 import numpy as np
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.rust.model cimport PriceType
-from nautilus_trader.core.stats cimport fast_mean
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
+from nautilus_trader.indicators.base.indicator cimport has_python_override
+from nautilus_trader.indicators.base.ring_buffer cimport RingBuffer
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.data cimport TradeTick
@@ -31,6 +32,9 @@ cdef class SimpleMovingAverage(MovingAverage):
     """
     An indicator which calculates a simple moving average across a rolling window.
 
+    Inputs are held in a preallocated `RingBuffer` which maintains a running sum,
+    so each update is O(1) regardless of the `period`.
+
     Parameters
     ----------
     period : int
@@ -48,7 +52,7 @@ cdef class SimpleMovingAverage(MovingAverage):
         Condition.positive_int(period, "period")
         super().__init__(period, params=[period], price_type=price_type)
 
-        self._inputs = deque(maxlen=period)
+        self._inputs = RingBuffer(period)
         self.value = 0
 
     cpdef void handle_quote_tick(self, QuoteTick tick):
@@ -106,8 +110,37 @@ cdef class SimpleMovingAverage(MovingAverage):
         """
         self._inputs.append(value)
 
-        self.value = fast_mean(np.asarray(self._inputs, dtype=np.float64))
+        self.value = self._inputs.mean()
         self._increment_count()
 
+    cpdef void update_raw_batch(self, np.ndarray values):
+        """
+        Update the indicator with the given raw values.
+
+        The indicator is left in the same state as if `update_raw` had been
+        called for each value in order, with only the values which can remain
+        in the window written to the inputs.
+
+        Parameters
+        ----------
+        values : np.ndarray[float64]
+            The update values (in time order).
+
+        """
+        Condition.not_none(values, "values")
+
+        if has_python_override(self, "update_raw"):
+            MovingAverage.update_raw_batch(self, values)  # Through the overridden update
+            return
+
+        cdef double[:] mv = np.asarray(values, dtype=np.float64)
+        if mv.shape[0] == 0:
+            return
+
+        self._inputs.extend(mv)
+
+        self.value = self._inputs.mean()
+        self._increment_count_by(mv.shape[0])
+
     cpdef void _reset_ma(self):
         self._inputs.clear()
@@ -16,10 +16,12 @@
 cimport numpy as np
 
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
+from nautilus_trader.indicators.base.ring_buffer cimport RingBuffer
 
 
 cdef class WeightedMovingAverage(MovingAverage):
-    cdef object _inputs
+    cdef RingBuffer _inputs
+    cdef double _weights_sum
 
     cdef readonly np.ndarray weights
     """The weights for the moving average calculation.\n\n:returns: `np.ndarray[float64]`"""
@@ -13,13 +13,14 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
-
 import numpy as np
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
+from nautilus_trader.indicators.base.ring_buffer cimport RingBuffer
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.data cimport TradeTick
@@ -67,8 +68,9 @@ cdef class WeightedMovingAverage(MovingAverage):
             Condition.is_true(eps < weights.sum(), f"sum of weights must be positive > {eps}")
         super().__init__(period, params=[period, weights], price_type=price_type)
 
-        self._inputs = deque(maxlen=period)
+        self._inputs = RingBuffer(period)
         self.weights = weights
+        self._weights_sum = weights.sum() if weights is not None else 0.0
         self.value = 0
 
     cpdef void handle_quote_tick(self, QuoteTick tick):
@@ -126,10 +128,14 @@ cdef class WeightedMovingAverage(MovingAverage):
         """
         self._inputs.append(value)
 
-        if self.initialized or self.weights is None:
-            self.value = np.average(self._inputs, weights=self.weights, axis=0)
+        cdef np.ndarray inputs = self._inputs.to_array()
+        if self.weights is None:
+            self.value = self._inputs.mean()
+        elif self.initialized:
+            # Equivalent to `np.average` with the weights sum precomputed
+            self.value = np.multiply(inputs, self.weights).sum() / self._weights_sum
         else:
-            self.value = np.average(self._inputs, weights=self.weights[-len(self._inputs):], axis=0)
+            self.value = np.average(inputs, weights=self.weights[-self._inputs.count:], axis=0)
 
         self._increment_count()
 
@@ -13,9 +13,18 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from types import FunctionType
+
+import numpy as np
+
+cimport numpy as np
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.data cimport TradeTick
+from nautilus_trader.model.objects cimport Price
 
 
 cdef class Indicator:
@@ -57,6 +66,66 @@ cdef class Indicator:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError(f"Cannot handle {repr(bar)}: method `handle_bar` not implemented in subclass")  # pragma: no cover
 
+    cpdef void handle_quote_ticks(self, list ticks):
+        """
+        Update the indicator with the given historical quote ticks.
+
+        The indicator is left in the same state as if `handle_quote_tick` had
+        been called for each tick in order. Subclasses may override this with a
+        vectorized implementation.
+
+        Parameters
+        ----------
+        ticks : list[QuoteTick]
+            The ticks to handle (in time order).
+
+        """
+        Condition.not_none(ticks, "ticks")
+
+        cdef QuoteTick tick
+        for tick in ticks:
+            self.handle_quote_tick(tick)
+
+    cpdef void handle_trade_ticks(self, list ticks):
+        """
+        Update the indicator with the given historical trade ticks.
+
+        The indicator is left in the same state as if `handle_trade_tick` had
+        been called for each tick in order. Subclasses may override this with a
+        vectorized implementation.
+
+        Parameters
+        ----------
+        ticks : list[TradeTick]
+            The ticks to handle (in time order).
+
+        """
+        Condition.not_none(ticks, "ticks")
+
+        cdef TradeTick tick
+        for tick in ticks:
+            self.handle_trade_tick(tick)
+
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given historical bars.
+
+        The indicator is left in the same state as if `handle_bar` had been
+        called for each bar in order. Subclasses may override this with a
+        vectorized implementation.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The bars to handle (in time order).
+
+        """
+        Condition.not_none(bars, "bars")
+
+        cdef Bar bar
+        for bar in bars:
+            self.handle_bar(bar)
+
     cpdef void reset(self):
         """
         Reset the indicator.
@@ -76,3 +145,105 @@ cdef class Indicator:
     cpdef void _reset(self):
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method `_reset` must be implemented in the subclass")  # pragma: no cover
+
+
+cdef bint has_python_override(Indicator indicator, str name):
+    # Methods overridden in Python are plain functions on the class (or assigned
+    # on the instance), whereas Cython implementations are method descriptors
+    if isinstance(getattr(type(indicator), name, None), FunctionType):
+        return True
+
+    cdef dict attrs = getattr(indicator, "__dict__", None)
+    return attrs is not None and name in attrs
+
+
+cdef np.ndarray quote_prices(list ticks, PriceType price_type):
+    if price_type == PriceType.BID:
+        return quote_bid_prices(ticks)
+    elif price_type == PriceType.ASK:
+        return quote_ask_prices(ticks)
+
+    # Extract per tick to match `QuoteTick.extract_price` (raises for unsupported price types)
+    cdef Py_ssize_t length = len(ticks)
+    cdef np.ndarray values = np.empty(length, dtype=np.float64)
+    cdef double[::1] mv = values
+    cdef QuoteTick tick
+    cdef Price price
+    cdef Py_ssize_t i
+    for i in range(length):
+        tick = ticks[i]
+        price = tick.extract_price(price_type)
+        mv[i] = Price.raw_to_f64_c(price._mem.raw)
+    return values
+
+
+cdef np.ndarray quote_bid_prices(list ticks):
+    cdef Py_ssize_t length = len(ticks)
+    cdef np.ndarray values = np.empty(length, dtype=np.float64)
+    cdef double[::1] mv = values
+    cdef QuoteTick tick
+    cdef Py_ssize_t i
+    for i in range(length):
+        tick = ticks[i]
+        mv[i] = Price.raw_to_f64_c(tick._mem.bid_price.raw)
+    return values
+
+
+cdef np.ndarray quote_ask_prices(list ticks):
+    cdef Py_ssize_t length = len(ticks)
+    cdef np.ndarray values = np.empty(length, dtype=np.float64)
+    cdef double[::1] mv = values
+    cdef QuoteTick tick
+    cdef Py_ssize_t i
+    for i in range(length):
+        tick = ticks[i]
+        mv[i] = Price.raw_to_f64_c(tick._mem.ask_price.raw)
+    return values
+
+
+cdef np.ndarray trade_prices(list ticks):
+    cdef Py_ssize_t length = len(ticks)
+    cdef np.ndarray values = np.empty(length, dtype=np.float64)
+    cdef double[::1] mv = values
+    cdef TradeTick tick
+    cdef Py_ssize_t i
+    for i in range(length):
+        tick = ticks[i]
+        mv[i] = Price.raw_to_f64_c(tick._mem.price.raw)
+    return values
+
+
+cdef np.ndarray bar_highs(list bars):
+    cdef Py_ssize_t length = len(bars)
+    cdef np.ndarray values = np.empty(length, dtype=np.float64)
+    cdef double[::1] mv = values
+    cdef Bar bar
+    cdef Py_ssize_t i
+    for i in range(length):
+        bar = bars[i]
+        mv[i] = Price.raw_to_f64_c(bar._mem.high.raw)
+    return values
+
+
+cdef np.ndarray bar_lows(list bars):
+    cdef Py_ssize_t length = len(bars)
+    cdef np.ndarray values = np.empty(length, dtype=np.float64)
+    cdef double[::1] mv = values
+    cdef Bar bar
+    cdef Py_ssize_t i
+    for i in range(length):
+        bar = bars[i]
+        mv[i] = Price.raw_to_f64_c(bar._mem.low.raw)
+    return values
+
+
+cdef np.ndarray bar_closes(list bars):
+    cdef Py_ssize_t length = len(bars)
+    cdef np.ndarray values = np.empty(length, dtype=np.float64)
+    cdef double[::1] mv = values
+    cdef Bar bar
+    cdef Py_ssize_t i
+    for i in range(length):
+        bar = bars[i]
+        mv[i] = Price.raw_to_f64_c(bar._mem.close.raw)
+    return values
@@ -0,0 +1,42 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+cimport numpy as np
+
+
+cdef class RingBuffer:
+    cdef np.ndarray _values
+    cdef double[::1] _mv
+    cdef int _head
+    cdef double _sum
+
+    cdef readonly int capacity
+    """The maximum number of values held in the window.\n\n:returns: `int`"""
+    cdef readonly int count
+    """The current number of values held in the window.\n\n:returns: `int`"""
+
+    cpdef void append(self, double value)
+    cpdef void extend(self, double[:] values)
+    cpdef bint is_full(self)
+    cpdef double oldest(self)
+    cpdef double newest(self)
+    cpdef double sum(self)
+    cpdef double mean(self)
+    cpdef double max(self)
+    cpdef double min(self)
+    cpdef np.ndarray to_array(self)
+    cpdef void clear(self)
+
+    cdef void _resync_sum(self)
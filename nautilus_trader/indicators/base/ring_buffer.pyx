@@ -0,0 +1,292 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import cython
+import numpy as np
+
+cimport numpy as np
+
+from nautilus_trader.core.correctness cimport Condition
+
+
+cdef class RingBuffer:
+    """
+    Provides a preallocated fixed capacity window of `double` values.
+
+    Values are written twice into storage of length ``2 * capacity`` so that the
+    current window is always available as a contiguous ordered (oldest to newest)
+    array without copying. A running sum of the window is maintained in O(1) per
+    append, and is recomputed exactly each time the buffer completes a full
+    revolution to bound any accumulated floating point error.
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of values held in the window (> 0).
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+    """
+
+    def __init__(self, int capacity):
+        Condition.positive_int(capacity, "capacity")
+
+        self.capacity = capacity
+        self.count = 0
+        self._values = np.zeros(2 * capacity, dtype=np.float64)
+        self._mv = self._values
+        self._head = 0
+        self._sum = 0.0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(capacity={self.capacity}, count={self.count})"
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef void append(self, double value):
+        """
+        Append the given value, evicting the oldest value if the buffer is full.
+
+        Parameters
+        ----------
+        value : double
+            The value to append.
+
+        """
+        if self.count < self.capacity:
+            self._sum += value
+            self.count += 1
+        else:
+            self._sum += value - self._mv[self._head]
+
+        self._mv[self._head] = value
+        self._mv[self._head + self.capacity] = value
+
+        self._head += 1
+        if self._head == self.capacity:
+            self._head = 0
+            self._resync_sum()
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef void extend(self, double[:] values):
+        """
+        Append the given values in order, evicting the oldest values as required.
+
+        The buffer is left in the same state as if `append` had been called for
+        each value, however only the values from the revolution before the last
+        wrap of the head onwards are written.
+
+        Parameters
+        ----------
+        values : double[:]
+            The values to append (oldest to newest).
+
+        """
+        cdef Py_ssize_t length = values.shape[0]
+        cdef Py_ssize_t tail = (self._head + length) % self.capacity
+        cdef Py_ssize_t start = 0
+        if length >= self.capacity + tail:
+            # Earlier values are evicted, and the running sum is resynced at the
+            # same value (when the head wraps) as for per value appends
+            start = length - self.capacity - tail
+            self.clear()
+
+        cdef Py_ssize_t i
+        for i in range(start, length):
+            self.append(values[i])
+
+    cpdef bint is_full(self):
+        """
+        Return a value indicating whether the buffer holds `capacity` values.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self.count == self.capacity
+
+    cpdef double oldest(self):
+        """
+        Return the oldest value in the window.
+
+        Returns
+        -------
+        double
+
+        Raises
+        ------
+        ValueError
+            If the buffer is empty.
+
+        """
+        Condition.positive_int(self.count, "count")
+
+        cdef int start = self._head - self.count
+        if start < 0:
+            start += self.capacity
+
+        return self._mv[start]
+
+    cpdef double newest(self):
+        """
+        Return the most recently appended value in the window.
+
+        Returns
+        -------
+        double
+
+        Raises
+        ------
+        ValueError
+            If the buffer is empty.
+
+        """
+        Condition.positive_int(self.count, "count")
+
+        return self._mv[self._head + self.capacity - 1]
+
+    cpdef double sum(self):
+        """
+        Return the running sum of the values in the window.
+
+        Returns
+        -------
+        double
+
+        """
+        return self._sum
+
+    cpdef double mean(self):
+        """
+        Return the mean of the values in the window.
+
+        Returns
+        -------
+        double
+            Zero if the buffer is empty.
+
+        """
+        if self.count == 0:
+            return 0.0
+
+        return self._sum / self.count
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef double max(self):
+        """
+        Return the maximum value in the window.
+
+        Returns
+        -------
+        double
+
+        Raises
+        ------
+        ValueError
+            If the buffer is empty.
+
+        """
+        Condition.positive_int(self.count, "count")
+
+        cdef int start = self._head - self.count
+        if start < 0:
+            start += self.capacity
+
+        cdef double result = self._mv[start]
+        cdef int i
+        for i in range(start + 1, start + self.count):
+            if self._mv[i] > result:
+                result = self._mv[i]
+
+        return result
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef double min(self):
+        """
+        Return the minimum value in the window.
+
+        Returns
+        -------
+        double
+
+        Raises
+        ------
+        ValueError
+            If the buffer is empty.
+
+        """
+        Condition.positive_int(self.count, "count")
+
+        cdef int start = self._head - self.count
+        if start < 0:
+            start += self.capacity
+
+        cdef double result = self._mv[start]
+        cdef int i
+        for i in range(start + 1, start + self.count):
+            if self._mv[i] < result:
+                result = self._mv[i]
+
+        return result
+
+    cpdef np.ndarray to_array(self):
+        """
+        Return the values in the window ordered from oldest to newest.
+
+        Returns
+        -------
+        np.ndarray[float64]
+
+        Warnings
+        --------
+        The returned array is a view onto the buffer storage and is only valid
+        until the next call to `append` or `clear`.
+
+        """
+        cdef int start = self._head - self.count
+        if start < 0:
+            start += self.capacity
+
+        return self._values[start:start + self.count]
+
+    cpdef void clear(self):
+        """
+        Clear all values from the buffer.
+
+        """
+        self.count = 0
+        self._head = 0
+        self._sum = 0.0
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _resync_sum(self):
+        # Only called when the head has wrapped to zero, so the window is
+        # ordered from oldest to newest at the start of storage.
+        cdef double total = 0.0
+        cdef int i
+        for i in range(self.count):
+            total += self._mv[i]
+
+        self._sum = total
@@ -14,11 +14,12 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.ring_buffer cimport RingBuffer
 
 
 cdef class BollingerBands(Indicator):
     cdef object _ma
-    cdef object _prices
+    cdef RingBuffer _prices
 
     cdef readonly int period
     """The period for the moving average.\n\n:returns: `int`"""
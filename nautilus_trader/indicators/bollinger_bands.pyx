@@ -13,16 +13,13 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
-
-import numpy as np
-
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.ma_factory import MovingAverageType
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.stats cimport fast_std_with_mean
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.ring_buffer cimport RingBuffer
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.data cimport TradeTick
@@ -66,7 +63,7 @@ cdef class BollingerBands(Indicator):
         self.period = period
         self.k = k
         self._ma = MovingAverageFactory.create(period, ma_type)
-        self._prices = deque(maxlen=period)
+        self._prices = RingBuffer(period)
 
         self.upper = 0.0
         self.middle = 0.0
@@ -145,12 +142,12 @@ cdef class BollingerBands(Indicator):
         # Initialization logic
         if not self.initialized:
             self._set_has_inputs(True)
-            if len(self._prices) >= self.period:
+            if self._prices.is_full():
                 self._set_initialized(True)
 
         # Calculate values
         cdef double std = fast_std_with_mean(
-            values=np.asarray(self._prices, dtype=np.float64),
+            values=self._prices.to_array(),
             mean=self._ma.value,
         )
 
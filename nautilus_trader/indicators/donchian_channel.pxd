@@ -14,11 +14,12 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.ring_buffer cimport RingBuffer
 
 
 cdef class DonchianChannel(Indicator):
-    cdef object _upper_prices
-    cdef object _lower_prices
+    cdef RingBuffer _upper_prices
+    cdef RingBuffer _lower_prices
 
     cdef readonly int period
     """The period for the moving average.\n\n:returns: `int`"""
@@ -13,10 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
-
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.ring_buffer cimport RingBuffer
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.data cimport TradeTick
@@ -48,8 +47,8 @@ cdef class DonchianChannel(Indicator):
         super().__init__(params=[period])
 
         self.period = period
-        self._upper_prices = deque(maxlen=period)
-        self._lower_prices = deque(maxlen=period)
+        self._upper_prices = RingBuffer(period)
+        self._lower_prices = RingBuffer(period)
 
         self.upper = 0
         self.middle = 0
@@ -119,12 +118,12 @@ cdef class DonchianChannel(Indicator):
         # Initialization logic
         if not self.initialized:
             self._set_has_inputs(True)
-            if len(self._upper_prices) >= self.period and len(self._lower_prices) >= self.period:
+            if self._upper_prices.is_full() and self._lower_prices.is_full():
                 self._set_initialized(True)
 
         # Set values
-        self.upper = max(self._upper_prices)
-        self.lower = min(self._lower_prices)
+        self.upper = self._upper_prices.max()
+        self.lower = self._lower_prices.min()
         self.middle = (self.upper + self.lower) / 2
 
     cpdef void _reset(self):
@@ -14,10 +14,13 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.ring_buffer cimport RingBuffer
 
 
 cdef class LinearRegression(Indicator):
-    cdef object _inputs
+    cdef RingBuffer _inputs
+    cdef double _xy_sum
+    cdef int _rolls
 
     cdef readonly int period
     """The window period.\n\n:returns: `int`"""
@@ -35,3 +38,4 @@ cdef class LinearRegression(Indicator):
     """The current value.\n\n:returns: `double`"""
 
     cpdef void update_raw(self, double close_price)
+    cdef void _resync_xy_sum(self)
@@ -13,15 +13,15 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
-from statistics import mean
-
-import numpy as np
+import cython
 
 cimport numpy as np
+from libc.math cimport M_PI
+from libc.math cimport atan
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.ring_buffer cimport RingBuffer
 from nautilus_trader.model.data cimport Bar
 
 
@@ -29,6 +29,10 @@ cdef class LinearRegression(Indicator):
     """
     An indicator that calculates a simple linear regression.
 
+    The sums of the inputs and of the inputs weighted by their position in the
+    window are maintained incrementally, so the regression coefficients are
+    updated in O(1) per input.
+
     Parameters
     ----------
     period : int
@@ -45,7 +49,9 @@ cdef class LinearRegression(Indicator):
         super().__init__(params=[period])
 
         self.period = period
-        self._inputs = deque(maxlen=self.period)
+        self._inputs = RingBuffer(period)
+        self._xy_sum = 0.0
+        self._rolls = 0
         self.slope = 0.0
         self.intercept = 0.0
         self.degree = 0.0
@@ -77,38 +83,76 @@ cdef class LinearRegression(Indicator):
             The close price.
 
         """
+        cdef double y_sum_prev = self._inputs.sum()
+        cdef bint was_full = self._inputs.is_full()
         self._inputs.append(close)
 
+        # Maintain the sum of inputs weighted by x = 1..period (oldest to newest)
+        if was_full:
+            self._xy_sum += self.period * close - y_sum_prev
+            self._rolls += 1
+            if self._rolls == self.period:
+                # Recompute in step with the buffer's running sum to bound drift
+                self._resync_xy_sum()
+        else:
+            self._xy_sum += self._inputs.count * close
+
         # Warmup indicator logic
         if not self.initialized:
             self._set_has_inputs(True)
-            if len(self._inputs) >= self.period:
+            if self._inputs.is_full():
                 self._set_initialized(True)
             else:
                 return
 
-        cdef np.ndarray x_arr = np.arange(1, self.period + 1, dtype=np.float64)
-        cdef np.ndarray y_arr = np.asarray(self._inputs, dtype=np.float64)
+        cdef np.ndarray y_arr = self._inputs.to_array()
+        cdef double[:] y = y_arr
         cdef double x_sum = 0.5 * self.period * (self.period + 1)
         cdef double x2_sum = x_sum * (2 * self.period + 1) / 3
         cdef double divisor = self.period * x2_sum - x_sum * x_sum
-        cdef double y_sum = sum(y_arr)
-        cdef double xy_sum = sum(x_arr * y_arr)
-        self.slope = (self.period * xy_sum - x_sum * y_sum) / divisor
-        self.intercept = (y_sum * x2_sum - x_sum * xy_sum) / divisor
+        cdef double y_sum = self._inputs.sum()
+        self.slope = (self.period * self._xy_sum - x_sum * y_sum) / divisor
+        self.intercept = (y_sum * x2_sum - x_sum * self._xy_sum) / divisor
 
-        cdef np.ndarray residuals = np.zeros(self.period, dtype=np.float64)
+        # Mean summed over the window (rather than the running sum) so it is free of drift
+        cdef double y_mean = 0.0
+        cdef int i
+        for i in range(self.period):
+            y_mean += y[i]
+        y_mean /= self.period
+
+        cdef double ss_res = 0.0
+        cdef double ss_tot = 0.0
+        cdef double residual
+        for i in range(self.period):
+            residual = self.slope * (i + 1) + self.intercept - y[i]
+            ss_res += residual * residual
+            ss_tot += (y[i] - y_mean) * (y[i] - y_mean)
+
+        cdef double y_last = y[self.period - 1]
+        residual = self.slope * self.period + self.intercept - y_last
+
+        self.value = residual + y_last
+        self.degree = 180.0 / M_PI * atan(self.slope)
+        self.cfo = 100.0 * residual / y_last
+        self.R2 = 1.0 - ss_res / ss_tot
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _resync_xy_sum(self):
+        cdef double[:] y = self._inputs.to_array()
+        cdef double xy_sum = 0.0
         cdef int i
-        for i in np.arange(self.period):
-            residuals[i] = self.slope * x_arr[i] + self.intercept - y_arr[i]
+        for i in range(self.period):
+            xy_sum += (i + 1) * y[i]
 
-        self.value = residuals[-1] + y_arr[-1]
-        self.degree = 180.0 / np.pi * np.arctan(self.slope)
-        self.cfo = 100.0 * residuals[-1] / y_arr[-1]
-        self.R2 = 1.0 - sum(residuals * residuals) / sum((y_arr - mean(y_arr)) * (y_arr - mean(y_arr)))
+        self._xy_sum = xy_sum
+        self._rolls = 0
 
     cpdef void _reset(self):
         self._inputs.clear()
+        self._xy_sum = 0.0
+        self._rolls = 0
         self.slope = 0.0
         self.intercept = 0.0
         self.degree = 0.0
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
 from nautilus_trader.indicators.base.indicator cimport Indicator
 
@@ -29,3 +31,4 @@ cdef class RelativeStrengthIndex(Indicator):
     """The current value.\n\n:returns: `double`"""
 
     cpdef void update_raw(self, double value)
+    cpdef void update_raw_batch(self, np.ndarray values)
@@ -13,11 +13,20 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.moving_average import MovingAverageType
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.indicators.average.ema cimport ExponentialMovingAverage
+from nautilus_trader.indicators.average.moving_average cimport MovingAverage
+from nautilus_trader.indicators.average.rma cimport WilderMovingAverage
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport bar_closes
+from nautilus_trader.indicators.base.indicator cimport has_python_override
 from nautilus_trader.model.data cimport Bar
 
 
@@ -67,6 +76,24 @@ cdef class RelativeStrengthIndex(Indicator):
 
         self.update_raw(bar.close.as_double())
 
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given historical bars.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The bars to handle (in time order).
+
+        """
+        Condition.not_none(bars, "bars")
+
+        if has_python_override(self, "handle_bar"):
+            Indicator.handle_bars(self, bars)  # Through the overridden handler
+            return
+
+        self.update_raw_batch(bar_closes(bars))
+
     cpdef void update_raw(self, double value):
         """
         Update the indicator with the given value.
@@ -108,6 +135,87 @@ cdef class RelativeStrengthIndex(Indicator):
         self.value = self._rsi_max - (self._rsi_max / (1 + rs))
         self._last_value = value
 
+    cpdef void update_raw_batch(self, np.ndarray values):
+        """
+        Update the indicator with the given values.
+
+        The indicator is left in the same state as if `update_raw` had been
+        called for each value in order. For the exponential and Wilder moving
+        average types the average gain and loss recurrences are applied across
+        the array directly, otherwise `update_raw` is called for each value.
+
+        Parameters
+        ----------
+        values : np.ndarray[float64]
+            The update values (in time order).
+
+        """
+        Condition.not_none(values, "values")
+
+        cdef double[:] mv = np.asarray(values, dtype=np.float64)
+        cdef Py_ssize_t length = mv.shape[0]
+        cdef Py_ssize_t i
+
+        cdef double alpha = 0
+        if type(self._average_gain) is ExponentialMovingAverage:
+            alpha = (<ExponentialMovingAverage>self._average_gain).alpha
+        elif type(self._average_gain) is WilderMovingAverage:
+            alpha = (<WilderMovingAverage>self._average_gain).alpha
+
+        if alpha == 0 or has_python_override(self, "update_raw"):
+            for i in range(length):
+                self.update_raw(mv[i])
+            return
+
+        if length == 0:
+            return
+
+        if not self.has_inputs:
+            self._last_value = mv[0]
+            self._set_has_inputs(True)
+
+        cdef MovingAverage average_gain = self._average_gain
+        cdef MovingAverage average_loss = self._average_loss
+        cdef bint has_averages = average_gain.has_inputs
+        cdef double gain_value = average_gain.value
+        cdef double loss_value = average_loss.value
+        cdef double last_value = self._last_value
+        cdef double value = self.value
+        cdef double change
+        cdef double gain
+        cdef double loss
+        for i in range(length):
+            change = mv[i] - last_value
+            gain = change if change > 0 else 0
+            loss = -change if change < 0 else 0
+
+            if not has_averages:
+                gain_value = gain
+                loss_value = loss
+                has_averages = True
+
+            gain_value = alpha * gain + ((1.0 - alpha) * gain_value)
+            loss_value = alpha * loss + ((1.0 - alpha) * loss_value)
+
+            if loss_value == 0:
+                value = self._rsi_max
+                continue  # The last value is held, as for `update_raw`
+
+            value = self._rsi_max - (self._rsi_max / (1 + gain_value / loss_value))
+            last_value = mv[i]
+
+        average_gain.value = gain_value
+        average_loss.value = loss_value
+        average_gain._increment_count_by(length)
+        average_loss._increment_count_by(length)
+        self._last_value = last_value
+        self.value = value
+
+        # Initialization logic
+        if not self.initialized:
+            if average_gain.initialized and average_loss.initialized:
+                self._set_initialized(True)
+
     cpdef void _reset(self):
         self._average_gain.reset()
         self._average_loss.reset()
@@ -42,10 +42,20 @@ class LiveDataEngineConfig(DataEngineConfig, frozen=True):
     ----------
     qsize : PositiveInt, default 100_000
         The queue size for the engines internal queue buffers.
+    conflation_threshold : PositiveInt, optional
+        The data queue depth beyond which `QuoteTick` and `OrderBookDepth10` data are
+        conflated, so that only the latest per instrument is delivered. Trades, bars
+        and order book deltas are never conflated. If ``None`` then conflation is disabled.
+    catalog_chunk_size : PositiveInt, optional
+        The maximum number of data objects per response chunk when delivering catalog query
+        results to the requester, yielding to the event loop between chunks. If ``None`` then
+        results are delivered as a single response.
 
     """
 
     qsize: PositiveInt = 100_000
+    conflation_threshold: PositiveInt | None = None
+    catalog_chunk_size: PositiveInt | None = None
 
 
 class LiveRiskEngineConfig(RiskEngineConfig, frozen=True):
@@ -98,6 +108,22 @@ class LiveExecEngineConfig(ExecEngineConfig, frozen=True):
     inflight_check_retries : NonNegativeInt, default 5
         The number of retry attempts the engine will make to verify the status of an
         in-flight order with the venue, should the initial attempt fail.
+    purge_closed_orders_interval_mins : PositiveInt, optional
+        The interval (minutes) between purging closed orders from the in-memory cache.
+        If ``None`` then closed orders will **not** be automatically purged.
+        Purging only runs when the cache has database backing.
+    purge_closed_orders_buffer_mins : NonNegativeInt, optional
+        The time buffer (minutes) from when an order was closed before it can be purged.
+        This should allow enough time for the order to be persisted via the cache database.
+        If ``None`` then closed orders are purged at the next interval.
+    purge_closed_positions_interval_mins : PositiveInt, optional
+        The interval (minutes) between purging closed positions from the in-memory cache.
+        If ``None`` then closed positions will **not** be automatically purged.
+        Purging only runs when the cache has database backing.
+    purge_closed_positions_buffer_mins : NonNegativeInt, optional
+        The time buffer (minutes) from when a position was closed before it can be purged.
+        This should allow enough time for the position to be persisted via the cache database.
+        If ``None`` then closed positions are purged at the next interval.
     qsize : PositiveInt, default 100_000
         The queue size for the engines internal queue buffers.
 
@@ -111,6 +137,10 @@ class LiveExecEngineConfig(ExecEngineConfig, frozen=True):
     inflight_check_interval_ms: NonNegativeInt = 2_000
     inflight_check_threshold_ms: NonNegativeInt = 5_000
     inflight_check_retries: NonNegativeInt = 5
+    purge_closed_orders_interval_mins: PositiveInt | None = None
+    purge_closed_orders_buffer_mins: NonNegativeInt | None = None
+    purge_closed_positions_interval_mins: PositiveInt | None = None
+    purge_closed_positions_buffer_mins: NonNegativeInt | None = None
     qsize: PositiveInt = 100_000
 
 
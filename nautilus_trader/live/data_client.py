@@ -46,6 +46,7 @@ from nautilus_trader.model.enums import BookType
 from nautilus_trader.model.identifiers import ClientId
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.instruments import Instrument
 
 
 class LiveDataClient(DataClient):
@@ -322,6 +323,7 @@ class LiveMarketDataClient(MarketDataClient):
 
         self._loop = loop
         self._instrument_provider = instrument_provider
+        self._instrument_provider.register_update_handler(self._handle_instrument_updates)
 
     async def run_after_delay(
         self,
@@ -438,6 +440,14 @@ class LiveMarketDataClient(MarketDataClient):
             success_color=LogColor.GREEN,
         )
 
+    def _handle_instrument_updates(self, instruments: list[Instrument]) -> None:
+        # Instruments changed at the venue since a warm start from the provider snapshot
+        for currency in self._instrument_provider.currencies().values():
+            self._cache.add_currency(currency)
+
+        for instrument in instruments:
+            self._handle_data(instrument)
+
     # -- SUBSCRIPTIONS ----------------------------------------------------------------------------
 
     def subscribe(self, data_type: DataType) -> None:
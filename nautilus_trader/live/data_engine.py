@@ -15,11 +15,13 @@
 
 import asyncio
 from asyncio import Queue
-from typing import Final
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Final
 
 from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.component import LiveClock
 from nautilus_trader.common.component import MessageBus
+from nautilus_trader.common.enums import LogColor
 from nautilus_trader.config import LiveDataEngineConfig
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.core.data import Data
@@ -27,6 +29,24 @@ from nautilus_trader.data.engine import DataEngine
 from nautilus_trader.data.messages import DataCommand
 from nautilus_trader.data.messages import DataRequest
 from nautilus_trader.data.messages import DataResponse
+from nautilus_trader.live.queues import QueueStats
+from nautilus_trader.live.queues import drain_nowait
+from nautilus_trader.live.queues import enqueue
+from nautilus_trader.live.queues import is_loop_thread
+from nautilus_trader.model.data import OrderBookDepth10
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.identifiers import InstrumentId
+
+
+class _ConflatedSlot:
+    # Placeholder on the data queue for the latest conflated data of a given key,
+    # the data is set to None once the slot is superseded by a slot further back
+    __slots__ = ("key", "data", "seq")
+
+    def __init__(self, key: tuple[type, InstrumentId], data: Data, seq: int) -> None:
+        self.key = key
+        self.data: Data | None = data
+        self.seq = seq
 
 
 class LiveDataEngine(DataEngine):
@@ -79,6 +99,28 @@ class LiveDataEngine(DataEngine):
         self._res_queue: asyncio.Queue = Queue(maxsize=config.qsize)
         self._data_queue: asyncio.Queue = Queue(maxsize=config.qsize)
 
+        # Queue counters
+        self._cmd_queue_stats = QueueStats("cmd")
+        self._req_queue_stats = QueueStats("req")
+        self._res_queue_stats = QueueStats("res")
+        self._data_queue_stats = QueueStats("data")
+
+        # Conflation (opt-in)
+        self._conflation_threshold: int | None = config.conflation_threshold
+        self._conflated: dict[tuple[type, InstrumentId], _ConflatedSlot] = {}
+        self._conflated_count: int = 0
+        self._data_enqueued_seq: int = 0
+
+        # Catalog queries run off the event loop, one at a time
+        self._catalog_chunk_size: int | None = config.catalog_chunk_size
+        self._catalog_executor: ThreadPoolExecutor | None = None
+        self._catalog_lock = asyncio.Lock()
+        self._catalog_tasks: set[asyncio.Task] = set()
+
+        self._log.info(f"{config.qsize=}", LogColor.BLUE)
+        self._log.info(f"{config.conflation_threshold=}", LogColor.BLUE)
+        self._log.info(f"{config.catalog_chunk_size=}", LogColor.BLUE)
+
         # Async tasks
         self._cmd_queue_task: asyncio.Task | None = None
         self._req_queue_task: asyncio.Task | None = None
@@ -200,6 +242,33 @@ class LiveDataEngine(DataEngine):
         """
         return self._data_queue.qsize()
 
+    def conflated_count(self) -> int:
+        """
+        Return the number of data messages dropped through conflation.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._conflated_count
+
+    def queue_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Return the throughput and latency counters for the internal queues.
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+
+        """
+        return {
+            "cmd": self._cmd_queue_stats.to_dict(),
+            "req": self._req_queue_stats.to_dict(),
+            "res": self._res_queue_stats.to_dict(),
+            "data": self._data_queue_stats.to_dict(),
+        }
+
     def kill(self) -> None:
         """
         Kill the engine by abruptly canceling the queue tasks and calling stop.
@@ -223,6 +292,9 @@ class LiveDataEngine(DataEngine):
             self._log.debug(f"Canceling task '{self._data_queue_task.get_name()}'")
             self._data_queue_task.cancel()
             self._data_queue_task = None
+        for task in list(self._catalog_tasks):
+            self._log.debug(f"Canceling task '{task.get_name()}'")
+            task.cancel()
 
     def execute(self, command: DataCommand) -> None:
         """
@@ -245,15 +317,7 @@ class LiveDataEngine(DataEngine):
         PyCondition.not_none(command, "command")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._loop.call_soon_threadsafe(self._cmd_queue.put_nowait, command)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_cmd_queue.put` as queue full at "
-                f"{self._cmd_queue.qsize()} items",
-            )
-            # Schedule the `put` operation to be executed once there is space in the queue
-            self._loop.create_task(self._cmd_queue.put(command))
+        enqueue(self._loop, self._cmd_queue, command, self._cmd_queue_stats, self._log)
 
     def request(self, request: DataRequest) -> None:
         """
@@ -276,15 +340,7 @@ class LiveDataEngine(DataEngine):
         PyCondition.not_none(request, "request")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._loop.call_soon_threadsafe(self._req_queue.put_nowait, request)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_req_queue.put` as queue full at "
-                f"{self._req_queue.qsize()} items",
-            )
-            # Schedule the `put` operation to be executed once there is space in the queue
-            self._loop.create_task(self._req_queue.put(request))
+        enqueue(self._loop, self._req_queue, request, self._req_queue_stats, self._log)
 
     def response(self, response: DataResponse) -> None:
         """
@@ -307,15 +363,7 @@ class LiveDataEngine(DataEngine):
         PyCondition.not_none(response, "response")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._loop.call_soon_threadsafe(self._res_queue.put_nowait, response)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_res_queue.put` as queue full at "
-                f"{self._res_queue.qsize():_} items",
-            )
-            # Schedule the `put` operation to be executed once there is space in the queue
-            self._loop.create_task(self._res_queue.put(response))
+        enqueue(self._loop, self._res_queue, response, self._res_queue_stats, self._log)
 
     def process(self, data: Data) -> None:
         """
@@ -324,6 +372,10 @@ class LiveDataEngine(DataEngine):
         If the internal queue is already full then will log a warning and block
         until queue size reduces.
 
+        If conflation is enabled and the internal queue is backed up beyond the
+        `conflation_threshold`, then `QuoteTick` and `OrderBookDepth10` data will
+        be conflated so that only the latest per instrument is delivered.
+
         Parameters
         ----------
         data : Data
@@ -338,18 +390,124 @@ class LiveDataEngine(DataEngine):
         PyCondition.not_none(data, "data")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._loop.call_soon_threadsafe(self._data_queue.put_nowait, data)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_data_queue.put` as queue full at "
-                f"{self._data_queue.qsize():_} items",
-            )
-            # Schedule the `put` operation to be executed once there is space in the queue
-            self._loop.create_task(self._data_queue.put(data))
+        if self._conflation_threshold is not None:
+            if self._conflate(data):
+                return
+            self._data_enqueued_seq += 1
+
+        enqueue(self._loop, self._data_queue, data, self._data_queue_stats, self._log)
 
     # -- INTERNAL -------------------------------------------------------------------------------------
 
+    def _conflate(self, data: Data) -> bool:
+        if not isinstance(data, QuoteTick | OrderBookDepth10):
+            return False  # Trades, bars, deltas and all other data are always delivered
+
+        if not is_loop_thread(self._loop):
+            return False  # Only conflate on the loop thread where the consumer also runs
+
+        key = (type(data), data.instrument_id)
+        slot = self._conflated.get(key)
+        if slot is not None:
+            # A slot is already queued for this instrument, replace with the latest
+            self._conflated_count += 1
+            if slot.seq == self._data_enqueued_seq:
+                # Nothing was queued behind the slot, so it can be replaced in place
+                slot.data = data
+                return True
+            # Supersede the slot so the latest data is delivered after any data
+            # queued behind it (preserves ordering relative to trades and deltas)
+            slot.data = None
+        elif self._data_queue.qsize() < self._conflation_threshold:
+            return False
+
+        self._data_enqueued_seq += 1
+        slot = _ConflatedSlot(key, data, self._data_enqueued_seq)
+        self._conflated[key] = slot
+        enqueue(self._loop, self._data_queue, slot, self._data_queue_stats, self._log)
+        return True
+
+    def _handle_conflatable_data(self, data: Data | _ConflatedSlot) -> None:
+        if type(data) is _ConflatedSlot:
+            if data.data is None:
+                return  # Superseded by a later slot
+            del self._conflated[data.key]
+            data = data.data
+        self._handle_data(data)
+
+    def _query_catalog(self, request: DataRequest) -> None:
+        # Overrides the synchronous query so the catalog never blocks the event loop
+        ts_start, ts_end = self._catalog_time_range(request)
+        task = self._loop.create_task(
+            self._run_catalog_query(request, ts_start, ts_end),
+            name=f"catalog_query-{request.id}",
+        )
+        self._catalog_tasks.add(task)
+        task.add_done_callback(self._catalog_tasks.discard)
+
+    async def _run_catalog_query(self, request: DataRequest, ts_start: int, ts_end: int) -> None:
+        data_type = request.data_type
+        try:
+            # Queries are serialized so that concurrent requests for the same
+            # series are served from the cache filled by the first
+            async with self._catalog_lock:
+                data = self._catalog_cache_get(data_type, ts_start, ts_end)
+                if data is None:
+                    query_start, query_end = self._catalog_query_range(data_type, ts_start, ts_end)
+                    if self._catalog_executor is None:
+                        self._catalog_executor = ThreadPoolExecutor(
+                            max_workers=1,
+                            thread_name_prefix="catalog",
+                        )
+                    data = await self._loop.run_in_executor(
+                        self._catalog_executor,
+                        self._query_catalog_data,
+                        data_type,
+                        query_start,
+                        query_end,
+                    )
+                    if data is None:
+                        self._log.error("No bar type provided for bars request")
+                        self._send_catalog_error_response(request)
+                        return
+                    if self._catalog_cache_put(data_type, query_start, query_end, data):
+                        data = self._catalog_cache_get(data_type, ts_start, ts_end)
+
+            await self._deliver_catalog_data(request, data)
+        except asyncio.CancelledError:
+            self._log.warning(f"Catalog query canceled for {request}")
+        except Exception as e:
+            self._log.exception(f"Error querying catalog for {request}", e)
+            self._send_catalog_error_response(request)
+
+    def _send_catalog_error_response(self, request: DataRequest) -> None:
+        # Complete the request with a final empty response so the requester
+        # is not left waiting on a query which will never return data
+        response = self._catalog_response(request, [])
+        self._send_response_chunk(response, [], True)
+
+    async def _deliver_catalog_data(self, request: DataRequest, data: list[Data]) -> None:
+        response = self._catalog_response(request, data)
+        chunk_size = self._catalog_chunk_size
+        if chunk_size is None or len(data) <= chunk_size:
+            self._handle_response(response)
+            return
+
+        # Engine side handling sees the complete data once, the requester
+        # receives it in chunks with the event loop free in between
+        self._handle_response_data(response)
+        for i in range(0, len(data), chunk_size):
+            final = i + chunk_size >= len(data)
+            self._send_response_chunk(response, data[i : i + chunk_size], final)
+            if not final:
+                await asyncio.sleep(0)
+
+    def _dispose(self) -> None:
+        super()._dispose()
+        if self._catalog_executor is not None:
+            self._catalog_executor.shutdown(wait=False, cancel_futures=True)
+            self._catalog_executor = None
+
     def _enqueue_sentinels(self) -> None:
         self._loop.call_soon_threadsafe(self._cmd_queue.put_nowait, self._sentinel)
         self._loop.call_soon_threadsafe(self._req_queue.put_nowait, self._sentinel)
@@ -385,9 +543,21 @@ class LiveDataEngine(DataEngine):
         try:
             while True:
                 command: DataCommand | None = await self._cmd_queue.get()
+                self._cmd_queue_stats.on_wakeup()
+                qsize = self._cmd_queue.qsize()  # Messages available on wakeup
                 if command is self._sentinel:
                     break
                 self._execute_command(command)
+                # Drain the messages available on wakeup before awaiting again
+                count, stopped = drain_nowait(
+                    self._cmd_queue,
+                    self._execute_command,
+                    self._sentinel,
+                    qsize,
+                )
+                self._cmd_queue_stats.on_drain(count + 1)
+                if stopped:
+                    break
         except asyncio.CancelledError:
             self._log.warning("DataCommand message queue canceled")
         except RuntimeError as e:
@@ -406,9 +576,21 @@ class LiveDataEngine(DataEngine):
         try:
             while True:
                 request: DataRequest | None = await self._req_queue.get()
+                self._req_queue_stats.on_wakeup()
+                qsize = self._req_queue.qsize()  # Messages available on wakeup
                 if request is self._sentinel:
                     break
                 self._handle_request(request)
+                # Drain the messages available on wakeup before awaiting again
+                count, stopped = drain_nowait(
+                    self._req_queue,
+                    self._handle_request,
+                    self._sentinel,
+                    qsize,
+                )
+                self._req_queue_stats.on_drain(count + 1)
+                if stopped:
+                    break
         except asyncio.CancelledError:
             self._log.warning("DataRequest message queue canceled")
         except RuntimeError as e:
@@ -427,9 +609,21 @@ class LiveDataEngine(DataEngine):
         try:
             while True:
                 response: DataResponse | None = await self._res_queue.get()
+                self._res_queue_stats.on_wakeup()
+                qsize = self._res_queue.qsize()  # Messages available on wakeup
                 if response is self._sentinel:
                     break
                 self._handle_response(response)
+                # Drain the messages available on wakeup before awaiting again
+                count, stopped = drain_nowait(
+                    self._res_queue,
+                    self._handle_response,
+                    self._sentinel,
+                    qsize,
+                )
+                self._res_queue_stats.on_drain(count + 1)
+                if stopped:
+                    break
         except asyncio.CancelledError:
             self._log.warning("DataResponse message queue canceled")
         except RuntimeError as e:
@@ -443,12 +637,27 @@ class LiveDataEngine(DataEngine):
 
     async def _run_data_queue(self) -> None:
         self._log.debug(f"Data queue processing starting (qsize={self.data_qsize()})")
+        handler = self._handle_data
+        if self._conflation_threshold is not None:
+            handler = self._handle_conflatable_data
         try:
             while True:
                 data: Data | None = await self._data_queue.get()
+                self._data_queue_stats.on_wakeup()
+                qsize = self._data_queue.qsize()  # Messages available on wakeup
                 if data is self._sentinel:
                     break
-                self._handle_data(data)
+                handler(data)
+                # Drain the messages available on wakeup before awaiting again
+                count, stopped = drain_nowait(
+                    self._data_queue,
+                    handler,
+                    self._sentinel,
+                    qsize,
+                )
+                self._data_queue_stats.on_drain(count + 1)
+                if stopped:
+                    break
         except asyncio.CancelledError:
             self._log.warning("Data message queue canceled")
         except RuntimeError as e:
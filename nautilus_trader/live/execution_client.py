@@ -286,14 +286,21 @@ class LiveExecutionClient(ExecutionClient):
             log_msg=f"cancel_all_orders: {command}",
         )
 
+    def supports_batch_cancel(self) -> bool:
+        cls = type(self)
+        return (
+            cls._batch_cancel_orders is not LiveExecutionClient._batch_cancel_orders
+            or cls.batch_cancel_orders is not LiveExecutionClient.batch_cancel_orders
+        )
+
     def batch_cancel_orders(self, command: BatchCancelOrders) -> None:
         self._log.info(
-            f"Batch cancel orders {[repr(c.client_order_id) for c in command.cancels]}",
+            f"Batch cancel {len(command.cancels)} {command.instrument_id} orders",
             LogColor.BLUE,
         )
         self.create_task(
             self._batch_cancel_orders(command),
-            log_msg=f"batch_cancel_orders: {command}",
+            log_msg=f"batch_cancel_orders: {command.instrument_id} ({len(command.cancels)} cancels)",
         )
 
     def query_order(self, command: QueryOrder) -> None:
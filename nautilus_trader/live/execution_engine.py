@@ -39,6 +39,9 @@ from nautilus_trader.execution.reports import ExecutionReport
 from nautilus_trader.execution.reports import FillReport
 from nautilus_trader.execution.reports import OrderStatusReport
 from nautilus_trader.execution.reports import PositionStatusReport
+from nautilus_trader.live.queues import QueueStats
+from nautilus_trader.live.queues import drain_nowait
+from nautilus_trader.live.queues import enqueue
 from nautilus_trader.model.enums import LiquiditySide
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.enums import OrderStatus
@@ -119,12 +122,18 @@ class LiveExecutionEngine(ExecutionEngine):
         self._loop: asyncio.AbstractEventLoop = loop
         self._cmd_queue: asyncio.Queue = Queue(maxsize=config.qsize)
         self._evt_queue: asyncio.Queue = Queue(maxsize=config.qsize)
+
+        # Queue counters
+        self._cmd_queue_stats = QueueStats("cmd")
+        self._evt_queue_stats = QueueStats("evt")
         self._inflight_check_retries: Counter[ClientOrderId] = Counter()
 
         # Async tasks
         self._cmd_queue_task: asyncio.Task | None = None
         self._evt_queue_task: asyncio.Task | None = None
         self._inflight_check_task: asyncio.Task | None = None
+        self._purge_closed_orders_task: asyncio.Task | None = None
+        self._purge_closed_positions_task: asyncio.Task | None = None
         self._kill: bool = False
 
         # Settings
@@ -136,6 +145,10 @@ class LiveExecutionEngine(ExecutionEngine):
         self.inflight_check_interval_ms: int = config.inflight_check_interval_ms
         self.inflight_check_threshold_ms: int = config.inflight_check_threshold_ms
         self._inflight_check_threshold_ns: int = millis_to_nanos(self.inflight_check_threshold_ms)
+        self.purge_closed_orders_interval_mins = config.purge_closed_orders_interval_mins
+        self.purge_closed_orders_buffer_mins = config.purge_closed_orders_buffer_mins or 0
+        self.purge_closed_positions_interval_mins = config.purge_closed_positions_interval_mins
+        self.purge_closed_positions_buffer_mins = config.purge_closed_positions_buffer_mins or 0
 
         self._log.info(f"{config.reconciliation=}", LogColor.BLUE)
         self._log.info(f"{config.reconciliation_lookback_mins=}", LogColor.BLUE)
@@ -144,6 +157,10 @@ class LiveExecutionEngine(ExecutionEngine):
         self._log.info(f"{config.inflight_check_interval_ms=}", LogColor.BLUE)
         self._log.info(f"{config.inflight_check_threshold_ms=}", LogColor.BLUE)
         self._log.info(f"{config.inflight_check_retries=}", LogColor.BLUE)
+        self._log.info(f"{config.purge_closed_orders_interval_mins=}", LogColor.BLUE)
+        self._log.info(f"{config.purge_closed_orders_buffer_mins=}", LogColor.BLUE)
+        self._log.info(f"{config.purge_closed_positions_interval_mins=}", LogColor.BLUE)
+        self._log.info(f"{config.purge_closed_positions_buffer_mins=}", LogColor.BLUE)
 
         # Register endpoints
         self._msgbus.register(endpoint="ExecEngine.reconcile_report", handler=self.reconcile_report)
@@ -245,6 +262,20 @@ class LiveExecutionEngine(ExecutionEngine):
         """
         return self._evt_queue.qsize()
 
+    def queue_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Return the throughput and latency counters for the internal queues.
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+
+        """
+        return {
+            "cmd": self._cmd_queue_stats.to_dict(),
+            "evt": self._evt_queue_stats.to_dict(),
+        }
+
     # -- COMMANDS -------------------------------------------------------------------------------------
 
     def kill(self) -> None:
@@ -284,15 +315,7 @@ class LiveExecutionEngine(ExecutionEngine):
         PyCondition.not_none(command, "command")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._loop.call_soon_threadsafe(self._cmd_queue.put_nowait, command)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_cmd_queue.put` as queue full "
-                f"at {self._cmd_queue.qsize():_} items",
-            )
-            # Schedule the `put` operation to be executed once there is space in the queue
-            self._loop.create_task(self._cmd_queue.put(command))
+        enqueue(self._loop, self._cmd_queue, command, self._cmd_queue_stats, self._log)
 
     def process(self, event: OrderEvent) -> None:
         """
@@ -314,15 +337,7 @@ class LiveExecutionEngine(ExecutionEngine):
         """
         PyCondition.not_none(event, "event")
 
-        try:
-            self._loop.call_soon_threadsafe(self._evt_queue.put_nowait, event)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_evt_queue.put` as queue full "
-                f"at {self._evt_queue.qsize():_} items",
-            )
-            # Schedule the `put` operation to be executed once there is space in the queue
-            self._loop.create_task(self._evt_queue.put(event))
+        enqueue(self._loop, self._evt_queue, event, self._evt_queue_stats, self._log)
 
     # -- INTERNAL -------------------------------------------------------------------------------------
 
@@ -348,12 +363,44 @@ class LiveExecutionEngine(ExecutionEngine):
                 )
                 self._log.debug(f"Scheduled task '{self._inflight_check_task.get_name()}'")
 
+        if not self._cache.has_backing:
+            if self.purge_closed_orders_interval_mins or self.purge_closed_positions_interval_mins:
+                self._log.warning(
+                    "Closed orders and positions will not be purged: "
+                    "no cache database to persist them",
+                )
+            return
+
+        if not self._purge_closed_orders_task and self.purge_closed_orders_interval_mins:
+            self._purge_closed_orders_task = self._loop.create_task(
+                self._purge_closed_orders_loop(),
+                name="purge_closed_orders",
+            )
+            self._log.debug(f"Scheduled task '{self._purge_closed_orders_task.get_name()}'")
+
+        if not self._purge_closed_positions_task and self.purge_closed_positions_interval_mins:
+            self._purge_closed_positions_task = self._loop.create_task(
+                self._purge_closed_positions_loop(),
+                name="purge_closed_positions",
+            )
+            self._log.debug(f"Scheduled task '{self._purge_closed_positions_task.get_name()}'")
+
     def _on_stop(self) -> None:
         if self._inflight_check_task:
             self._log.debug(f"Canceling task '{self._inflight_check_task.get_name()}'")
             self._inflight_check_task.cancel()
             self._inflight_check_task = None
 
+        if self._purge_closed_orders_task:
+            self._log.debug(f"Canceling task '{self._purge_closed_orders_task.get_name()}'")
+            self._purge_closed_orders_task.cancel()
+            self._purge_closed_orders_task = None
+
+        if self._purge_closed_positions_task:
+            self._log.debug(f"Canceling task '{self._purge_closed_positions_task.get_name()}'")
+            self._purge_closed_positions_task.cancel()
+            self._purge_closed_positions_task = None
+
         if self._kill:
             return  # Avoids enqueuing unnecessary sentinel messages when termination already signaled
 
@@ -372,9 +419,21 @@ class LiveExecutionEngine(ExecutionEngine):
         try:
             while True:
                 command: TradingCommand | None = await self._cmd_queue.get()
+                self._cmd_queue_stats.on_wakeup()
+                qsize = self._cmd_queue.qsize()  # Messages available on wakeup
                 if command is self._sentinel:
                     break
                 self._execute_command(command)
+                # Drain the messages available on wakeup before awaiting again
+                count, stopped = drain_nowait(
+                    self._cmd_queue,
+                    self._execute_command,
+                    self._sentinel,
+                    qsize,
+                )
+                self._cmd_queue_stats.on_drain(count + 1)
+                if stopped:
+                    break
         except asyncio.CancelledError:
             self._log.warning("Command message queue canceled")
         except RuntimeError as e:
@@ -393,9 +452,21 @@ class LiveExecutionEngine(ExecutionEngine):
         try:
             while True:
                 event: OrderEvent | None = await self._evt_queue.get()
+                self._evt_queue_stats.on_wakeup()
+                qsize = self._evt_queue.qsize()  # Messages available on wakeup
                 if event is self._sentinel:
                     break
                 self._handle_event(event)
+                # Drain the messages available on wakeup before awaiting again
+                count, stopped = drain_nowait(
+                    self._evt_queue,
+                    self._handle_event,
+                    self._sentinel,
+                    qsize,
+                )
+                self._evt_queue_stats.on_drain(count + 1)
+                if stopped:
+                    break
         except asyncio.CancelledError:
             self._log.warning("Event message queue canceled")
         except RuntimeError as e:
@@ -442,6 +513,28 @@ class LiveExecutionEngine(ExecutionEngine):
                 self._execute_command(query)
                 self._inflight_check_retries[order.client_order_id] += 1
 
+    async def _purge_closed_orders_loop(self) -> None:
+        try:
+            while True:
+                await asyncio.sleep(self.purge_closed_orders_interval_mins * 60)
+                self._cache.purge_closed_orders(
+                    ts_now=self._clock.timestamp_ns(),
+                    buffer_secs=self.purge_closed_orders_buffer_mins * 60,
+                )
+        except asyncio.CancelledError:
+            self._log.debug("Purge closed orders loop task canceled")
+
+    async def _purge_closed_positions_loop(self) -> None:
+        try:
+            while True:
+                await asyncio.sleep(self.purge_closed_positions_interval_mins * 60)
+                self._cache.purge_closed_positions(
+                    ts_now=self._clock.timestamp_ns(),
+                    buffer_secs=self.purge_closed_positions_buffer_mins * 60,
+                )
+        except asyncio.CancelledError:
+            self._log.debug("Purge closed positions loop task canceled")
+
     # -- RECONCILIATION -------------------------------------------------------------------------------
 
     def _log_reconciliation_result(self, value: ClientId | InstrumentId, result: bool) -> None:
@@ -0,0 +1,231 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from time import perf_counter_ns
+from typing import Any
+
+from nautilus_trader.common.component import Logger
+
+
+class QueueStats:
+    """
+    Provides throughput and latency counters for a live engine message queue.
+
+    Latency is measured from the time a message is placed on an empty queue,
+    until the consumer wakes up to drain it (the queueing delay of the oldest
+    message in each drained batch).
+
+    Parameters
+    ----------
+    name : str
+        The name of the queue.
+
+    """
+
+    __slots__ = (
+        "name",
+        "enqueued_count",
+        "processed_count",
+        "drain_count",
+        "max_batch_size",
+        "max_qsize",
+        "total_latency_ns",
+        "max_latency_ns",
+        "_pending_since_ns",
+    )
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.enqueued_count: int = 0
+        self.processed_count: int = 0
+        self.drain_count: int = 0
+        self.max_batch_size: int = 0
+        self.max_qsize: int = 0
+        self.total_latency_ns: int = 0
+        self.max_latency_ns: int = 0
+        self._pending_since_ns: int = 0
+
+    def on_enqueue(self, qsize: int) -> None:
+        """
+        Record a message being placed on the queue.
+
+        Parameters
+        ----------
+        qsize : int
+            The queue size after the message was placed.
+
+        """
+        self.enqueued_count += 1
+        if qsize > self.max_qsize:
+            self.max_qsize = qsize
+        if not self._pending_since_ns:
+            self._pending_since_ns = perf_counter_ns()
+
+    def on_wakeup(self) -> None:
+        """
+        Record the consumer waking up to drain the queue.
+        """
+        if self._pending_since_ns:
+            latency_ns = perf_counter_ns() - self._pending_since_ns
+            self._pending_since_ns = 0
+            self.total_latency_ns += latency_ns
+            if latency_ns > self.max_latency_ns:
+                self.max_latency_ns = latency_ns
+
+    def on_drain(self, count: int) -> None:
+        """
+        Record a batch of messages being processed from the queue.
+
+        Parameters
+        ----------
+        count : int
+            The number of messages processed in the batch.
+
+        """
+        self.processed_count += count
+        self.drain_count += 1
+        if count > self.max_batch_size:
+            self.max_batch_size = count
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Return a dictionary representation of the counters.
+
+        Returns
+        -------
+        dict[str, Any]
+
+        """
+        return {
+            "enqueued": self.enqueued_count,
+            "processed": self.processed_count,
+            "drains": self.drain_count,
+            "avg_batch_size": self.processed_count / self.drain_count if self.drain_count else 0.0,
+            "max_batch_size": self.max_batch_size,
+            "max_qsize": self.max_qsize,
+            "avg_latency_ns": self.total_latency_ns // self.drain_count if self.drain_count else 0,
+            "max_latency_ns": self.max_latency_ns,
+        }
+
+
+def is_loop_thread(loop: asyncio.AbstractEventLoop) -> bool:
+    """
+    Return whether the caller is running on the given `loop` (in its thread).
+
+    Parameters
+    ----------
+    loop : asyncio.AbstractEventLoop
+        The event loop to check.
+
+    Returns
+    -------
+    bool
+
+    """
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False  # No running loop in this thread
+
+
+def enqueue(
+    loop: asyncio.AbstractEventLoop,
+    queue: asyncio.Queue,
+    item: Any,
+    stats: QueueStats,
+    log: Logger,
+) -> None:
+    """
+    Place the given `item` on the `queue`.
+
+    When called from the event loop thread the item is placed on the queue
+    directly, otherwise placing the item is scheduled on the loop (thread-safe).
+    If the queue is full then a warning is logged and the `put` is scheduled
+    to complete once there is space.
+
+    Parameters
+    ----------
+    loop : asyncio.AbstractEventLoop
+        The event loop the queue belongs to.
+    queue : asyncio.Queue
+        The queue to place the item on.
+    item : Any
+        The item to place.
+    stats : QueueStats
+        The counters for the queue.
+    log : Logger
+        The logger for warnings.
+
+    """
+    if not is_loop_thread(loop):
+        # Called from another thread (or with no running loop), must hand off to the loop
+        loop.call_soon_threadsafe(queue.put_nowait, item)
+        stats.on_enqueue(queue.qsize() + 1)
+        return
+
+    # Fast path: on the loop thread, avoid scheduling a callback which wakes the loop
+    try:
+        queue.put_nowait(item)
+    except asyncio.QueueFull:
+        log.warning(
+            f"Blocking on `_{stats.name}_queue.put` as queue full at {queue.qsize():_} items",
+        )
+        # Schedule the `put` operation to be executed once there is space in the queue
+        loop.create_task(queue.put(item))
+    stats.on_enqueue(queue.qsize())
+
+
+def drain_nowait(
+    queue: asyncio.Queue,
+    handler: Callable[[Any], None],
+    sentinel: Any,
+    limit: int,
+) -> tuple[int, bool]:
+    """
+    Handle up to `limit` items available on the `queue` without awaiting.
+
+    The `limit` should be the queue size seen when the consumer woke up, so
+    that handlers which enqueue on the same thread cannot extend the drain
+    indefinitely and starve other tasks on the event loop.
+
+    Parameters
+    ----------
+    queue : asyncio.Queue
+        The queue to drain.
+    handler : Callable[[Any], None]
+        The handler for each item.
+    sentinel : Any
+        The sentinel value which stops processing.
+    limit : int
+        The maximum number of items to handle.
+
+    Returns
+    -------
+    tuple[int, bool]
+        The number of items handled, and whether the sentinel was seen.
+
+    """
+    count = 0
+    while count < limit and not queue.empty():
+        item = queue.get_nowait()
+        if item is sentinel:
+            return count, True
+        handler(item)
+        count += 1
+    return count, False
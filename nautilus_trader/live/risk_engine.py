@@ -15,7 +15,7 @@
 
 import asyncio
 from asyncio import Queue
-from typing import Final
+from typing import Any, Final
 
 from nautilus_trader.cache.base import CacheFacade
 from nautilus_trader.common.component import LiveClock
@@ -24,6 +24,9 @@ from nautilus_trader.config import LiveRiskEngineConfig
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.core.message import Command
 from nautilus_trader.core.message import Event
+from nautilus_trader.live.queues import QueueStats
+from nautilus_trader.live.queues import drain_nowait
+from nautilus_trader.live.queues import enqueue
 from nautilus_trader.portfolio.base import PortfolioFacade
 from nautilus_trader.risk.engine import RiskEngine
 
@@ -80,6 +83,10 @@ class LiveRiskEngine(RiskEngine):
         self._cmd_queue: asyncio.Queue = Queue(maxsize=config.qsize)
         self._evt_queue: asyncio.Queue = Queue(maxsize=config.qsize)
 
+        # Queue counters
+        self._cmd_queue_stats = QueueStats("cmd")
+        self._evt_queue_stats = QueueStats("evt")
+
         # Async tasks
         self._cmd_queue_task: asyncio.Task | None = None
         self._evt_queue_task: asyncio.Task | None = None
@@ -129,6 +136,20 @@ class LiveRiskEngine(RiskEngine):
         """
         return self._evt_queue.qsize()
 
+    def queue_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Return the throughput and latency counters for the internal queues.
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+
+        """
+        return {
+            "cmd": self._cmd_queue_stats.to_dict(),
+            "evt": self._evt_queue_stats.to_dict(),
+        }
+
     # -- COMMANDS -------------------------------------------------------------------------------------
 
     def kill(self) -> None:
@@ -168,15 +189,7 @@ class LiveRiskEngine(RiskEngine):
         PyCondition.not_none(command, "command")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._loop.call_soon_threadsafe(self._cmd_queue.put_nowait, command)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_cmd_queue.put` as queue full "
-                f"at {self._cmd_queue.qsize():_} items",
-            )
-            # Schedule the `put` operation to be executed once there is space in the queue
-            self._loop.create_task(self._cmd_queue.put(command))
+        enqueue(self._loop, self._cmd_queue, command, self._cmd_queue_stats, self._log)
 
     def process(self, event: Event) -> None:
         """
@@ -199,15 +212,7 @@ class LiveRiskEngine(RiskEngine):
         PyCondition.not_none(event, "event")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._loop.call_soon_threadsafe(self._evt_queue.put_nowait, event)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_evt_queue.put` as queue full "
-                f"at {self._evt_queue.qsize():_} items",
-            )
-            # Schedule the `put` operation to be executed once there is space in the queue
-            self._loop.create_task(self._evt_queue.put(event))
+        enqueue(self._loop, self._evt_queue, event, self._evt_queue_stats, self._log)
 
     # -- INTERNAL -------------------------------------------------------------------------------------
 
@@ -239,9 +244,21 @@ class LiveRiskEngine(RiskEngine):
         try:
             while True:
                 command: Command | None = await self._cmd_queue.get()
+                self._cmd_queue_stats.on_wakeup()
+                qsize = self._cmd_queue.qsize()  # Messages available on wakeup
                 if command is self._sentinel:
                     break
                 self._execute_command(command)
+                # Drain the messages available on wakeup before awaiting again
+                count, stopped = drain_nowait(
+                    self._cmd_queue,
+                    self._execute_command,
+                    self._sentinel,
+                    qsize,
+                )
+                self._cmd_queue_stats.on_drain(count + 1)
+                if stopped:
+                    break
         except asyncio.CancelledError:
             self._log.warning("Command message queue canceled")
         except RuntimeError as e:
@@ -260,9 +277,21 @@ class LiveRiskEngine(RiskEngine):
         try:
             while True:
                 event: Event | None = await self._evt_queue.get()
+                self._evt_queue_stats.on_wakeup()
+                qsize = self._evt_queue.qsize()  # Messages available on wakeup
                 if event is self._sentinel:
                     break
                 self._handle_event(event)
+                # Drain the messages available on wakeup before awaiting again
+                count, stopped = drain_nowait(
+                    self._evt_queue,
+                    self._handle_event,
+                    self._sentinel,
+                    qsize,
+                )
+                self._evt_queue_stats.on_drain(count + 1)
+                if stopped:
+                    break
         except asyncio.CancelledError:
             self._log.warning("Event message queue canceled")
         except RuntimeError as e:
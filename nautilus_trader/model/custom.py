@@ -18,10 +18,13 @@ from typing import Any
 
 import msgspec
 import pyarrow as pa
+import pyarrow.compute as pc
 
 from nautilus_trader.core.datetime import unix_nanos_to_dt
 from nautilus_trader.core.datetime import unix_nanos_to_str
 from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.serialization.arrow.serializer import columns_to_record_batch
+from nautilus_trader.serialization.arrow.serializer import make_columnar_serializer
 from nautilus_trader.serialization.arrow.serializer import register_arrow
 from nautilus_trader.serialization.base import register_serializable_type
 
@@ -81,6 +84,10 @@ def customdataclass(*args, **kwargs):  # noqa: C901 (too complex)
 
             cls.ts_init = ts_init
 
+        # Columnar Arrow encoding/decoding is only valid for the generated dict conversions
+        default_to_dict = "to_dict" not in cls.__dict__
+        default_from_dict = "from_dict" not in cls.__dict__
+
         if "to_dict" not in cls.__dict__:
 
             def to_dict(self, to_arrow=False) -> dict[str, Any]:
@@ -131,16 +138,62 @@ def customdataclass(*args, **kwargs):  # noqa: C901 (too complex)
 
         if "to_arrow" not in cls.__dict__:
 
+            def _to_arrow_columns(data: list) -> dict[str, list | pa.Array]:
+                if not default_to_dict:
+                    dicts = [d.to_dict(to_arrow=True) for d in data]
+                    return {name: [d.get(name) for d in dicts] for name in cls._schema.names}
+
+                columns: dict[str, list | pa.Array] = {}
+                for attr in cls.__annotations__:
+                    values = [getattr(d, attr) for d in data]
+                    if attr == "instrument_id":
+                        values = [v.value for v in values]
+                    columns[attr] = values
+
+                ts_event = pa.array([d._ts_event for d in data], type=pa.int64())
+                dt = ts_event.cast(pa.timestamp("ns"))
+                columns["type"] = [cls.__name__] * len(data)
+                columns["ts_event"] = ts_event
+                columns["ts_init"] = [d._ts_init for d in data]
+                columns["date"] = pc.add(
+                    pc.add(pc.multiply(pc.year(dt), 10_000), pc.multiply(pc.month(dt), 100)),
+                    pc.day(dt),
+                )
+
+                for name in cls._schema.names:
+                    if name not in columns:
+                        columns[name] = [None] * len(data)
+
+                return columns
+
             def to_arrow(self) -> pa.RecordBatch:
-                return pa.RecordBatch.from_pylist([self.to_dict(to_arrow=True)], schema=cls._schema)
+                return columns_to_record_batch(_to_arrow_columns([self]), schema=cls._schema)
 
             cls.to_arrow = to_arrow
+            cls._to_arrow_columns = staticmethod(_to_arrow_columns)
 
         if "from_arrow" not in cls.__dict__:
 
             @classmethod
             def from_arrow(cls, table: pa.Table) -> cls:
-                return [cls.from_dict(d) for d in table.to_pylist()]
+                columns = table.to_pydict()
+
+                if not default_from_dict:
+                    names = list(columns)
+                    return [cls.from_dict(dict(zip(names, row))) for row in zip(*columns.values())]
+
+                columns.pop("type", None)
+                columns.pop("date", None)
+
+                if "instrument_id" in columns:
+                    # Parse each distinct instrument ID only once
+                    instrument_ids: dict[str, InstrumentId] = {
+                        v: InstrumentId.from_str(v) for v in set(columns["instrument_id"])
+                    }
+                    columns["instrument_id"] = [instrument_ids[v] for v in columns["instrument_id"]]
+
+                names = list(columns)
+                return [cls(**dict(zip(names, row))) for row in zip(*columns.values())]
 
             cls.from_arrow = from_arrow
 
@@ -169,7 +222,16 @@ def customdataclass(*args, **kwargs):  # noqa: C901 (too complex)
             )
 
         register_serializable_type(cls, cls.to_dict, cls.from_dict)
-        register_arrow(cls, cls._schema, cls.to_arrow, cls.from_arrow)
+        if "_to_arrow_columns" in cls.__dict__:
+            register_arrow(
+                cls,
+                cls._schema,
+                make_columnar_serializer(cls._schema, cls._to_arrow_columns),
+                cls.from_arrow,
+                batch_encoder=True,
+            )
+        else:
+            register_arrow(cls, cls._schema, cls.to_arrow, cls.from_arrow)
 
         return cls
 
@@ -246,6 +246,22 @@ cdef class OrderBookDelta(Data):
         uint64_t ts_init,
     )
 
+    @staticmethod
+    cdef list[OrderBookDelta] from_raw_arrays_to_list_c(
+        InstrumentId instrument_id,
+        uint8_t price_prec,
+        uint8_t size_prec,
+        uint8_t[:] actions,
+        uint8_t[:] sides,
+        int64_t[:] prices_raw,
+        uint64_t[:] sizes_raw,
+        uint64_t[:] order_ids,
+        uint8_t[:] flags,
+        uint64_t[:] sequences,
+        uint64_t[:] ts_events,
+        uint64_t[:] ts_inits,
+    )
+
     @staticmethod
     cdef OrderBookDelta from_mem_c(OrderBookDelta_t mem)
 
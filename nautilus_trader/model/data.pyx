@@ -2099,6 +2099,84 @@ cdef class OrderBookDelta(Data):
         )
         return delta
 
+    @staticmethod
+    cdef list[OrderBookDelta] from_raw_arrays_to_list_c(
+        InstrumentId instrument_id,
+        uint8_t price_prec,
+        uint8_t size_prec,
+        uint8_t[:] actions,
+        uint8_t[:] sides,
+        int64_t[:] prices_raw,
+        uint64_t[:] sizes_raw,
+        uint64_t[:] order_ids,
+        uint8_t[:] flags,
+        uint64_t[:] sequences,
+        uint64_t[:] ts_events,
+        uint64_t[:] ts_inits,
+    ):
+        Condition.is_true(len(actions) == len(sides) == len(prices_raw) == len(sizes_raw) == len(order_ids)
+                       == len(flags) == len(sequences) == len(ts_events) == len(ts_inits), "Array lengths must be equal")
+
+        cdef int count = ts_events.shape[0]
+        cdef list[OrderBookDelta] deltas = []
+
+        cdef:
+            int i
+            BookOrder_t order_mem
+            OrderBookDelta delta
+        for i in range(count):
+            order_mem = book_order_from_raw(
+                <OrderSide>sides[i],
+                prices_raw[i],
+                price_prec,
+                sizes_raw[i],
+                size_prec,
+                order_ids[i],
+            )
+            delta = OrderBookDelta.__new__(OrderBookDelta)
+            delta._mem = orderbook_delta_new(
+                instrument_id._mem,
+                <BookAction>actions[i],
+                order_mem,
+                flags[i],
+                sequences[i],
+                ts_events[i],
+                ts_inits[i],
+            )
+            deltas.append(delta)
+
+        return deltas
+
+    @staticmethod
+    def from_raw_arrays_to_list(
+        instrument_id: InstrumentId,
+        price_prec: int,
+        size_prec: int,
+        actions: np.ndarray,
+        sides: np.ndarray,
+        prices_raw: np.ndarray,
+        sizes_raw: np.ndarray,
+        order_ids: np.ndarray,
+        flags: np.ndarray,
+        sequences: np.ndarray,
+        ts_events: np.ndarray,
+        ts_inits: np.ndarray,
+    ) -> list[OrderBookDelta]:
+        return OrderBookDelta.from_raw_arrays_to_list_c(
+            instrument_id,
+            price_prec,
+            size_prec,
+            actions,
+            sides,
+            prices_raw,
+            sizes_raw,
+            order_ids,
+            flags,
+            sequences,
+            ts_events,
+            ts_inits,
+        )
+
     @staticmethod
     cdef OrderBookDelta from_mem_c(OrderBookDelta_t mem):
         return delta_from_mem_c(mem)
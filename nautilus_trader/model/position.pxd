@@ -33,8 +33,11 @@ from nautilus_trader.model.objects cimport Quantity
 
 
 cdef class Position:
-    cdef list _events
-    cdef list _trade_ids
+    cdef object _events
+    cdef dict _trade_ids
+    cdef set _client_order_ids
+    cdef set _venue_order_ids
+    cdef int _event_count
     cdef Quantity _buy_qty
     cdef Quantity _sell_qty
     cdef dict _commissions
@@ -95,6 +98,8 @@ cdef class Position:
     """The current realized return for the position.\n\n:returns: `double`"""
     cdef readonly Money realized_pnl
     """The current realized PnL for the position (including commissions).\n\n:returns: `Money` or ``None``"""
+    cdef readonly int max_events
+    """The maximum number of fill events retained by the position (zero for unbounded).\n\n:returns: `int`"""
 
     cpdef str info(self)
     cpdef dict to_dict(self)
@@ -126,6 +131,7 @@ cdef class Position:
     cpdef list commissions(self)
 
     cdef void _check_duplicate_trade_id(self, OrderFilled fill)
+    cdef void _evict_oldest_event(self)
     cdef void _handle_buy_order_fill(self, OrderFilled fill)
     cdef void _handle_sell_order_fill(self, OrderFilled fill)
     cdef double _calculate_avg_px(self, double avg_px, double qty, double last_px, double last_qty)
@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from collections import deque
 from decimal import Decimal
 
 from libc.math cimport fabs
@@ -24,7 +25,9 @@ from nautilus_trader.core.rust.model cimport PositionSide
 from nautilus_trader.model.events.order cimport OrderFilled
 from nautilus_trader.model.functions cimport order_side_to_str
 from nautilus_trader.model.functions cimport position_side_to_str
+from nautilus_trader.model.identifiers cimport ClientOrderId
 from nautilus_trader.model.identifiers cimport TradeId
+from nautilus_trader.model.identifiers cimport VenueOrderId
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.objects cimport Quantity
@@ -43,6 +46,9 @@ cdef class Position:
         The trading instrument for the position.
     fill : OrderFilled
         The order fill event which opened the position.
+    max_events : int, optional
+        The maximum number of fill events to retain (compact mode).
+        If ``None`` then all fill events are retained for the life of the position.
 
     Raises
     ------
@@ -50,18 +56,32 @@ cdef class Position:
         If `instrument.id` is not equal to `fill.instrument_id`.
     ValueError
         If `event.position_id` is ``None``.
+    ValueError
+        If `max_events` is not ``None`` and not positive (> 0).
+
+    Warnings
+    --------
+    In compact mode only the aggregate state and the last `max_events` fills are
+    retained, so `events`, `trade_ids` and duplicate trade ID detection only
+    cover the retained fills.
     """
 
     def __init__(
         self,
         Instrument instrument not None,
         OrderFilled fill not None,
+        max_events: int | None = None,
     ) -> None:
         Condition.equal(instrument.id, fill.instrument_id, "instrument.id", "fill.instrument_id")
         Condition.not_none(fill.position_id, "fill.position_id")
-
-        self._events: list[OrderFilled] = []
-        self._trade_ids: list[TradeId] = []
+        if max_events is not None:
+            Condition.positive_int(max_events, "max_events")
+
+        self._events: deque[OrderFilled] = deque()
+        self._trade_ids: dict[TradeId, int] = {}  # Trade ID -> retained fill count
+        self._client_order_ids: set[ClientOrderId] = set()
+        self._venue_order_ids: set[VenueOrderId] = set()
+        self._event_count = 0
         self._buy_qty = Quantity.zero_c(precision=instrument.size_precision)
         self._sell_qty = Quantity.zero_c(precision=instrument.size_precision)
         self._commissions = {}
@@ -98,6 +118,7 @@ cdef class Position:
 
         self.realized_return = 0.0
         self.realized_pnl = None
+        self.max_events = max_events or 0
 
         self.apply(fill)
 
@@ -159,19 +180,17 @@ cdef class Position:
         }
 
     cdef list client_order_ids_c(self):
-        # Note the inner set {}
-        return sorted(list({fill.client_order_id for fill in self._events}))
+        return sorted(self._client_order_ids)
 
     cdef list venue_order_ids_c(self):
-        # Note the inner set {}
-        return sorted(list({fill.venue_order_id for fill in self._events}))
+        return sorted(self._venue_order_ids)
 
     cdef list trade_ids_c(self):
         # Checked for duplicate before appending to events
         return [fill.trade_id for fill in self._events]
 
     cdef list events_c(self):
-        return self._events.copy()
+        return list(self._events)
 
     cdef OrderFilled last_event_c(self):
         return self._events[-1]
@@ -184,7 +203,7 @@ cdef class Position:
         return trade_id in self._trade_ids
 
     cdef int event_count_c(self):
-        return len(self._events)
+        return self._event_count
 
     cdef bint is_open_c(self):
         return self.side != PositionSide.FLAT
@@ -275,6 +294,10 @@ cdef class Position:
         -------
         list[Event]
 
+        Notes
+        -----
+        In compact mode only the last `max_events` fill events are returned.
+
         """
         return self.events_c()
 
@@ -307,6 +330,8 @@ cdef class Position:
         """
         Return the count of order fill events applied to the position.
 
+        Includes fill events no longer retained in compact mode.
+
         Returns
         -------
         int
@@ -444,6 +469,9 @@ cdef class Position:
             # Reset position
             self._events.clear()
             self._trade_ids.clear()
+            self._client_order_ids.clear()
+            self._venue_order_ids.clear()
+            self._event_count = 0
             self._buy_qty = Quantity.zero_c(precision=self.size_precision)
             self._sell_qty = Quantity.zero_c(precision=self.size_precision)
             self._commissions = {}
@@ -460,7 +488,13 @@ cdef class Position:
             self.realized_pnl = None
 
         self._events.append(fill)
-        self._trade_ids.append(fill.trade_id)
+        self._trade_ids[fill.trade_id] = self._trade_ids.get(fill.trade_id, 0) + 1
+        self._client_order_ids.add(fill.client_order_id)
+        self._venue_order_ids.add(fill.venue_order_id)
+        self._event_count += 1
+
+        if self.max_events and len(self._events) > self.max_events:
+            self._evict_oldest_event()
 
         # Calculate cumulative commission
         cdef Currency currency = fill.commission.currency
@@ -625,7 +659,10 @@ cdef class Position:
         return list(self._commissions.values())
 
     cdef void _check_duplicate_trade_id(self, OrderFilled fill):
-        # Check all previous fills for matching trade ID and composite key
+        if fill.trade_id not in self._trade_ids:
+            return  # Fast path (no previous fill with this trade ID)
+
+        # Check previous fills for matching trade ID and composite key
         cdef:
             OrderFilled p_fill
         for p_fill in self._events:
@@ -638,6 +675,16 @@ cdef class Position:
             ):
                 raise KeyError(f"Duplicate {fill.trade_id!r} in events {fill} {p_fill}")
 
+    cdef void _evict_oldest_event(self):
+        cdef OrderFilled evicted = self._events.popleft()
+
+        # Only forget the trade ID if no retained fill shares it
+        cdef int count = self._trade_ids[evicted.trade_id] - 1
+        if count == 0:
+            del self._trade_ids[evicted.trade_id]
+        else:
+            self._trade_ids[evicted.trade_id] = count
+
     cdef void _handle_buy_order_fill(self, OrderFilled fill):
         # Initialize realized PnL for fill
         cdef double realized_pnl
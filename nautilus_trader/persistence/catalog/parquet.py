@@ -55,6 +55,7 @@ from nautilus_trader.model.data import OrderBookDepth10
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.data import capsule_to_list
+from nautilus_trader.model.enums import RecordFlag
 from nautilus_trader.model.instruments import Instrument
 from nautilus_trader.persistence.catalog.base import BaseDataCatalog
 from nautilus_trader.persistence.funcs import class_to_filename
@@ -435,6 +436,99 @@ class ParquetDataCatalog(BaseDataCatalog):
             ]
         return data
 
+    def query_chunks(
+        self,
+        data_cls: type,
+        instrument_ids: list[str] | None = None,
+        bar_types: list[str] | None = None,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+        where: str | None = None,
+        chunk_size: int = 10_000,
+        **kwargs: Any,
+    ) -> Generator[list[Data | CustomData], None, None]:
+        """
+        Query the catalog lazily, yielding converted objects one chunk at a time.
+
+        Each chunk is read from the underlying Arrow record batches and converted
+        to Cython objects only when requested, so peak memory is bounded by
+        `chunk_size` rather than by the size of the full query result.
+
+        Parameters
+        ----------
+        data_cls : type
+            The data type to query.
+        instrument_ids : list[str], optional
+            The instrument IDs to filter by.
+        bar_types : list[str], optional
+            The bar types to filter by.
+        start : TimestampLike, optional
+            The start time (inclusive) to filter by.
+        end : TimestampLike, optional
+            The end time (inclusive) to filter by.
+        where : str, optional
+            The additional SQL filter condition (Rust backend only).
+        chunk_size : int, default 10_000
+            The maximum number of rows per chunk.
+        **kwargs : Any
+            The additional query arguments.
+
+        Yields
+        ------
+        list[Data | CustomData]
+
+        Raises
+        ------
+        ValueError
+            If `chunk_size` is not positive.
+
+        Warnings
+        --------
+        When querying `OrderBookDeltas`, deltas are carried across chunk boundaries
+        until an `F_LAST` flag is seen, so chunks may contain more than `chunk_size` rows.
+
+        """
+        PyCondition.positive_int(chunk_size, "chunk_size")
+
+        if self.fs_protocol == "file" and data_cls in (
+            OrderBookDelta,
+            OrderBookDeltas,
+            OrderBookDepth10,
+            QuoteTick,
+            TradeTick,
+            Bar,
+        ):
+            chunks = self.query_rust_chunks(
+                data_cls=data_cls,
+                instrument_ids=instrument_ids,
+                bar_types=bar_types,
+                start=start,
+                end=end,
+                where=where,
+                chunk_size=chunk_size,
+                **kwargs,
+            )
+        else:
+            chunks = self.query_pyarrow_chunks(
+                data_cls=data_cls,
+                instrument_ids=instrument_ids,
+                bar_types=bar_types,
+                start=start,
+                end=end,
+                where=where,
+                chunk_size=chunk_size,
+                **kwargs,
+            )
+
+        if is_nautilus_class(data_cls):
+            yield from chunks
+            return
+
+        # Special handling for generic data
+        data_type = DataType(data_cls, metadata=kwargs.get("metadata"))
+        for chunk in chunks:
+            yield [CustomData(data_type=data_type, data=d) for d in chunk]
+
     def backend_session(
         self,
         data_cls: type,
@@ -527,6 +621,49 @@ class ParquetDataCatalog(BaseDataCatalog):
 
         return data
 
+    def query_rust_chunks(
+        self,
+        data_cls: type,
+        instrument_ids: list[str] | None = None,
+        bar_types: list[str] | None = None,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+        where: str | None = None,
+        chunk_size: int = 10_000,
+        **kwargs: Any,
+    ) -> Generator[list[Data], None, None]:
+        query_data_cls = OrderBookDelta if data_cls == OrderBookDeltas else data_cls
+        session = self.backend_session(
+            data_cls=query_data_cls,
+            instrument_ids=instrument_ids,
+            bar_types=bar_types,
+            start=start,
+            end=end,
+            where=where,
+            session=DataBackendSession(chunk_size=chunk_size),
+            **kwargs,
+        )
+
+        pending: list[OrderBookDelta] = []
+        for chunk in session.to_query_result():
+            data = capsule_to_list(chunk)
+            if data_cls != OrderBookDeltas:
+                yield data
+                continue
+
+            # Deltas for a single book event may straddle a chunk boundary, so only
+            # batch up to the last `F_LAST` flag and carry the remainder forward.
+            pending.extend(data)
+            last_idx = self._last_f_last_index(pending)
+            if last_idx < 0:
+                continue
+            yield OrderBookDeltas.batch(pending[: last_idx + 1])
+            pending = pending[last_idx + 1 :]
+
+        if pending:
+            # Will warn as there are deltas after the final `F_LAST` flag
+            yield OrderBookDeltas.batch(pending)
+
     def query_pyarrow(
         self,
         data_cls: type,
@@ -559,6 +696,35 @@ class ParquetDataCatalog(BaseDataCatalog):
 
         return self._handle_table_nautilus(table, data_cls=data_cls)
 
+    def query_pyarrow_chunks(
+        self,
+        data_cls: type,
+        instrument_ids: list[str] | None = None,
+        bar_types: list[str] | None = None,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+        filter_expr: str | None = None,
+        chunk_size: int = 10_000,
+        **kwargs: Any,
+    ) -> Generator[list[Data], None, None]:
+        file_prefix = class_to_filename(data_cls)
+        dataset_path = f"{self.path}/data/{file_prefix}"
+        if not self.fs.exists(dataset_path):
+            return
+        dataset, filter_ = self._load_pyarrow_dataset(
+            path=dataset_path,
+            filter_expr=filter_expr,
+            instrument_ids=instrument_ids,
+            bar_types=bar_types,
+            start=start,
+            end=end,
+        )
+
+        for batch in dataset.to_batches(filter=filter_, batch_size=chunk_size):
+            data = self._handle_batch_nautilus(batch, data_cls=data_cls)
+            if data:
+                yield data
+
     def _load_pyarrow_table(
         self,
         path: str,
@@ -568,7 +734,28 @@ class ParquetDataCatalog(BaseDataCatalog):
         start: TimestampLike | None = None,
         end: TimestampLike | None = None,
         ts_column: str = "ts_init",
-    ) -> pds.Dataset | None:
+    ) -> pa.Table | None:
+        dataset, filter_ = self._load_pyarrow_dataset(
+            path=path,
+            filter_expr=filter_expr,
+            instrument_ids=instrument_ids,
+            bar_types=bar_types,
+            start=start,
+            end=end,
+            ts_column=ts_column,
+        )
+        return dataset.to_table(filter=filter_)
+
+    def _load_pyarrow_dataset(
+        self,
+        path: str,
+        filter_expr: str | None = None,
+        instrument_ids: list[str] | None = None,
+        bar_types: list[str] | None = None,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+        ts_column: str = "ts_init",
+    ) -> tuple[pds.Dataset, pds.Expression | None]:
         # Original dataset
         dataset = pds.dataset(path, filesystem=self.fs)
 
@@ -600,7 +787,14 @@ class ParquetDataCatalog(BaseDataCatalog):
             filter_ = combine_filters(*filters)
         else:
             filter_ = None
-        return dataset.to_table(filter=filter_)
+        return dataset, filter_
+
+    @staticmethod
+    def _last_f_last_index(deltas: list[OrderBookDelta]) -> int:
+        for idx in range(len(deltas) - 1, -1, -1):
+            if deltas[idx].flags == RecordFlag.F_LAST:
+                return idx
+        return -1
 
     def _build_query(
         self,
@@ -647,7 +841,22 @@ class ParquetDataCatalog(BaseDataCatalog):
     ) -> list[Data]:
         if isinstance(table, pd.DataFrame):
             table = pa.Table.from_pandas(table)
-        data = ArrowSerializer.deserialize(data_cls=data_cls, batch=table)
+
+        # Convert one record batch at a time so that only a single batch of
+        # intermediate pyo3 objects is alive alongside the converted results.
+        data: list[Data] = []
+        for batch in table.to_batches():
+            data.extend(ParquetDataCatalog._handle_batch_nautilus(batch, data_cls=data_cls))
+        return data
+
+    @staticmethod
+    def _handle_batch_nautilus(
+        batch: pa.RecordBatch,
+        data_cls: type,
+    ) -> list[Data]:
+        if batch.num_rows == 0:
+            return []
+        data = ArrowSerializer.deserialize(data_cls=data_cls, batch=batch)
         # TODO (bm/cs) remove when pyo3 objects are used everywhere.
         module = data[0].__class__.__module__
         if "nautilus_pyo3" in module:
@@ -29,8 +29,6 @@ from libc.stdint cimport uint64_t
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport as_utc_index
 from nautilus_trader.core.rust.model cimport AggressorSide
-from nautilus_trader.core.rust.model cimport BookAction
-from nautilus_trader.core.rust.model cimport OrderSide
 from nautilus_trader.core.rust.model cimport RecordFlag
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport BarType
@@ -114,14 +112,107 @@ def calculate_bar_price_offsets(num_records, timestamp_is_close: bool, offset_in
 
     # Randomize high and low if seed is given
     if random_seed is not None:
-        local_random = random.Random(random_seed)
-        for i in range(num_records):
-            if local_random.getrandbits(1):  # With a 50% chance, swap high and low
-                offsets["high"][i], offsets["low"][i] = offsets["low"][i], offsets["high"][i]
+        swap = random_bits(num_records, random_seed)  # With a 50% chance, swap high and low
+        high = offsets["high"]
+        low = offsets["low"]
+        offsets["high"] = np.where(swap, low, high)
+        offsets["low"] = np.where(swap, high, low)
 
     return offsets
 
 
+def random_bits(num_records: int, random_seed: int) -> np.ndarray:
+    """
+    Return an array of random bits drawn from a seeded `random.Random`.
+
+    The bits are identical to calling `getrandbits(1)` once per record (which
+    takes the most significant bit of each 32-bit output of the generator),
+    however the outputs are drawn in a single call.
+
+    Parameters
+    ----------
+    num_records : int
+        The number of bits to draw.
+    random_seed : int
+        The seed for the random number generator.
+
+    Returns
+    -------
+    np.ndarray
+        The random bits as bool.
+
+    """
+    if num_records == 0:
+        return np.zeros(0, dtype=np.bool_)
+
+    outputs = random.Random(random_seed).getrandbits(32 * num_records)
+    words = np.frombuffer(outputs.to_bytes(4 * num_records, "little"), dtype="<u4")
+    return (words >> 31).astype(np.bool_)
+
+
+def bar_tick_order(timestamps: np.ndarray, offsets: dict[str, np.ndarray]):
+    """
+    Return the tick timestamps and OHLC order for ticks synthesized from bars.
+
+    Parameters
+    ----------
+    timestamps : np.ndarray
+        The bar timestamps as datetime64[ns].
+    offsets : dict[str, np.ndarray]
+        The offsets for the open, high, low and close ticks of each bar
+        (see `calculate_bar_price_offsets`).
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The tick timestamps with shape (bars, 4) in time order within each bar,
+        and the matching indices into the OHLC columns.
+
+    """
+    ts_ticks = np.column_stack([timestamps + offsets[key] for key in BAR_PRICES])
+    order = np.argsort(ts_ticks, axis=1, kind="stable")
+    return np.take_along_axis(ts_ticks, order, axis=1), order
+
+
+def interleave_bar_values(values: np.ndarray, order: np.ndarray) -> np.ndarray:
+    """
+    Interleave the given OHLC values per bar into a flat array of tick values.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The values with shape (bars, 4) in OHLC column order.
+    order : np.ndarray
+        The OHLC order within each bar (see `bar_tick_order`).
+
+    Returns
+    -------
+    np.ndarray
+
+    """
+    return np.take_along_axis(values, order, axis=1).ravel()
+
+
+def sorted_tick_indices(ts_events: np.ndarray):
+    """
+    Return the indices which sort the given tick timestamps (stable).
+
+    Parameters
+    ----------
+    ts_events : np.ndarray
+        The tick timestamps.
+
+    Returns
+    -------
+    np.ndarray or ``None``
+        The sort indices, or ``None`` if the timestamps are already sorted.
+
+    """
+    if len(ts_events) < 2 or np.all(ts_events[1:] >= ts_events[:-1]):
+        return None
+    return np.argsort(ts_events, kind="stable")
+
+
 def calculate_volume_quarter(volume: np.ndarray, precision: int):
     """
     Convert raw volume data to quarter precision.
@@ -165,6 +256,50 @@ def align_bid_ask_bar_data(bid_data: pd.DataFrame, ask_data: pd.DataFrame):
     return merged_data
 
 
+def map_enum_column(column: pd.Series, parser) -> np.ndarray:
+    """
+    Map a column of enum names to an array of enum values.
+
+    Each unique name is only parsed once, which avoids a parser call per row.
+
+    Parameters
+    ----------
+    column : pd.Series
+        The column of enum names (e.g. 'ADD', 'BUY').
+    parser : Callable[[str], int]
+        The parser for a single enum name.
+
+    Returns
+    -------
+    np.ndarray
+        The enum values as uint8.
+
+    """
+    mapping = {name: int(parser(name)) for name in column.unique()}
+    return column.map(mapping).to_numpy(dtype=np.uint8)
+
+
+def as_writable_array(values, dtype) -> np.ndarray:
+    """
+    Return the given values as a C-contiguous writable array of the given dtype.
+
+    A copy is only made if required, such as for read-only arrays from Arrow.
+
+    Parameters
+    ----------
+    values : array-like
+        The values to convert.
+    dtype : np.dtype
+        The required dtype.
+
+    Returns
+    -------
+    np.ndarray
+
+    """
+    return np.require(values, dtype=dtype, requirements=["C", "W"])
+
+
 def prepare_event_and_init_timestamps(
     index: pd.DatetimeIndex,
     ts_init_delta: int,
@@ -217,33 +352,94 @@ cdef class OrderBookDeltaDataWrangler:
         data = as_utc_index(data)
         ts_events, ts_inits = prepare_event_and_init_timestamps(data.index, ts_init_delta)
 
-        cdef list[OrderBookDelta] deltas
+        return self.process_arrays(
+            actions=map_enum_column(data["action"], book_action_from_str),
+            sides=map_enum_column(data["side"], order_side_from_str),
+            prices=data["price"].to_numpy(),
+            sizes=data["size"].to_numpy(),
+            order_ids=data["order_id"].to_numpy(),
+            flags=data["flags"].to_numpy(),
+            sequences=data["sequence"].to_numpy(),
+            ts_events=ts_events,
+            ts_inits=ts_inits,
+            is_raw=is_raw,
+        )
+
+    def process_arrays(
+        self,
+        actions: np.ndarray,
+        sides: np.ndarray,
+        prices: np.ndarray,
+        sizes: np.ndarray,
+        order_ids: np.ndarray,
+        flags: np.ndarray,
+        sequences: np.ndarray,
+        ts_events: np.ndarray,
+        ts_inits: np.ndarray,
+        bint is_raw=False,
+    ):
+        """
+        Process the given order book data columns into Nautilus `OrderBookDelta` objects.
+
+        All deltas are built in a single pass over the columns, without any
+        intermediate per-row Python objects. Arrow arrays can be passed directly
+        (they are converted with `numpy.asarray`).
+
+        Parameters
+        ----------
+        actions : np.ndarray
+            The `BookAction` enum values.
+        sides : np.ndarray
+            The `OrderSide` enum values.
+        prices : np.ndarray
+            The order prices (fixed-point int64 if `is_raw`).
+        sizes : np.ndarray
+            The order sizes (fixed-point uint64 if `is_raw`).
+        order_ids : np.ndarray
+            The order IDs.
+        flags : np.ndarray
+            The record flags bit fields.
+        sequences : np.ndarray
+            The message sequence numbers.
+        ts_events : np.ndarray
+            UNIX timestamps (nanoseconds) when the deltas occurred.
+        ts_inits : np.ndarray
+            UNIX timestamps (nanoseconds) when the deltas were initialized.
+        is_raw : bool, default False
+            If the prices and sizes are scaled to Nautilus fixed-point values.
+
+        Returns
+        -------
+        list[OrderBookDelta]
+
+        Raises
+        ------
+        ValueError
+            If the array lengths are not equal.
+
+        """
         if is_raw:
-            deltas = list(map(
-                self._build_delta_from_raw,
-                data["action"].apply(book_action_from_str),
-                data["side"].apply(order_side_from_str),
-                data["price"],
-                data["size"],
-                data["order_id"],
-                data["flags"],
-                data["sequence"],
-                ts_events,
-                ts_inits,
-            ))
+            prices_raw = as_writable_array(prices, np.int64)
+            sizes_raw = as_writable_array(sizes, np.uint64)
         else:
-            deltas = list(map(
-                self._build_delta,
-                data["action"].apply(book_action_from_str),
-                data["side"].apply(order_side_from_str),
-                data["price"],
-                data["size"],
-                data["order_id"],
-                data["flags"],
-                data["sequence"],
-                ts_events,
-                ts_inits,
-            ))
+            # Truncates toward zero when scaling to fixed-point
+            prices_raw = (np.asarray(prices, dtype=np.float64) * 1e9).astype(np.int64)
+            sizes_raw = (np.asarray(sizes, dtype=np.float64) * 1e9).astype(np.uint64)
+
+        cdef list[OrderBookDelta] deltas = OrderBookDelta.from_raw_arrays_to_list_c(
+            self.instrument.id,
+            self.instrument.price_precision,
+            self.instrument.size_precision,
+            as_writable_array(actions, np.uint8),
+            as_writable_array(sides, np.uint8),
+            prices_raw,
+            sizes_raw,
+            as_writable_array(order_ids, np.uint64),
+            as_writable_array(flags, np.uint8),
+            as_writable_array(sequences, np.uint64),
+            as_writable_array(ts_events, np.uint64),
+            as_writable_array(ts_inits, np.uint64),
+        )
 
         cdef:
             OrderBookDelta first
@@ -260,62 +456,6 @@ cdef class OrderBookDeltaDataWrangler:
 
         return deltas
 
-    # cpdef method for Python wrap() (called with map)
-    cpdef OrderBookDelta _build_delta_from_raw(
-        self,
-        BookAction action,
-        OrderSide side,
-        int64_t price_raw,
-        uint64_t size_raw,
-        uint64_t order_id,
-        uint8_t flags,
-        uint64_t sequence,
-        uint64_t ts_event,
-        uint64_t ts_init,
-    ):
-        return OrderBookDelta.from_raw_c(
-            self.instrument.id,
-            action,
-            side,
-            price_raw,
-            self.instrument.price_precision,
-            size_raw,
-            self.instrument.size_precision,
-            order_id,
-            flags,
-            sequence,
-            ts_event,
-            ts_init,
-        )
-
-    # cpdef method for Python wrap() (called with map)
-    cpdef OrderBookDelta _build_delta(
-        self,
-        BookAction action,
-        OrderSide side,
-        double price,
-        double size,
-        uint64_t order_id,
-        uint8_t flags,
-        uint64_t sequence,
-        uint64_t ts_event,
-        uint64_t ts_init,
-    ):
-        return OrderBookDelta.from_raw_c(
-            self.instrument.id,
-            action,
-            side,
-            int(price * 1e9),
-            self.instrument.price_precision,
-            int(size * 1e9),
-            self.instrument.size_precision,
-            order_id,
-            flags,
-            sequence,
-            ts_event,
-            ts_init,
-        )
-
 
 cdef class QuoteTickDataWrangler:
     """
@@ -459,65 +599,47 @@ cdef class QuoteTickDataWrangler:
 
         merged_data = align_bid_ask_bar_data(bid_data, ask_data)
         offsets = calculate_bar_price_offsets(len(merged_data), timestamp_is_close, offset_interval_ms, random_seed)
-        ticks_final = self._create_quote_ticks_array(merged_data, is_raw, self.instrument, offsets, ts_init_delta)
 
-        # Sort data by timestamp, if required
+        # Build interleaved open, high, low, close tick arrays (four ticks per bar)
+        ts_ticks, order = bar_tick_order(merged_data.index.to_numpy(dtype="datetime64[ns]"), offsets)
+        bid_prices = interleave_bar_values(
+            merged_data[[f"bid_{key}" for key in BAR_PRICES]].to_numpy(dtype=np.int64),
+            order,
+        )
+        ask_prices = interleave_bar_values(
+            merged_data[[f"ask_{key}" for key in BAR_PRICES]].to_numpy(dtype=np.int64),
+            order,
+        )
+
+        size_precision = self.instrument.size_precision
+        bid_sizes = np.repeat(calculate_volume_quarter(merged_data["bid_volume"].to_numpy(), size_precision), 4)
+        ask_sizes = np.repeat(calculate_volume_quarter(merged_data["ask_volume"].to_numpy(), size_precision), 4)
+        ts_events = ts_ticks.ravel().view(np.uint64)
+
+        # Sort data by timestamp, if required (already in order unless bars overlap)
         if sort_data:
-            sorted_indices = np.argsort(ticks_final["timestamp"])
-            ticks_final = ticks_final[sorted_indices]
+            sorted_indices = sorted_tick_indices(ts_events)
+            if sorted_indices is not None:
+                bid_prices = bid_prices[sorted_indices]
+                ask_prices = ask_prices[sorted_indices]
+                bid_sizes = bid_sizes[sorted_indices]
+                ask_sizes = ask_sizes[sorted_indices]
+                ts_events = ts_events[sorted_indices]
 
-        ts_events = ticks_final["timestamp"].view(np.uint64)
         ts_inits = ts_events + ts_init_delta
 
         return QuoteTick.from_raw_arrays_to_list_c(
             self.instrument.id,
             self.instrument.price_precision,
             self.instrument.size_precision,
-            ticks_final["bid_price_raw"],
-            ticks_final["ask_price_raw"],
-            ticks_final["bid_size_raw"],
-            ticks_final["ask_size_raw"],
+            bid_prices,
+            ask_prices,
+            bid_sizes,
+            ask_sizes,
             ts_events,
             ts_inits,
         )
 
-    def _create_quote_ticks_array(
-        self,
-        merged_data,
-        is_raw,
-        instrument: Instrument,
-        offsets,
-        ts_init_delta,
-    ):
-        dtype = [
-            ("bid_price_raw", np.int64), ("ask_price_raw", np.int64),
-            ("bid_size_raw", np.uint64), ("ask_size_raw", np.uint64),
-            ("timestamp", "datetime64[ns]")
-        ]
-
-        size_precision = instrument.size_precision
-        merged_data.loc[:, "bid_volume"] = calculate_volume_quarter(merged_data["bid_volume"], size_precision)
-        merged_data.loc[:, "ask_volume"] = calculate_volume_quarter(merged_data["ask_volume"], size_precision)
-
-        # Convert to record array
-        records = merged_data.to_records()
-
-        # Create structured array
-        total_records = len(records) * 4  # For open, high, low, close
-        tick_data = np.empty(total_records, dtype=dtype)
-
-        for i, price_key in enumerate(BAR_PRICES):
-            start_index = i * len(records)
-            end_index = start_index + len(records)
-
-            tick_data["bid_price_raw"][start_index:end_index] = records[f"bid_{price_key}"].astype(np.int64)
-            tick_data["ask_price_raw"][start_index:end_index] = records[f"ask_{price_key}"].astype(np.int64)
-            tick_data["bid_size_raw"][start_index:end_index] = records["bid_volume"].astype(np.uint64)
-            tick_data["ask_size_raw"][start_index:end_index] = records["ask_volume"].astype(np.uint64)
-            tick_data["timestamp"][start_index:end_index] = records["timestamp"] + offsets[price_key]
-
-        return tick_data
-
     # cpdef method for Python wrap() (called with map)
     cpdef QuoteTick _build_tick_from_raw(
         self,
@@ -681,19 +803,22 @@ cdef class TradeTickDataWrangler:
 
         # Standardize and preprocess data
         data = preprocess_bar_data(data, is_raw)
-        data.loc[:, "volume"] = calculate_volume_quarter(data["volume"], self.instrument.size_precision)
-        data.loc[:, "trade_id"] = data.index.view(np.uint64).astype(str)
+        offsets = calculate_bar_price_offsets(len(data), timestamp_is_close, offset_interval_ms, random_seed)
 
-        records = data.to_records()
-        offsets = calculate_bar_price_offsets(len(records), timestamp_is_close, offset_interval_ms, random_seed)
-        ticks_final = self._create_trade_ticks_array(records, offsets)
+        # Build interleaved open, high, low, close tick arrays (four ticks per bar)
+        ts_ticks, order = bar_tick_order(data.index.to_numpy(dtype="datetime64[ns]"), offsets)
+        prices = interleave_bar_values(data[list(BAR_PRICES)].to_numpy(dtype=np.int64), order)
+        sizes = np.repeat(calculate_volume_quarter(data["volume"].to_numpy(), self.instrument.size_precision), 4)
+        ts_events = ts_ticks.ravel().view(np.uint64)
 
-        # Sort data by timestamp, if required
+        # Sort data by timestamp, if required (already in order unless bars overlap)
         if sort_data:
-            sorted_indices = np.argsort(ticks_final["timestamp"])
-            ticks_final = ticks_final[sorted_indices]
+            sorted_indices = sorted_tick_indices(ts_events)
+            if sorted_indices is not None:
+                prices = prices[sorted_indices]
+                sizes = sizes[sorted_indices]
+                ts_events = ts_events[sorted_indices]
 
-        ts_events = ticks_final["timestamp"].view(np.uint64)
         ts_inits = ts_events + ts_init_delta
 
         cdef uint8_t[:] aggressor_sides = np.full(len(ts_events), AggressorSide.NO_AGGRESSOR, dtype=np.uint8)
@@ -702,30 +827,14 @@ cdef class TradeTickDataWrangler:
             self.instrument.id,
             self.instrument.price_precision,
             self.instrument.size_precision,
-            ticks_final["price"],
-            ticks_final["size"],
+            prices,
+            sizes,
             aggressor_sides,
             ts_events.astype(str).tolist(),
             ts_events,
             ts_inits,
         )
 
-    def _create_trade_ticks_array(
-        self,
-        records,
-        offsets,
-    ):
-        dtype = [("price", np.int64), ("size", np.uint64), ("timestamp", "datetime64[ns]")]
-        tick_data = np.empty(len(records) * 4, dtype=dtype)
-        for i, price_key in enumerate(BAR_PRICES):
-            start_index = i * len(records)
-            end_index = start_index + len(records)
-            tick_data["price"][start_index:end_index] = records[price_key].astype(np.int64)
-            tick_data["size"][start_index:end_index] = records["volume"].astype(np.uint64)
-            tick_data["timestamp"][start_index:end_index] = records["timestamp"] + offsets[price_key]
-
-        return tick_data
-
     def _create_side_if_not_exist(self, data):
         if "side" in data.columns:
             return data["side"].apply(lambda x: AggressorSide.BUYER if str(x).upper() == "BUY" else AggressorSide.SELLER)
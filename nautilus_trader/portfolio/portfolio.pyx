@@ -48,6 +48,7 @@ from nautilus_trader.model.events.account cimport AccountState
 from nautilus_trader.model.events.order cimport OrderAccepted
 from nautilus_trader.model.events.order cimport OrderCanceled
 from nautilus_trader.model.events.order cimport OrderEvent
+from nautilus_trader.model.events.order cimport OrderExpired
 from nautilus_trader.model.events.order cimport OrderFilled
 from nautilus_trader.model.events.order cimport OrderRejected
 from nautilus_trader.model.events.order cimport OrderUpdated
@@ -425,10 +426,15 @@ cdef class Portfolio(PortfolioFacade):
         if not account.calculate_account_state:
             return  # Nothing to calculate
 
+        cdef Order order
         if not isinstance(event, _UPDATE_ORDER_EVENTS):
+            if isinstance(event, OrderExpired):
+                order = self._cache.order(event.client_order_id)
+                if order is not None:
+                    self._accounts.discard_order(order)
             return  # No change to account state
 
-        cdef Order order = self._cache.order(event.client_order_id)
+        order = self._cache.order(event.client_order_id)
         if order is None:
             self._log.error(
                 f"Cannot update order: "
@@ -461,17 +467,11 @@ cdef class Portfolio(PortfolioFacade):
                 instrument_id=event.instrument_id,
             )
 
-        cdef list orders_open = self._cache.orders_open(
-            venue=None,  # Faster query filtering
-            instrument_id=event.instrument_id,
-        )
-
-        cdef:
-            Order o
-        account_state = self._accounts.update_orders(
+        # Adjust locked balance or initial margin by the change for this order only
+        account_state = self._accounts.update_order(
             account=account,
             instrument=instrument,
-            orders_open=[o for o in orders_open if o.is_passive_c()],
+            order=order,
             ts_event=event.ts_event,
         )
 
@@ -541,6 +541,7 @@ cdef class Portfolio(PortfolioFacade):
         self._net_positions.clear()
         self._unrealized_pnls.clear()
         self._pending_calcs.clear()
+        self._accounts.reset()
         self.analyzer.reset()
 
         self.initialized = False
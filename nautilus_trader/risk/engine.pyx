@@ -29,6 +29,7 @@ from nautilus_trader.common.component cimport RECV
 from nautilus_trader.common.component cimport Clock
 from nautilus_trader.common.component cimport Component
 from nautilus_trader.common.component cimport LogColor
+from nautilus_trader.common.component cimport LogLevel
 from nautilus_trader.common.component cimport MessageBus
 from nautilus_trader.common.component cimport Throttler
 from nautilus_trader.common.messages cimport TradingStateChanged
@@ -389,7 +390,7 @@ cdef class RiskEngine(Component):
 # -- COMMAND HANDLERS -----------------------------------------------------------------------------
 
     cpdef void _execute_command(self, Command command):
-        if self.debug:
+        if self.debug and self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"{RECV}{CMD} {command}", LogColor.MAGENTA)
         self.command_count += 1
 
@@ -616,7 +617,7 @@ cdef class RiskEngine(Component):
             return True  # TODO: Determine risk controls for margin
 
         free = account.balance_free(instrument.quote_currency)
-        if self.debug:
+        if self.debug and self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"Free: {free!r}", LogColor.MAGENTA)
 
         cdef:
@@ -664,7 +665,7 @@ cdef class RiskEngine(Component):
                 last_px = order.price
 
             notional = instrument.notional_value(order.quantity, last_px, use_quote_for_inverse=True)
-            if self.debug:
+            if self.debug and self._log.is_enabled(LogLevel.DEBUG):
                 self._log.debug(f"Notional: {order_balance_impact!r}", LogColor.MAGENTA)
 
             if max_notional and notional._mem.raw > max_notional._mem.raw:
@@ -699,7 +700,7 @@ cdef class RiskEngine(Component):
                 return False  # Denied
 
             order_balance_impact = account.balance_impact(instrument, order.quantity, last_px, order.side)
-            if self.debug:
+            if self.debug and self._log.is_enabled(LogLevel.DEBUG):
                 self._log.debug(f"Balance impact: {order_balance_impact!r}", LogColor.MAGENTA)
 
             if free is not None and (free._mem.raw + order_balance_impact._mem.raw) < 0:
@@ -718,7 +719,7 @@ cdef class RiskEngine(Component):
                 else:
                     cum_notional_buy._mem.raw += -order_balance_impact._mem.raw
 
-                if self.debug:
+                if self.debug and self._log.is_enabled(LogLevel.DEBUG):
                     self._log.debug(f"Cumulative notional BUY: {cum_notional_buy!r}")
                 if free is not None and cum_notional_buy._mem.raw > free._mem.raw:
                     self._deny_order(
@@ -733,7 +734,7 @@ cdef class RiskEngine(Component):
                     else:
                         cum_notional_sell._mem.raw += order_balance_impact._mem.raw
 
-                    if self.debug:
+                    if self.debug and self._log.is_enabled(LogLevel.DEBUG):
                         self._log.debug(f"Cumulative notional SELL: {cum_notional_sell!r}")
                     if free is not None and cum_notional_sell._mem.raw > free._mem.raw:
                         self._deny_order(
@@ -757,7 +758,7 @@ cdef class RiskEngine(Component):
                     else:
                         cum_notional_sell._mem.raw += cash_value._mem.raw
 
-                    if self.debug:
+                    if self.debug and self._log.is_enabled(LogLevel.DEBUG):
                         self._log.debug(f"Cumulative notional SELL: {cum_notional_sell!r}")
                     if free is not None and cum_notional_sell._mem.raw > free._mem.raw:
                         self._deny_order(
@@ -929,6 +930,6 @@ cdef class RiskEngine(Component):
 # -- EVENT HANDLERS -------------------------------------------------------------------------------
 
     cpdef void _handle_event(self, Event event):
-        if self.debug:
+        if self.debug and self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"{RECV}{EVT} {event}", LogColor.MAGENTA)
         self.event_count += 1
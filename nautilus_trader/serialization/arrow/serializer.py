@@ -54,6 +54,7 @@ from nautilus_trader.serialization.arrow.schema import NAUTILUS_ARROW_SCHEMA
 _ARROW_ENCODERS: dict[type, Callable] = {}
 _ARROW_DECODERS: dict[type, Callable] = {}
 _SCHEMAS: dict[type, pa.Schema] = {}
+_BATCH_ENCODERS: set[type] = set()
 
 
 def get_schema(data_cls: type) -> pa.Schema:
@@ -69,6 +70,7 @@ def register_arrow(
     schema: pa.Schema | None,
     encoder: Callable | None = None,
     decoder: Callable | None = None,
+    batch_encoder: bool = False,
 ) -> None:
     """
     Register a new class for serialization to parquet.
@@ -84,6 +86,9 @@ def register_arrow(
     schema : pa.Schema, optional
         If the schema cannot be correctly inferred from a subset of the data
         (i.e. if certain values may be missing in the first chunk).
+    batch_encoder : bool, default False
+        If the `encoder` also accepts a list of objects, returning a single
+        record batch for all of them (enables bulk serialization of batches).
     table : type, optional
         An optional table override for `cls`. Used if `cls` is going to be
         transformed and stored in a table other than its own.
@@ -95,6 +100,10 @@ def register_arrow(
 
     if encoder is not None:
         _ARROW_ENCODERS[data_cls] = encoder
+        if batch_encoder:
+            _BATCH_ENCODERS.add(data_cls)
+        else:
+            _BATCH_ENCODERS.discard(data_cls)
     if decoder is not None:
         _ARROW_DECODERS[data_cls] = decoder
     if schema is not None:
@@ -215,6 +224,12 @@ class ArrowSerializer:
         """
         if data_cls in RUST_SERIALIZERS or data_cls.__name__ in RUST_STR_SERIALIZERS:
             return ArrowSerializer.rust_defined_to_record_batch(data, data_cls=data_cls)
+        if data_cls in _BATCH_ENCODERS:
+            # Encode all objects into a single record batch in one pass
+            data = [obj.data if isinstance(obj, CustomData) else obj for obj in data]
+            batch = _ARROW_ENCODERS[data_cls](data)
+            assert isinstance(batch, pa.RecordBatch)
+            return pa.Table.from_batches([batch])
         batches = [ArrowSerializer.serialize(obj, data_cls) for obj in data]
         return pa.Table.from_batches(batches, schema=batches[0].schema)
 
@@ -277,19 +292,89 @@ def make_dict_serializer(schema: pa.Schema) -> Callable[[list[Data | Event]], pa
     return inner
 
 
+def make_columnar_serializer(
+    schema: pa.Schema,
+    to_columns: Callable[[list[Any]], dict[str, list | pa.Array]],
+) -> Callable[[Any | list[Any]], pa.RecordBatch]:
+    """
+    Return an encoder which builds a record batch from column arrays.
+
+    Parameters
+    ----------
+    schema : pa.Schema
+        The schema for the encoded record batches.
+    to_columns : Callable[[list[Any]], dict[str, list | pa.Array]]
+        The callable to extract the column values (keyed by field name) from a list of objects.
+
+    Returns
+    -------
+    Callable[[Any | list[Any]], pa.RecordBatch]
+
+    """
+
+    def inner(data: Any | list[Any]) -> pa.RecordBatch:
+        if not isinstance(data, list):
+            data = [data]
+        return columns_to_record_batch(to_columns(data), schema=schema)
+
+    return inner
+
+
 def make_dict_deserializer(data_cls):
     def inner(table: pa.Table) -> list[Data | Event]:
         assert isinstance(table, pa.Table | pa.RecordBatch)
-        return [data_cls.from_dict(d) for d in table.to_pylist()]
+        columns = table.to_pydict()
+        names = list(columns)
+        return [data_cls.from_dict(dict(zip(names, row))) for row in zip(*columns.values())]
 
     return inner
 
 
 def dicts_to_record_batch(data: list[dict], schema: pa.Schema) -> pa.RecordBatch:
-    try:
-        return pa.RecordBatch.from_pylist(data, schema=schema)
-    except Exception as e:
-        print(e)
+    columns = {name: [d.get(name) for d in data] for name in schema.names}
+    return columns_to_record_batch(columns, schema=schema)
+
+
+def columns_to_record_batch(
+    columns: dict[str, list | pa.Array],
+    schema: pa.Schema,
+) -> pa.RecordBatch:
+    """
+    Build a record batch directly from the given column values.
+
+    Parameters
+    ----------
+    columns : dict[str, list | pa.Array]
+        The values for each column, keyed by field name.
+    schema : pa.Schema
+        The schema for the record batch.
+
+    Returns
+    -------
+    pa.RecordBatch
+
+    Raises
+    ------
+    KeyError
+        If `columns` is missing a field in `schema`.
+    ValueError
+        If the values for a column cannot be converted to the fields type.
+
+    """
+    arrays: list[pa.Array] = []
+    for field in schema:
+        values = columns[field.name]
+        try:
+            if isinstance(values, pa.Array):
+                arrays.append(values.cast(field.type))
+            else:
+                arrays.append(pa.array(values, type=field.type))
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+            raise ValueError(
+                f"Cannot convert column `{field.name}` to Arrow type `{field.type}`: {e}",
+            ) from e
+
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
 
 
 RUST_SERIALIZERS = {
@@ -319,6 +404,7 @@ for _data_cls in NAUTILUS_ARROW_SCHEMA:
             schema=NAUTILUS_ARROW_SCHEMA[_data_cls],
             encoder=make_dict_serializer(NAUTILUS_ARROW_SCHEMA[_data_cls]),
             decoder=make_dict_deserializer(_data_cls),
+            batch_encoder=True,
         )
 
 
@@ -13,9 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-import re
 from typing import Any
 
+from libc.stdint cimport int64_t
 from libc.stdint cimport uint64_t
 
 import pandas as pd
@@ -23,6 +23,7 @@ import pytz
 from msgspec import msgpack
 
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.datetime cimport unix_nanos_to_iso8601
 from nautilus_trader.serialization.base cimport _OBJECT_FROM_DICT_MAP
 from nautilus_trader.serialization.base cimport _OBJECT_TO_DICT_MAP
 from nautilus_trader.serialization.base cimport Serializer
@@ -30,6 +31,56 @@ from nautilus_trader.serialization.base cimport Serializer
 
 cdef tuple[str, int, float, bool] _PRIMITIVES = (str, int, float, bool)
 
+# Timestamp field keys per object type name (computed once per type)
+cdef dict[str, tuple] _TIMESTAMP_KEYS = {}
+
+
+cdef inline tuple _timestamp_keys(dict obj_dict):
+    cdef str obj_type = obj_dict.get("type")
+    cdef tuple keys = _TIMESTAMP_KEYS.get(obj_type)
+    if keys is not None:
+        return keys
+
+    cdef str k
+    keys = tuple([k for k in obj_dict if k == "expire_time_ns" or k.startswith("ts_")])
+    if obj_type is not None:
+        _TIMESTAMP_KEYS[obj_type] = keys
+
+    return keys
+
+
+cdef inline uint64_t _iso8601_to_unix_nanos(str value):
+    # Fast path for the fixed width UTC format 'YYYY-MM-DDTHH:MM:SS.fffffffffZ'
+    if not (
+        len(value) == 30
+        and value[4] == "-"
+        and value[10] == "T"
+        and value[19] == "."
+        and value[29] == "Z"
+    ):
+        return pd.Timestamp(value, tz=pytz.utc).value
+
+    cdef int64_t year = int(value[0:4])
+    cdef int64_t month = int(value[5:7])
+    cdef int64_t day = int(value[8:10])
+
+    # Days since UNIX epoch from the civil date (proleptic Gregorian calendar)
+    if month <= 2:
+        year -= 1
+    cdef int64_t era = year // 400
+    cdef int64_t yoe = year - era * 400
+    cdef int64_t doy = (153 * (month - 3 if month > 2 else month + 9) + 2) // 5 + day - 1
+    cdef int64_t doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    cdef int64_t days = era * 146097 + doe - 719468
+
+    cdef int64_t secs = (
+        days * 86400
+        + int(value[11:13]) * 3600
+        + int(value[14:16]) * 60
+        + int(value[17:19])
+    )
+    return secs * 1_000_000_000 + int(value[20:29])
+
 
 cdef class MsgSpecSerializer(Serializer):
     """
@@ -91,21 +142,18 @@ cdef class MsgSpecSerializer(Serializer):
                     raise RuntimeError(f"cannot serialize object: unrecognized type {type(obj)}")
             obj_dict = delegate(obj)
 
-        cdef dict timestamp_kvs = {
-            k: v for k, v in obj_dict.items() if k in ("expire_time_ns") or re.match(r"^ts_", k)
-        }
+        if not (self.timestamps_as_iso8601 or self.timestamps_as_str):
+            return self._encode(obj_dict)
 
         cdef str key
-        if self.timestamps_as_iso8601:
-            for key, value in timestamp_kvs.items():
-                if value is None:
-                    continue
-                timestamp = pd.Timestamp(value, unit="ns", tz=pytz.utc)
-                obj_dict[key] = timestamp.isoformat().replace("+00:00", "Z")
-        elif self.timestamps_as_str:
-            for key, value in timestamp_kvs.items():
-                if value is not None:
-                    obj_dict[key] = str(value)
+        for key in _timestamp_keys(obj_dict):
+            value = obj_dict.get(key)
+            if value is None:
+                continue
+            if self.timestamps_as_iso8601:
+                obj_dict[key] = unix_nanos_to_iso8601(value)
+            else:
+                obj_dict[key] = str(value)
 
         return self._encode(obj_dict)
 
@@ -131,23 +179,17 @@ cdef class MsgSpecSerializer(Serializer):
         Condition.not_none(obj_bytes, "obj_bytes")
 
         cdef dict obj_dict = self._decode(obj_bytes)  # type: dict[str, Any]
-        cdef dict timestamp_kvs = {
-            k: v for k, v in obj_dict.items() if k in ("expire_time_ns") or re.match(r"^ts_", k)
-        }
 
-        cdef:
-            str key
-            uint64_t value_uint64
+        cdef str key
         if self.timestamps_as_iso8601 or self.timestamps_as_str:
-            for key, value in timestamp_kvs.items():
-                if value is None:
+            for key in _timestamp_keys(obj_dict):
+                value = obj_dict.get(key)
+                if value is None or not isinstance(value, str):
                     continue
-                if re.match(r"^\d+$", value):  # Check if value is an integer-like string
-                    value_uint64 = int(value)
-                    obj_dict[key] = value_uint64
+                if value.isdigit():  # Integer-like string
+                    obj_dict[key] = int(value)
                 else:  # Else assume the value is ISO 8601 format
-                    value_uint64 = pd.Timestamp(value, tz=pytz.utc).value
-                    obj_dict[key] = value_uint64
+                    obj_dict[key] = _iso8601_to_unix_nanos(value)
 
         cdef str obj_type = obj_dict.get("type")
         if obj_type is None:
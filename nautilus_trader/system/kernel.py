@@ -277,6 +277,9 @@ class NautilusKernel:
                     timestamps_as_iso8601=config.cache.timestamps_as_iso8601,
                 ),
                 config=config.cache,
+                position_max_events=(
+                    config.exec_engine.position_max_events if config.exec_engine else None
+                ),
             )
         else:
             raise ValueError(
@@ -156,6 +156,8 @@ cdef class Strategy(Actor):
         ClientId client_id=*,
     )
     cdef CancelOrder _create_cancel_order(self, Order order, ClientId client_id=*)
+    cdef list _create_cancel_orders(self, list orders, ClientId client_id=*)
+    cdef void _cancel_gtd_expiries(self, list orders)
 
     cpdef void cancel_gtd_expiry(self, Order order)
     cdef bint _has_gtd_expiry_timer(self, ClientOrderId client_order_id)
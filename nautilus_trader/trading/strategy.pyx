@@ -1021,10 +1021,14 @@ cdef class Strategy(Actor):
         """
         Batch cancel the given list of orders with optional routing instructions.
 
-        For each order in the list, a `CancelOrder` command will be created and added to a
-        `BatchCancelOrders` command. This command is then sent to the `ExecutionEngine`.
+        The orders are grouped per instrument, and for each group a `CancelOrder`
+        command is created per order and added to a single `BatchCancelOrders`
+        command, which is then sent to the `ExecutionEngine`. Pending cancel state
+        is applied to the cache in bulk, and any managed GTD expiry timers for the
+        orders are canceled together.
 
-        Logs an error if the `orders` list contains local/emulated orders.
+        Emulated orders, and orders which are active locally with an execution
+        algorithm, are canceled individually (as per `cancel_order`).
 
         Parameters
         ----------
@@ -1042,54 +1046,60 @@ cdef class Strategy(Actor):
             If `orders` contains a type other than `Order`.
 
         """
+        Condition.is_true(self.trader_id is not None, "The strategy has not been registered")
         Condition.not_empty(orders, "orders")
         Condition.list_type(orders, Order, "orders")
 
-        cdef list cancels = []
+        cdef dict batches = {}  # type: dict[InstrumentId, list[Order]]
+        cdef list local_orders = []
 
         cdef:
             Order order
-            Order first = None
-            CancelOrder cancel
+            list batch
         for order in orders:
-            if first is None:
-                first = order
-            else:
-                if first.instrument_id != order.instrument_id:
-                    self._log.error(
-                        "Cannot cancel all orders: instrument_id mismatch "
-                        f"{first.instrument_id} vs {order.instrument_id}",
-                    )
-                    return
-                if order.is_emulated_c():
-                    self._log.error(
-                        "Cannot include emulated orders in a batch cancel"
-                    )
-                    return
+            if (
+                order.is_emulated_c()
+                or order.emulation_trigger != TriggerType.NO_TRIGGER
+                or (order.exec_algorithm_id is not None and order.is_active_local_c())
+            ):
+                local_orders.append(order)
+                continue
+            batch = batches.get(order.instrument_id)
+            if batch is None:
+                batch = []
+                batches[order.instrument_id] = batch
+            batch.append(order)
 
-            cancel = self._create_cancel_order(
-                order=order,
-                client_id=client_id,
-            )
-            if cancel is None:
+        for order in local_orders:
+            self.cancel_order(order, client_id)
+
+        cdef:
+            InstrumentId instrument_id
+            list cancels
+            BatchCancelOrders command
+        for instrument_id, batch in batches.items():
+            cancels = self._create_cancel_orders(batch, client_id)
+            if not cancels:
+                self._log.warning(
+                    f"Cannot send `BatchCancelOrders` for {instrument_id}, no valid cancel commands",
+                )
                 continue
-            cancels.append(cancel)
 
-        if not cancels:
-            self._log.warning("Cannot send `BatchCancelOrders`, no valid cancel commands")
-            return
+            command = BatchCancelOrders(
+                trader_id=self.trader_id,
+                strategy_id=self.id,
+                instrument_id=instrument_id,
+                cancels=cancels,
+                command_id=UUID4(),
+                ts_init=self.clock.timestamp_ns(),
+                client_id=client_id,
+            )
 
-        cdef command = BatchCancelOrders(
-            trader_id=self.trader_id,
-            strategy_id=self.id,
-            instrument_id=first.instrument_id,
-            cancels=cancels,
-            command_id=UUID4(),
-            ts_init=self.clock.timestamp_ns(),
-            client_id=client_id,
-        )
+            self._manager.send_exec_command(command)
 
-        self._manager.send_exec_command(command)
+            # Cancel any GTD expiry timers
+            if self.manage_gtd_expiry:
+                self._cancel_gtd_expiries(batch)
 
     cpdef void cancel_all_orders(
         self,
@@ -1152,6 +1162,8 @@ cdef class Strategy(Actor):
                 f"{instrument_id.to_str()} order{'' if emulated_count == 1 else 's'}",
             )
 
+        cdef list pending_orders = []
+
         cdef:
             OrderPendingCancel event
             Order order
@@ -1161,10 +1173,12 @@ cdef class Strategy(Actor):
             event = self._generate_order_pending_cancel(order)
             try:
                 order.apply(event)
-                self.cache.update_order(order)
             except InvalidStateTrigger as e:
                 self._log.warning(f"InvalidStateTrigger: {e}, did not apply {event}")
                 continue
+            pending_orders.append(order)
+
+        self.cache.update_orders(pending_orders)
 
         cdef CancelAllOrders command = CancelAllOrders(
             trader_id=self.trader_id,
@@ -1190,6 +1204,10 @@ cdef class Strategy(Actor):
         self._manager.send_exec_command(command)
         self._manager.send_emulator_command(command)
 
+        # Cancel any GTD expiry timers
+        if self.manage_gtd_expiry:
+            self._cancel_gtd_expiries(open_orders)
+
     cpdef void close_position(
         self,
         Position position,
@@ -1445,6 +1463,90 @@ cdef class Strategy(Actor):
             client_id=client_id,
         )
 
+    cdef list _create_cancel_orders(self, list orders, ClientId client_id = None):
+        # Bulk equivalent of `_create_cancel_order`: pending cancel events are
+        # applied to every order, the cache is updated once for the batch, and
+        # orders which cannot be canceled are reported with a single warning.
+        cdef uint64_t ts_now = self.clock.timestamp_ns()
+        cdef list cancels = []
+        cdef list updated_orders = []
+        cdef list events = []
+        cdef int skipped = 0
+
+        cdef:
+            Order order
+            OrderPendingCancel event
+        for order in orders:
+            if order.is_closed_c() or order.is_pending_cancel_c():
+                skipped += 1
+                continue
+
+            if not order.is_active_local_c():
+                event = self._generate_order_pending_cancel(order)
+                try:
+                    order.apply(event)
+                except InvalidStateTrigger as e:
+                    self._log.warning(f"InvalidStateTrigger: {e}, did not apply {event}")
+                    continue
+                updated_orders.append(order)
+                events.append(event)
+
+            cancels.append(
+                CancelOrder(
+                    trader_id=self.trader_id,
+                    strategy_id=self.id,
+                    instrument_id=order.instrument_id,
+                    client_order_id=order.client_order_id,
+                    venue_order_id=order.venue_order_id,
+                    command_id=UUID4(),
+                    ts_init=ts_now,
+                    client_id=client_id,
+                ),
+            )
+
+        if skipped:
+            self.log.warning(
+                f"Cannot cancel {skipped} order{'' if skipped == 1 else 's'}: "
+                "state is closed or already pending cancel",
+            )
+
+        self.cache.update_orders(updated_orders)
+
+        # Publish events
+        for event in events:
+            self._msgbus.publish_c(
+                topic=f"events.order.{event.strategy_id.to_str()}",
+                msg=event,
+            )
+
+        return cancels
+
+    cdef void _cancel_gtd_expiries(self, list orders):
+        # Snapshot the active timer names once rather than per order
+        cdef set timer_names = set(self._clock.timer_names)
+        cdef list expiry_timer_names = []
+
+        cdef:
+            Order order
+            str timer_name
+        for order in orders:
+            if order.time_in_force != TimeInForce.GTD:
+                continue
+            timer_name = self._get_gtd_expiry_timer_name(order.client_order_id)
+            if timer_name in timer_names:
+                expiry_timer_names.append(timer_name)
+
+        if not expiry_timer_names:
+            return
+
+        cdef int count = len(expiry_timer_names)
+        self._log.info(
+            f"Canceling {count} managed GTD expiry timer{'' if count == 1 else 's'}",
+            LogColor.BLUE,
+        )
+        for timer_name in expiry_timer_names:
+            self._clock.cancel_timer(name=timer_name)
+
     cpdef void cancel_gtd_expiry(self, Order order):
         """
         Cancel the managed GTD expiry for the given order.
@@ -0,0 +1,280 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+import datetime
+
+import pandas as pd
+import pytest
+
+from nautilus_trader.adapters.interactive_brokers.common import IBContract
+from nautilus_trader.adapters.interactive_brokers.historic import HistoricInteractiveBrokersClient
+from nautilus_trader.adapters.interactive_brokers.historic.client import _RequestPacer
+from nautilus_trader.core.datetime import dt_to_unix_nanos
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import BarType
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+from tests.integration_tests.adapters.interactive_brokers.test_kit import IBTestContractStubs
+
+
+class _StubHistoricalDataClient:
+    def __init__(self, instruments: list[Instrument]) -> None:
+        self._cache = TestComponentStubs.cache()
+        for instrument in instruments:
+            self._cache.add_instrument(instrument)
+
+        self.bar_requests: list[tuple[BarType, pd.Timestamp, str]] = []
+        self.tick_requests: list[tuple[IBContract, pd.Timestamp]] = []
+        self.return_no_bars = False
+        self.return_no_ticks = False
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_historical_bars(
+        self,
+        bar_type: BarType,
+        contract: IBContract,
+        use_rth: bool,
+        end_date_time: pd.Timestamp,
+        duration: str,
+        timeout: int = 60,
+    ) -> list[Bar]:
+        self.bar_requests.append((bar_type, end_date_time, duration))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+        if self.return_no_bars:
+            return []  # As for a timeout or connection error
+
+        instrument = self._cache.instrument(bar_type.instrument_id)
+        ts = dt_to_unix_nanos(end_date_time)
+        return [
+            Bar(
+                bar_type=bar_type,
+                open=instrument.make_price(1.0),
+                high=instrument.make_price(1.0),
+                low=instrument.make_price(1.0),
+                close=instrument.make_price(1.0),
+                volume=instrument.make_qty(1),
+                ts_event=ts,
+                ts_init=ts,
+            ),
+        ]
+
+    async def get_historical_ticks(
+        self,
+        contract: IBContract,
+        tick_type: str,
+        start_date_time: pd.Timestamp,
+        use_rth: bool,
+        timeout: int = 60,
+    ) -> list[TradeTick]:
+        self.tick_requests.append((contract, start_date_time))
+        if self.return_no_ticks:
+            return []  # As at the live edge or for a transient empty reply
+
+        ts = dt_to_unix_nanos(start_date_time)
+        return [TestDataStubs.trade_tick(ts_event=ts, ts_init=ts)]
+
+
+class TestHistoricInteractiveBrokersClient:
+    def setup(self):
+        # Fixture Setup
+        self.instruments = [
+            IBTestContractStubs.aapl_instrument(),
+            IBTestContractStubs.eurusd_instrument(),
+        ]
+
+    def _contracts(self) -> list[IBContract]:
+        return [
+            IBTestContractStubs.aapl_equity_ib_contract(),
+            IBTestContractStubs.convert_contract_to_ib_contract(
+                IBTestContractStubs.eurusd_forex_contract(),
+            ),
+        ]
+
+    async def _request_bars(self, client: HistoricInteractiveBrokersClient, **kwargs) -> list[Bar]:
+        # Two duration segments ('1 Y' and '2 D') for each contract
+        return await client.request_bars(
+            bar_specifications=["1-MINUTE-LAST"],
+            start_date_time=datetime.datetime(2022, 1, 1),
+            end_date_time=datetime.datetime(2023, 1, 3),
+            tz_name="UTC",
+            contracts=self._contracts(),
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_request_bars_runs_segments_concurrently_within_limit(self):
+        # Arrange
+        stub = _StubHistoricalDataClient(self.instruments)
+        client = HistoricInteractiveBrokersClient(max_concurrent_requests=3, client=stub)
+
+        # Act
+        bars = await self._request_bars(client)
+
+        # Assert
+        assert len(stub.bar_requests) == 4
+        assert stub.max_in_flight == 3
+        assert len(bars) == 4
+        assert bars == sorted(bars, key=lambda x: x.ts_init)
+
+    @pytest.mark.asyncio
+    async def test_request_bars_with_cache_path_resumes_from_completed_segments(self, tmp_path):
+        # Arrange
+        cache_path = str(tmp_path / "segments")
+        first_stub = _StubHistoricalDataClient(self.instruments)
+        first = HistoricInteractiveBrokersClient(cache_path=cache_path, client=first_stub)
+        expected = await self._request_bars(first)
+
+        second_stub = _StubHistoricalDataClient(self.instruments)
+        second = HistoricInteractiveBrokersClient(cache_path=cache_path, client=second_stub)
+
+        # Act
+        bars = await self._request_bars(second)
+
+        # Assert
+        assert len(first_stub.bar_requests) == 4
+        assert second_stub.bar_requests == []
+        assert bars == expected
+
+    @pytest.mark.asyncio
+    async def test_request_bars_with_catalog_writes_instruments_and_bars(self, tmp_path):
+        # Arrange
+        catalog = ParquetDataCatalog(str(tmp_path / "catalog"))
+        stub = _StubHistoricalDataClient(self.instruments)
+        client = HistoricInteractiveBrokersClient(client=stub)
+
+        # Act
+        result = await self._request_bars(client, catalog=catalog)
+
+        # Assert
+        assert result == []
+        assert len(catalog.instruments()) == 2
+        assert len(catalog.bars()) == 4
+
+    @pytest.mark.asyncio
+    async def test_request_bars_with_cache_path_does_not_cache_empty_segments(self, tmp_path):
+        # Arrange
+        cache_path = str(tmp_path / "segments")
+        first_stub = _StubHistoricalDataClient(self.instruments)
+        first_stub.return_no_bars = True
+        first = HistoricInteractiveBrokersClient(cache_path=cache_path, client=first_stub)
+        await self._request_bars(first)
+
+        second_stub = _StubHistoricalDataClient(self.instruments)
+        second = HistoricInteractiveBrokersClient(cache_path=cache_path, client=second_stub)
+
+        # Act
+        bars = await self._request_bars(second)
+
+        # Assert
+        assert len(second_stub.bar_requests) == 4
+        assert len(bars) == 4
+
+    @pytest.mark.asyncio
+    async def test_request_ticks_with_cache_path_does_not_cache_empty_batches(self, tmp_path):
+        # Arrange
+        cache_path = str(tmp_path / "segments")
+        contract = IBTestContractStubs.aapl_equity_ib_contract()
+        first_stub = _StubHistoricalDataClient(self.instruments)
+        first_stub.return_no_ticks = True
+        first = HistoricInteractiveBrokersClient(cache_path=cache_path, client=first_stub)
+        await first.request_ticks(
+            tick_type="TRADES",
+            start_date_time=datetime.datetime(2023, 1, 3, 15, 0),
+            end_date_time=datetime.datetime(2023, 1, 3, 15, 2),
+            tz_name="UTC",
+            contracts=[contract],
+        )
+
+        second_stub = _StubHistoricalDataClient(self.instruments)
+        second = HistoricInteractiveBrokersClient(cache_path=cache_path, client=second_stub)
+
+        # Act
+        ticks = await second.request_ticks(
+            tick_type="TRADES",
+            start_date_time=datetime.datetime(2023, 1, 3, 15, 0),
+            end_date_time=datetime.datetime(2023, 1, 3, 15, 2),
+            tz_name="UTC",
+            contracts=[contract],
+        )
+
+        # Assert
+        assert len(first_stub.tick_requests) == 1
+        assert len(second_stub.tick_requests) == 2
+        assert len(ticks) == 2
+
+
+class TestRequestPacer:
+    async def _start_times(self, pacer: _RequestPacer, keys: list[tuple[str, str]]) -> list[float]:
+        loop = asyncio.get_running_loop()
+        starts: list[float] = []
+
+        async def request(contract_key: str, request_key: str) -> None:
+            async with pacer.request(contract_key, request_key):
+                starts.append(loop.time())
+
+        for contract_key, request_key in keys:
+            await request(contract_key, request_key)
+
+        return starts
+
+    @pytest.mark.asyncio
+    async def test_request_limits_requests_per_contract_within_window(self):
+        # Arrange
+        pacer = _RequestPacer(
+            max_concurrent=10,
+            max_requests=100,
+            window_secs=600.0,
+            max_contract_requests=2,
+            contract_window_secs=0.2,
+        )
+
+        # Act
+        starts = await self._start_times(
+            pacer,
+            [("AAPL|LAST", "1"), ("AAPL|LAST", "2"), ("EUR/USD|MID", "3"), ("AAPL|LAST", "4")],
+        )
+
+        # Assert
+        assert starts[2] - starts[0] < 0.2  # Other contracts are not held up
+        assert starts[3] - starts[0] >= 0.2
+
+    @pytest.mark.asyncio
+    async def test_request_delays_identical_requests(self):
+        # Arrange
+        pacer = _RequestPacer(
+            max_concurrent=10,
+            max_requests=100,
+            window_secs=600.0,
+            identical_window_secs=0.2,
+        )
+
+        # Act
+        starts = await self._start_times(
+            pacer,
+            [("AAPL|LAST", "1"), ("AAPL|LAST", "2"), ("AAPL|LAST", "1")],
+        )
+
+        # Assert
+        assert starts[1] - starts[0] < 0.2
+        assert starts[2] - starts[0] >= 0.2
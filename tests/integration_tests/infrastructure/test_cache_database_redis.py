@@ -897,6 +897,58 @@ class TestCacheDatabaseAdapter:
         assert result == position
         assert position.id == position_id
 
+    @pytest.mark.asyncio
+    async def test_load_position_with_position_max_events_returns_compact_position(self):
+        # Arrange
+        database = CacheDatabaseAdapter(
+            trader_id=self.trader_id,
+            instance_id=UUID4(),
+            serializer=MsgSpecSerializer(encoding=msgspec.msgpack, timestamps_as_str=True),
+            config=CacheConfig(database=DatabaseConfig()),
+            position_max_events=1,
+        )
+        self.database.add_instrument(_AUDUSD_SIM)
+
+        # Allow MPSC thread to insert
+        await eventually(lambda: self.database.load_instrument(_AUDUSD_SIM.id))
+
+        position_id = PositionId("P-1")
+        fills = []
+        for i in range(2):
+            order = self.strategy.order_factory.market(
+                _AUDUSD_SIM.id,
+                OrderSide.BUY,
+                Quantity.from_int(100_000),
+            )
+            fills.append(
+                TestEventStubs.order_filled(
+                    order,
+                    instrument=_AUDUSD_SIM,
+                    position_id=position_id,
+                    last_px=Price.from_str("1.00000"),
+                    trade_id=TradeId(str(i + 1)),
+                ),
+            )
+
+        position = Position(instrument=_AUDUSD_SIM, fill=fills[0])
+        self.database.add_position(position)
+        position.apply(fills[1])
+        self.database.update_position(position)
+
+        # Allow MPSC thread to insert
+        await eventually(
+            lambda: getattr(self.database.load_position(position_id), "event_count", 0) == 2,
+        )
+
+        # Act
+        result = database.load_position(position_id)
+
+        # Assert
+        assert result.max_events == 1
+        assert result.events == [fills[1]]
+        assert result.event_count == 2
+        assert result.quantity == Quantity.from_int(200_000)
+
     @pytest.mark.asyncio
     async def test_load_accounts_when_no_accounts_returns_empty_dict(self):
         # Arrange, Act
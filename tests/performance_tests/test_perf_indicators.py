@@ -0,0 +1,364 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import tracemalloc
+from collections import deque
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+
+from nautilus_trader.core.stats import fast_mean
+from nautilus_trader.indicators.amat import ArcherMovingAveragesTrends
+from nautilus_trader.indicators.aroon import AroonOscillator
+from nautilus_trader.indicators.atr import AverageTrueRange
+from nautilus_trader.indicators.average.ama import AdaptiveMovingAverage
+from nautilus_trader.indicators.average.dema import DoubleExponentialMovingAverage
+from nautilus_trader.indicators.average.ema import ExponentialMovingAverage
+from nautilus_trader.indicators.average.hma import HullMovingAverage
+from nautilus_trader.indicators.average.rma import WilderMovingAverage
+from nautilus_trader.indicators.average.sma import SimpleMovingAverage
+from nautilus_trader.indicators.average.vidya import VariableIndexDynamicAverage
+from nautilus_trader.indicators.average.wma import WeightedMovingAverage
+from nautilus_trader.indicators.base.indicator import Indicator
+from nautilus_trader.indicators.base.ring_buffer import RingBuffer
+from nautilus_trader.indicators.bias import Bias
+from nautilus_trader.indicators.bollinger_bands import BollingerBands
+from nautilus_trader.indicators.cci import CommodityChannelIndex
+from nautilus_trader.indicators.cmo import ChandeMomentumOscillator
+from nautilus_trader.indicators.dm import DirectionalMovement
+from nautilus_trader.indicators.donchian_channel import DonchianChannel
+from nautilus_trader.indicators.efficiency_ratio import EfficiencyRatio
+from nautilus_trader.indicators.fuzzy_candlesticks import FuzzyCandlesticks
+from nautilus_trader.indicators.keltner_channel import KeltnerChannel
+from nautilus_trader.indicators.keltner_position import KeltnerPosition
+from nautilus_trader.indicators.kvo import KlingerVolumeOscillator
+from nautilus_trader.indicators.linear_regression import LinearRegression
+from nautilus_trader.indicators.macd import MovingAverageConvergenceDivergence
+from nautilus_trader.indicators.obv import OnBalanceVolume
+from nautilus_trader.indicators.pressure import Pressure
+from nautilus_trader.indicators.psl import PsychologicalLine
+from nautilus_trader.indicators.roc import RateOfChange
+from nautilus_trader.indicators.rsi import RelativeStrengthIndex
+from nautilus_trader.indicators.rvi import RelativeVolatilityIndex
+from nautilus_trader.indicators.spread_analyzer import SpreadAnalyzer
+from nautilus_trader.indicators.stochastics import Stochastics
+from nautilus_trader.indicators.swings import Swings
+from nautilus_trader.indicators.vhf import VerticalHorizontalFilter
+from nautilus_trader.indicators.volatility_ratio import VolatilityRatio
+from nautilus_trader.indicators.vwap import VolumeWeightedAveragePrice
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.enums import PriceType
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+PERIODS = [20, 200, 2_000]
+
+# Prices for a random walk around 1.0, long enough to fill the largest window
+PRICES = 1.0 + np.cumsum(np.random.default_rng(42).normal(0.0, 0.0001, 10_000))
+
+
+class _DequeSimpleMovingAverage:
+    # Reference for the previous `deque` plus `fast_mean` implementation
+    def __init__(self, period: int) -> None:
+        self._inputs: deque[float] = deque(maxlen=period)
+        self.value = 0.0
+
+    def update_raw(self, value: float) -> None:
+        self._inputs.append(value)
+        self.value = fast_mean(np.asarray(self._inputs, dtype=np.float64))
+
+
+def _warm_up(update, size: int) -> None:
+    for price in PRICES[:size]:
+        update(price)
+
+
+@pytest.mark.parametrize("period", PERIODS)
+def test_ring_buffer_append(benchmark, period):
+    buffer = RingBuffer(period)
+    _warm_up(buffer.append, period)
+
+    benchmark.pedantic(
+        target=buffer.append,
+        args=(1.00001,),
+        iterations=100_000,
+        rounds=1,
+    )
+
+
+@pytest.mark.parametrize("period", PERIODS)
+def test_deque_sma_update_raw(benchmark, period):
+    indicator = _DequeSimpleMovingAverage(period)
+    _warm_up(indicator.update_raw, period)
+
+    benchmark.pedantic(
+        target=indicator.update_raw,
+        args=(1.00001,),
+        iterations=10_000,
+        rounds=1,
+    )
+
+
+@pytest.mark.parametrize("period", PERIODS)
+def test_sma_update_raw(benchmark, period):
+    indicator = SimpleMovingAverage(period)
+    _warm_up(indicator.update_raw, period)
+
+    benchmark.pedantic(
+        target=indicator.update_raw,
+        args=(1.00001,),
+        iterations=100_000,
+        rounds=1,
+    )
+
+
+@pytest.mark.parametrize("period", PERIODS)
+def test_wma_update_raw(benchmark, period):
+    weights = np.arange(1, period + 1, dtype=np.float64)
+    indicator = WeightedMovingAverage(period, weights=weights)
+    _warm_up(indicator.update_raw, period)
+
+    benchmark.pedantic(
+        target=indicator.update_raw,
+        args=(1.00001,),
+        iterations=10_000,
+        rounds=1,
+    )
+
+
+@pytest.mark.parametrize("period", PERIODS)
+def test_hma_update_raw(benchmark, period):
+    indicator = HullMovingAverage(period)
+    _warm_up(indicator.update_raw, period)
+
+    benchmark.pedantic(
+        target=indicator.update_raw,
+        args=(1.00001,),
+        iterations=10_000,
+        rounds=1,
+    )
+
+
+@pytest.mark.parametrize("period", PERIODS)
+def test_bollinger_bands_update_raw(benchmark, period):
+    indicator = BollingerBands(period, 2.0)
+    _warm_up(lambda p: indicator.update_raw(p, p, p), period)
+
+    benchmark.pedantic(
+        target=indicator.update_raw,
+        args=(1.00002, 1.00000, 1.00001),
+        iterations=10_000,
+        rounds=1,
+    )
+
+
+@pytest.mark.parametrize("period", PERIODS)
+def test_donchian_channel_update_raw(benchmark, period):
+    indicator = DonchianChannel(period)
+    _warm_up(lambda p: indicator.update_raw(p, p), period)
+
+    benchmark.pedantic(
+        target=indicator.update_raw,
+        args=(1.00002, 1.00000),
+        iterations=10_000,
+        rounds=1,
+    )
+
+
+@pytest.mark.parametrize("period", PERIODS)
+def test_linear_regression_update_raw(benchmark, period):
+    indicator = LinearRegression(period)
+    _warm_up(indicator.update_raw, period)
+
+    benchmark.pedantic(
+        target=indicator.update_raw,
+        args=(1.00001,),
+        iterations=1_000,
+        rounds=1,
+    )
+
+
+# -- All indicators ------------------------------------------------------------------------------
+#
+# Each benchmark warms an indicator up on `WARMUP_COUNT` inputs, then times rounds of
+# `UPDATE_COUNT` updates through the public `handle_*` methods. The per update cost and the
+# memory retained by the warmed up indicator are reported in the benchmark `extra_info`.
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+PERIOD = 20
+WARMUP_COUNT = 500
+UPDATE_COUNT = 1_000
+
+
+def _quote_ticks() -> list:
+    mids = PRICES[: WARMUP_COUNT + UPDATE_COUNT]
+    return [
+        TestDataStubs.quote_tick(
+            instrument=AUDUSD_SIM,
+            bid_price=mid - 0.00001,
+            ask_price=mid + 0.00001,
+            ts_event=i,
+            ts_init=i,
+        )
+        for i, mid in enumerate(mids)
+    ]
+
+
+def _trade_ticks() -> list:
+    prices = PRICES[: WARMUP_COUNT + UPDATE_COUNT]
+    return [
+        TestDataStubs.trade_tick(
+            instrument=AUDUSD_SIM,
+            price=price,
+            trade_id=str(i),
+            ts_event=i,
+            ts_init=i,
+        )
+        for i, price in enumerate(prices)
+    ]
+
+
+def _bars() -> list[Bar]:
+    bar_type = TestDataStubs.bartype_audusd_1min_bid()
+    rng = np.random.default_rng(42)
+    bars: list[Bar] = []
+    previous = PRICES[0]
+    for i, price in enumerate(PRICES[1 : WARMUP_COUNT + UPDATE_COUNT + 1]):
+        spread = abs(rng.normal(0.0, 0.0001))
+        ts = i * 60_000_000_000
+        bars.append(
+            Bar(
+                bar_type=bar_type,
+                open=AUDUSD_SIM.make_price(previous),
+                high=AUDUSD_SIM.make_price(max(previous, price) + spread),
+                low=AUDUSD_SIM.make_price(min(previous, price) - spread),
+                close=AUDUSD_SIM.make_price(price),
+                volume=Quantity.from_int(int(rng.integers(100_000, 1_000_000))),
+                ts_event=ts,
+                ts_init=ts,
+            ),
+        )
+        previous = price
+    return bars
+
+
+QUOTE_TICKS = _quote_ticks()
+TRADE_TICKS = _trade_ticks()
+BARS = _bars()
+
+# Indicators which handle quote ticks, trade ticks and bars
+PRICE_INDICATORS: dict[str, Callable[[], Indicator]] = {
+    "AdaptiveMovingAverage": lambda: AdaptiveMovingAverage(10, 2, 30, PriceType.MID),
+    "DoubleExponentialMovingAverage": lambda: DoubleExponentialMovingAverage(PERIOD, PriceType.MID),
+    "ExponentialMovingAverage": lambda: ExponentialMovingAverage(PERIOD, PriceType.MID),
+    "HullMovingAverage": lambda: HullMovingAverage(PERIOD, PriceType.MID),
+    "SimpleMovingAverage": lambda: SimpleMovingAverage(PERIOD, PriceType.MID),
+    "VariableIndexDynamicAverage": lambda: VariableIndexDynamicAverage(PERIOD, PriceType.MID),
+    "WeightedMovingAverage": lambda: WeightedMovingAverage(PERIOD, price_type=PriceType.MID),
+    "WilderMovingAverage": lambda: WilderMovingAverage(PERIOD, PriceType.MID),
+    "BollingerBands": lambda: BollingerBands(PERIOD, 2.0),
+    "DonchianChannel": lambda: DonchianChannel(PERIOD),
+    "MovingAverageConvergenceDivergence": lambda: MovingAverageConvergenceDivergence(
+        12,
+        26,
+        price_type=PriceType.MID,
+    ),
+}
+
+# Indicators which handle bars only
+BAR_INDICATORS: dict[str, Callable[[], Indicator]] = {
+    "ArcherMovingAveragesTrends": lambda: ArcherMovingAveragesTrends(5, 10, 5),
+    "AroonOscillator": lambda: AroonOscillator(PERIOD),
+    "AverageTrueRange": lambda: AverageTrueRange(PERIOD),
+    "Bias": lambda: Bias(PERIOD),
+    "ChandeMomentumOscillator": lambda: ChandeMomentumOscillator(PERIOD),
+    "CommodityChannelIndex": lambda: CommodityChannelIndex(PERIOD),
+    "DirectionalMovement": lambda: DirectionalMovement(PERIOD),
+    "EfficiencyRatio": lambda: EfficiencyRatio(PERIOD),
+    "FuzzyCandlesticks": lambda: FuzzyCandlesticks(PERIOD),
+    "KeltnerChannel": lambda: KeltnerChannel(PERIOD, 2.5),
+    "KeltnerPosition": lambda: KeltnerPosition(PERIOD, 2.5),
+    "KlingerVolumeOscillator": lambda: KlingerVolumeOscillator(34, 55, 13),
+    "LinearRegression": lambda: LinearRegression(PERIOD),
+    "OnBalanceVolume": lambda: OnBalanceVolume(PERIOD),
+    "Pressure": lambda: Pressure(PERIOD),
+    "PsychologicalLine": lambda: PsychologicalLine(PERIOD),
+    "RateOfChange": lambda: RateOfChange(PERIOD),
+    "RelativeStrengthIndex": lambda: RelativeStrengthIndex(14),
+    "RelativeVolatilityIndex": lambda: RelativeVolatilityIndex(PERIOD),
+    "Stochastics": lambda: Stochastics(14, 3),
+    "Swings": lambda: Swings(PERIOD),
+    "VerticalHorizontalFilter": lambda: VerticalHorizontalFilter(PERIOD),
+    "VolatilityRatio": lambda: VolatilityRatio(10, 100),
+    "VolumeWeightedAveragePrice": lambda: VolumeWeightedAveragePrice(),
+    **PRICE_INDICATORS,
+}
+
+
+def _benchmark_indicator(
+    benchmark,
+    factory: Callable[[], Indicator],
+    handler_name: str,
+    data: list,
+) -> None:
+    warmup = data[:WARMUP_COUNT]
+    updates = data[WARMUP_COUNT:]
+
+    tracemalloc.start()
+    indicator = factory()
+    handler = getattr(indicator, handler_name)
+    for item in warmup:
+        handler(item)
+    memory_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    def update() -> None:
+        for item in updates:
+            handler(item)
+
+    benchmark.pedantic(target=update, rounds=10, iterations=1)
+
+    benchmark.extra_info["updates_per_round"] = len(updates)
+    benchmark.extra_info["memory_bytes"] = memory_bytes
+    if benchmark.stats is not None:
+        benchmark.extra_info["per_update_ns"] = benchmark.stats.stats.mean / len(updates) * 1e9
+
+
+@pytest.mark.parametrize("name", list(PRICE_INDICATORS))
+def test_indicator_handle_quote_tick(benchmark, name):
+    _benchmark_indicator(benchmark, PRICE_INDICATORS[name], "handle_quote_tick", QUOTE_TICKS)
+
+
+@pytest.mark.parametrize("name", list(PRICE_INDICATORS))
+def test_indicator_handle_trade_tick(benchmark, name):
+    _benchmark_indicator(benchmark, PRICE_INDICATORS[name], "handle_trade_tick", TRADE_TICKS)
+
+
+@pytest.mark.parametrize("name", list(BAR_INDICATORS))
+def test_indicator_handle_bar(benchmark, name):
+    _benchmark_indicator(benchmark, BAR_INDICATORS[name], "handle_bar", BARS)
+
+
+def test_spread_analyzer_handle_quote_tick(benchmark):
+    _benchmark_indicator(
+        benchmark,
+        lambda: SpreadAnalyzer(AUDUSD_SIM.id, 100),
+        "handle_quote_tick",
+        QUOTE_TICKS,
+    )
@@ -20,6 +20,9 @@ from nautilus_trader.common.component import Logger
 from nautilus_trader.common.component import init_logging
 from nautilus_trader.common.component import is_logging_initialized
 from nautilus_trader.common.enums import LogLevel
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
+from nautilus_trader.test_kit.stubs.execution import TestExecStubs
 
 
 def test_logging(benchmark: Any) -> None:
@@ -70,3 +73,29 @@ def test_logging(benchmark: Any) -> None:
             logger.info(f"{i}: {message}")
 
     benchmark.pedantic(run, rounds=10, iterations=2, warmup_rounds=1)
+
+
+def test_logging_debug_event_formatting(benchmark: Any) -> None:
+    # Cost paid per event when a DEBUG message is formatted unconditionally
+    logger = Logger(name="TEST_LOGGER")
+    event = TestEventStubs.order_filled(
+        TestExecStubs.limit_order(),
+        instrument=TestInstrumentProvider.default_fx_ccy("AUD/USD"),
+    )
+
+    def run():
+        for _ in range(100_000):
+            logger.debug(f"<--[EVT] {event!r}")
+
+    benchmark.pedantic(run, rounds=10, iterations=2, warmup_rounds=1)
+
+
+def test_logging_debug_event_level_check(benchmark: Any) -> None:
+    # Cost paid per event when the DEBUG message is gated by the level check
+    logger = Logger(name="TEST_LOGGER")
+
+    def run():
+        for _ in range(100_000):
+            logger.is_enabled(LogLevel.DEBUG)
+
+    benchmark.pedantic(run, rounds=10, iterations=2, warmup_rounds=1)
@@ -0,0 +1,135 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.accounting.factory import AccountFactory
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.core.uuid import UUID4
+from nautilus_trader.execution.engine import ExecutionEngine
+from nautilus_trader.model.currencies import USDT
+from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.events import AccountState
+from nautilus_trader.model.events import OrderCanceled
+from nautilus_trader.model.identifiers import AccountId
+from nautilus_trader.model.identifiers import StrategyId
+from nautilus_trader.model.objects import AccountBalance
+from nautilus_trader.model.objects import Money
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.portfolio.portfolio import Portfolio
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+BTCUSDT_BINANCE = TestInstrumentProvider.btcusdt_binance()
+
+
+class TestPortfolioPerformance:
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.trader_id = TestIdStubs.trader_id()
+        self.account_id = AccountId("BINANCE-000")
+
+        self.order_factory = OrderFactory(
+            trader_id=self.trader_id,
+            strategy_id=StrategyId("S-001"),
+            clock=TestClock(),
+        )
+
+        self.msgbus = MessageBus(
+            trader_id=self.trader_id,
+            clock=self.clock,
+        )
+
+        self.cache = TestComponentStubs.cache()
+        self.cache.add_instrument(BTCUSDT_BINANCE)
+
+        self.portfolio = Portfolio(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        self.exec_engine = ExecutionEngine(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        AccountFactory.register_calculated_account("BINANCE")
+        self.portfolio.update_account(
+            AccountState(
+                account_id=self.account_id,
+                account_type=AccountType.CASH,
+                base_currency=None,
+                reported=True,
+                balances=[
+                    AccountBalance(
+                        Money(1_000_000_000, USDT),
+                        Money(0, USDT),
+                        Money(1_000_000_000, USDT),
+                    ),
+                ],
+                margins=[],
+                info={},
+                event_id=UUID4(),
+                ts_event=0,
+                ts_init=0,
+            ),
+        )
+
+        # Resting grid of passive orders
+        for i in range(2_000):
+            self._accept_order(price=Price.from_str(f"{40000 + i}.00"))
+
+    def _accept_order(self, price: Price):
+        order = self.order_factory.limit(
+            BTCUSDT_BINANCE.id,
+            OrderSide.BUY,
+            Quantity.from_str("0.001"),
+            price,
+        )
+        self.cache.add_order(order, position_id=None)
+        self.exec_engine.process(TestEventStubs.order_submitted(order, account_id=self.account_id))
+        self.exec_engine.process(TestEventStubs.order_accepted(order, account_id=self.account_id))
+        return order
+
+    def _accept_and_cancel_order(self):
+        order = self._accept_order(price=Price.from_str("39000.00"))
+        self.exec_engine.process(
+            OrderCanceled(
+                trader_id=order.trader_id,
+                strategy_id=order.strategy_id,
+                instrument_id=order.instrument_id,
+                client_order_id=order.client_order_id,
+                venue_order_id=order.venue_order_id,
+                account_id=self.account_id,
+                event_id=UUID4(),
+                ts_event=0,
+                ts_init=0,
+            ),
+        )
+
+    def test_order_churn_with_many_resting_orders(self, benchmark):
+        benchmark.pedantic(
+            target=self._accept_and_cancel_order,
+            iterations=1_000,
+            rounds=1,
+        )
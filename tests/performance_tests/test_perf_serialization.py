@@ -17,6 +17,7 @@ import msgspec
 
 from nautilus_trader.common.component import TestClock
 from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.core.datetime import unix_nanos_to_iso8601
 from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.execution.messages import SubmitOrder
 from nautilus_trader.model.enums import OrderSide
@@ -25,6 +26,7 @@ from nautilus_trader.model.identifiers import StrategyId
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.serialization.serializer import MsgSpecSerializer
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
 from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
 
 
@@ -57,6 +59,12 @@ class TestSerializationPerformance:
         )
 
         self.serializer = MsgSpecSerializer(encoding=msgspec.msgpack)
+        self.serializer_str = MsgSpecSerializer(encoding=msgspec.msgpack, timestamps_as_str=True)
+        self.serializer_iso8601 = MsgSpecSerializer(
+            encoding=msgspec.msgpack,
+            timestamps_as_iso8601=True,
+        )
+        self.event = TestEventStubs.order_submitted(self.order)
 
     def test_serialize_submit_order(self, benchmark):
         benchmark.pedantic(
@@ -66,3 +74,37 @@ class TestSerializationPerformance:
             rounds=1,
         )
         # ~0.0ms / ~4.1μs / 4105ns minimum of 10,000 runs @ 1 iteration each run.
+
+    def test_serialize_order_event_timestamps_as_str(self, benchmark):
+        benchmark.pedantic(
+            target=self.serializer_str.serialize,
+            args=(self.event,),
+            iterations=10_000,
+            rounds=1,
+        )
+
+    def test_serialize_order_event_timestamps_as_iso8601(self, benchmark):
+        benchmark.pedantic(
+            target=self.serializer_iso8601.serialize,
+            args=(self.event,),
+            iterations=10_000,
+            rounds=1,
+        )
+
+    def test_deserialize_order_event_timestamps_as_iso8601(self, benchmark):
+        serialized = self.serializer_iso8601.serialize(self.event)
+
+        benchmark.pedantic(
+            target=self.serializer_iso8601.deserialize,
+            args=(serialized,),
+            iterations=10_000,
+            rounds=1,
+        )
+
+    def test_unix_nanos_to_iso8601(self, benchmark):
+        benchmark.pedantic(
+            target=unix_nanos_to_iso8601,
+            args=(1_715_248_800_123_456_789,),
+            iterations=100_000,
+            rounds=1,
+        )
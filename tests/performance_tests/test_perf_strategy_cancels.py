@@ -0,0 +1,129 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.execution.engine import ExecutionEngine
+from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import AccountId
+from nautilus_trader.model.identifiers import ClientId
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.portfolio.portfolio import Portfolio
+from nautilus_trader.test_kit.mocks.exec_clients import MockExecutionClient
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+from nautilus_trader.trading.strategy import Strategy
+
+
+BINANCE = Venue("BINANCE")
+BTCUSDT_BINANCE = TestInstrumentProvider.btcusdt_binance()
+
+OPEN_ORDER_COUNT = 5_000
+
+
+class _BatchCancelExecutionClient(MockExecutionClient):
+    def batch_cancel_orders(self, command) -> None:
+        self.commands.append(command)
+
+
+class TestStrategyCancelPerformance:
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.trader_id = TestIdStubs.trader_id()
+        self.account_id = AccountId(f"{BINANCE.value}-001")
+
+        self.msgbus = MessageBus(
+            trader_id=self.trader_id,
+            clock=self.clock,
+        )
+
+        self.cache = TestComponentStubs.cache()
+        self.cache.add_instrument(BTCUSDT_BINANCE)
+
+        self.portfolio = Portfolio(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        self.exec_engine = ExecutionEngine(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        self.exec_client = _BatchCancelExecutionClient(
+            client_id=ClientId(BINANCE.value),
+            venue=BINANCE,
+            account_type=AccountType.CASH,
+            base_currency=None,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+        self.exec_engine.register_client(self.exec_client)
+        self.exec_engine.start()
+
+        self.strategy = Strategy()
+        self.strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+    def _open_orders(self) -> list:
+        orders = []
+        for i in range(OPEN_ORDER_COUNT):
+            order = self.strategy.order_factory.limit(
+                BTCUSDT_BINANCE.id,
+                OrderSide.BUY,
+                Quantity.from_str("0.001"),
+                Price.from_int(40_000 - i),
+            )
+            self.cache.add_order(order, position_id=None)
+            order.apply(TestEventStubs.order_submitted(order, account_id=self.account_id))
+            order.apply(TestEventStubs.order_accepted(order, account_id=self.account_id))
+            self.cache.update_order(order)
+            orders.append(order)
+        return orders
+
+    def test_cancel_orders_at_scale(self, benchmark):
+        def setup():
+            return (self._open_orders(),), {}
+
+        benchmark.pedantic(
+            target=self.strategy.cancel_orders,
+            setup=setup,
+            rounds=10,
+        )
+
+    def test_cancel_all_orders_at_scale(self, benchmark):
+        def setup():
+            self._open_orders()
+            return (BTCUSDT_BINANCE.id,), {}
+
+        benchmark.pedantic(
+            target=self.strategy.cancel_all_orders,
+            setup=setup,
+            rounds=10,
+        )
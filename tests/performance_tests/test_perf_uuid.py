@@ -16,6 +16,7 @@
 import uuid
 
 from nautilus_trader.core.uuid import UUID4
+from nautilus_trader.core.uuid import set_deterministic_uuids
 
 
 def test_make_builtin_uuid(benchmark):
@@ -52,6 +53,18 @@ def test_make_nautilus_uuid_bench(benchmark):
     # ~0.0ms / ~0.8μs / 780ns minimum of 100,000 runs @ 1 iteration each run.
 
 
+def test_make_nautilus_deterministic_uuid_bench(benchmark):
+    set_deterministic_uuids(True)
+    try:
+        benchmark.pedantic(
+            target=UUID4,
+            rounds=100_000,
+            iterations=1,
+        )
+    finally:
+        set_deterministic_uuids(False)
+
+
 def test_nautilus_uuid_value_bench(benchmark):
     uuid = UUID4()
 
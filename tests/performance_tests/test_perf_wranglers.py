@@ -13,6 +13,12 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+import pandas as pd
+
+from nautilus_trader.model.enums import BookAction
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.persistence.wranglers import OrderBookDeltaDataWrangler
 from nautilus_trader.persistence.wranglers import QuoteTickDataWrangler
 from nautilus_trader.persistence.wranglers import TradeTickDataWrangler
 from nautilus_trader.test_kit.providers import TestDataProvider
@@ -55,3 +61,90 @@ def test_trade_tick_data_wrangler_process(benchmark):
         iterations=1,
     )
     # ~500.2ms / ~500210.6μs / 500210608ns minimum of 10 runs @ 1 iteration each run.
+
+
+def test_quote_tick_data_wrangler_process_bar_data(benchmark):
+    usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+    wrangler = QuoteTickDataWrangler(instrument=usdjpy)
+    provider = TestDataProvider()
+    bid_data = provider.read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv")
+    ask_data = provider.read_csv_bars("fxcm/usdjpy-m1-ask-2013.csv")
+
+    def wrangler_process():
+        wrangler.process_bar_data(
+            bid_data=bid_data.copy(),
+            ask_data=ask_data.copy(),
+            random_seed=42,
+        )
+
+    benchmark.pedantic(
+        target=wrangler_process,
+        rounds=10,
+        iterations=1,
+    )
+
+
+def _l3_deltas_dataframe(count: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    return pd.DataFrame(
+        {
+            "action": rng.choice(["ADD", "UPDATE", "DELETE"], size=count),
+            "side": rng.choice(["BUY", "SELL"], size=count),
+            "price": np.round(rng.uniform(100.0, 101.0, size=count), 2),
+            "size": rng.integers(1, 1_000, size=count).astype(np.float64),
+            "order_id": np.arange(count, dtype=np.uint64),
+            "flags": np.zeros(count, dtype=np.uint8),
+            "sequence": np.arange(count, dtype=np.uint64),
+        },
+        index=pd.date_range("2024-01-01", periods=count, freq="us", tz="UTC"),
+    )
+
+
+def test_order_book_delta_data_wrangler_process(benchmark):
+    instrument = TestInstrumentProvider.equity(symbol="AAPL", venue="XNAS")
+    wrangler = OrderBookDeltaDataWrangler(instrument=instrument)
+    data = _l3_deltas_dataframe(100_000)
+
+    def wrangler_process():
+        wrangler.process(data=data)
+
+    benchmark.pedantic(
+        target=wrangler_process,
+        rounds=10,
+        iterations=1,
+    )
+
+
+def test_order_book_delta_data_wrangler_process_arrays_raw(benchmark):
+    instrument = TestInstrumentProvider.equity(symbol="AAPL", venue="XNAS")
+    wrangler = OrderBookDeltaDataWrangler(instrument=instrument)
+    count = 100_000
+    rng = np.random.default_rng(42)
+    book_actions = [BookAction.ADD, BookAction.UPDATE, BookAction.DELETE]
+    actions = rng.choice(book_actions, size=count).astype(np.uint8)
+    sides = rng.choice([OrderSide.BUY, OrderSide.SELL], size=count).astype(np.uint8)
+    prices = rng.integers(10_000, 10_100, size=count, dtype=np.int64) * 10_000_000
+    sizes = rng.integers(1, 1_000, size=count, dtype=np.uint64) * 1_000_000_000
+    order_ids = np.arange(count, dtype=np.uint64)
+    flags = np.zeros(count, dtype=np.uint8)
+    ts_events = np.arange(count, dtype=np.uint64) * 1_000
+
+    def wrangler_process():
+        wrangler.process_arrays(
+            actions=actions,
+            sides=sides,
+            prices=prices,
+            sizes=sizes,
+            order_ids=order_ids,
+            flags=flags,
+            sequences=order_ids,
+            ts_events=ts_events,
+            ts_inits=ts_events,
+            is_raw=True,
+        )
+
+    benchmark.pedantic(
+        target=wrangler_process,
+        rounds=10,
+        iterations=1,
+    )
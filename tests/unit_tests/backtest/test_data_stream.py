@@ -0,0 +1,247 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.backtest.data_stream import CompactDataSegment
+from nautilus_trader.backtest.data_stream import CompactDataStream
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.test_kit.stubs.data import MyData
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+def _bar(ts_init: int) -> Bar:
+    return Bar(
+        bar_type=TestDataStubs.bartype_audusd_1min_bid(),
+        open=Price.from_str("1.00002"),
+        high=Price.from_str("1.00004"),
+        low=Price.from_str("1.00001"),
+        close=Price.from_str("1.00003"),
+        volume=Quantity.from_int(1_000_000),
+        ts_event=ts_init,
+        ts_init=ts_init,
+    )
+
+
+def _mixed_data() -> list:
+    return [
+        TestDataStubs.quote_tick(bid_price=1.00001, ask_price=1.00003, ts_event=1, ts_init=1),
+        TestDataStubs.trade_tick(price=1.00002, ts_event=2, ts_init=2),
+        _bar(3),
+        TestDataStubs.order_book_delta(ts_event=4, ts_init=4),
+        MyData(value=5, ts_event=5, ts_init=5),
+        TestDataStubs.quote_tick(bid_price=1.00002, ask_price=1.00004, ts_event=6, ts_init=6),
+    ]
+
+
+def _flatten(stream: CompactDataStream) -> list:
+    return [data for chunk in stream for data in chunk]
+
+
+class TestCompactDataSegment:
+    def test_instantiate_with_empty_data_raises(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            CompactDataSegment([])
+
+    def test_size_and_nbytes(self):
+        # Arrange, Act
+        segment = CompactDataSegment(_mixed_data())
+
+        # Assert
+        assert len(segment) == 6
+        assert segment.size == 6
+        assert segment.nbytes > 0
+        assert repr(segment) == f"CompactDataSegment(size=6, nbytes={segment.nbytes})"
+
+
+class TestCompactDataStream:
+    def test_instantiate_with_invalid_chunk_size_raises(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            CompactDataStream(chunk_size=0)
+
+    def test_iterate_empty_stream_yields_no_chunks(self):
+        # Arrange
+        stream = CompactDataStream()
+
+        # Act, Assert
+        assert len(stream) == 0
+        assert list(stream) == []
+
+    def test_add_empty_data_raises(self):
+        # Arrange
+        stream = CompactDataStream()
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            stream.add([])
+
+    def test_iterate_materializes_equal_data_in_order(self):
+        # Arrange
+        data = _mixed_data()
+        stream = CompactDataStream()
+        stream.add(data)
+
+        # Act
+        result = _flatten(stream)
+
+        # Assert
+        assert len(stream) == 6
+        assert [type(x) for x in result] == [type(x) for x in data]
+        assert [x.ts_init for x in result] == [1, 2, 3, 4, 5, 6]
+        assert result[:4] == data[:4]
+        assert result[4] is data[4]  # Non compact data is held as is
+        assert result[5] == data[5]
+
+    def test_iterate_yields_chunks_of_chunk_size(self):
+        # Arrange
+        ticks = TestDataStubs.quote_ticks_usdjpy()[:2_500]
+        stream = CompactDataStream(chunk_size=1_000)
+        stream.add(ticks)
+
+        # Act
+        chunks = list(stream)
+
+        # Assert
+        assert [len(chunk) for chunk in chunks] == [1_000, 1_000, 500]
+        assert [x for chunk in chunks for x in chunk] == ticks
+
+    def test_iterate_can_be_repeated(self):
+        # Arrange
+        stream = CompactDataStream()
+        stream.add(_mixed_data())
+
+        # Act, Assert
+        assert _flatten(stream) == _flatten(stream)
+
+    def test_add_with_sort_sorts_by_ts_init(self):
+        # Arrange
+        data = _mixed_data()
+        stream = CompactDataStream()
+
+        # Act
+        stream.add(list(reversed(data)))
+
+        # Assert
+        assert [x.ts_init for x in _flatten(stream)] == [1, 2, 3, 4, 5, 6]
+
+    def test_iterate_merges_segments_matching_stable_sort(self):
+        # Arrange
+        quotes = [TestDataStubs.quote_tick(ts_event=ts, ts_init=ts) for ts in (1, 3, 3, 5)]
+        trades = [TestDataStubs.trade_tick(ts_event=ts, ts_init=ts) for ts in (2, 3, 4, 6)]
+        stream = CompactDataStream(chunk_size=3)
+        stream.add(quotes)
+        stream.add(trades)
+
+        # Act
+        result = _flatten(stream)
+
+        # Assert
+        expected = sorted(quotes + trades, key=lambda x: x.ts_init)
+        assert len(stream) == 8
+        assert [type(x) for x in result] == [type(x) for x in expected]
+        assert result == expected
+
+    def test_clear_removes_all_data(self):
+        # Arrange
+        stream = CompactDataStream()
+        stream.add(_mixed_data())
+
+        # Act
+        stream.clear()
+
+        # Assert
+        assert len(stream) == 0
+        assert stream.nbytes == 0
+        assert list(stream) == []
+
+    def test_add_with_directory_memory_maps_buffers(self, tmp_path):
+        # Arrange
+        ticks = TestDataStubs.quote_ticks_usdjpy()[:100]
+        stream = CompactDataStream(directory=tmp_path / "stream")
+
+        # Act
+        stream.add(ticks)
+
+        # Assert
+        names = sorted(p.name for p in (tmp_path / "stream").iterdir())
+        assert len(names) == 3
+        assert names[0].startswith("segment-0-1-")
+        assert names[1].startswith("segment-0-tags-")
+        assert names[2].startswith("segment-0-ts-init-")
+        assert all(name.endswith(".bin") for name in names)
+        assert _flatten(stream) == ticks
+
+    def test_clear_with_directory_deletes_buffer_files(self, tmp_path):
+        # Arrange
+        ticks = TestDataStubs.quote_ticks_usdjpy()[:100]
+        directory = tmp_path / "stream"
+        stream = CompactDataStream(directory=directory)
+        stream.add(ticks)
+
+        # Act
+        stream.clear()
+
+        # Assert
+        assert list(directory.iterdir()) == []
+
+    def test_add_after_clear_with_directory_does_not_reuse_mapped_files(self, tmp_path):
+        # Arrange
+        ticks = TestDataStubs.quote_ticks_usdjpy()[:100]
+        directory = tmp_path / "stream"
+        stream = CompactDataStream(chunk_size=10, directory=directory)
+        stream.add(ticks[:50])
+        chunks = iter(stream)
+        first_chunk = next(chunks)
+
+        # Act
+        stream.clear()
+        stream.add(ticks[50:])
+
+        # Assert
+        assert first_chunk + [x for chunk in chunks for x in chunk] == ticks[:50]
+        assert _flatten(stream) == ticks[50:]
+
+    def test_streams_sharing_directory_use_separate_files(self, tmp_path):
+        # Arrange
+        ticks = TestDataStubs.quote_ticks_usdjpy()[:100]
+        directory = tmp_path / "stream"
+        stream1 = CompactDataStream(directory=directory)
+        stream2 = CompactDataStream(directory=directory)
+
+        # Act
+        stream1.add(ticks[:50])
+        stream2.add(ticks[50:])
+
+        # Assert
+        assert len(list(directory.iterdir())) == 6
+        assert _flatten(stream1) == ticks[:50]
+        assert _flatten(stream2) == ticks[50:]
+
+    def test_iterate_merges_many_segments_in_order(self):
+        # Arrange
+        ticks = TestDataStubs.quote_ticks_usdjpy()[:1_000]
+        stream = CompactDataStream(chunk_size=100)
+        for i in range(20):
+            stream.add(ticks[i::20], sort=False)
+
+        # Act
+        result = _flatten(stream)
+
+        # Assert
+        assert result == sorted(ticks, key=lambda x: x.ts_init)
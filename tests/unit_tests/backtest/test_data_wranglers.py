@@ -14,6 +14,8 @@
 # -------------------------------------------------------------------------------------------------
 
 
+import random
+
 import pandas as pd
 
 from nautilus_trader.common.component import TestClock
@@ -24,6 +26,7 @@ from nautilus_trader.model.objects import Quantity
 from nautilus_trader.persistence.wranglers import BarDataWrangler
 from nautilus_trader.persistence.wranglers import QuoteTickDataWrangler
 from nautilus_trader.persistence.wranglers import TradeTickDataWrangler
+from nautilus_trader.persistence.wranglers import random_bits
 from nautilus_trader.test_kit.providers import TestDataProvider
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
@@ -166,6 +169,45 @@ class TestQuoteTickDataWrangler:
         assert ticks[3].bid_price == Price.from_str("91.653")
         assert ticks[3].ask_price == Price.from_str("91.655")
 
+    def test_pre_process_bar_data_without_sort_interleaves_ticks_per_bar(self):
+        # Arrange
+        usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+        provider = TestDataProvider()
+        bid_data = provider.read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv")[:100]
+        ask_data = provider.read_csv_bars("fxcm/usdjpy-m1-ask-2013.csv")[:100]
+
+        wrangler = QuoteTickDataWrangler(instrument=usdjpy)
+
+        # Act
+        sorted_ticks = wrangler.process_bar_data(
+            bid_data=bid_data.copy(),
+            ask_data=ask_data.copy(),
+            random_seed=42,
+        )
+        unsorted_ticks = wrangler.process_bar_data(
+            bid_data=bid_data.copy(),
+            ask_data=ask_data.copy(),
+            random_seed=42,
+            sort_data=False,
+        )
+
+        # Assert
+        assert len(unsorted_ticks) == 400
+        assert unsorted_ticks == sorted_ticks
+        assert [t.ts_event for t in unsorted_ticks] == sorted(t.ts_event for t in unsorted_ticks)
+
+    def test_random_bits_matches_sequential_getrandbits(self):
+        # Arrange
+        local_random = random.Random(42)  # noqa: S311
+        expected = [bool(local_random.getrandbits(1)) for _ in range(1_000)]
+
+        # Act
+        result = random_bits(1_000, random_seed=42)
+
+        # Assert
+        assert result.tolist() == expected
+        assert len(random_bits(0, random_seed=42)) == 0
+
 
 class TestTradeTickDataWrangler:
     def setup(self):
@@ -239,6 +281,46 @@ class TestTradeTickDataWrangler:
         # Assert
         assert ticks[0].ts_event == 1672876741642000000
 
+    def test_process_bar_data_produces_open_high_low_close_ticks(self):
+        # Arrange
+        ethusdt = TestInstrumentProvider.ethusdt_binance()
+        wrangler = TradeTickDataWrangler(instrument=ethusdt)
+        df = pd.DataFrame.from_dict(
+            {
+                "timestamp": [
+                    pd.Timestamp("2023-01-04 00:01:00+0000", tz="UTC"),
+                    pd.Timestamp("2023-01-04 00:02:00+0000", tz="UTC"),
+                ],
+                "open": [100.0, 101.0],
+                "high": [102.0, 103.0],
+                "low": [99.0, 100.0],
+                "close": [101.0, 102.0],
+                "volume": [4.0, 8.0],
+            },
+        )
+        df = df.set_index("timestamp")
+
+        # Act
+        ticks = wrangler.process_bar_data(df)
+
+        # Assert
+        assert len(ticks) == 8
+        assert [t.price for t in ticks] == [
+            Price.from_str("100.00"),
+            Price.from_str("102.00"),
+            Price.from_str("99.00"),
+            Price.from_str("101.00"),
+            Price.from_str("101.00"),
+            Price.from_str("103.00"),
+            Price.from_str("100.00"),
+            Price.from_str("102.00"),
+        ]
+        assert ticks[0].size == Quantity.from_str("1.00000")
+        assert ticks[4].size == Quantity.from_str("2.00000")
+        assert ticks[0].ts_event == 1672790459700000000
+        assert ticks[3].ts_event == 1672790460000000000
+        assert ticks[3].trade_id == TradeId("1672790460000000000")
+
 
 class TestBarDataWrangler:
     def setup(self):
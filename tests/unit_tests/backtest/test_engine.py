@@ -20,6 +20,7 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
+from nautilus_trader.backtest.data_stream import CompactDataStream
 from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.backtest.engine import BacktestEngineConfig
 from nautilus_trader.backtest.models import FillModel
@@ -195,6 +196,180 @@ class TestBacktestEngine:
         # Assert
         assert len(self.engine.trader.strategy_states()) == 1
 
+    def test_add_data_iterator_when_data_already_added_raises(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            self.engine.add_data_iterator(iter([]))
+
+    def test_add_data_when_data_iterator_added_raises(self):
+        # Arrange
+        ticks = self.engine.data
+        self.engine.clear_data()
+        self.engine.add_data_iterator([ticks])
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            self.engine.add_data(ticks)
+
+    def test_run_with_data_iterator_consumes_all_chunks(self):
+        # Arrange
+        ticks = self.engine.data
+        self.engine.clear_data()
+
+        pulled: list[int] = []
+
+        def chunks():
+            for i in range(0, len(ticks), 1_000):
+                pulled.append(i)
+                yield ticks[i : i + 1_000]
+
+        self.engine.add_data_iterator(chunks())
+
+        # Act
+        self.engine.run()
+
+        # Assert
+        assert len(pulled) == 8
+        assert self.engine.iteration == 8000
+
+    def test_run_with_compact_data_stream_processes_all_data(self):
+        # Arrange
+        ticks = self.engine.data
+        self.engine.clear_data()
+
+        stream = CompactDataStream(chunk_size=1_000)
+        stream.add(ticks)
+        self.engine.add_data_iterator(stream)
+
+        # Act
+        self.engine.run()
+
+        # Assert
+        assert self.engine.iteration == 8000
+
+    def test_run_with_data_iterator_and_end_resumes_on_next_run(self):
+        # Arrange
+        ticks = self.engine.data
+        self.engine.clear_data()
+        self.engine.add_data_iterator(ticks[i : i + 1_000] for i in range(0, len(ticks), 1_000))
+
+        end_ns = ticks[4_499].ts_init
+        expected_iterations = len([t for t in ticks if t.ts_init <= end_ns])
+
+        # Act
+        self.engine.run(end=end_ns, streaming=True)
+        iterations_at_end = self.engine.iteration
+        self.engine.run()
+
+        # Assert
+        assert iterations_at_end == expected_iterations
+        assert self.engine.iteration == 8000
+
+    def test_reset_with_data_iterator_clears_iterator(self):
+        # Arrange
+        ticks = self.engine.data
+        self.engine.clear_data()
+        self.engine.add_data_iterator(ticks[i : i + 1_000] for i in range(0, len(ticks), 1_000))
+        self.engine.run(end=ticks[4_499].ts_init, streaming=True)
+
+        # Act
+        self.engine.reset()
+        self.engine.add_data_iterator([ticks])
+        self.engine.run()
+
+        # Assert
+        assert self.engine.iteration == 8000
+
+    def test_run_with_empty_data_iterator_ends_without_running(self):
+        # Arrange
+        self.engine.clear_data()
+        self.engine.add_data_iterator(iter([[], []]))
+
+        # Act
+        self.engine.run()
+
+        # Assert
+        assert self.engine.iteration == 0
+        assert self.engine.run_finished is not None
+
+    def test_run_with_data_iterator_with_unordered_chunks_raises(self):
+        # Arrange
+        ticks = self.engine.data
+        self.engine.clear_data()
+        self.engine.add_data_iterator([ticks[4_000:], ticks[:4_000]])
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            self.engine.run()
+
+    def test_run_with_profiling_reports_stage_timings(self):
+        # Arrange
+        engine = self.create_engine(
+            BacktestEngineConfig(
+                logging=LoggingConfig(bypass_logging=True),
+                profile=True,
+                profile_sample_interval=10,
+            ),
+        )
+        engine.add_strategy(Strategy())
+
+        # Act
+        engine.run()
+
+        # Assert
+        report = engine.profiler.report()
+        assert report["sample_interval"] == 10
+        assert report["sampled_iterations"] == 800
+        assert report["stages"]["data_engine.process"]["count"] == 800
+        assert report["stages"]["exchange.process_data"]["count"] == 800
+        assert report["stages"]["exchange.process"]["count"] == 800
+        assert report["handlers"]
+        engine.dispose()
+
+    def test_profiler_is_none_by_default(self):
+        # Arrange, Act, Assert
+        assert self.engine.profiler is None
+
+    def test_deterministic_uuids_reproduces_run_id_after_reset(self):
+        # Arrange
+        config = BacktestEngineConfig(
+            logging=LoggingConfig(bypass_logging=True),
+            deterministic_uuids=True,
+        )
+        engine = self.create_engine(config)
+        engine.add_strategy(Strategy())
+        engine.run()
+        run_id1 = engine.run_id
+
+        # Act
+        engine.reset()
+        engine.run()
+        run_id2 = engine.run_id
+        engine.dispose()
+
+        # Assert
+        assert run_id1 == run_id2
+        assert UUID4() != run_id1  # Random generation outside of the engine scope
+
+    def test_deterministic_uuids_are_distinct_between_engines(self):
+        # Arrange
+        config = BacktestEngineConfig(
+            logging=LoggingConfig(bypass_logging=True),
+            deterministic_uuids=True,
+        )
+        engine1 = self.create_engine(config)
+        engine2 = self.create_engine(config)
+
+        # Act
+        engine1.run()
+        engine2.run()
+
+        # Assert
+        assert engine1.instance_id != engine2.instance_id
+        assert engine1.run_id != engine2.run_id
+        engine1.dispose()
+        engine2.dispose()
+
     def test_change_fill_model(self):
         # Arrange, Act
         self.engine.change_fill_model(Venue("SIM"), FillModel())
@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 import pandas as pd
+import pytest
 
 from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.backtest.modules import FXRolloverInterestConfig
@@ -25,18 +26,46 @@ from nautilus_trader.config import LoggingConfig
 from nautilus_trader.config import SimulationModuleConfig
 from nautilus_trader.core.data import Data
 from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import OmsType
+from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Money
+from nautilus_trader.model.objects import Quantity
 from nautilus_trader.persistence.wranglers import QuoteTickDataWrangler
 from nautilus_trader.test_kit.providers import TestDataProvider
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.trading.strategy import Strategy
+from tests import TEST_DATA_DIR
 
 
 USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
 
 
+class _BuyOnFirstQuoteStrategy(Strategy):
+    def __init__(self, quantities: list[int]) -> None:
+        super().__init__()
+        self._quantities = quantities
+        self._submitted = False
+
+    def on_start(self) -> None:
+        self.subscribe_quote_ticks(USDJPY_SIM.id)
+
+    def on_quote_tick(self, tick: QuoteTick) -> None:
+        if self._submitted:
+            return
+        self._submitted = True
+
+        for quantity in self._quantities:
+            order = self.order_factory.market(
+                instrument_id=USDJPY_SIM.id,
+                order_side=OrderSide.BUY,
+                quantity=Quantity.from_int(quantity),
+            )
+            self.submit_order(order)  # Separate positions with HEDGING OMS
+
+
 class TestSimulationModules:
     def create_engine(self, modules: list) -> BacktestEngine:
         engine = BacktestEngine(BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True)))
@@ -58,6 +87,41 @@ class TestSimulationModules:
         engine.add_data(ticks)
         return engine
 
+    def run_rollover_engine(
+        self,
+        quantities: list[int],
+        end: str,
+        with_module: bool = True,
+    ) -> tuple[BacktestEngine, FXRolloverInterestModule]:
+        interest_rate_data = pd.read_csv(TEST_DATA_DIR / "short-term-interest.csv")
+        module = FXRolloverInterestModule(FXRolloverInterestConfig(interest_rate_data))
+        engine = BacktestEngine(BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True)))
+        engine.add_venue(
+            venue=Venue("SIM"),
+            oms_type=OmsType.HEDGING,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            starting_balances=[Money(1_000_000, USD)],
+            modules=[module] if with_module else [],
+        )
+
+        # Monday 2013-02-04 from 00:00 US/Eastern, so the first rollover is
+        # Monday 17:00 US/Eastern (22:00 UTC), followed by the UTC day change.
+        provider = TestDataProvider()
+        bid_data = provider.read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv")
+        ask_data = provider.read_csv_bars("fxcm/usdjpy-m1-ask-2013.csv")
+        start = "2013-02-04 05:00"
+        wrangler = QuoteTickDataWrangler(USDJPY_SIM)
+        ticks = wrangler.process_bar_data(
+            bid_data=bid_data.loc[start:end],
+            ask_data=ask_data.loc[start:end],
+        )
+        engine.add_instrument(USDJPY_SIM)
+        engine.add_data(ticks)
+        engine.add_strategy(_BuyOnFirstQuoteStrategy(quantities))
+        engine.run()
+        return engine, module
+
     def test_fx_rollover_interest_module(self):
         # Arrange
         config = FXRolloverInterestConfig(pd.DataFrame(columns=["LOCATION"]))
@@ -68,6 +132,80 @@ class TestSimulationModules:
         [venue] = engine.list_venues()
         assert venue
 
+    def test_fx_rollover_interest_module_run_and_reset(self):
+        # Arrange
+        interest_rate_data = pd.read_csv(TEST_DATA_DIR / "short-term-interest.csv")
+        config = FXRolloverInterestConfig(interest_rate_data)
+        module = FXRolloverInterestModule(config)
+        engine = self.create_engine(modules=[module])
+
+        # Act
+        engine.run()
+        engine.reset()
+        engine.run()
+
+        # Assert
+        assert engine.iteration > 0
+
+    def test_fx_rollover_interest_applied_once_across_utc_day_change(self):
+        # Arrange, Act
+        engine_before, module_before = self.run_rollover_engine([100_000], end="2013-02-04 23:30")
+        engine_after, module_after = self.run_rollover_engine([100_000], end="2013-02-05 00:30")
+
+        # Assert
+        assert len(engine_after.cache.positions_open()) == 1
+        assert list(module_before._rollover_totals) == [USD]
+        assert module_before._rollover_totals[USD].as_double() != 0.0
+        assert module_after._rollover_totals == module_before._rollover_totals
+
+    def test_fx_rollover_interest_adjusts_account_balance(self):
+        # Arrange, Act
+        engine, module = self.run_rollover_engine([100_000], end="2013-02-05 00:30")
+        engine_no_module, _ = self.run_rollover_engine(
+            [100_000],
+            end="2013-02-05 00:30",
+            with_module=False,
+        )
+
+        # Assert
+        balance = engine.cache.account_for_venue(Venue("SIM")).balance_total(USD)
+        balance_no_module = engine_no_module.cache.account_for_venue(Venue("SIM")).balance_total(
+            USD,
+        )
+        rollover_total = module._rollover_totals[USD]
+        assert balance_no_module.as_double() - balance.as_double() == pytest.approx(
+            rollover_total.as_double(),
+            abs=0.01,
+        )
+
+    def test_fx_rollover_interest_aggregates_positions_per_instrument(self):
+        # Arrange, Act
+        engine_single, module_single = self.run_rollover_engine([200_000], end="2013-02-05 00:30")
+        engine_split, module_split = self.run_rollover_engine(
+            [50_000, 150_000],
+            end="2013-02-05 00:30",
+        )
+
+        # Assert
+        assert len(engine_single.cache.positions_open()) == 1
+        assert len(engine_split.cache.positions_open()) == 2
+        assert module_split._rollover_totals[USD].as_double() == pytest.approx(
+            module_single._rollover_totals[USD].as_double(),
+            abs=0.01,
+        )
+
+    def test_fx_rollover_interest_module_reset_clears_totals(self):
+        # Arrange
+        engine, module = self.run_rollover_engine([100_000], end="2013-02-05 00:30")
+        rollover_total = module._rollover_totals[USD]
+
+        # Act
+        engine.reset()
+
+        # Assert
+        assert module._rollover_totals == {}
+        assert rollover_total.as_double() != 0.0
+
     def test_python_module(self):
         # Arrange
         class PythonModule(SimulationModule):
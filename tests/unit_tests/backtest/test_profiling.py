@@ -0,0 +1,83 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.backtest.profiling import BacktestProfiler
+
+
+class _Component:
+    id = "Component-001"
+
+    def on_data(self, data):
+        pass
+
+
+class TestBacktestProfiler:
+    def test_instantiate_with_invalid_sample_interval_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            BacktestProfiler(sample_interval=0)
+
+    def test_begin_iteration_samples_on_interval(self):
+        # Arrange
+        profiler = BacktestProfiler(sample_interval=3)
+
+        # Act
+        sampled = [profiler.begin_iteration(i) for i in range(7)]
+
+        # Assert
+        assert sampled == [True, False, False, True, False, False, True]
+        assert profiler.sampled_iterations == 3
+
+    def test_report_aggregates_stages_and_handlers(self):
+        # Arrange
+        profiler = BacktestProfiler()
+        component = _Component()
+
+        # Act
+        profiler.record("data_engine.process", 100)
+        profiler.record("data_engine.process", 300)
+        profiler.record("exchange.process", 50)
+        profiler.record_handler(component.on_data, 20)
+        profiler.record_handler(component.on_data, 40)
+
+        # Assert
+        report = profiler.report()
+        assert list(report["stages"]) == ["data_engine.process", "exchange.process"]
+        assert report["stages"]["data_engine.process"] == {
+            "count": 2,
+            "total_ns": 400,
+            "mean_ns": 200,
+            "max_ns": 300,
+        }
+        assert report["handlers"]["Component-001.on_data"]["count"] == 2
+        assert report["handlers"]["Component-001.on_data"]["max_ns"] == 40
+
+    def test_reset_clears_timings(self):
+        # Arrange
+        profiler = BacktestProfiler()
+        profiler.begin_iteration(0)
+        profiler.record("time_events", 10)
+
+        # Act
+        profiler.reset()
+
+        # Assert
+        report = profiler.report()
+        assert report["sampled_iterations"] == 0
+        assert report["stages"] == {}
+        assert report["handlers"] == {}
+        assert not profiler.sampling
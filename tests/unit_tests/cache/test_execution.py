@@ -52,6 +52,7 @@ from nautilus_trader.persistence.wranglers import QuoteTickDataWrangler
 from nautilus_trader.portfolio.portfolio import Portfolio
 from nautilus_trader.risk.engine import RiskEngine
 from nautilus_trader.test_kit.mocks.actors import MockActor
+from nautilus_trader.test_kit.mocks.cache_database import MockCacheDatabase
 from nautilus_trader.test_kit.providers import TestDataProvider
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.events import TestEventStubs
@@ -945,6 +946,229 @@ class TestCache:
         assert order1 in self.cache.orders_for_position(position.id)
         assert order2 in self.cache.orders_for_position(position.id)
 
+    def test_purge_closed_orders_without_database_does_not_purge(self):
+        # Arrange
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        self.cache.add_order(order)
+        order.apply(TestEventStubs.order_submitted(order))
+        order.apply(TestEventStubs.order_accepted(order))
+        order.apply(TestEventStubs.order_filled(order, instrument=AUDUSD_SIM))
+        self.cache.update_order(order)
+
+        # Act
+        self.cache.purge_closed_orders(ts_now=60_000_000_000)
+
+        # Assert
+        assert self.cache.order_exists(order.client_order_id)
+        assert order in self.cache.orders_closed()
+
+    def test_purge_closed_orders_within_buffer_does_not_purge(self):
+        # Arrange
+        cache = Cache(database=MockCacheDatabase())
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        cache.add_order(order, PositionId("P-1"))
+        order.apply(TestEventStubs.order_submitted(order))
+        order.apply(TestEventStubs.order_accepted(order))
+        order.apply(TestEventStubs.order_filled(order, instrument=AUDUSD_SIM))
+        cache.update_order(order)
+
+        # Act
+        cache.purge_closed_orders(ts_now=1_000_000_000, buffer_secs=60)
+
+        # Assert
+        assert cache.order_exists(order.client_order_id)
+        assert order in cache.orders_closed()
+
+    def test_purge_closed_orders_removes_orders_and_indexes(self):
+        # Arrange
+        cache = Cache(database=MockCacheDatabase())
+        order1 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        order2 = self.strategy.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+
+        cache.add_order(order1, PositionId("P-1"))
+        cache.add_order(order2)
+        order1.apply(TestEventStubs.order_submitted(order1))
+        order1.apply(TestEventStubs.order_accepted(order1))
+        order1.apply(TestEventStubs.order_filled(order1, instrument=AUDUSD_SIM))
+        cache.update_order(order1)
+
+        # Act
+        cache.purge_closed_orders(ts_now=60_000_000_000, buffer_secs=60)
+
+        # Assert
+        assert not cache.order_exists(order1.client_order_id)
+        assert cache.order_exists(order2.client_order_id)
+        assert cache.client_order_ids() == {order2.client_order_id}
+        assert cache.client_order_ids(strategy_id=self.strategy.id) == {order2.client_order_id}
+        assert cache.client_order_id(order1.venue_order_id) is None
+        assert cache.orders_closed_count() == 0
+        assert cache.orders_total_count() == 1
+        assert cache.check_integrity()
+
+    def test_purge_closed_orders_drops_empty_indexes(self):
+        # Arrange
+        cache = Cache(database=MockCacheDatabase())
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        cache.add_order(order)
+        order.apply(TestEventStubs.order_submitted(order))
+        order.apply(TestEventStubs.order_accepted(order))
+        order.apply(TestEventStubs.order_filled(order, instrument=AUDUSD_SIM))
+        cache.update_order(order)
+
+        # Act
+        cache.purge_closed_orders(ts_now=0)
+
+        # Assert
+        assert cache.orders_total_count() == 0
+        assert cache.client_order_ids(venue=AUDUSD_SIM.id.venue) == set()
+        assert cache.client_order_ids(instrument_id=AUDUSD_SIM.id) == set()
+        assert cache.client_order_ids(strategy_id=self.strategy.id) == set()
+        assert cache.check_integrity()
+
+    def test_purge_closed_orders_retains_orders_for_cached_positions(self):
+        # Arrange
+        cache = Cache(database=MockCacheDatabase())
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        position_id = PositionId("P-1")
+        cache.add_order(order, position_id)
+        order.apply(TestEventStubs.order_submitted(order))
+        order.apply(TestEventStubs.order_accepted(order))
+        fill = TestEventStubs.order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            position_id=position_id,
+        )
+        order.apply(fill)
+        cache.update_order(order)
+
+        position = Position(instrument=AUDUSD_SIM, fill=fill)
+        cache.add_position(position, OmsType.HEDGING)
+
+        # Act
+        cache.purge_closed_orders(ts_now=60_000_000_000)
+
+        # Assert
+        assert cache.order_exists(order.client_order_id)
+        assert cache.orders_for_position(position_id) == [order]
+        assert cache.check_integrity()
+
+    def test_purge_closed_positions_without_database_does_not_purge(self):
+        # Arrange
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        position_id = PositionId("P-1")
+        self.cache.add_order(order, position_id)
+        fill = TestEventStubs.order_filled(order, instrument=AUDUSD_SIM, position_id=position_id)
+        position = Position(instrument=AUDUSD_SIM, fill=fill)
+        self.cache.add_position(position, OmsType.HEDGING)
+
+        # Act
+        self.cache.purge_closed_positions(ts_now=60_000_000_000)
+
+        # Assert
+        assert self.cache.position_exists(position_id)
+
+    def test_purge_closed_positions_removes_positions_and_indexes(self):
+        # Arrange
+        cache = Cache(database=MockCacheDatabase())
+        order1 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        order2 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+        )
+
+        position_id = PositionId("P-1")
+        cache.add_order(order1, position_id)
+        cache.add_order(order2, position_id)
+
+        fill1 = TestEventStubs.order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            position_id=position_id,
+            last_px=Price.from_str("1.00001"),
+        )
+        position = Position(instrument=AUDUSD_SIM, fill=fill1)
+        cache.add_position(position, OmsType.HEDGING)
+
+        fill2 = TestEventStubs.order_filled(
+            order2,
+            instrument=AUDUSD_SIM,
+            position_id=position_id,
+            last_px=Price.from_str("1.00001"),
+            trade_id=TradeId("2"),
+        )
+        position.apply(fill2)
+        cache.update_position(position)
+
+        # Act
+        cache.purge_closed_positions(ts_now=0)
+
+        # Assert
+        assert not cache.position_exists(position_id)
+        assert cache.position(position_id) is None
+        assert cache.positions() == []
+        assert cache.positions_closed_count() == 0
+        assert cache.positions_total_count() == 0
+        assert cache.check_integrity()
+
+    def test_memory_stats(self):
+        # Arrange
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        self.cache.add_order(order)
+        order.apply(TestEventStubs.order_submitted(order))
+        self.cache.update_order(order)
+
+        # Act
+        result = self.cache.memory_stats()
+
+        # Assert
+        assert result["orders"] == 1
+        assert result["order_events"] == 2
+        assert result["positions"] == 0
+        assert result["position_events"] == 0
+
     def test_positions_queries_with_multiple_open_returns_expected_positions(self):
         # Arrange
         # -- Position 1 --------------------------------------------------------
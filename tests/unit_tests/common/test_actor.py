@@ -30,6 +30,7 @@ from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.data.engine import DataEngine
 from nautilus_trader.data.messages import DataResponse
 from nautilus_trader.execution.engine import ExecutionEngine
+from nautilus_trader.indicators.average.ema import ExponentialMovingAverage
 from nautilus_trader.model.currencies import EUR
 from nautilus_trader.model.currencies import USD
 from nautilus_trader.model.data import Bar
@@ -1222,6 +1223,54 @@ class TestActor:
         # Assert
         assert result == bars
 
+    def test_handle_bars_with_registered_indicator_updates_indicator(self) -> None:
+        # Arrange
+        actor = MockActor()
+        actor.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+        ema = ExponentialMovingAverage(2)
+        actor.register_indicator_for_bars(TestDataStubs.bartype_audusd_1min_bid(), ema)
+
+        actor.start()
+
+        bars = [TestDataStubs.bar_5decimal(), TestDataStubs.bar_5decimal()]
+
+        # Act
+        actor.handle_bars(bars)
+
+        # Assert
+        assert ema.count == 2
+        assert ema.value == 1.00003
+        assert ema.initialized
+
+    def test_handle_bars_with_historical_data_handler_updates_indicator_per_bar(self) -> None:
+        # Arrange
+        actor = MockActor()
+        actor.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+        ema = ExponentialMovingAverage(2)
+        actor.register_indicator_for_bars(TestDataStubs.bartype_audusd_1min_bid(), ema)
+        counts: list[int] = []
+        actor.on_historical_data = lambda bar: counts.append(ema.count)
+
+        actor.start()
+
+        bars = [TestDataStubs.bar_5decimal(), TestDataStubs.bar_5decimal()]
+
+        # Act
+        actor.handle_bars(bars)
+
+        # Assert
+        assert counts == [1, 2]
+
     def test_handle_data_when_not_running_does_not_send_to_on_data(self) -> None:
         # Arrange
         actor = MockActor()
@@ -57,6 +57,27 @@ class TestOrderIdGenerator:
         # Assert
         assert result1 == ClientOrderId("O-19700101-000000-001-001-1")
 
+    def test_generate_order_id_updates_datetime_tag_each_second(self):
+        # Arrange
+        clock = TestClock()
+        generator = ClientOrderIdGenerator(
+            trader_id=TraderId("TRADER-001"),
+            strategy_id=StrategyId("SCALPER-001"),
+            clock=clock,
+        )
+
+        # Act
+        result1 = generator.generate()
+        clock.set_time(999_999_999)
+        result2 = generator.generate()
+        clock.set_time(61_000_000_000)
+        result3 = generator.generate()
+
+        # Assert
+        assert result1 == ClientOrderId("O-19700101-000000-001-001-1")
+        assert result2 == ClientOrderId("O-19700101-000000-001-001-2")
+        assert result3 == ClientOrderId("O-19700101-000101-001-001-3")
+
 
 class TestOrderListIdGenerator:
     def setup(self):
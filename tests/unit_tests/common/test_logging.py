@@ -68,6 +68,16 @@ class TestLoggerTests:
         # Act, Assert
         assert logger.name == name
 
+    def test_is_enabled_for_levels_at_or_above_configured_level(self):
+        # Arrange (test session logging is initialized at DEBUG level)
+        logger = Logger(name="TEST_LOGGER")
+
+        # Act, Assert
+        assert not logger.is_enabled(LogLevel.TRACE)
+        assert logger.is_enabled(LogLevel.DEBUG)
+        assert logger.is_enabled(LogLevel.INFO)
+        assert logger.is_enabled(LogLevel.ERROR)
+
     def test_log_debug_messages_to_console(self):
         # Arrange
         logger = Logger(name="TEST_LOGGER")
@@ -13,11 +13,33 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import asyncio
+
+import pytest
+
 from nautilus_trader.common.providers import InstrumentProvider
+from nautilus_trader.config import InstrumentProviderConfig
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
 
 
 AUDUSD = TestIdStubs.audusd_id()
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+BTCUSDT_BINANCE = TestInstrumentProvider.btcusdt_binance()
+ETHUSDT_BINANCE = TestInstrumentProvider.ethusdt_binance()
+
+
+class _VenueInstrumentProvider(InstrumentProvider):
+    def __init__(self, instruments: list[Instrument], config: InstrumentProviderConfig) -> None:
+        super().__init__(config=config)
+        self.venue_instruments = instruments
+        self.venue_responded = asyncio.Event()
+        self.venue_responded.set()
+
+    async def load_all_async(self, filters: dict | None = None) -> None:
+        await self.venue_responded.wait()
+        self.add_bulk(self.venue_instruments)
 
 
 class TestInstrumentProvider:
@@ -38,3 +60,89 @@ class TestInstrumentProvider:
 
         # Assert
         assert result is None
+
+
+class TestInstrumentProviderSnapshot:
+    @pytest.mark.asyncio
+    async def test_initialize_warm_starts_from_snapshot_and_applies_venue_updates(self, tmp_path):
+        # Arrange
+        config = InstrumentProviderConfig(
+            load_all=True,
+            snapshot_path=str(tmp_path / "instruments.snapshot"),
+        )
+        cold = _VenueInstrumentProvider([AUDUSD_SIM, BTCUSDT_BINANCE], config=config)
+        await cold.initialize()
+
+        warm = _VenueInstrumentProvider(
+            [AUDUSD_SIM, BTCUSDT_BINANCE, ETHUSDT_BINANCE],
+            config=config,
+        )
+        warm.venue_responded.clear()
+        updates: list[list[Instrument]] = []
+        warm.register_update_handler(updates.append)
+
+        # Act
+        await warm.initialize()
+        count_before_venue = warm.count
+        warm.venue_responded.set()
+        await asyncio.gather(*warm._tasks)
+
+        # Assert
+        assert count_before_venue == 2
+        assert warm.find(BTCUSDT_BINANCE.id) == BTCUSDT_BINANCE
+        assert warm.count == 3
+        assert updates == [[ETHUSDT_BINANCE]]
+
+    @pytest.mark.asyncio
+    async def test_refresh_removes_instruments_no_longer_listed_by_venue(self, tmp_path):
+        # Arrange
+        config = InstrumentProviderConfig(
+            load_all=True,
+            snapshot_path=str(tmp_path / "instruments.snapshot"),
+        )
+        cold = _VenueInstrumentProvider([AUDUSD_SIM, BTCUSDT_BINANCE], config=config)
+        await cold.initialize()
+
+        warm = _VenueInstrumentProvider([AUDUSD_SIM], config=config)
+
+        # Act
+        await warm.initialize()
+        await asyncio.gather(*warm._tasks)
+
+        # Assert
+        assert warm.list_all() == [AUDUSD_SIM]
+        assert warm.find(BTCUSDT_BINANCE.id) is None
+
+        # Snapshot rewritten without the delisted instrument
+        restarted = _VenueInstrumentProvider([AUDUSD_SIM], config=config)
+        restarted.venue_responded.clear()
+        await restarted.initialize()
+        assert restarted.list_all() == [AUDUSD_SIM]
+        restarted.venue_responded.set()
+        await asyncio.gather(*restarted._tasks)
+
+    @pytest.mark.asyncio
+    async def test_initialize_with_snapshot_for_other_config_loads_from_venue(self, tmp_path):
+        # Arrange
+        snapshot_path = str(tmp_path / "instruments.snapshot")
+        cold = _VenueInstrumentProvider(
+            [AUDUSD_SIM],
+            config=InstrumentProviderConfig(load_all=True, snapshot_path=snapshot_path),
+        )
+        await cold.initialize()
+
+        other = _VenueInstrumentProvider(
+            [BTCUSDT_BINANCE],
+            config=InstrumentProviderConfig(
+                load_all=True,
+                filters={"market": "spot"},
+                snapshot_path=snapshot_path,
+            ),
+        )
+
+        # Act
+        await other.initialize()
+
+        # Assert
+        assert other.list_all() == [BTCUSDT_BINANCE]
+        assert not other._tasks
@@ -37,6 +37,7 @@ from nautilus_trader.core.datetime import nanos_to_secs
 from nautilus_trader.core.datetime import secs_to_millis
 from nautilus_trader.core.datetime import secs_to_nanos
 from nautilus_trader.core.datetime import unix_nanos_to_dt
+from nautilus_trader.core.datetime import unix_nanos_to_iso8601
 from nautilus_trader.test_kit.stubs.data import UNIX_EPOCH
 
 
@@ -258,6 +259,23 @@ class TestDatetimeFunctions:
         # Assert
         assert result == pytest.approx(expected, 100)  # 100 nanoseconds
 
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            [0, "1970-01-01T00:00:00.000000000Z"],
+            [1, "1970-01-01T00:00:00.000000001Z"],
+            [1_357_002_000_000_000_000, "2013-01-01T01:00:00.000000000Z"],
+            [1_577_934_120_003_330_001, "2020-01-02T03:02:00.003330001Z"],
+        ],
+    )
+    def test_unix_nanos_to_iso8601(self, value, expected):
+        # Arrange, Act
+        result = unix_nanos_to_iso8601(value)
+
+        # Assert
+        assert result == expected
+        assert dt_to_unix_nanos(result) == value
+
     def test_is_datetime_utc_given_tz_naive_datetime_returns_false(self):
         # Arrange
         dt = datetime(2013, 1, 1, 1, 0)
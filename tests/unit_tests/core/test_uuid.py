@@ -16,6 +16,8 @@
 import pickle
 
 from nautilus_trader.core.uuid import UUID4
+from nautilus_trader.core.uuid import DeterministicUUIDScope
+from nautilus_trader.core.uuid import set_deterministic_uuids
 
 
 class TestUUID:
@@ -67,3 +69,48 @@ class TestUUID:
         assert isinstance(result, UUID4)
         assert len(str(result)) == 36
         assert len(str(result).replace("-", "")) == 32
+
+    def test_deterministic_uuids_are_sequential_and_reproducible(self):
+        # Arrange
+        set_deterministic_uuids(True, seed=7)
+
+        try:
+            # Act
+            uuid1 = UUID4()
+            uuid2 = UUID4()
+            set_deterministic_uuids(True, seed=7)  # Restarts sequence
+            uuid3 = UUID4()
+        finally:
+            set_deterministic_uuids(False)
+
+        # Assert
+        assert uuid1.value == "00000007-0000-4000-8000-000000000001"
+        assert uuid2.value == "00000007-0000-4000-8000-000000000002"
+        assert uuid3 == uuid1
+        assert UUID4(uuid1.value) == uuid1  # Valid version 4 UUID
+        assert UUID4() != uuid1
+
+    def test_deterministic_uuid_scope_resumes_sequence_and_restores_mode(self):
+        # Arrange
+        scope1 = DeterministicUUIDScope(seed=1)
+        scope2 = DeterministicUUIDScope(seed=2)
+
+        # Act
+        with scope1:
+            uuid1 = UUID4()
+            with scope2:
+                uuid2 = UUID4()
+            with scope1:  # Re-entrant
+                uuid3 = UUID4()
+        with scope1:
+            uuid4 = UUID4()
+        uuid5 = UUID4()
+
+        # Assert
+        assert uuid1.value == "00000001-0000-4000-8000-000000000001"
+        assert uuid2.value == "00000002-0000-4000-8000-000000000001"
+        assert uuid3.value == "00000001-0000-4000-8000-000000000002"
+        assert uuid4.value == "00000001-0000-4000-8000-000000000003"
+        assert scope1.count == 3
+        assert scope2.count == 1
+        assert not uuid5.value.startswith("00000001-0000-4000-8000")  # Random mode restored
@@ -21,6 +21,7 @@ from nautilus_trader.backtest.data_client import BacktestMarketDataClient
 from nautilus_trader.common.component import MessageBus
 from nautilus_trader.common.component import TestClock
 from nautilus_trader.core.data import Data
+from nautilus_trader.core.datetime import unix_nanos_to_dt
 from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.data.engine import DataEngine
 from nautilus_trader.data.engine import DataEngineConfig
@@ -2206,6 +2207,65 @@ class TestDataEngine:
         assert len(handler) == 1
         assert len(handler[0].data) == 1
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="Failing on windows")
+    def test_request_quote_ticks_when_catalog_cached_queries_only_missing_ranges(self):
+        # Arrange
+        self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.data_engine.execute)
+        self.msgbus.deregister(endpoint="DataEngine.process", handler=self.data_engine.process)
+        self.msgbus.deregister(endpoint="DataEngine.request", handler=self.data_engine.request)
+        self.msgbus.deregister(endpoint="DataEngine.response", handler=self.data_engine.response)
+        data_engine = DataEngine(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=DataEngineConfig(catalog_cache_size=10),
+        )
+
+        catalog = setup_catalog(protocol="file")
+        ticks = [TestDataStubs.quote_tick(ts_event=i, ts_init=i) for i in range(1, 11)]
+        catalog.write_data(ticks)
+
+        queries = []
+        query_quote_ticks = catalog.quote_ticks
+
+        def quote_ticks(**kwargs):
+            queries.append((kwargs["start"], kwargs["end"]))
+            return query_quote_ticks(**kwargs)
+
+        catalog.quote_ticks = quote_ticks
+        data_engine.register_catalog(catalog)
+
+        handler = []
+
+        def request_quote_ticks(start=None, end=None):
+            request = DataRequest(
+                client_id=None,
+                venue=Venue("SIM"),
+                data_type=DataType(
+                    QuoteTick,
+                    metadata={
+                        "instrument_id": ticks[0].instrument_id,
+                        "start": start,
+                        "end": end,
+                    },
+                ),
+                callback=handler.append,
+                request_id=UUID4(),
+                ts_init=self.clock.timestamp_ns(),
+            )
+            self.msgbus.request(endpoint="DataEngine.request", request=request)
+
+        # Act
+        self.clock.set_time(5)
+        request_quote_ticks()
+        self.clock.set_time(10)
+        request_quote_ticks()
+        request_quote_ticks(start=unix_nanos_to_dt(3), end=unix_nanos_to_dt(7))
+
+        # Assert
+        assert queries == [(0, 5), (6, 10)]
+        assert [r.data for r in handler] == [ticks[:5], ticks, ticks[2:7]]
+
     def test_request_order_book_snapshot_reaches_client(self):
         # Arrange
         self.data_engine.register_client(self.binance_client)
@@ -23,6 +23,7 @@ from nautilus_trader.common.component import MessageBus
 from nautilus_trader.common.component import TestClock
 from nautilus_trader.config import DataEngineConfig
 from nautilus_trader.config import ExecEngineConfig
+from nautilus_trader.config import OrderEmulatorConfig
 from nautilus_trader.config import RiskEngineConfig
 from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.data.engine import DataEngine
@@ -467,6 +468,60 @@ class TestOrderEmulatorWithSingleOrders:
         assert order2.is_canceled
         assert not order2.is_active_local
 
+    def test_cancel_last_emulated_order_retains_data_subscription_by_default(self) -> None:
+        # Arrange
+        order = self.strategy.order_factory.limit(
+            instrument_id=ETHUSDT_PERP_BINANCE.id,
+            order_side=OrderSide.BUY,
+            quantity=Quantity.from_int(10),
+            price=ETHUSDT_PERP_BINANCE.make_price(2_000),
+            emulation_trigger=TriggerType.BID_ASK,
+        )
+
+        self.strategy.submit_order(order)
+
+        # Act
+        self.strategy.cancel_order(order)
+
+        # Assert
+        assert order.is_canceled
+        assert not self.emulator.auto_unsubscribe
+        assert self.emulator.subscribed_quotes == [ETHUSDT_PERP_BINANCE.id]
+
+    def test_process_quote_tick_only_iterates_when_nearest_trigger_crossed(self) -> None:
+        # Arrange
+        order = self.strategy.order_factory.limit(
+            instrument_id=ETHUSDT_PERP_BINANCE.id,
+            order_side=OrderSide.BUY,
+            quantity=Quantity.from_int(10),
+            price=ETHUSDT_PERP_BINANCE.make_price(5_000),
+            emulation_trigger=TriggerType.BID_ASK,
+        )
+
+        self.strategy.submit_order(order)
+        matching_core = self.emulator.get_matching_core(ETHUSDT_PERP_BINANCE.id)
+
+        tick1 = TestDataStubs.quote_tick(
+            instrument=ETHUSDT_PERP_BINANCE,
+            bid_price=5_010.0,
+            ask_price=5_020.0,
+        )
+        tick2 = TestDataStubs.quote_tick(
+            instrument=ETHUSDT_PERP_BINANCE,
+            bid_price=4_990.0,
+            ask_price=5_000.0,
+        )
+
+        # Act
+        self.data_engine.process(tick1)
+        crossed_before = matching_core.is_trigger_crossed()
+        self.data_engine.process(tick2)
+
+        # Assert
+        assert not crossed_before
+        assert self.cache.order(order.client_order_id).order_type == OrderType.MARKET
+        assert self.exec_client.calls == ["_start", "submit_order"]
+
     @pytest.mark.parametrize(
         ("order_side", "trigger_price"),
         [
@@ -1232,3 +1287,145 @@ class TestOrderEmulatorWithSingleOrders:
         assert isinstance(order.events[2], OrderInitialized)
         assert isinstance(order.events[3], OrderReleased)
         assert self.exec_client.calls == ["_start", "submit_order"]
+
+
+class TestOrderEmulatorWithAutoUnsubscribe:
+    def setup(self) -> None:
+        # Fixture Setup
+        self.clock = TestClock()
+        self.trader_id = TestIdStubs.trader_id()
+        self.strategy_id = TestIdStubs.strategy_id()
+        self.account_id = TestIdStubs.account_id()
+
+        self.msgbus = MessageBus(
+            trader_id=self.trader_id,
+            clock=self.clock,
+        )
+
+        self.cache_db = MockCacheDatabase()
+        self.cache = Cache(database=self.cache_db)
+        self.cache.add_instrument(ETHUSDT_PERP_BINANCE)
+        self.cache.add_instrument(BTCUSDT_BINANCE)
+        self.cache.add_instrument(ETHUSDT_BINANCE)
+
+        self.portfolio = Portfolio(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        self.data_engine = DataEngine(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=DataEngineConfig(debug=True),
+        )
+
+        self.exec_engine = ExecutionEngine(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=ExecEngineConfig(debug=True),
+        )
+
+        self.risk_engine = RiskEngine(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=RiskEngineConfig(debug=True),
+        )
+
+        self.emulator = OrderEmulator(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=OrderEmulatorConfig(auto_unsubscribe=True),
+        )
+
+        self.venue = Venue("BINANCE")
+        self.data_client = BacktestMarketDataClient(
+            client_id=ClientId(self.venue.value),
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        self.exec_client = MockExecutionClient(
+            client_id=ClientId(self.venue.value),
+            venue=self.venue,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        update = TestEventStubs.margin_account_state(account_id=AccountId("BINANCE-001"))
+        self.portfolio.update_account(update)
+        self.data_engine.register_client(self.data_client)
+        self.exec_engine.register_client(self.exec_client)
+
+        self.strategy = Strategy()
+        self.strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        self.data_engine.start()
+        self.risk_engine.start()
+        self.exec_engine.start()
+        self.emulator.start()
+        self.strategy.start()
+
+    def test_cancel_last_emulated_order_unsubscribes_from_data(self) -> None:
+        # Arrange
+        order = self.strategy.order_factory.limit(
+            instrument_id=ETHUSDT_PERP_BINANCE.id,
+            order_side=OrderSide.BUY,
+            quantity=Quantity.from_int(10),
+            price=ETHUSDT_PERP_BINANCE.make_price(2_000),
+            emulation_trigger=TriggerType.BID_ASK,
+        )
+
+        self.strategy.submit_order(order)
+
+        # Act
+        self.strategy.cancel_order(order)
+
+        # Assert
+        matching_core = self.emulator.get_matching_core(ETHUSDT_PERP_BINANCE.id)
+        assert order.is_canceled
+        assert not matching_core.get_orders()
+        assert not matching_core.is_bid_initialized
+        assert not matching_core.is_ask_initialized
+        assert self.emulator.subscribed_quotes == []
+
+    def test_release_last_emulated_order_unsubscribes_from_data(self) -> None:
+        # Arrange
+        order = self.strategy.order_factory.limit(
+            instrument_id=ETHUSDT_PERP_BINANCE.id,
+            order_side=OrderSide.BUY,
+            quantity=Quantity.from_int(10),
+            price=ETHUSDT_PERP_BINANCE.make_price(5_000),
+            emulation_trigger=TriggerType.BID_ASK,
+        )
+
+        self.strategy.submit_order(order)
+
+        tick = TestDataStubs.quote_tick(
+            instrument=ETHUSDT_PERP_BINANCE,
+            bid_price=4_990.0,
+            ask_price=5_000.0,
+        )
+
+        # Act
+        self.data_engine.process(tick)
+
+        # Assert
+        assert self.cache.order(order.client_order_id).order_type == OrderType.MARKET
+        assert self.emulator.subscribed_quotes == []
@@ -25,6 +25,7 @@ from nautilus_trader.config import StrategyConfig
 from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.data.engine import DataEngine
 from nautilus_trader.execution.engine import ExecutionEngine
+from nautilus_trader.execution.messages import BatchCancelOrders
 from nautilus_trader.execution.messages import CancelOrder
 from nautilus_trader.execution.messages import ModifyOrder
 from nautilus_trader.execution.messages import SubmitOrder
@@ -720,6 +721,43 @@ class TestExecutionEngine:
         # Assert
         assert order.status == OrderStatus.FILLED
 
+    def test_batch_cancel_orders_when_client_has_no_batch_support_routes_individual_cancels(
+        self,
+    ) -> None:
+        # Arrange
+        self.exec_engine.start()
+
+        cancels = [
+            CancelOrder(
+                self.trader_id,
+                StrategyId("S-001"),
+                AUDUSD_SIM.id,
+                ClientOrderId(f"O-{i}"),
+                VenueOrderId(str(i)),
+                UUID4(),
+                self.clock.timestamp_ns(),
+            )
+            for i in range(3)
+        ]
+
+        batch_cancel_orders = BatchCancelOrders(
+            trader_id=self.trader_id,
+            strategy_id=StrategyId("S-001"),
+            instrument_id=AUDUSD_SIM.id,
+            cancels=cancels,
+            command_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+        )
+
+        # Act
+        self.exec_engine.execute(batch_cancel_orders)
+
+        # Assert
+        assert not self.exec_client.supports_batch_cancel()
+        assert self.exec_engine.command_count == 1
+        assert self.exec_client.calls == ["_start", "cancel_order", "cancel_order", "cancel_order"]
+        assert self.exec_client.commands == cancels
+
     def test_cancel_order_then_filled_reopens_order(self) -> None:
         # Arrange
         self.exec_engine.start()
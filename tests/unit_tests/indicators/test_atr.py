@@ -18,6 +18,7 @@ import sys
 import pytest
 
 from nautilus_trader.indicators.atr import AverageTrueRange
+from nautilus_trader.indicators.average.moving_average import MovingAverageType
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
 
@@ -171,3 +172,34 @@ class TestAverageTrueRange:
         # Assert
         assert not self.atr.initialized
         assert self.atr.value == 0
+
+    @pytest.mark.parametrize(
+        "ma_type",
+        [
+            MovingAverageType.SIMPLE,
+            MovingAverageType.EXPONENTIAL,
+            MovingAverageType.WILDER,
+            MovingAverageType.HULL,
+        ],
+    )
+    @pytest.mark.parametrize("use_previous", [True, False])
+    def test_handle_bars_leaves_same_state_as_sequential_updates(self, ma_type, use_previous):
+        # Arrange
+        bars = TestDataStubs.binance_bars_from_csv(
+            "ADABTC-1m-2021-11-27.csv",
+            TestDataStubs.bartype_adabtc_binance_1min_last(),
+            TestInstrumentProvider.adabtc_binance(),
+        )
+        indicator = AverageTrueRange(10, ma_type, use_previous)
+        expected = AverageTrueRange(10, ma_type, use_previous)
+        indicator.handle_bar(bars[0])
+        expected.handle_bar(bars[0])
+
+        # Act
+        indicator.handle_bars(bars[1:])
+        for bar in bars[1:]:
+            expected.handle_bar(bar)
+
+        # Assert
+        assert indicator.value == expected.value
+        assert indicator.initialized
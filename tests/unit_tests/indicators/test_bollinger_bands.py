@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+
 from nautilus_trader.indicators.bollinger_bands import BollingerBands
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
@@ -144,3 +145,20 @@ class TestBollingerBands:
         assert indicator.upper == 0
         assert indicator.middle == 0
         assert indicator.lower == 0
+
+    def test_handle_quote_ticks_leaves_same_state_as_sequential_updates(self):
+        # Arrange
+        ticks = TestDataStubs.quote_ticks_usdjpy()[:100]
+        indicator = BollingerBands(20, 2.0)
+        expected = BollingerBands(20, 2.0)
+
+        # Act
+        indicator.handle_quote_ticks(ticks)
+        for tick in ticks:
+            expected.handle_quote_tick(tick)
+
+        # Assert
+        assert indicator.upper == expected.upper
+        assert indicator.middle == expected.middle
+        assert indicator.lower == expected.lower
+        assert indicator.initialized
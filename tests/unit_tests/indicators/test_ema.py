@@ -15,6 +15,7 @@
 
 from decimal import Decimal
 
+import numpy as np
 import pytest
 
 from nautilus_trader.indicators.average.ema import ExponentialMovingAverage
@@ -138,3 +139,41 @@ class TestExponentialMovingAverage:
         # Assert
         assert not self.ema.initialized
         assert self.ema.value == 0.0
+
+    def test_update_raw_batch_leaves_same_state_as_sequential_updates(self):
+        # Arrange
+        values = np.linspace(1.0, 2.0, 25)
+        indicator = ExponentialMovingAverage(10)
+        indicator.update_raw(1.5)
+        self.ema.update_raw(1.5)
+
+        # Act
+        indicator.update_raw_batch(values)
+        for value in values:
+            self.ema.update_raw(value)
+
+        # Assert
+        assert indicator.value == self.ema.value
+        assert indicator.count == self.ema.count == 26
+        assert indicator.initialized
+
+    def test_update_raw_batch_with_python_override_calls_update_raw_per_value(self):
+        # Arrange
+        class RecordingMovingAverage(ExponentialMovingAverage):
+            def __init__(self) -> None:
+                super().__init__(10)
+                self.updates: list[float] = []
+
+            def update_raw(self, value: float) -> None:
+                self.updates.append(value)
+                super().update_raw(value)
+
+        values = np.linspace(1.0, 2.0, 5)
+        indicator = RecordingMovingAverage()
+
+        # Act
+        indicator.update_raw_batch(values)
+
+        # Assert
+        assert indicator.updates == list(values)
+        assert indicator.count == 5
@@ -0,0 +1,129 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from collections import deque
+
+import numpy as np
+import pytest
+
+from nautilus_trader.indicators.base.ring_buffer import RingBuffer
+
+
+class TestRingBuffer:
+    def setup(self):
+        # Fixture Setup
+        self.buffer = RingBuffer(3)
+
+    def test_instantiate_with_invalid_capacity_raises(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            RingBuffer(0)
+
+    def test_instantiate_returns_empty_buffer(self):
+        # Arrange, Act, Assert
+        assert self.buffer.capacity == 3
+        assert self.buffer.count == 0
+        assert len(self.buffer) == 0
+        assert not self.buffer.is_full()
+        assert self.buffer.sum() == 0.0
+        assert self.buffer.mean() == 0.0
+        assert len(self.buffer.to_array()) == 0
+        assert repr(self.buffer) == "RingBuffer(capacity=3, count=0)"
+
+    def test_oldest_when_empty_raises(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            self.buffer.oldest()
+
+    def test_append_before_full_returns_values_in_order(self):
+        # Arrange, Act
+        self.buffer.append(1.0)
+        self.buffer.append(2.0)
+
+        # Assert
+        assert self.buffer.count == 2
+        assert not self.buffer.is_full()
+        assert self.buffer.oldest() == 1.0
+        assert self.buffer.newest() == 2.0
+        assert self.buffer.sum() == 3.0
+        assert self.buffer.mean() == 1.5
+        assert self.buffer.to_array().tolist() == [1.0, 2.0]
+
+    def test_append_when_full_evicts_oldest_value(self):
+        # Arrange, Act
+        for value in (1.0, 2.0, 3.0, 4.0, 5.0):
+            self.buffer.append(value)
+
+        # Assert
+        assert self.buffer.count == 3
+        assert self.buffer.is_full()
+        assert self.buffer.oldest() == 3.0
+        assert self.buffer.newest() == 5.0
+        assert self.buffer.sum() == 12.0
+        assert self.buffer.mean() == 4.0
+        assert self.buffer.max() == 5.0
+        assert self.buffer.min() == 3.0
+        assert self.buffer.to_array().tolist() == [3.0, 4.0, 5.0]
+
+    def test_running_sum_matches_window_sum_over_many_revolutions(self):
+        # Arrange
+        buffer = RingBuffer(50)
+        window = deque(maxlen=50)
+        values = np.random.default_rng(42).normal(1.0, 0.01, 10_000)
+
+        # Act
+        for value in values:
+            buffer.append(value)
+            window.append(value)
+
+        # Assert
+        assert buffer.to_array().tolist() == list(window)
+        assert buffer.sum() == pytest.approx(sum(window), rel=1e-12)
+        assert buffer.max() == max(window)
+        assert buffer.min() == min(window)
+
+    @pytest.mark.parametrize("count", [0, 2, 3, 5, 7, 101])
+    def test_extend_leaves_same_state_as_appends(self, count):
+        # Arrange
+        buffer = RingBuffer(3)
+        buffer.append(0.5)
+        values = np.random.default_rng(42).normal(1.0, 0.01, count)
+
+        expected = RingBuffer(3)
+        expected.append(0.5)
+
+        # Act
+        buffer.extend(values)
+        for value in values:
+            expected.append(value)
+
+        # Assert
+        assert buffer.count == expected.count
+        assert buffer.sum() == expected.sum()
+        assert buffer.to_array().tolist() == expected.to_array().tolist()
+
+    def test_clear_returns_buffer_to_fresh_state(self):
+        # Arrange
+        for value in (1.0, 2.0, 3.0, 4.0):
+            self.buffer.append(value)
+
+        # Act
+        self.buffer.clear()
+        self.buffer.append(10.0)
+
+        # Assert
+        assert self.buffer.count == 1
+        assert self.buffer.sum() == 10.0
+        assert self.buffer.to_array().tolist() == [10.0]
@@ -13,6 +13,10 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+import pytest
+
+from nautilus_trader.indicators.average.moving_average import MovingAverageType
 from nautilus_trader.indicators.rsi import RelativeStrengthIndex
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
@@ -137,3 +141,58 @@ class TestRelativeStrengthIndex:
         # Assert
         assert not self.rsi.initialized
         assert self.rsi.value == 0
+
+    @pytest.mark.parametrize(
+        "ma_type",
+        [
+            MovingAverageType.EXPONENTIAL,
+            MovingAverageType.WILDER,
+            MovingAverageType.SIMPLE,
+        ],
+    )
+    def test_update_raw_batch_leaves_same_state_as_sequential_updates(self, ma_type):
+        # Arrange
+        values = np.concatenate(
+            [
+                np.linspace(1.0, 1.1, 15),  # No losses while rising
+                np.random.default_rng(42).normal(1.1, 0.01, 50),
+            ],
+        )
+        indicator = RelativeStrengthIndex(10, ma_type)
+        expected = RelativeStrengthIndex(10, ma_type)
+        indicator.update_raw(1.0)
+        expected.update_raw(1.0)
+
+        # Act
+        indicator.update_raw_batch(values)
+        for value in values:
+            expected.update_raw(value)
+
+        # Assert
+        assert indicator.value == expected.value
+        assert indicator.initialized
+
+        # Act
+        indicator.update_raw(1.2)
+        expected.update_raw(1.2)
+
+        # Assert
+        assert indicator.value == expected.value
+
+    def test_handle_bars_leaves_same_state_as_sequential_updates(self):
+        # Arrange
+        bars = TestDataStubs.binance_bars_from_csv(
+            "ADABTC-1m-2021-11-27.csv",
+            TestDataStubs.bartype_adabtc_binance_1min_last(),
+            TestInstrumentProvider.adabtc_binance(),
+        )
+
+        # Act
+        self.rsi.handle_bars(bars)
+        expected = RelativeStrengthIndex(10)
+        for bar in bars:
+            expected.handle_bar(bar)
+
+        # Assert
+        assert self.rsi.value == expected.value
+        assert self.rsi.initialized
@@ -13,7 +13,10 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+
 from nautilus_trader.indicators.average.sma import SimpleMovingAverage
+from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.enums import PriceType
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
@@ -126,6 +129,15 @@ class TestSimpleMovingAverage:
         # Act, Assert
         assert self.sma.value == 2.0
 
+    def test_value_with_rolling_window_returns_mean_of_last_period_inputs(self):
+        # Arrange
+        for i in range(1, 26):
+            self.sma.update_raw(float(i))
+
+        # Act, Assert
+        assert self.sma.count == 25
+        assert self.sma.value == 20.5
+
     def test_handle_quote_tick_updates_with_expected_value(self):
         # Arrange
         sma_for_ticks1 = SimpleMovingAverage(10, PriceType.ASK)
@@ -174,3 +186,58 @@ class TestSimpleMovingAverage:
         # Assert
         assert not self.sma.initialized
         assert self.sma.value == 0
+
+    def test_update_raw_batch_leaves_same_state_as_sequential_updates(self):
+        # Arrange
+        values = np.random.default_rng(42).normal(1.0, 0.01, 37)
+        indicator = SimpleMovingAverage(10)
+        for value in (1.5, 1.6, 1.7):
+            indicator.update_raw(value)
+            self.sma.update_raw(value)
+
+        # Act
+        indicator.update_raw_batch(values)
+        for value in values:
+            self.sma.update_raw(value)
+
+        # Assert
+        assert indicator.value == self.sma.value
+        assert indicator.count == self.sma.count == 40
+        assert indicator.initialized
+
+    def test_handle_quote_ticks_leaves_same_state_as_sequential_updates(self):
+        # Arrange
+        ticks = TestDataStubs.quote_ticks_usdjpy()[:100]
+        indicator = SimpleMovingAverage(10, PriceType.MID)
+        expected = SimpleMovingAverage(10, PriceType.MID)
+
+        # Act
+        indicator.handle_quote_ticks(ticks)
+        for tick in ticks:
+            expected.handle_quote_tick(tick)
+
+        # Assert
+        assert indicator.value == expected.value
+        assert indicator.count == expected.count == 100
+        assert indicator.initialized
+
+    def test_handle_quote_ticks_with_python_override_calls_handler_per_tick(self):
+        # Arrange
+        class RecordingMovingAverage(SimpleMovingAverage):
+            def __init__(self) -> None:
+                super().__init__(10, PriceType.MID)
+                self.handled: list[QuoteTick] = []
+
+            def handle_quote_tick(self, tick: QuoteTick) -> None:
+                self.handled.append(tick)
+                super().handle_quote_tick(tick)
+
+        ticks = TestDataStubs.quote_ticks_usdjpy()[:20]
+        indicator = RecordingMovingAverage()
+
+        # Act
+        indicator.handle_quote_ticks(ticks)
+
+        # Assert
+        assert indicator.handled == ticks
+        assert indicator.count == 20
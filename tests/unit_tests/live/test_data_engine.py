@@ -48,6 +48,21 @@ BTCUSDT_BINANCE = TestInstrumentProvider.btcusdt_binance()
 ETHUSDT_BINANCE = TestInstrumentProvider.ethusdt_binance()
 
 
+class _RecordingCatalog:
+    def __init__(self, ticks: list[QuoteTick]) -> None:
+        self.ticks = ticks
+        self.queries: list[tuple[int, int]] = []
+
+    def quote_ticks(self, instrument_ids: list[str], start: int, end: int) -> list[QuoteTick]:
+        self.queries.append((start, end))
+        return [t for t in self.ticks if start <= t.ts_init <= end]
+
+
+class _FailingCatalog:
+    def quote_ticks(self, instrument_ids: list[str], start: int, end: int) -> list[QuoteTick]:
+        raise OSError("catalog unavailable")
+
+
 class TestLiveDataEngine:
     def setup(self):
         # Fixture Setup
@@ -336,6 +351,101 @@ class TestLiveDataEngine:
         # Tear Down
         self.engine.stop()
 
+    @pytest.mark.asyncio
+    async def test_request_when_catalog_registered_queries_off_loop_and_delivers_chunks(self):
+        # Arrange
+        self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
+        self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
+        self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
+
+        self.engine = LiveDataEngine(
+            loop=self.loop,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=LiveDataEngineConfig(catalog_cache_size=10, catalog_chunk_size=2),
+        )
+
+        ticks = [TestDataStubs.quote_tick(ts_event=i, ts_init=i) for i in range(1, 6)]
+        catalog = _RecordingCatalog(ticks)
+        self.engine.register_catalog(catalog)
+        self.engine.start()
+
+        handler = []
+        requests = [
+            DataRequest(
+                client_id=None,
+                venue=Venue("SIM"),
+                data_type=DataType(
+                    QuoteTick,
+                    metadata={
+                        "instrument_id": ticks[0].instrument_id,
+                        "start": None,
+                        "end": None,
+                    },
+                ),
+                callback=handler.append,
+                request_id=UUID4(),
+                ts_init=self.clock.timestamp_ns(),
+            )
+            for _ in range(2)
+        ]
+
+        # Act
+        for request in requests:
+            self.msgbus.request(endpoint="DataEngine.request", request=request)
+
+        # Assert
+        await eventually(lambda: self.engine.response_count == 2)
+        for request in requests:
+            chunks = [r.data for r in handler if r.correlation_id == request.id]
+            assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+            assert [tick for chunk in chunks for tick in chunk] == ticks
+            assert not self.msgbus.is_pending_request(request.id)
+
+        # Second request only queried the tail beyond the cached range
+        assert len(catalog.queries) == 2
+        assert catalog.queries[1][0] == catalog.queries[0][1] + 1
+
+        # Tear Down
+        self.engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_request_when_catalog_query_fails_sends_final_empty_response(self):
+        # Arrange
+        self.engine.register_catalog(_FailingCatalog())
+        self.engine.start()
+
+        handler = []
+        request = DataRequest(
+            client_id=None,
+            venue=Venue("SIM"),
+            data_type=DataType(
+                QuoteTick,
+                metadata={
+                    "instrument_id": TestDataStubs.quote_tick().instrument_id,
+                    "start": None,
+                    "end": None,
+                },
+            ),
+            callback=handler.append,
+            request_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+        )
+
+        # Act
+        self.msgbus.request(endpoint="DataEngine.request", request=request)
+
+        # Assert
+        await eventually(lambda: len(handler) == 1)
+        assert handler[0].correlation_id == request.id
+        assert handler[0].data == []
+        assert not self.msgbus.is_pending_request(request.id)
+
+        # Tear Down
+        self.engine.stop()
+
     @pytest.mark.asyncio
     async def test_process_data_processes_data(self):
         # Arrange
@@ -353,3 +463,105 @@ class TestLiveDataEngine:
 
         # Tear Down
         self.engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_process_data_drains_batch_and_updates_queue_stats(self):
+        # Arrange
+        self.engine.start()
+        tick = TestDataStubs.trade_tick()
+
+        # Act
+        for _ in range(10):
+            self.engine.process(tick)
+
+        # Assert
+        await eventually(lambda: self.engine.data_count == 10)
+        stats = self.engine.queue_stats()["data"]
+        assert stats["enqueued"] == 10
+        assert stats["processed"] == 10
+        assert stats["drains"] == 1
+        assert stats["max_batch_size"] == 10
+        assert stats["max_qsize"] == 10
+
+        # Tear Down
+        self.engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_process_quotes_when_backed_up_conflates_to_latest(self):
+        # Arrange
+        self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
+        self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
+        self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
+
+        self.engine = LiveDataEngine(
+            loop=self.loop,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=LiveDataEngineConfig(conflation_threshold=2),
+        )
+
+        trade = TestDataStubs.trade_tick()
+        quotes = [TestDataStubs.quote_tick(bid_price=1.0 + i / 10) for i in range(4)]
+
+        # Act
+        self.engine.process(trade)
+        self.engine.process(trade)
+        for quote in quotes:
+            self.engine.process(quote)
+        self.engine.process(trade)
+
+        # Assert
+        assert self.engine.data_qsize() == 4
+        assert self.engine.conflated_count() == 3
+
+        self.engine.start()
+        await eventually(lambda: self.engine.data_count == 4)
+        assert self.cache.quote_tick(quotes[-1].instrument_id) == quotes[-1]
+        assert self.cache.trade_ticks(trade.instrument_id) == [trade, trade, trade]
+
+        # Tear Down
+        self.engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_process_quotes_conflated_around_trades_preserves_order(self):
+        # Arrange
+        self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
+        self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
+        self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
+
+        self.engine = LiveDataEngine(
+            loop=self.loop,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=LiveDataEngineConfig(conflation_threshold=1),
+        )
+
+        received: list = []
+        self.msgbus.subscribe(topic="data.*", handler=received.append)
+
+        trade1 = TestDataStubs.trade_tick(trade_id="1")
+        trade2 = TestDataStubs.trade_tick(trade_id="2")
+        quote1 = TestDataStubs.quote_tick(bid_price=1.1)
+        quote2 = TestDataStubs.quote_tick(bid_price=1.2)
+        quote3 = TestDataStubs.quote_tick(bid_price=1.3)
+
+        # Act
+        self.engine.process(trade1)
+        self.engine.process(quote1)  # Conflation slot
+        self.engine.process(trade2)
+        self.engine.process(quote2)  # Supersedes slot (trade queued behind it)
+        self.engine.process(quote3)  # Replaces new slot in place
+
+        self.engine.start()
+        await eventually(lambda: self.engine.data_count == 3)
+
+        # Assert
+        assert self.engine.conflated_count() == 2
+        assert received == [trade1, trade2, quote3]
+
+        # Tear Down
+        self.engine.stop()
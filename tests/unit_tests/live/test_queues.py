@@ -0,0 +1,131 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+
+import pytest
+
+from nautilus_trader.common.component import Logger
+from nautilus_trader.live.queues import QueueStats
+from nautilus_trader.live.queues import drain_nowait
+from nautilus_trader.live.queues import enqueue
+from nautilus_trader.live.queues import is_loop_thread
+
+
+@pytest.mark.asyncio
+async def test_enqueue_on_loop_thread_puts_directly():
+    # Arrange
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    stats = QueueStats("data")
+
+    # Act
+    enqueue(loop, queue, 1, stats, Logger("Test"))
+
+    # Assert (no loop iteration required)
+    assert queue.qsize() == 1
+    assert stats.enqueued_count == 1
+
+
+@pytest.mark.asyncio
+async def test_enqueue_when_full_schedules_put():
+    # Arrange
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+    stats = QueueStats("data")
+    log = Logger("Test")
+
+    # Act
+    enqueue(loop, queue, 1, stats, log)
+    enqueue(loop, queue, 2, stats, log)
+    first = queue.get_nowait()
+    await asyncio.sleep(0)
+
+    # Assert
+    assert first == 1
+    assert queue.get_nowait() == 2
+
+
+def test_drain_nowait_stops_at_sentinel():
+    # Arrange
+    queue: asyncio.Queue = asyncio.Queue()
+    for item in (1, 2, None, 3):
+        queue.put_nowait(item)
+    handled: list[int] = []
+
+    # Act
+    count, stopped = drain_nowait(queue, handled.append, None, queue.qsize())
+
+    # Assert
+    assert count == 2
+    assert stopped
+    assert handled == [1, 2]
+    assert queue.qsize() == 1
+
+
+def test_drain_nowait_stops_at_limit_when_handler_enqueues():
+    # Arrange
+    queue: asyncio.Queue = asyncio.Queue()
+    for item in (1, 2, 3):
+        queue.put_nowait(item)
+    handled: list[int] = []
+
+    def handler(item: int) -> None:
+        handled.append(item)
+        queue.put_nowait(item + 10)  # Re-enqueue on the same thread
+
+    # Act
+    count, stopped = drain_nowait(queue, handler, None, queue.qsize())
+
+    # Assert
+    assert count == 3
+    assert not stopped
+    assert handled == [1, 2, 3]
+    assert queue.qsize() == 3
+
+
+def test_is_loop_thread_with_no_running_loop_returns_false():
+    # Arrange
+    loop = asyncio.new_event_loop()
+
+    # Act, Assert
+    assert not is_loop_thread(loop)
+    loop.close()
+
+
+@pytest.mark.asyncio
+async def test_is_loop_thread_on_running_loop_returns_true():
+    # Arrange, Act, Assert
+    assert is_loop_thread(asyncio.get_running_loop())
+
+
+def test_queue_stats_to_dict():
+    # Arrange
+    stats = QueueStats("data")
+    stats.on_enqueue(1)
+    stats.on_enqueue(2)
+    stats.on_wakeup()
+
+    # Act
+    stats.on_drain(2)
+
+    # Assert
+    result = stats.to_dict()
+    assert result["enqueued"] == 2
+    assert result["processed"] == 2
+    assert result["drains"] == 1
+    assert result["avg_batch_size"] == 2.0
+    assert result["max_qsize"] == 2
+    assert result["max_latency_ns"] >= 0
@@ -13,10 +13,12 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import pytest
 
 from nautilus_trader.core.data import Data
 from nautilus_trader.model.custom import customdataclass
 from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
 
 
 @customdataclass
@@ -120,3 +122,52 @@ def test_customdata_decorator_arrow_identity() -> None:
 
     # Assert
     assert new_data == data
+
+
+def test_customdata_decorator_arrow_batch_identity() -> None:
+    # Arrange
+    data = [
+        GreeksTestData(
+            ts_event=1_715_248_800_000_000_000 + i,
+            ts_init=1_715_248_800_000_000_000 + i,
+            instrument_id=InstrumentId.from_str("CL.GLBX" if i % 2 else "ES.GLBX"),
+            delta=float(i),
+        )
+        for i in range(10)
+    ]
+
+    # Act
+    table = ArrowSerializer.serialize_batch(data, data_cls=GreeksTestData)
+    new_data = ArrowSerializer.deserialize(data_cls=GreeksTestData, batch=table)
+
+    # Assert
+    assert table.num_rows == 10
+    assert table.num_columns == len(GreeksTestData._schema)
+    assert table.column("date").to_pylist() == [20240509] * 10
+    assert new_data == data
+
+
+def test_customdata_decorator_arrow_matches_dict_encoding() -> None:
+    # Arrange
+    data = GreeksTestData(
+        ts_event=1_715_248_800_000_000_000,
+        ts_init=1_715_248_860_000_000_000,
+        instrument_id=InstrumentId.from_str("CL.GLBX"),
+        delta=0.5,
+    )
+
+    # Act
+    batch = data.to_arrow()
+
+    # Assert
+    assert batch.schema == GreeksTestData._schema
+    assert batch.to_pylist() == [data.to_dict(to_arrow=True)]
+
+
+def test_customdata_decorator_arrow_invalid_value_raises() -> None:
+    # Arrange
+    data = GreeksTestData(ts_event=1, ts_init=2, delta="not-a-float")
+
+    # Act, Assert
+    with pytest.raises(ValueError, match="delta"):
+        data.to_arrow()
@@ -818,6 +818,97 @@ class TestPosition:
         assert position.commissions() == [Money(8.00, USD)]
         assert repr(position) == "Position(FLAT AUD/USD.SIM, id=P-123456)"
 
+    def test_position_with_max_events_retains_last_fills_only(self) -> None:
+        # Arrange
+        orders = [
+            self.order_factory.market(
+                AUDUSD_SIM.id,
+                OrderSide.BUY,
+                Quantity.from_int(100_000),
+            )
+            for _ in range(5)
+        ]
+
+        fills = [
+            TestEventStubs.order_filled(
+                order,
+                instrument=AUDUSD_SIM,
+                position_id=PositionId("P-123456"),
+                strategy_id=StrategyId("S-001"),
+                last_px=Price.from_str("1.00000"),
+            )
+            for order in orders
+        ]
+
+        # Act
+        position = Position(instrument=AUDUSD_SIM, fill=fills[0], max_events=2)
+        for fill in fills[1:]:
+            position.apply(fill)
+
+        # Assert
+        assert position.max_events == 2
+        assert position.quantity == Quantity.from_int(500_000)
+        assert position.event_count == 5
+        assert position.events == fills[-2:]
+        assert position.last_event == fills[-1]
+        assert position.trade_ids == [fills[-2].trade_id, fills[-1].trade_id]
+        assert position.client_order_ids == [order.client_order_id for order in orders]
+        assert position.commissions() == [Money(10.00, USD)]
+
+    def test_position_with_max_events_when_duplicate_retained_fill_raises(self) -> None:
+        # Arrange
+        order1 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        order2 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        fill1 = TestEventStubs.order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-123456"),
+            strategy_id=StrategyId("S-001"),
+        )
+
+        fill2 = TestEventStubs.order_filled(
+            order2,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-123456"),
+            strategy_id=StrategyId("S-001"),
+        )
+
+        position = Position(instrument=AUDUSD_SIM, fill=fill1, max_events=1)
+        position.apply(fill2)
+
+        # Act, Assert
+        with pytest.raises(KeyError):
+            position.apply(fill2)
+
+    def test_position_with_invalid_max_events_raises(self) -> None:
+        # Arrange
+        order = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        fill = TestEventStubs.order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-123456"),
+            strategy_id=StrategyId("S-001"),
+        )
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            Position(instrument=AUDUSD_SIM, fill=fill, max_events=0)
+
     def test_pnl_calculation_from_trading_technologies_example(self) -> None:
         # https://www.tradingtechnologies.com/xtrader-help/fix-adapter-reference/pl-calculation-algorithm/understanding-pl-calculations/
 
@@ -357,6 +357,46 @@ def test_catalog_write_pyo3_trade_ticks(catalog: ParquetDataCatalog) -> None:
     assert len(all_trades) == 69_806
 
 
+def test_catalog_query_chunks_yields_bounded_chunks(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    path = TEST_DATA_DIR / "binance" / "ethusdt-trades.csv"
+    df = pd.read_csv(path)
+    instrument = TestInstrumentProvider.ethusdt_binance()
+    wrangler = TradeTickDataWranglerV2.from_instrument(instrument)
+    catalog.write_data(wrangler.from_pandas(df))
+
+    # Act
+    chunks = list(catalog.query_chunks(TradeTick, chunk_size=10_000))
+
+    # Assert
+    trades = [trade for chunk in chunks for trade in chunk]
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 10_000 for chunk in chunks)
+    assert all(isinstance(trade, TradeTick) for trade in trades)
+    assert trades == catalog.trade_ticks()
+
+
+def test_catalog_query_chunks_custom_data(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    TestPersistenceStubs.setup_news_event_persistence()
+    catalog.write_data(TestPersistenceStubs.news_events())
+
+    # Act
+    chunks = list(
+        catalog.query_chunks(
+            NewsEventData,
+            filter_expr=ds.field("currency") == "CHF",
+            chunk_size=1_000,
+        ),
+    )
+
+    # Assert
+    data = [d for chunk in chunks for d in chunk]
+    assert len(data) == 2745
+    assert all(len(chunk) <= 1_000 for chunk in chunks)
+    assert isinstance(data[0], CustomData)
+
+
 def test_catalog_multiple_bar_types(catalog: ParquetDataCatalog) -> None:
     # Arrange
     bar_type1 = TestDataStubs.bartype_adabtc_binance_1min_last()
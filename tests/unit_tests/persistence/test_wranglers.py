@@ -12,6 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -46,6 +47,32 @@ def test_load_binance_deltas() -> None:
     assert deltas[1].flags == RecordFlag.F_SNAPSHOT
 
 
+def test_load_binance_deltas_from_arrays_matches_dataframe() -> None:
+    # Arrange
+    instrument = TestInstrumentProvider.btcusdt_binance()
+    data_path = TEST_DATA_DIR / "binance" / "btcusdt-depth-snap.csv"
+    df = BinanceOrderBookDeltaDataLoader.load(data_path)
+
+    wrangler = OrderBookDeltaDataWrangler(instrument)
+    ts_events = df.index.view(np.uint64)
+
+    # Act
+    deltas = wrangler.process_arrays(
+        actions=np.full(len(df), BookAction.ADD, dtype=np.uint8),
+        sides=np.where(df["side"] == "BUY", OrderSide.BUY, OrderSide.SELL),
+        prices=df["price"].to_numpy(),
+        sizes=df["size"].to_numpy(),
+        order_ids=df["order_id"].to_numpy(),
+        flags=df["flags"].to_numpy(),
+        sequences=df["sequence"].to_numpy(),
+        ts_events=ts_events,
+        ts_inits=ts_events,
+    )
+
+    # Assert
+    assert deltas == wrangler.process(df)
+
+
 bar_timestamp_tests_params = (
     ("timestamp_is_close", "interval_ms", "ts_event1", "ts_event2", "ts_event3", "ts_event4"),
     [
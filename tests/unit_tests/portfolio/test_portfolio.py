@@ -32,6 +32,7 @@ from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import OmsType
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.events import AccountState
+from nautilus_trader.model.events import OrderCanceled
 from nautilus_trader.model.identifiers import AccountId
 from nautilus_trader.model.identifiers import PositionId
 from nautilus_trader.model.identifiers import StrategyId
@@ -345,6 +346,76 @@ class TestPortfolio:
         # Assert
         assert self.portfolio.balances_locked(BINANCE)[USDT].as_decimal() == 50100
 
+    def test_update_orders_open_cash_account_adjusts_incrementally(self):
+        # Arrange
+        AccountFactory.register_calculated_account("BINANCE")
+
+        account_id = AccountId("BINANCE-000")
+        state = AccountState(
+            account_id=account_id,
+            account_type=AccountType.CASH,
+            base_currency=None,  # Multi-currency account
+            reported=True,
+            balances=[
+                AccountBalance(
+                    Money(100000.00000000, USDT),
+                    Money(0.00000000, USDT),
+                    Money(100000.00000000, USDT),
+                ),
+            ],
+            margins=[],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.portfolio.update_account(state)
+
+        orders = [
+            self.order_factory.limit(
+                BTCUSDT_BINANCE.id,
+                OrderSide.BUY,
+                Quantity.from_str("0.1"),
+                Price.from_str(f"{50000 - i * 100}.00"),
+            )
+            for i in range(3)
+        ]
+
+        # Act
+        for order in orders:
+            self.cache.add_order(order, position_id=None)
+            self.exec_engine.process(TestEventStubs.order_submitted(order, account_id=account_id))
+            self.exec_engine.process(TestEventStubs.order_accepted(order, account_id=account_id))
+
+        locked_all = self.portfolio.balances_locked(BINANCE)[USDT].as_decimal()
+
+        def cancel(order):
+            self.exec_engine.process(
+                OrderCanceled(
+                    trader_id=order.trader_id,
+                    strategy_id=order.strategy_id,
+                    instrument_id=order.instrument_id,
+                    client_order_id=order.client_order_id,
+                    venue_order_id=order.venue_order_id,
+                    account_id=account_id,
+                    event_id=UUID4(),
+                    ts_event=0,
+                    ts_init=0,
+                ),
+            )
+
+        cancel(orders[1])
+        locked_after_cancel = self.portfolio.balances_locked(BINANCE)[USDT].as_decimal()
+
+        cancel(orders[0])
+        cancel(orders[2])
+
+        # Assert
+        assert locked_all == Decimal("14999.94")
+        assert locked_after_cancel == Decimal("9999.96")
+        assert self.portfolio.balances_locked(BINANCE)[USDT].as_decimal() == 0
+
     def test_update_orders_open_margin_account(self):
         # Arrange
         AccountFactory.register_calculated_account("BINANCE")
@@ -17,6 +17,7 @@ import copy
 import sys
 from typing import Any
 
+import pyarrow as pa
 import pytest
 
 from nautilus_trader.common.component import TestClock
@@ -36,6 +37,7 @@ from nautilus_trader.model.objects import Quantity
 from nautilus_trader.model.position import Position
 from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
 from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
+from nautilus_trader.serialization.arrow.serializer import dicts_to_record_batch
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
 from nautilus_trader.test_kit.stubs.events import TestEventStubs
@@ -61,6 +63,27 @@ def _reset(catalog: ParquetDataCatalog) -> None:
     assert catalog.fs.exists(catalog.path)
 
 
+def test_dicts_to_record_batch_builds_columns_from_schema() -> None:
+    # Arrange
+    schema = pa.schema({"name": pa.string(), "value": pa.float64()})
+
+    # Act
+    batch = dicts_to_record_batch([{"name": "a", "value": 1.0}, {"name": "b"}], schema=schema)
+
+    # Assert
+    assert batch.schema == schema
+    assert batch.to_pylist() == [{"name": "a", "value": 1.0}, {"name": "b", "value": None}]
+
+
+def test_dicts_to_record_batch_with_invalid_value_raises() -> None:
+    # Arrange
+    schema = pa.schema({"name": pa.string(), "value": pa.float64()})
+
+    # Act, Assert
+    with pytest.raises(ValueError, match="value"):
+        dicts_to_record_batch([{"name": "a", "value": "invalid"}], schema=schema)
+
+
 @pytest.mark.skipif(sys.platform == "win32", reason="Failing on windows")
 class TestArrowSerializer:
     def setup(self):
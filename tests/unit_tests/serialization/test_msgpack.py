@@ -17,6 +17,7 @@ from base64 import b64encode
 from decimal import Decimal
 
 import msgspec
+import pytest
 
 from nautilus_trader.common.component import TestClock
 from nautilus_trader.common.enums import ComponentState
@@ -141,6 +142,57 @@ class TestMsgSpecSerializer:
         print(b64encode(serialized))
         print(deserialized)
 
+    @pytest.mark.parametrize(
+        ("timestamps_as_str", "timestamps_as_iso8601"),
+        [
+            [True, False],
+            [False, True],
+            [True, True],
+        ],
+    )
+    def test_serialize_and_deserialize_with_timestamp_conversions(
+        self,
+        timestamps_as_str,
+        timestamps_as_iso8601,
+    ):
+        # Arrange
+        serializer = MsgSpecSerializer(
+            encoding=msgspec.msgpack,
+            timestamps_as_str=timestamps_as_str,
+            timestamps_as_iso8601=timestamps_as_iso8601,
+        )
+        order = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity(100_000, precision=0),
+        )
+        event = OrderSubmitted(
+            trader_id=order.trader_id,
+            strategy_id=order.strategy_id,
+            instrument_id=order.instrument_id,
+            client_order_id=order.client_order_id,
+            account_id=self.account_id,
+            event_id=UUID4(),
+            ts_event=1_715_248_800_123_456_789,
+            ts_init=1_715_248_800_123_456_789,
+        )
+        values = {"expire_time_ns": 1_715_248_800_123_456_789, "ts_last": None}
+
+        # Act
+        serialized = serializer.serialize(event)
+        deserialized = serializer.deserialize(serialized)
+        raw = msgspec.msgpack.decode(serialized)
+        values_deserialized = serializer.deserialize(serializer.serialize(values))
+
+        # Assert
+        assert deserialized == event
+        assert deserialized.ts_event == event.ts_event
+        assert values_deserialized == values
+        if timestamps_as_iso8601:
+            assert raw["ts_event"] == "2024-05-09T10:00:00.123456789Z"
+        else:
+            assert raw["ts_event"] == "1715248800123456789"
+
     def test_pack_and_unpack_market_orders(self):
         # Arrange
         order = self.order_factory.market(
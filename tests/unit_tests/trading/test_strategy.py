@@ -1496,7 +1496,48 @@ class TestStrategy:
         self.exchange.process(0)
 
         # Assert
-        # TODO: WIP!
+        assert order1.status == OrderStatus.CANCELED
+        assert order2.status == OrderStatus.CANCELED
+        assert order1 in self.cache.orders_closed()
+        assert order2 in self.cache.orders_closed()
+        assert self.exec_engine.command_count == 3  # Two submits and one batch cancel
+
+    def test_cancel_orders_with_managed_gtd_expiry_cancels_timers(self) -> None:
+        # Arrange
+        config = StrategyConfig(manage_gtd_expiry=True)
+        strategy = Strategy(config)
+        strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        orders = [
+            strategy.order_factory.limit(
+                _USDJPY_SIM.id,
+                OrderSide.SELL,
+                Quantity.from_int(100_000),
+                _USDJPY_SIM.make_price(100.000 + i),
+                time_in_force=TimeInForce.GTD,
+                expire_time=self.clock.utc_now() + pd.Timedelta(minutes=10),
+            )
+            for i in range(3)
+        ]
+
+        for order in orders:
+            strategy.submit_order(order)
+        self.exchange.process(0)
+
+        # Act
+        strategy.cancel_orders(orders)
+        self.exchange.process(0)
+
+        # Assert
+        assert strategy.clock.timer_count == 0
+        assert all(order.status == OrderStatus.CANCELED for order in orders)
+        assert self.exec_engine.command_count == 4  # Three submits and one batch cancel
 
     def test_cancel_all_orders(self) -> None:
         # Arrange